@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the hot per-click service readers.
+
+Compares the per-call Python overhead of building ``select(...)`` constructs
+inline on every call (the previous implementation) against the module-level
+statements, prebuilt once with bind parameters, now used by the services. Runs
+against an in-memory SQLite database so the numbers mostly reflect statement
+construction and compilation rather than I/O.
+
+Usage:
+    python benchmarks/hot_queries.py --iterations 2000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Allow running from a source checkout without installing the package
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+import pandas as pd
+from sqlalchemy import create_engine, select, func
+from sqlalchemy.orm import Session
+
+from label_pizza.db import Base
+from label_pizza.models import (
+    User, Video, Project, ProjectVideo, ProjectUserRole, Question,
+    QuestionGroup, QuestionGroupQuestion, AnnotatorAnswer, ReviewerGroundTruth
+)
+from label_pizza.services import AnnotatorService, GroundTruthService, BaseAnswerService
+
+
+def seed(session: Session, num_questions: int = 8) -> dict:
+    """Create one project with a single question group and a few answers."""
+    user = User(user_id_str="bench_user", email="bench@example.com", password_hash="x", user_type="human")
+    video = Video(video_uid="bench.mp4", url="http://example.com/bench.mp4")
+    group = QuestionGroup(title="bench_group", display_title="bench_group")
+    project = Project(name="bench_project", schema_id=1)
+    session.add_all([user, video, group, project])
+    session.flush()
+
+    session.add(ProjectVideo(project_id=project.id, video_id=video.id))
+    session.add(ProjectUserRole(project_id=project.id, user_id=user.id, role="annotator"))
+    for i in range(num_questions):
+        question = Question(text=f"bench question {i}", display_text=f"Bench Question {i}", type="single",
+                            options=["a", "b"], display_values=["A", "B"])
+        session.add(question)
+        session.flush()
+        session.add(QuestionGroupQuestion(question_group_id=group.id, question_id=question.id, display_order=i))
+        session.add(AnnotatorAnswer(video_id=video.id, question_id=question.id, user_id=user.id,
+                                    project_id=project.id, answer_value="a"))
+        session.add(ReviewerGroundTruth(video_id=video.id, question_id=question.id, project_id=project.id,
+                                        reviewer_id=user.id, answer_value="a", original_answer_value="a"))
+    session.commit()
+    return {"video_id": video.id, "project_id": project.id, "user_id": user.id, "question_group_id": group.id}
+
+
+# ---------------------------------------------------------------------------
+# Previous implementations (statement rebuilt on every call)
+# ---------------------------------------------------------------------------
+
+def legacy_validate_user_role(user_id, project_id, session):
+    return session.scalars(
+        select(ProjectUserRole).where(
+            ProjectUserRole.user_id == user_id,
+            ProjectUserRole.project_id == project_id,
+            ProjectUserRole.is_archived == False
+        )
+    ).all()
+
+
+def legacy_get_user_answers_for_question_group(video_id, project_id, user_id, question_group_id, session):
+    answers = session.scalars(
+        select(AnnotatorAnswer)
+        .join(Question, AnnotatorAnswer.question_id == Question.id)
+        .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
+        .where(
+            AnnotatorAnswer.video_id == video_id,
+            AnnotatorAnswer.project_id == project_id,
+            AnnotatorAnswer.user_id == user_id,
+            QuestionGroupQuestion.question_group_id == question_group_id
+        )
+    ).all()
+    result = {}
+    for answer in answers:
+        question = session.get(Question, answer.question_id)
+        if question:
+            result[question.text] = answer.answer_value
+    return result
+
+
+def legacy_check_user_has_submitted_answers(video_id, project_id, user_id, question_group_id, session):
+    return session.scalar(
+        select(func.count())
+        .select_from(AnnotatorAnswer)
+        .join(Question, AnnotatorAnswer.question_id == Question.id)
+        .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
+        .where(
+            AnnotatorAnswer.video_id == video_id,
+            AnnotatorAnswer.project_id == project_id,
+            AnnotatorAnswer.user_id == user_id,
+            QuestionGroupQuestion.question_group_id == question_group_id
+        )
+    ) > 0
+
+
+def legacy_get_ground_truth_for_question_group(video_id, project_id, question_group_id, session):
+    group = session.get(QuestionGroup, question_group_id)
+    questions = session.scalars(
+        select(Question)
+        .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
+        .where(QuestionGroupQuestion.question_group_id == question_group_id)
+        .order_by(QuestionGroupQuestion.display_order)
+    ).all()
+    if not questions:
+        return pd.DataFrame()
+    question_ids = [q.id for q in questions]
+    gts = session.scalars(
+        select(ReviewerGroundTruth)
+        .where(
+            ReviewerGroundTruth.video_id == video_id,
+            ReviewerGroundTruth.project_id == project_id,
+            ReviewerGroundTruth.question_id.in_(question_ids)
+        )
+    ).all()
+    # Same DataFrame as the service builds, so only the query side differs
+    return pd.DataFrame([
+        {
+            "Question ID": gt.question_id,
+            "Answer Value": gt.answer_value,
+            "Original Value": gt.original_answer_value,
+            "Reviewer ID": gt.reviewer_id,
+            "Modified At": gt.modified_at,
+            "Modified By Admin": gt.modified_by_admin_id,
+            "Modified By Admin At": gt.modified_by_admin_at,
+            "Confidence Score": gt.confidence_score,
+            "Created At": gt.created_at,
+            "Notes": gt.notes
+        }
+        for gt in gts
+    ])
+
+
+def time_calls(fn, iterations: int) -> float:
+    """Return the mean wall time per call in microseconds."""
+    fn()  # warm up caches
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hot per-click service queries")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per measurement")
+    parser.add_argument("--questions", type=int, default=8, help="Questions in the benchmark group")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        ids = seed(session, num_questions=args.questions)
+        v, p, u, g = ids["video_id"], ids["project_id"], ids["user_id"], ids["question_group_id"]
+
+        cases = [
+            (
+                "_validate_user_role",
+                lambda: legacy_validate_user_role(u, p, session),
+                lambda: BaseAnswerService._validate_user_role(u, p, "annotator", session),
+            ),
+            (
+                "get_user_answers_for_question_group",
+                lambda: legacy_get_user_answers_for_question_group(v, p, u, g, session),
+                lambda: AnnotatorService.get_user_answers_for_question_group(v, p, u, g, session),
+            ),
+            (
+                "check_user_has_submitted_answers",
+                lambda: legacy_check_user_has_submitted_answers(v, p, u, g, session),
+                lambda: AnnotatorService.check_user_has_submitted_answers(v, p, u, g, session),
+            ),
+            (
+                "get_ground_truth_for_question_group",
+                lambda: legacy_get_ground_truth_for_question_group(v, p, g, session),
+                lambda: GroundTruthService.get_ground_truth_for_question_group(v, p, g, session),
+            ),
+        ]
+
+        print(f"{'Method':<40} {'before (us)':>12} {'after (us)':>12} {'speedup':>9}")
+        print("-" * 76)
+        for name, before_fn, after_fn in cases:
+            before = time_calls(before_fn, args.iterations)
+            after = time_calls(after_fn, args.iterations)
+            print(f"{name:<40} {before:>12.1f} {after:>12.1f} {before / after:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
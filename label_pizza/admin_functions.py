@@ -2739,25 +2739,34 @@ def show_export_project_interface(grouped_projects):
                 try:
                     project_ids = list(current_selections)
                     with st.spinner("Exporting..."):
-                        with get_db_session() as session:
-                            export_data = export_module.GroundTruthExportService.export_ground_truth_data(project_ids, session)
-                        
                         file_ext = ".json" if export_format == "json" else ".xlsx"
                         final_filename = f"{filename}{file_ext}" if not filename.endswith(file_ext) else filename
                         
                         if export_format == "json":
+                            with get_db_session() as session:
+                                export_data = export_module.GroundTruthExportService.export_ground_truth_data(project_ids, session)
                             import json
                             json_str = json.dumps(export_data, indent=2, ensure_ascii=False)
                             st.download_button("📥 Download JSON", json_str, final_filename, "application/json", use_container_width=True)
+                            video_count = len(export_data)
                         else:
-                            import io
-                            buffer = io.BytesIO()
-                            export_module.save_export_as_excel(export_data, buffer)
-                            buffer.seek(0)
-                            st.download_button("📥 Download Excel", buffer.getvalue(), final_filename, 
-                                             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
+                            # Stream rows from the database into a temp file instead of building the workbook in memory
+                            import os
+                            import tempfile
+                            with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+                                tmp_path = tmp.name
+                            try:
+                                with get_db_session() as session:
+                                    records = export_module.GroundTruthExportService.iter_ground_truth_data(project_ids, session)
+                                    questions = export_module.GroundTruthExportService.get_export_question_texts(project_ids, session)
+                                    video_count = export_module.save_export_as_excel(records, tmp_path, questions=questions)
+                                with open(tmp_path, "rb") as f:
+                                    st.download_button("📥 Download Excel", f, final_filename, 
+                                                     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
+                            finally:
+                                os.remove(tmp_path)
                     
-                    custom_info(f"✅ Exported {len(export_data)} videos!")
+                    custom_info(f"✅ Exported {video_count} videos!")
                 except ValueError as e:
                     st.error(f"❌ Export failed:\n\n{str(e)}")
         
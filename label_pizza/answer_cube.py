@@ -0,0 +1,409 @@
+"""
+Dense, encoded answers of one project for analytics.
+
+Consensus, accuracy, auto-submit voting and the sort metrics all join
+annotator_answers with reviewer_ground_truth per question. ProjectAnswerCube
+loads a project's answers and ground truth once, with a single query, into
+NumPy arrays:
+
+- answers: (video, question, user) option codes, MISSING where unanswered
+- confidence: (video, question, user) confidence scores, NaN where missing
+- ground_truth: (video, question) option codes, MISSING where there is none
+
+Answer values are encoded per question: code i is values[question][i].
+Codes are int16, and a cube switches to int32 only if a question has more
+distinct answers than int16 can hold (e.g. free-text descriptions in a very
+large project). IDs are mapped to array positions with video_index,
+question_index and user_index.
+
+The cube is updated in place when answers or ground truth are submitted, and
+can be saved to a directory of .npy files that load() memory-maps.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import Integer, cast, literal, null, select, union_all
+from sqlalchemy.orm import Session
+
+from label_pizza.models import AnnotatorAnswer, ReviewerGroundTruth
+
+
+MISSING = -1
+CODE_DTYPE = np.int16
+WIDE_CODE_DTYPE = np.int32
+CONFIDENCE_DTYPE = np.float32
+
+_ARRAY_FILES = ("answers", "confidence", "ground_truth")
+_META_FILE = "meta.json"
+
+
+class ProjectAnswerCube:
+    """Encoded answers and ground truth of one project, indexed by (video, question, user)"""
+
+    def __init__(self, video_ids: List[int], question_ids: List[int], user_ids: List[int],
+                 answers: np.ndarray, confidence: np.ndarray, ground_truth: np.ndarray,
+                 values: List[List[str]], project_id: Optional[int] = None):
+        """Wrap already encoded arrays; use build(), from_rows() or load() to create a cube.
+
+        Args:
+            video_ids: Video ID of each position of the first axis
+            question_ids: Question ID of each position of the second axis
+            user_ids: User ID of each position of the third axis
+            answers: Option codes with shape (videos, questions, users)
+            confidence: Confidence scores with shape (videos, questions, users)
+            ground_truth: Option codes with shape (videos, questions)
+            values: Answer value of each code, per question position
+            project_id: The ID of the project, if known
+        """
+        self.project_id = project_id
+        self.video_ids = list(video_ids)
+        self.question_ids = list(question_ids)
+        self.user_ids = list(user_ids)
+        self.video_index = {video_id: i for i, video_id in enumerate(self.video_ids)}
+        self.question_index = {question_id: i for i, question_id in enumerate(self.question_ids)}
+        self.user_index = {user_id: i for i, user_id in enumerate(self.user_ids)}
+        self.answers = answers
+        self.confidence = confidence
+        self.ground_truth = ground_truth
+        self.values = [list(question_values) for question_values in values]
+        self._codes = [{value: code for code, value in enumerate(question_values)} for question_values in self.values]
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def empty(cls, project_id: Optional[int] = None) -> "ProjectAnswerCube":
+        """Create a cube without videos, questions or users"""
+        return cls(
+            [], [], [],
+            np.full((0, 0, 0), MISSING, dtype=CODE_DTYPE),
+            np.full((0, 0, 0), np.nan, dtype=CONFIDENCE_DTYPE),
+            np.full((0, 0), MISSING, dtype=CODE_DTYPE),
+            [], project_id=project_id,
+        )
+
+    @classmethod
+    def from_rows(cls, answer_rows: Iterable[Tuple], ground_truth_rows: Iterable[Tuple],
+                  project_id: Optional[int] = None) -> "ProjectAnswerCube":
+        """Encode answer and ground truth rows.
+
+        Args:
+            answer_rows: (video_id, question_id, user_id, answer_value, confidence_score) tuples
+            ground_truth_rows: (video_id, question_id, answer_value) tuples
+            project_id: The ID of the project, if known
+
+        Returns:
+            ProjectAnswerCube holding the rows
+        """
+        answer_rows = list(answer_rows)
+        ground_truth_rows = list(ground_truth_rows)
+
+        video_ids = sorted({row[0] for row in answer_rows} | {row[0] for row in ground_truth_rows})
+        question_ids = sorted({row[1] for row in answer_rows} | {row[1] for row in ground_truth_rows})
+        user_ids = sorted({row[2] for row in answer_rows})
+
+        # Sorted per-question vocabularies make the codes independent of row order
+        vocabularies = {question_id: set() for question_id in question_ids}
+        for row in answer_rows:
+            vocabularies[row[1]].add(row[3])
+        for row in ground_truth_rows:
+            vocabularies[row[1]].add(row[2])
+        values = [sorted(vocabularies[question_id]) for question_id in question_ids]
+        code_dtype = CODE_DTYPE
+        if values and max(len(question_values) for question_values in values) - 1 > np.iinfo(CODE_DTYPE).max:
+            code_dtype = WIDE_CODE_DTYPE
+
+        cube = cls(
+            video_ids, question_ids, user_ids,
+            np.full((len(video_ids), len(question_ids), len(user_ids)), MISSING, dtype=code_dtype),
+            np.full((len(video_ids), len(question_ids), len(user_ids)), np.nan, dtype=CONFIDENCE_DTYPE),
+            np.full((len(video_ids), len(question_ids)), MISSING, dtype=code_dtype),
+            values, project_id=project_id,
+        )
+
+        if answer_rows:
+            v = np.fromiter((cube.video_index[row[0]] for row in answer_rows), dtype=np.intp, count=len(answer_rows))
+            q = np.fromiter((cube.question_index[row[1]] for row in answer_rows), dtype=np.intp, count=len(answer_rows))
+            u = np.fromiter((cube.user_index[row[2]] for row in answer_rows), dtype=np.intp, count=len(answer_rows))
+            cube.answers[v, q, u] = [cube._codes[qi][row[3]] for qi, row in zip(q, answer_rows)]
+            cube.confidence[v, q, u] = [np.nan if row[4] is None else row[4] for row in answer_rows]
+
+        if ground_truth_rows:
+            v = np.fromiter((cube.video_index[row[0]] for row in ground_truth_rows), dtype=np.intp, count=len(ground_truth_rows))
+            q = np.fromiter((cube.question_index[row[1]] for row in ground_truth_rows), dtype=np.intp, count=len(ground_truth_rows))
+            cube.ground_truth[v, q] = [cube._codes[qi][row[2]] for qi, row in zip(q, ground_truth_rows)]
+
+        return cube
+
+    @classmethod
+    def build(cls, project_id: int, session: Session) -> "ProjectAnswerCube":
+        """Load a project's annotator answers and ground truth with one query.
+
+        Args:
+            project_id: The ID of the project
+            session: Database session
+
+        Returns:
+            ProjectAnswerCube for the project
+        """
+        answer_query = select(
+            literal(False).label("is_ground_truth"),
+            AnnotatorAnswer.video_id, AnnotatorAnswer.question_id, AnnotatorAnswer.user_id,
+            AnnotatorAnswer.answer_value, AnnotatorAnswer.confidence_score,
+        ).where(AnnotatorAnswer.project_id == project_id)
+        ground_truth_query = select(
+            literal(True).label("is_ground_truth"),
+            ReviewerGroundTruth.video_id, ReviewerGroundTruth.question_id, cast(null(), Integer),
+            ReviewerGroundTruth.answer_value, ReviewerGroundTruth.confidence_score,
+        ).where(ReviewerGroundTruth.project_id == project_id)
+
+        answer_rows = []
+        ground_truth_rows = []
+        for is_ground_truth, video_id, question_id, user_id, value, confidence in session.execute(
+            union_all(answer_query, ground_truth_query)
+        ):
+            if is_ground_truth:
+                ground_truth_rows.append((video_id, question_id, value))
+            else:
+                answer_rows.append((video_id, question_id, user_id, value, confidence))
+
+        return cls.from_rows(answer_rows, ground_truth_rows, project_id=project_id)
+
+    # ------------------------------------------------------------------
+    # Encoding and incremental updates
+    # ------------------------------------------------------------------
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the arrays"""
+        return self.answers.nbytes + self.confidence.nbytes + self.ground_truth.nbytes
+
+    def encode(self, question_id: int, value: str) -> int:
+        """Code of an answer value, MISSING if the question or value is unknown"""
+        question_idx = self.question_index.get(question_id)
+        if question_idx is None:
+            return MISSING
+        return self._codes[question_idx].get(value, MISSING)
+
+    def decode(self, question_id: int, code: int) -> Optional[str]:
+        """Answer value of a code, None for MISSING"""
+        if code == MISSING:
+            return None
+        return self.values[self.question_index[question_id]][code]
+
+    def _add_code(self, question_idx: int, value: str) -> int:
+        code = self._codes[question_idx].get(value)
+        if code is None:
+            code = len(self.values[question_idx])
+            if code > np.iinfo(self.answers.dtype).max:
+                self.answers = self.answers.astype(WIDE_CODE_DTYPE)
+                self.ground_truth = self.ground_truth.astype(WIDE_CODE_DTYPE)
+            self.values[question_idx].append(value)
+            self._codes[question_idx][value] = code
+        return code
+
+    def _grow(self, axis: int, ids: List[int], index: Dict[int, int], new_id: int) -> int:
+        position = index.get(new_id)
+        if position is not None:
+            return position
+
+        position = len(ids)
+        ids.append(new_id)
+        index[new_id] = position
+
+        def extend(array: np.ndarray, fill) -> np.ndarray:
+            shape = list(array.shape)
+            shape[axis] = 1
+            return np.concatenate([array, np.full(shape, fill, dtype=array.dtype)], axis=axis)
+
+        self.answers = extend(self.answers, MISSING)
+        self.confidence = extend(self.confidence, np.nan)
+        if axis < 2:
+            self.ground_truth = extend(self.ground_truth, MISSING)
+        if axis == 1:
+            self.values.append([])
+            self._codes.append({})
+        return position
+
+    def _positions(self, video_id: int, question_id: int) -> Tuple[int, int]:
+        return (self._grow(0, self.video_ids, self.video_index, video_id),
+                self._grow(1, self.question_ids, self.question_index, question_id))
+
+    def set_answer(self, video_id: int, question_id: int, user_id: int, value: str,
+                   confidence: Optional[float] = None):
+        """Record a submitted annotator answer"""
+        video_idx, question_idx = self._positions(video_id, question_id)
+        user_idx = self._grow(2, self.user_ids, self.user_index, user_id)
+        self.answers[video_idx, question_idx, user_idx] = self._add_code(question_idx, value)
+        self.confidence[video_idx, question_idx, user_idx] = np.nan if confidence is None else confidence
+
+    def set_answers(self, video_id: int, user_id: int, answers: Dict[int, str],
+                    confidences: Optional[Dict[int, float]] = None):
+        """Record the answers a user submitted for a video, keyed by question ID"""
+        confidences = confidences or {}
+        for question_id, value in answers.items():
+            self.set_answer(video_id, question_id, user_id, value, confidences.get(question_id))
+
+    def remove_answer(self, video_id: int, question_id: int, user_id: int):
+        """Forget a deleted annotator answer"""
+        position = (self.video_index.get(video_id), self.question_index.get(question_id), self.user_index.get(user_id))
+        if None not in position:
+            self.answers[position] = MISSING
+            self.confidence[position] = np.nan
+
+    def set_ground_truth(self, video_id: int, question_id: int, value: str):
+        """Record submitted or overridden ground truth"""
+        video_idx, question_idx = self._positions(video_id, question_id)
+        self.ground_truth[video_idx, question_idx] = self._add_code(question_idx, value)
+
+    def set_ground_truths(self, video_id: int, answers: Dict[int, str]):
+        """Record the ground truth submitted for a video, keyed by question ID"""
+        for question_id, value in answers.items():
+            self.set_ground_truth(video_id, question_id, value)
+
+    def remove_ground_truth(self, video_id: int, question_id: int):
+        """Forget deleted ground truth"""
+        position = (self.video_index.get(video_id), self.question_index.get(question_id))
+        if None not in position:
+            self.ground_truth[position] = MISSING
+
+    # ------------------------------------------------------------------
+    # Analytics
+    # ------------------------------------------------------------------
+
+    def _indices(self, index: Dict[int, int], ids: Iterable[int]) -> np.ndarray:
+        return np.array([index[i] for i in ids if i in index], dtype=np.intp)
+
+    def _select(self, user_ids: Iterable[int], question_ids: Iterable[int]) -> Tuple[np.ndarray, np.ndarray]:
+        question_idx = self._indices(self.question_index, question_ids)
+        user_idx = self._indices(self.user_index, user_ids)
+        return question_idx, user_idx
+
+    def _by_video(self, values: np.ndarray, keep: np.ndarray) -> Dict[int, float]:
+        return {self.video_ids[i]: float(values[i]) for i in np.flatnonzero(keep)}
+
+    def model_confidence(self, model_user_ids: List[int], question_ids: List[int]) -> Dict[int, float]:
+        """Mean confidence score of the model users' answers on the questions, per video"""
+        question_idx, user_idx = self._select(model_user_ids, question_ids)
+        scores = self.confidence[:, question_idx][:, :, user_idx]
+        present = ~np.isnan(scores)
+        counts = present.sum(axis=(1, 2))
+        totals = np.where(present, scores, 0).sum(axis=(1, 2), dtype=np.float64)
+        return self._by_video(totals / np.maximum(counts, 1), counts > 0)
+
+    def consensus_rates(self, annotator_user_ids: List[int], question_ids: List[int]) -> Dict[int, float]:
+        """Share of questions, among those answered by 2+ annotators, where a majority agrees, per video"""
+        question_idx, user_idx = self._select(annotator_user_ids, question_ids)
+        codes = self.answers[:, question_idx][:, :, user_idx]
+        answered = codes != MISSING
+
+        # Largest number of annotators giving the same answer to each (video, question)
+        same = (codes[..., :, None] == codes[..., None, :]) & answered[..., None, :]
+        majority = np.where(answered, same.sum(axis=-1), 0).max(axis=-1, initial=0)
+        counts = answered.sum(axis=-1)
+
+        contested = counts >= 2
+        agreed = contested & (majority >= 0.5 * counts)
+        contested_per_video = contested.sum(axis=1)
+        return self._by_video(agreed.sum(axis=1) / np.maximum(contested_per_video, 1), contested_per_video > 0)
+
+    def accuracy_rates(self, annotator_user_ids: List[int], question_ids: List[int]) -> Dict[int, float]:
+        """Share of the annotators' answers that match the ground truth, per video"""
+        question_idx, user_idx = self._select(annotator_user_ids, question_ids)
+        codes = self.answers[:, question_idx][:, :, user_idx]
+        truth = self.ground_truth[:, question_idx][:, :, None]
+
+        compared = (codes != MISSING) & (truth != MISSING)
+        compared_per_video = compared.sum(axis=(1, 2))
+        correct_per_video = (compared & (codes == truth)).sum(axis=(1, 2))
+        return self._by_video(correct_per_video / np.maximum(compared_per_video, 1), compared_per_video > 0)
+
+    def completion_rates(self, question_ids: List[int]) -> Dict[int, float]:
+        """Percentage of the questions that have ground truth, per video"""
+        if not question_ids:
+            return {}
+        question_idx = self._indices(self.question_index, question_ids)
+        completed = (self.ground_truth[:, question_idx] != MISSING).sum(axis=1)
+        return self._by_video(completed / len(question_ids) * 100, completed > 0)
+
+    def user_completion_rates(self, user_id: int, question_ids: List[int]) -> Dict[int, float]:
+        """Percentage of the questions a user answered, per video"""
+        if not question_ids:
+            return {}
+        question_idx, user_idx = self._select([user_id], question_ids)
+        answered = (self.answers[:, question_idx][:, :, user_idx] != MISSING).sum(axis=(1, 2))
+        return self._by_video(answered / len(question_ids) * 100, answered > 0)
+
+    def videos_matching_ground_truth(self, filter_by_gt: Dict[int, str]) -> set:
+        """IDs of the videos whose ground truth has the required answer for every filtered question"""
+        matches = np.ones(len(self.video_ids), dtype=bool)
+        for question_id, required_answer in filter_by_gt.items():
+            code = self.encode(question_id, required_answer)
+            if code == MISSING:
+                return set()
+            matches &= self.ground_truth[:, self.question_index[question_id]] == code
+        return {self.video_ids[i] for i in np.flatnonzero(matches)}
+
+    def answer_votes(self, video_id: int, question_id: int,
+                     user_ids: Optional[List[int]] = None) -> Dict[str, int]:
+        """Number of users giving each answer to a question of a video"""
+        video_idx = self.video_index.get(video_id)
+        question_idx = self.question_index.get(question_id)
+        if video_idx is None or question_idx is None:
+            return {}
+        codes = self.answers[video_idx, question_idx]
+        if user_ids is not None:
+            codes = codes[self._indices(self.user_index, user_ids)]
+        codes = codes[codes != MISSING]
+        counts = np.bincount(codes, minlength=len(self.values[question_idx]))
+        return {self.values[question_idx][code]: int(count) for code, count in enumerate(counts) if count}
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def save(self, directory: str):
+        """Write the cube as .npy arrays plus a JSON file with the ID maps and answer values.
+
+        Args:
+            directory: Directory to write to; it is created if needed
+        """
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in _ARRAY_FILES:
+            np.save(path / f"{name}.npy", getattr(self, name))
+        meta = {
+            "project_id": self.project_id,
+            "video_ids": self.video_ids,
+            "question_ids": self.question_ids,
+            "user_ids": self.user_ids,
+            "values": self.values,
+        }
+        with open(path / _META_FILE, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: Optional[str] = "r") -> "ProjectAnswerCube":
+        """Open a cube written by save().
+
+        Args:
+            directory: Directory written by save()
+            mmap_mode: numpy memory-map mode; "r" maps the arrays read-only, "r+" allows
+                in-place updates, None reads them into memory
+
+        Returns:
+            ProjectAnswerCube backed by the files
+        """
+        path = Path(directory)
+        with open(path / _META_FILE, encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode) for name in _ARRAY_FILES}
+        return cls(
+            meta["video_ids"], meta["question_ids"], meta["user_ids"],
+            arrays["answers"], arrays["confidence"], arrays["ground_truth"],
+            meta["values"], project_id=meta["project_id"],
+        )
@@ -15,7 +15,7 @@ from label_pizza.ui_components import (
 from label_pizza.database_utils import (
     get_db_session, get_questions_by_group_cached, get_project_videos,
     get_session_cached_project_annotators, get_optimized_annotator_user_ids,
-    get_cached_video_reviewer_data, get_session_cache_key,
+    get_video_reviewer_data_cached,
     get_cached_user_completion_progress, get_schema_question_groups,
     get_project_metadata_cached
 )
@@ -1182,10 +1182,8 @@ def calculate_preload_answers_no_threshold(video_id: int, project_id: int, quest
         # Get cached data if this is for a reviewer with selected annotators
         cache_data = None
         if role == "reviewer" and include_user_ids:
-            session_id = get_session_cache_key()
-            cache_data = get_cached_video_reviewer_data(
-                video_id=video_id, project_id=project_id, 
-                annotator_user_ids=include_user_ids, session_id=session_id
+            cache_data = get_video_reviewer_data_cached(
+                video_id=video_id, project_id=project_id, annotator_user_ids=include_user_ids
             )
         
         for question in questions:
@@ -1349,10 +1347,8 @@ def calculate_preload_with_weights(
 
         cache_data = None
         if include_user_ids:
-            session_id = get_session_cache_key()
-            cache_data = get_cached_video_reviewer_data(
-                video_id=video_id, project_id=project_id, 
-                annotator_user_ids=include_user_ids, session_id=session_id
+            cache_data = get_video_reviewer_data_cached(
+                video_id=video_id, project_id=project_id, annotator_user_ids=include_user_ids
             )
         
         for question in questions:
@@ -1507,10 +1503,8 @@ def build_virtual_responses_for_video(video_id: int, project_id: int, role: str)
             display_names=selected_annotators, project_id=project_id
         )
         if annotator_user_ids:
-            session_id = get_session_cache_key()
-            cache_data = get_cached_video_reviewer_data(
-                video_id=video_id, project_id=project_id, 
-                annotator_user_ids=annotator_user_ids, session_id=session_id
+            cache_data = get_video_reviewer_data_cached(
+                video_id=video_id, project_id=project_id, annotator_user_ids=annotator_user_ids
             )
     
     # Handle description questions with specific annotator selections
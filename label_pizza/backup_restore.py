@@ -18,21 +18,46 @@ Usage:
     # Backup with compression
     python label_pizza/backup_restore.py backup --database-url-name DBURL --backup-dir ./backups --output mybackup.sql.gz --compress
     
+    # Parallel COPY backup (tar archive; restore accepts it like any other backup)
+    python label_pizza/backup_restore.py backup --database-url-name DBURL --backup-dir ./backups --output mybackup.tar --format copy --jobs 8
+    
+    # Differential backup with only the rows changed since the newest COPY/differential backup in --backup-dir
+    python label_pizza/backup_restore.py backup --database-url-name DBURL --backup-dir ./backups --auto-name --format diff
+    
+    # zstd-compressed COPY archive with checksummed chunks, then check it without restoring
+    python label_pizza/backup_restore.py backup --database-url-name DBURL --backup-dir ./backups --output mybackup.tar --format copy --compress --compression zstd
+    python label_pizza/backup_restore.py verify --input ./backups/mybackup.tar
+    
+    # Restore a single table from a COPY archive
+    python label_pizza/backup_restore.py restore --database-url-name DBURL --input ./backups/mybackup.tar --table reviewer_ground_truth
+    
+    # Parallel restore of a COPY archive (indexes are built after the data is loaded)
+    python label_pizza/backup_restore.py restore --database-url-name DBURL --input ./backups/mybackup.tar --jobs 8
+    
     # List available backups
     python label_pizza/backup_restore.py list --backup-dir ./backups
 
 Dependencies:
     pip install psycopg2-binary python-dotenv
+    pip install zstandard  # only for --compression zstd
 """
 
 import argparse
 import os
 import sys
 import gzip
+import hashlib
+import io
 import datetime
 import json
+import shutil
+import tarfile
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Iterable
 from urllib.parse import urlparse
 from dotenv import load_dotenv
 
@@ -48,6 +73,166 @@ except ImportError:
     sys.exit(1)
 
 
+COPY_ARCHIVE_FORMAT = "label-pizza-copy"
+COPY_MANIFEST = "manifest.json"
+COPY_FORMATS = {"binary": ".copy", "csv": ".csv"}
+RESTORE_BATCH_SIZE = 10000  # Rows per COPY batch when restoring .sql backups
+DIFF_ARCHIVE_FORMAT = "label-pizza-diff"
+DIFF_CHAIN_LIMIT = 24  # Automatic differential backups start a new base after this many diffs
+ROW_FINGERPRINT_SQL = "left(md5(t::text), 16)"  # Whole-row fingerprint of a row aliased as t
+COPY_COMPRESSIONS = {"gzip": ".gz", "zstd": ".zst"}
+ZSTD_CHUNK_SIZE = 8 * 1024 * 1024  # Uncompressed bytes per independently compressed, checksummed zstd chunk
+ZSTD_LEVEL = 3
+
+
+def _require_zstandard():
+    """Import zstandard or raise a helpful ImportError."""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstandard is required for zstd-compressed backups. Install with: pip install zstandard")
+    return zstandard
+
+
+def _archive_compression(manifest: Dict[str, Any]) -> Optional[str]:
+    """Codec of an archive's members: None, "gzip" (also archives written before zstd support) or "zstd"."""
+    return (manifest.get('compression') or 'gzip') if manifest.get('compressed') else None
+
+
+def _compress_chunk(raw: bytes, level: int) -> Tuple[bytes, str]:
+    zstd = _require_zstandard()
+    frame = zstd.ZstdCompressor(level=level, write_checksum=True).compress(raw)
+    return frame, hashlib.sha256(frame).hexdigest()
+
+
+class _ChunkedZstdWriter:
+    """Binary file writer that compresses every chunk_size bytes into an independent zstd frame
+    
+    Frames are compressed on `executor` when one is given (zstandard releases the GIL) and
+    written in order, so the file is an ordinary multi-frame zstd stream. `chunks` collects
+    [offset, compressed size, raw size, sha256 of the compressed frame] for every frame.
+    """
+    
+    def __init__(self, path: str, chunk_size: int = ZSTD_CHUNK_SIZE, level: int = ZSTD_LEVEL,
+                 executor: Optional[ThreadPoolExecutor] = None):
+        _require_zstandard()
+        self.file = open(path, 'wb')
+        self.chunk_size = chunk_size
+        self.level = level
+        self.executor = executor
+        self.max_pending = 2 * getattr(executor, '_max_workers', 1)
+        self.buffer = bytearray()
+        self.pending = deque()
+        self.chunks = []
+        self.offset = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.file.close()
+    
+    def write(self, data) -> int:
+        self.buffer += data
+        while len(self.buffer) >= self.chunk_size:
+            self._submit(bytes(self.buffer[:self.chunk_size]))
+            del self.buffer[:self.chunk_size]
+        return len(data)
+    
+    def close(self):
+        if self.buffer:
+            self._submit(bytes(self.buffer))
+            self.buffer = bytearray()
+        while self.pending:
+            self._write_next()
+        self.file.close()
+    
+    def _submit(self, raw: bytes):
+        if self.executor is None:
+            future = Future()
+            future.set_result(_compress_chunk(raw, self.level))
+        else:
+            future = self.executor.submit(_compress_chunk, raw, self.level)
+        self.pending.append((len(raw), future))
+        # Bound memory by the number of frames in flight
+        while len(self.pending) > self.max_pending:
+            self._write_next()
+    
+    def _write_next(self):
+        raw_size, future = self.pending.popleft()
+        frame, digest = future.result()
+        self.file.write(frame)
+        self.chunks.append([self.offset, len(frame), raw_size, digest])
+        self.offset += len(frame)
+
+
+def _open_member_writer(path: str, compression: Optional[str], executor: Optional[ThreadPoolExecutor] = None):
+    """Open an archive member for binary writing with the given codec (None, "gzip" or "zstd")"""
+    if compression == 'zstd':
+        return _ChunkedZstdWriter(path, executor=executor)
+    if compression == 'gzip':
+        return gzip.open(path, 'wb', compresslevel=6)
+    return open(path, 'wb')
+
+
+def is_copy_archive(path: str) -> bool:
+    """True for a directory or tar archive written by DatabaseBackupRestore.create_copy_backup"""
+    if os.path.isdir(path):
+        return os.path.exists(os.path.join(path, COPY_MANIFEST))
+    return path.endswith('.tar') and os.path.isfile(path) and tarfile.is_tarfile(path)
+
+
+class _CopyArchiveReader:
+    """Read members of a COPY backup stored as a directory or an uncompressed tar file"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.tar = None
+    
+    def __enter__(self):
+        if not os.path.isdir(self.path):
+            self.tar = tarfile.open(self.path, 'r:')
+        return self
+    
+    def __exit__(self, *exc):
+        if self.tar is not None:
+            self.tar.close()
+    
+    def exists(self, name: str) -> bool:
+        if self.tar is None:
+            return os.path.exists(os.path.join(self.path, name))
+        try:
+            self.tar.getmember(name)
+            return True
+        except KeyError:
+            return False
+    
+    def open(self, name: str, compression: Optional[str] = None):
+        """Open a member for binary reading, decompressing it with the given codec (None, "gzip" or "zstd")"""
+        if self.tar is None:
+            raw = open(os.path.join(self.path, name), 'rb')
+        else:
+            raw = self.tar.extractfile(name)
+        if compression == 'gzip':
+            return gzip.GzipFile(fileobj=raw, mode='rb')
+        if compression == 'zstd':
+            return _require_zstandard().ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        return raw
+    
+    def read_text(self, name: str) -> str:
+        with self.open(name) as f:
+            return f.read().decode('utf-8')
+    
+    def manifest(self) -> Dict[str, Any]:
+        # Archives are packed with the manifest first, so a tar's manifest is read without scanning it
+        if self.tar is not None and self.tar.firstmember is not None and self.tar.firstmember.name == COPY_MANIFEST:
+            return json.load(self.tar.extractfile(self.tar.firstmember))
+        return json.loads(self.read_text(COPY_MANIFEST))
+
+
 class DatabaseBackupRestore:
     """Handle database backup and restore operations using psycopg2"""
     
@@ -101,6 +286,9 @@ class DatabaseBackupRestore:
                     if verbose:
                         print("   ✅ Data backup completed")
                 
+                # Indexes and constraints come after the data so restores build them once
+                self._backup_post_data(conn, file_handle, verbose)
+                
                 file_handle.write("\n-- Backup completed\n")
                 
             finally:
@@ -123,8 +311,18 @@ class DatabaseBackupRestore:
                 print(f"   Full error: {traceback.format_exc()}")
             return False
 
-    def restore_backup(self, input_file: str, force: bool = False, verbose: bool = False) -> bool:
-        """Restore a database backup with optimized performance"""
+    def restore_backup(self, input_file: str, force: bool = False, verbose: bool = False, jobs: int = 1,
+                       tables: Optional[List[str]] = None) -> bool:
+        """Restore a database backup with optimized performance
+        
+        With jobs > 1 a COPY archive is restored by _parallel_restore_copy_archive; .sql
+        backups are always restored sequentially in a single transaction. A differential
+        backup restores its base archive and then applies every diff in its chain.
+        
+        With tables, only those tables of a COPY or differential backup are replaced
+        (truncated and reloaded from their own members); the schema, indexes and every
+        other table are left as they are.
+        """
         try:
             if not os.path.exists(input_file):
                 print(f"❌ Backup file not found: {input_file}")
@@ -139,34 +337,64 @@ class DatabaseBackupRestore:
                 print(f"   Compressed: {is_compressed}")
                 print(f"   Mode: FAST RESTORE (optimized for speed)")
             
+            if tables and not is_copy_archive(input_file):
+                print("❌ Single-table restore needs a COPY or differential backup")
+                return False
+            
             if not force:
                 response = input("⚠️  This will overwrite existing data. Continue? (y/N): ")
                 if response.lower() not in ['y', 'yes']:
                     print("❌ Restore cancelled")
                     return False
             
+            # A differential backup is restored by replaying its base and every diff up to it
+            chain = self._archive_chain(input_file) if is_copy_archive(input_file) else None
+            if chain and len(chain) > 1:
+                print(f"   🔗 Replaying base {chain[0][0]} and {len(chain) - 1} differential backups")
+            
+            if tables:
+                known = {member['table'] for member in chain[0][1]['tables']}
+                unknown = [table for table in tables if table not in known]
+                if unknown:
+                    print(f"❌ Tables not in backup: {', '.join(unknown)}")
+                    return False
+            
+            restored_base = False
+            if jobs > 1 and not tables:
+                if chain:
+                    self._parallel_restore_copy_archive(chain[0][0], jobs, verbose)
+                    restored_base = True
+                else:
+                    print("   ℹ️  Parallel restore needs a COPY archive; restoring sequentially")
+            
             # Connect to database
             conn = psycopg2.connect(self.db_url)
             
             try:
+                if chain:
+                    with conn:
+                        with conn.cursor() as cursor:
+                            if not restored_base:
+                                self._restore_copy_archive(cursor, chain[0][0], verbose, tables)
+                            for diff_path, _ in chain[1:]:
+                                self._apply_diff_archive(cursor, diff_path, verbose, tables)
+                    print("🎉 Restore completed successfully!")
+                    return True
+                
                 # Use a transaction for better performance and atomicity
                 with conn:
                     with conn.cursor() as cursor:
-                        # Read backup file
+                        # Stream backup file
                         if verbose:
-                            print("   📖 Reading backup file...")
+                            print("   📖 Streaming backup file...")
                         if is_compressed:
                             file_handle = gzip.open(input_file, 'rt', encoding='utf-8')
                         else:
                             file_handle = open(input_file, 'r', encoding='utf-8')
                         
                         try:
-                            content = file_handle.read()
-                            if verbose:
-                                print(f"   📄 Processing backup content ({len(content)} characters)")
-                            
-                            # Parse and execute backup with optimizations
-                            self._restore_from_content(cursor, content, verbose)
+                            # Parse and execute the backup while streaming it, one line at a time
+                            self._restore_from_lines(cursor, file_handle, verbose)
                             
                         finally:
                             file_handle.close()
@@ -187,6 +415,622 @@ class DatabaseBackupRestore:
                 print(f"   Full error: {traceback.format_exc()}")
             return False
 
+    def create_copy_backup(self, output_path: str, jobs: int = 4, compress: bool = False, schema_only: bool = False,
+                           copy_format: str = "binary", verbose: bool = False, compression: str = "gzip") -> bool:
+        """Create a COPY-based backup archive, dumping tables in parallel from one consistent snapshot
+        
+        The archive holds schema.sql (same statements as a .sql backup), one COPY member per
+        table under data/, post_data.sql (secondary indexes and constraints), sequences.sql
+        and a manifest.json. Full backups also store a fingerprint per row under
+        fingerprints/ so they can serve as the base of create_diff_backup. output_path ending in .tar
+        produces a tar file; anything else is written as a directory. Each table is dumped
+        with COPY ... TO STDOUT by one of `jobs` worker connections that all import the
+        snapshot exported by the coordinating connection, so the tables are mutually consistent.
+        
+        With compress, members are gzip files, or with compression="zstd" streams of
+        independent zstd frames of at most ZSTD_CHUNK_SIZE input bytes. zstd frames are
+        compressed on `jobs` threads and the manifest records each frame's offset, sizes
+        and sha256, which verify_backup checks without decompressing anything.
+        """
+        if copy_format not in COPY_FORMATS:
+            print(f"❌ Unsupported COPY format: {copy_format}")
+            return False
+        if compression not in COPY_COMPRESSIONS:
+            print(f"❌ Unsupported compression: {compression}")
+            return False
+        if compress and compression == 'zstd':
+            try:
+                _require_zstandard()
+            except ImportError as e:
+                print(f"❌ {e}")
+                return False
+        
+        as_tar = output_path.endswith('.tar')
+        archive_dir = output_path + '.partial' if as_tar else output_path
+        
+        try:
+            print(f"🔄 Creating COPY backup: {output_path}")
+            if verbose:
+                print(f"   Database: {self.parsed_url.hostname}")
+                print(f"   Workers: {jobs}")
+                print(f"   COPY format: {copy_format}")
+                print(f"   Compressed members: {compression if compress else False}")
+            
+            if os.path.exists(archive_dir) and os.listdir(archive_dir):
+                print(f"❌ Output directory is not empty: {archive_dir}")
+                return False
+            os.makedirs(os.path.join(archive_dir, 'data'), exist_ok=True)
+            
+            # The coordinating transaction must stay open until every worker has imported its snapshot
+            conn = psycopg2.connect(self.db_url)
+            conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT pg_export_snapshot();")
+                    snapshot_id = cursor.fetchone()[0]
+                    tables = self._list_tables(cursor)
+                    table_columns = {table: self._table_columns(cursor, table) for table in tables}
+                    key_columns = {table: self._table_key_columns(cursor, table) for table in tables}
+                    # Largest tables first so the slowest dump starts immediately
+                    cursor.execute("""
+                        SELECT c.relname, pg_total_relation_size(c.oid)
+                        FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+                        WHERE n.nspname = 'public' AND c.relkind = 'r';
+                    """)
+                    table_sizes = dict(cursor.fetchall())
+                
+                # Schema discovery falls back between catalog queries on errors, which would abort
+                # the snapshot transaction, so it runs on its own autocommit connection
+                schema_conn = psycopg2.connect(self.db_url)
+                schema_conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                try:
+                    with open(os.path.join(archive_dir, 'schema.sql'), 'w', encoding='utf-8') as f:
+                        self._backup_schema(schema_conn, f, verbose)
+                    with open(os.path.join(archive_dir, 'post_data.sql'), 'w', encoding='utf-8') as f:
+                        self._backup_post_data(schema_conn, f, verbose)
+                finally:
+                    schema_conn.close()
+                
+                members = []
+                if not schema_only:
+                    member_compression = compression if compress else None
+                    suffix = COPY_COMPRESSIONS[compression] if compress else ''
+                    extension = COPY_FORMATS[copy_format] + suffix
+                    fingerprint_extension = '.tsv' + suffix
+                    os.makedirs(os.path.join(archive_dir, 'fingerprints'), exist_ok=True)
+                    ordered = sorted(tables, key=lambda t: table_sizes.get(t, 0), reverse=True)
+                    # zstd chunks are compressed on their own pool so dump workers keep reading COPY output
+                    compressors = ThreadPoolExecutor(max_workers=max(1, jobs)) if member_compression == 'zstd' else None
+                    try:
+                        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+                            futures = {
+                                table: executor.submit(
+                                    self._dump_table_copy, snapshot_id, table, table_columns[table],
+                                    os.path.join(archive_dir, 'data', table + extension), copy_format, member_compression,
+                                    key_columns[table], os.path.join(archive_dir, 'fingerprints', table + fingerprint_extension),
+                                    compressors
+                                )
+                                for table in ordered if table_columns[table]
+                            }
+                            for table in tables:
+                                if table not in futures:
+                                    continue
+                                rows, chunks, fingerprint_chunks = futures[table].result()
+                                member = {
+                                    'table': table,
+                                    'columns': table_columns[table],
+                                    'key_columns': key_columns[table],
+                                    'file': f"data/{table}{extension}",
+                                    'fingerprints': f"fingerprints/{table}{fingerprint_extension}",
+                                    'rows': rows
+                                }
+                                if chunks is not None:
+                                    member['chunks'] = chunks
+                                    member['fingerprint_chunks'] = fingerprint_chunks
+                                members.append(member)
+                                if verbose:
+                                    print(f"   💾 {table}: {rows:,} rows")
+                    finally:
+                        if compressors is not None:
+                            compressors.shutdown()
+                    
+                    with open(os.path.join(archive_dir, 'sequences.sql'), 'w', encoding='utf-8') as f:
+                        self._backup_sequence_values(conn, f, tables, verbose)
+                
+                manifest = {
+                    'format': COPY_ARCHIVE_FORMAT,
+                    'version': 1,
+                    'backup_id': uuid.uuid4().hex,
+                    'created_at': datetime.datetime.now().isoformat(),
+                    'database_host': self.parsed_url.hostname,
+                    'schema_only': schema_only,
+                    'copy_format': copy_format,
+                    'compressed': compress,
+                    'compression': compression if compress else None,
+                    'fingerprints': not schema_only,
+                    'tables': members
+                }
+                with open(os.path.join(archive_dir, COPY_MANIFEST), 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f, indent=2)
+            finally:
+                conn.rollback()
+                conn.close()
+            
+            if as_tar:
+                self._pack_archive(archive_dir, output_path)
+            
+            total_rows = sum(member['rows'] for member in members)
+            print(f"✅ Backup completed: {total_rows:,} rows from {len(members)} tables, {self._path_size(output_path):,} bytes")
+            
+            self._create_backup_metadata(output_path, schema_only, compress, backup_method='copy')
+            return True
+            
+        except Exception as e:
+            print(f"❌ Backup failed: {e}")
+            if verbose:
+                import traceback
+                print(f"   Full error: {traceback.format_exc()}")
+            return False
+
+    def _dump_table_copy(self, snapshot_id: str, table: str, columns: List[str], path: str,
+                         copy_format: str, compression: Optional[str], key_columns: Optional[List[str]] = None,
+                         fingerprint_path: Optional[str] = None,
+                         compressors: Optional[ThreadPoolExecutor] = None) -> Tuple[int, Optional[list], Optional[list]]:
+        """Dump one table with COPY TO STDOUT on its own connection inside the shared snapshot
+        
+        With fingerprint_path the row fingerprints (see create_diff_backup) are written from
+        the same snapshot.
+        
+        Returns:
+            Row count and, for zstd members, the chunk index of the data and fingerprint files
+        """
+        conn = psycopg2.connect(self.db_url)
+        try:
+            conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+            with conn.cursor() as cursor:
+                cursor.execute("SET TRANSACTION SNAPSHOT %s;", (snapshot_id,))
+                # Fingerprints hash the text form of each row, which must not depend on the session time zone
+                cursor.execute("SET LOCAL TimeZone = 'UTC';")
+                columns_str = ', '.join(f'"{col}"' for col in columns)
+                copy_sql = f'COPY public."{table}" ({columns_str}) TO STDOUT WITH (FORMAT {copy_format})'
+                with _open_member_writer(path, compression, compressors) as f:
+                    cursor.copy_expert(copy_sql, f)
+                rows = cursor.rowcount
+                chunks = getattr(f, 'chunks', None)
+                fingerprint_chunks = None
+                if fingerprint_path:
+                    fingerprint_sql = (f'COPY (SELECT {self._row_key_sql(key_columns)}, {ROW_FINGERPRINT_SQL} '
+                                       f'FROM public."{table}" t) TO STDOUT')
+                    with _open_member_writer(fingerprint_path, compression, compressors) as f:
+                        cursor.copy_expert(fingerprint_sql, f)
+                    fingerprint_chunks = getattr(f, 'chunks', None)
+                return rows, chunks, fingerprint_chunks
+        finally:
+            conn.rollback()
+            conn.close()
+
+    def create_diff_backup(self, output_path: str, parent_path: str, compress: bool = False, verbose: bool = False) -> bool:
+        """Create a differential backup holding only the rows that changed since parent_path
+        
+        parent_path is a full COPY archive (the base) or an earlier differential backup, so
+        backups form a chain base -> diff -> diff that must stay in one directory. Rows are
+        matched by primary key and compared by a fingerprint of the whole row rather than by
+        updated_at/modified_at: several tables have no such column and some updates clear it.
+        Rows that disappeared are recorded as tombstones. The archive holds data/ (new and
+        changed rows as binary COPY), changes/ (key and fingerprint of every changed row, no
+        fingerprint for deleted rows), sequences.sql and a manifest.json naming its parent.
+        Restoring the newest diff with restore_backup replays the whole chain.
+        """
+        as_tar = output_path.endswith('.tar')
+        archive_dir = output_path + '.partial' if as_tar else output_path
+        
+        try:
+            chain = self._archive_chain(parent_path)
+            base_path, base_manifest = chain[0]
+            if not base_manifest.get('fingerprints'):
+                print(f"❌ {base_path} has no row fingerprints; create a new COPY backup to start a differential chain")
+                return False
+            
+            print(f"🔄 Creating differential backup: {output_path}")
+            if verbose:
+                print(f"   Database: {self.parsed_url.hostname}")
+                print(f"   Parent: {parent_path} ({len(chain) - 1} diffs after base {base_path})")
+            
+            if os.path.exists(archive_dir) and os.listdir(archive_dir):
+                print(f"❌ Output directory is not empty: {archive_dir}")
+                return False
+            os.makedirs(os.path.join(archive_dir, 'data'), exist_ok=True)
+            os.makedirs(os.path.join(archive_dir, 'changes'), exist_ok=True)
+            extension = '.gz' if compress else ''
+            
+            members = []
+            conn = psycopg2.connect(self.db_url)
+            conn.set_session(isolation_level='REPEATABLE READ')
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("SET LOCAL TimeZone = 'UTC';")
+                    cursor.execute("CREATE TEMP TABLE _fingerprints (k text PRIMARY KEY, fp text) ON COMMIT DROP;")
+                    cursor.execute("CREATE TEMP TABLE _changes (k text, fp text) ON COMMIT DROP;")
+                    tables = self._list_tables(cursor)
+                    for table in tables:
+                        columns = self._table_columns(cursor, table)
+                        if not columns:
+                            continue
+                        key_columns = self._table_key_columns(cursor, table)
+                        key_sql = self._row_key_sql(key_columns)
+                        self._load_chain_fingerprints(cursor, chain, table)
+                        
+                        cursor.execute("TRUNCATE _changes;")
+                        cursor.execute(f"""
+                            INSERT INTO _changes
+                            SELECT cur.k, cur.fp
+                            FROM (SELECT {key_sql} AS k, {ROW_FINGERPRINT_SQL} AS fp FROM public."{table}" t) cur
+                            LEFT JOIN _fingerprints f ON f.k = cur.k
+                            WHERE f.fp IS DISTINCT FROM cur.fp
+                            UNION ALL
+                            SELECT f.k, NULL
+                            FROM _fingerprints f
+                            WHERE NOT EXISTS (SELECT 1 FROM public."{table}" t WHERE {key_sql} = f.k);
+                        """)
+                        if cursor.rowcount == 0:
+                            continue
+                        
+                        changes_file = f"changes/{table}.tsv{extension}"
+                        with _open_member_writer(os.path.join(archive_dir, changes_file), 'gzip' if compress else None) as f:
+                            cursor.copy_expert("COPY _changes (k, fp) TO STDOUT", f)
+                        changed = cursor.rowcount
+                        
+                        data_file = f"data/{table}.copy{extension}"
+                        columns_str = ', '.join(f't."{col}"' for col in columns)
+                        with _open_member_writer(os.path.join(archive_dir, data_file), 'gzip' if compress else None) as f:
+                            cursor.copy_expert(
+                                f'COPY (SELECT {columns_str} FROM public."{table}" t JOIN _changes c '
+                                f'ON c.k = {key_sql} WHERE c.fp IS NOT NULL) TO STDOUT WITH (FORMAT binary)', f
+                            )
+                        rows = cursor.rowcount
+                        
+                        members.append({
+                            'table': table,
+                            'columns': columns,
+                            'key_columns': key_columns,
+                            'file': data_file,
+                            'changes': changes_file,
+                            'rows': rows,
+                            'deleted': changed - rows
+                        })
+                        if verbose:
+                            print(f"   💾 {table}: {rows:,} new or changed rows, {changed - rows:,} deleted")
+                
+                with open(os.path.join(archive_dir, 'sequences.sql'), 'w', encoding='utf-8') as f:
+                    self._backup_sequence_values(conn, f, tables, verbose)
+                
+                manifest = {
+                    'format': DIFF_ARCHIVE_FORMAT,
+                    'version': 1,
+                    'backup_id': uuid.uuid4().hex,
+                    'parent': os.path.basename(parent_path.rstrip(os.sep)),
+                    'parent_id': chain[-1][1]['backup_id'],
+                    'base_id': base_manifest['backup_id'],
+                    'chain_length': len(chain),
+                    'created_at': datetime.datetime.now().isoformat(),
+                    'database_host': self.parsed_url.hostname,
+                    'copy_format': 'binary',
+                    'compressed': compress,
+                    'tables': members
+                }
+                with open(os.path.join(archive_dir, COPY_MANIFEST), 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f, indent=2)
+            finally:
+                conn.rollback()
+                conn.close()
+            
+            if as_tar:
+                self._pack_archive(archive_dir, output_path)
+            
+            total_rows = sum(member['rows'] for member in members)
+            total_deleted = sum(member['deleted'] for member in members)
+            print(f"✅ Differential backup completed: {total_rows:,} new or changed rows, {total_deleted:,} deleted "
+                  f"in {len(members)} tables, {self._path_size(output_path):,} bytes")
+            
+            self._create_backup_metadata(output_path, False, compress, backup_method='diff', parent=manifest['parent'])
+            return True
+            
+        except Exception as e:
+            print(f"❌ Differential backup failed: {e}")
+            if verbose:
+                import traceback
+                print(f"   Full error: {traceback.format_exc()}")
+            return False
+
+    def _archive_chain(self, path: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Follow parent links from a COPY or differential backup back to its base
+        
+        Returns:
+            (path, manifest) pairs from the base archive to path
+            
+        Raises:
+            ValueError: If an archive is not a COPY/differential backup or a parent is missing
+        """
+        chain = []
+        expected_id = None
+        while True:
+            if not is_copy_archive(path):
+                raise ValueError(f"Not a COPY or differential backup: {path}")
+            with _CopyArchiveReader(path) as archive:
+                manifest = archive.manifest()
+            if expected_id is not None and manifest.get('backup_id') != expected_id:
+                raise ValueError(f"{path} is not the parent recorded in {chain[-1][0]}")
+            chain.append((path, manifest))
+            if manifest.get('format') == COPY_ARCHIVE_FORMAT:
+                break
+            if manifest.get('format') != DIFF_ARCHIVE_FORMAT:
+                raise ValueError(f"Not a COPY or differential backup: {path}")
+            expected_id = manifest['parent_id']
+            path = os.path.join(os.path.dirname(path.rstrip(os.sep)), manifest['parent'])
+            if not os.path.exists(path):
+                raise ValueError(f"Parent backup not found: {path}")
+        chain.reverse()
+        return chain
+
+    def _load_chain_fingerprints(self, cursor, chain: List[Tuple[str, Dict[str, Any]]], table: str):
+        """Fill the _fingerprints temp table with a table's row fingerprints as of the last archive in chain"""
+        cursor.execute("TRUNCATE _fingerprints;")
+        for path, manifest in chain:
+            member = next((m for m in manifest['tables'] if m['table'] == table), None)
+            if member is None:
+                continue
+            with _CopyArchiveReader(path) as archive:
+                if manifest['format'] == COPY_ARCHIVE_FORMAT:
+                    with archive.open(member['fingerprints'], _archive_compression(manifest)) as f:
+                        cursor.copy_expert("COPY _fingerprints (k, fp) FROM STDIN", f)
+                    continue
+                cursor.execute("TRUNCATE _changes;")
+                with archive.open(member['changes'], _archive_compression(manifest)) as f:
+                    cursor.copy_expert("COPY _changes (k, fp) FROM STDIN", f)
+            cursor.execute("DELETE FROM _fingerprints f USING _changes c WHERE f.k = c.k;")
+            cursor.execute("INSERT INTO _fingerprints SELECT k, fp FROM _changes WHERE fp IS NOT NULL;")
+
+    def _apply_diff_archive(self, cursor, path: str, verbose: bool = False, tables: Optional[List[str]] = None):
+        """Apply a differential backup: delete every changed or tombstoned row, then COPY in the new versions"""
+        with _CopyArchiveReader(path) as archive:
+            manifest = archive.manifest()
+            if manifest.get('format') != DIFF_ARCHIVE_FORMAT:
+                raise ValueError(f"Not a differential backup: {path}")
+            
+            if verbose:
+                print(f"   🔗 Applying differential backup {path}")
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS _changes (k text, fp text) ON COMMIT DROP;")
+            for member in manifest['tables']:
+                table = member['table']
+                if tables and table not in tables:
+                    continue
+                cursor.execute("TRUNCATE _changes;")
+                with archive.open(member['changes'], _archive_compression(manifest)) as f:
+                    cursor.copy_expert("COPY _changes (k, fp) FROM STDIN", f)
+                cursor.execute(f'DELETE FROM public."{table}" t USING _changes c '
+                               f'WHERE c.k = {self._row_key_sql(member["key_columns"])};')
+                if member['rows']:
+                    with archive.open(member['file'], _archive_compression(manifest)) as data:
+                        cursor.copy_expert(self._copy_from_sql(member, manifest['copy_format']), data)
+                if verbose:
+                    print(f"   💾 {table}: {member['rows']:,} rows replaced or added, {member['deleted']:,} deleted")
+            
+            if archive.exists('sequences.sql'):
+                self._restore_from_content(cursor, self._sequence_updates(archive.read_text('sequences.sql'), tables), verbose)
+
+    def _restore_copy_archive(self, cursor, input_path: str, verbose: bool = False, tables: Optional[List[str]] = None):
+        """Restore a directory or tar archive written by create_copy_backup
+        
+        With tables, only those tables are truncated and reloaded; schema.sql and
+        post_data.sql are skipped and only the tables' own sequences are updated.
+        """
+        with _CopyArchiveReader(input_path) as archive:
+            manifest = archive.manifest()
+            if manifest.get('format') != COPY_ARCHIVE_FORMAT:
+                raise ValueError(f"Not a COPY backup archive: {input_path}")
+            
+            members = manifest['tables']
+            if tables:
+                members = [member for member in members if member['table'] in tables]
+                cursor.execute("TRUNCATE " + ", ".join(f'public."{member["table"]}"' for member in members) + ";")
+            else:
+                # Schema statements are parsed exactly like a .sql backup
+                self._restore_from_content(cursor, archive.read_text('schema.sql'), verbose)
+            
+            copy_format = manifest['copy_format']
+            total_rows = sum(member['rows'] for member in members)
+            print(f"   📊 Restoring {total_rows:,} rows to {len(members)} tables")
+            for member in members:
+                if verbose:
+                    print(f"   💾 COPY {member['rows']:,} rows into {member['table']}")
+                with archive.open(member['file'], _archive_compression(manifest)) as data:
+                    cursor.copy_expert(self._copy_from_sql(member, copy_format), data)
+            
+            if archive.exists('post_data.sql') and not tables:
+                self._restore_from_content(cursor, archive.read_text('post_data.sql'), verbose)
+            
+            if archive.exists('sequences.sql'):
+                self._restore_from_content(cursor, self._sequence_updates(archive.read_text('sequences.sql'), tables), verbose)
+
+    @staticmethod
+    def _sequence_updates(sequences_sql: str, tables: Optional[List[str]] = None) -> str:
+        """Keep only the setval statements of the given tables' id sequences (all of them without tables)"""
+        if not tables:
+            return sequences_sql
+        return "\n".join(line for line in sequences_sql.splitlines()
+                         if any(f'"{table}_id_seq"' in line for table in tables))
+
+    def _parallel_restore_copy_archive(self, input_path: str, jobs: int, verbose: bool = False) -> Dict[str, float]:
+        """Restore a COPY archive over `jobs` connections, deferring indexes and constraints
+        
+        Phases: schema (tables with primary keys only), data (one COPY per table, tables
+        loaded concurrently, largest first), indexes (secondary indexes, unique and check
+        constraints, built concurrently), foreign keys (added one at a time, since each one
+        locks two tables) and sequences. Unlike the single-transaction restore every phase
+        and every table commits on its own, so a failed restore leaves the database
+        partially restored.
+        
+        Returns:
+            Seconds spent in each phase
+        """
+        timings = {}
+        
+        def finish_phase(phase: str, started: float):
+            timings[phase] = time.perf_counter() - started
+            print(f"   ⏱️  {phase}: {timings[phase]:.2f}s")
+        
+        with _CopyArchiveReader(input_path) as archive:
+            manifest = archive.manifest()
+            if manifest.get('format') != COPY_ARCHIVE_FORMAT:
+                raise ValueError(f"Not a COPY backup archive: {input_path}")
+            schema_sql = archive.read_text('schema.sql')
+            post_data_sql = archive.read_text('post_data.sql') if archive.exists('post_data.sql') else ""
+            sequences_sql = archive.read_text('sequences.sql') if archive.exists('sequences.sql') else ""
+        
+        post_data = [line for line in post_data_sql.splitlines() if line.strip() and not line.startswith('--')]
+        foreign_keys = [sql for sql in post_data if ' FOREIGN KEY ' in sql]
+        indexes = [sql for sql in post_data if ' FOREIGN KEY ' not in sql]
+        if not post_data_sql:
+            print("   ⚠️  Archive has no post_data.sql; secondary indexes and constraints will not be restored")
+        
+        members = sorted(manifest['tables'], key=lambda member: member['rows'], reverse=True)
+        total_rows = sum(member['rows'] for member in members)
+        print(f"   📊 Restoring {total_rows:,} rows to {len(members)} tables with {jobs} workers")
+        
+        started = time.perf_counter()
+        conn = psycopg2.connect(self.db_url)
+        try:
+            with conn:
+                with conn.cursor() as cursor:
+                    self._restore_from_content(cursor, schema_sql, verbose)
+        finally:
+            conn.close()
+        finish_phase('schema', started)
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(self._load_table_copy, input_path, member, manifest['copy_format'], _archive_compression(manifest))
+                for member in members
+            ]
+            for member, future in zip(members, futures):
+                future.result()
+                if verbose:
+                    print(f"   💾 COPY {member['rows']:,} rows into {member['table']}")
+        finish_phase('data', started)
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for future in [executor.submit(self._execute_autocommit, [sql]) for sql in indexes]:
+                future.result()
+        if verbose:
+            print(f"   📝 Built {len(indexes)} indexes and constraints")
+        finish_phase('indexes', started)
+        
+        started = time.perf_counter()
+        self._execute_autocommit(foreign_keys)
+        if verbose:
+            print(f"   📝 Added {len(foreign_keys)} foreign keys")
+        finish_phase('foreign keys', started)
+        
+        started = time.perf_counter()
+        if sequences_sql:
+            conn = psycopg2.connect(self.db_url)
+            try:
+                with conn:
+                    with conn.cursor() as cursor:
+                        self._restore_from_content(cursor, sequences_sql, verbose)
+            finally:
+                conn.close()
+        finish_phase('sequences', started)
+        
+        print(f"   ⏱️  total: {sum(timings.values()):.2f}s")
+        return timings
+
+    def _load_table_copy(self, input_path: str, member: Dict[str, Any], copy_format: str, compression: Optional[str]) -> int:
+        """Load one archive member with COPY FROM STDIN on its own connection and commit it"""
+        conn = psycopg2.connect(self.db_url)
+        try:
+            with conn:
+                with conn.cursor() as cursor:
+                    # The restore is rerun from scratch after a crash, so commits need not wait for the WAL flush
+                    cursor.execute("SET LOCAL synchronous_commit = off;")
+                    with _CopyArchiveReader(input_path) as archive:
+                        with archive.open(member['file'], compression) as data:
+                            cursor.copy_expert(self._copy_from_sql(member, copy_format), data)
+            return member['rows']
+        finally:
+            conn.close()
+
+    def _execute_autocommit(self, statements: List[str]):
+        """Run statements one after another on a fresh autocommit connection"""
+        conn = psycopg2.connect(self.db_url)
+        try:
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _copy_from_sql(member: Dict[str, Any], copy_format: str) -> str:
+        columns_str = ', '.join(f'"{col}"' for col in member['columns'])
+        return f'COPY public."{member["table"]}" ({columns_str}) FROM STDIN WITH (FORMAT {copy_format})'
+
+    def _table_key_columns(self, cursor, table: str) -> List[str]:
+        cursor.execute("""
+            SELECT a.attname
+            FROM pg_index i
+            JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+            WHERE i.indrelid = %s::regclass AND i.indisprimary
+            ORDER BY array_position(i.indkey::int2[], a.attnum);
+        """, (f'public."{table}"',))
+        return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def _row_key_sql(key_columns: Optional[List[str]]) -> str:
+        """SQL text key of a row aliased as t: its primary key as a JSON array, or the row fingerprint without one"""
+        if not key_columns:
+            return ROW_FINGERPRINT_SQL
+        return "json_build_array(" + ", ".join(f't."{col}"' for col in key_columns) + ")::text"
+
+    @staticmethod
+    def _pack_archive(archive_dir: str, output_path: str):
+        """Pack an archive directory into an uncompressed tar file and remove the directory"""
+        with tarfile.open(output_path, 'w') as tar:
+            # Manifest first so readers can plan the restore before reaching the data
+            tar.add(os.path.join(archive_dir, COPY_MANIFEST), arcname=COPY_MANIFEST)
+            for name in sorted(os.listdir(archive_dir)):
+                if name != COPY_MANIFEST:
+                    tar.add(os.path.join(archive_dir, name), arcname=name)
+        shutil.rmtree(archive_dir)
+
+    def _list_tables(self, cursor) -> List[str]:
+        cursor.execute("""
+            SELECT table_name 
+            FROM information_schema.tables 
+            WHERE table_schema = 'public' 
+            AND table_type = 'BASE TABLE'
+            ORDER BY table_name;
+        """)
+        return [row[0] for row in cursor.fetchall()]
+
+    def _table_columns(self, cursor, table: str) -> List[str]:
+        cursor.execute("""
+            SELECT column_name 
+            FROM information_schema.columns 
+            WHERE table_schema = 'public' AND table_name = %s
+            ORDER BY ordinal_position;
+        """, (table,))
+        return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def _path_size(path: str) -> int:
+        if os.path.isdir(path):
+            return sum(f.stat().st_size for f in Path(path).rglob('*') if f.is_file())
+        return os.path.getsize(path)
+
     def _backup_schema(self, conn, file_handle, verbose: bool = False):
         """Backup database schema"""
         with conn.cursor() as cursor:
@@ -390,6 +1234,51 @@ class DatabaseBackupRestore:
                 if verbose:
                     print(f"   ⚠️  Warning: Could not prepare sequence updates: {e}")
 
+    def _backup_post_data(self, conn, file_handle, verbose: bool = False):
+        """Backup secondary indexes and non-primary-key constraints, one statement per line
+        
+        Foreign keys are written last so every index they rely on already exists.
+        """
+        file_handle.write("-- Secondary indexes and constraints\n")
+        with conn.cursor() as cursor:
+            try:
+                cursor.execute("""
+                    SELECT pg_get_indexdef(i.indexrelid)
+                    FROM pg_index i
+                    JOIN pg_class t ON t.oid = i.indrelid
+                    JOIN pg_class ic ON ic.oid = i.indexrelid
+                    JOIN pg_namespace n ON n.oid = t.relnamespace
+                    WHERE n.nspname = 'public' AND t.relkind = 'r'
+                    AND NOT EXISTS (
+                        SELECT 1 FROM pg_constraint c
+                        WHERE c.conindid = i.indexrelid AND c.contype IN ('p', 'u', 'x')
+                    )
+                    ORDER BY t.relname, ic.relname;
+                """)
+                indexes = [row[0] for row in cursor.fetchall()]
+                
+                cursor.execute("""
+                    SELECT format('ALTER TABLE ONLY %s ADD CONSTRAINT %I %s', c.conrelid::regclass, c.conname,
+                                  pg_get_constraintdef(c.oid))
+                    FROM pg_constraint c
+                    JOIN pg_class t ON t.oid = c.conrelid
+                    JOIN pg_namespace n ON n.oid = t.relnamespace
+                    WHERE n.nspname = 'public' AND t.relkind = 'r' AND c.contype IN ('u', 'x', 'c', 'f')
+                    ORDER BY c.contype = 'f', t.relname, c.conname;
+                """)
+                constraints = [row[0] for row in cursor.fetchall()]
+                
+                for sql in indexes + constraints:
+                    file_handle.write(" ".join(sql.split()) + ";\n")
+                file_handle.write("\n")
+                if verbose:
+                    print(f"   📝 Found {len(indexes)} secondary indexes and {len(constraints)} constraints")
+                    
+            except Exception as e:
+                if verbose:
+                    print(f"   ⚠️  Warning: Could not backup indexes and constraints: {e}")
+                file_handle.write("-- Could not backup indexes and constraints\n\n")
+
     def _backup_data(self, conn, file_handle, verbose: bool = False):
         """Backup table data using JSON format for safety"""
         # First get tables with regular cursor
@@ -506,6 +1395,10 @@ class DatabaseBackupRestore:
         if not verbose:
             print(f"   📊 Backed up {total_rows:,} rows from {tables_with_data} tables")
         
+        self._backup_sequence_values(conn, file_handle, tables, verbose)
+
+    def _backup_sequence_values(self, conn, file_handle, tables: List[str], verbose: bool = False):
+        """Write setval statements that move each table's id sequence past its current maximum"""
         # Add sequence value updates at the end
         file_handle.write("-- Update sequence values to current maximums\n")
         with conn.cursor() as cursor:
@@ -541,17 +1434,55 @@ class DatabaseBackupRestore:
                     print(f"   ⚠️  Warning: Could not update sequence values: {e}")
 
     def _restore_from_content(self, cursor, content: str, verbose: bool = False):
-        """Restore from backup content with optimized bulk inserts"""
-        lines = content.split('\n')
+        """Restore from in-memory backup content (see _restore_from_lines)"""
+        self._restore_from_lines(cursor, io.StringIO(content), verbose)
+
+    def _restore_from_lines(self, cursor, lines: Iterable[str], verbose: bool = False,
+                            batch_size: int = RESTORE_BATCH_SIZE):
+        """Stream-restore a .sql backup from an iterable of lines (e.g. an open, possibly gzip, file)
         
-        schema_statements = []
-        data_sections = []
+        Statements run as soon as they are complete and data rows are loaded in batches of
+        batch_size, so memory use does not depend on the size of the backup. Sequence updates
+        are deferred until all data has been loaded.
+        """
+        sequence_updates = []
         current_table = None
         current_columns = []
         current_rows = []
         current_sql = ""
+        schema_statements = 0
+        schema_errors = 0
+        tables_restored = 0
+        total_rows_restored = 0
         
-        # Parse content
+        def execute_statement(sql: str):
+            nonlocal schema_statements, schema_errors
+            if not sql.strip():
+                return
+            if 'setval(' in sql.lower():
+                sequence_updates.append(sql)
+                return
+            schema_statements += 1
+            try:
+                cursor.execute(sql)
+            except Exception as e:
+                schema_errors += 1
+                if verbose:
+                    error_msg = str(e).replace('\n', ' ')[:100]
+                    print(f"   ⚠️  Schema error #{schema_errors}: {error_msg}...")
+                    
+                    # For debugging, show the problematic SQL
+                    if schema_errors <= 3:  # Only show first few errors
+                        print(f"        SQL: {sql[:200]}...")
+        
+        def flush_rows():
+            nonlocal current_rows, total_rows_restored
+            if current_table and current_columns and current_rows:
+                self._restore_rows(cursor, current_table, current_columns, current_rows, verbose)
+                total_rows_restored += len(current_rows)
+            current_rows = []
+        
+        # Parse and execute line by line
         for line_num, line in enumerate(lines, 1):
             line = line.strip()
             
@@ -559,9 +1490,9 @@ class DatabaseBackupRestore:
                 continue
             
             if line.startswith('--'):
-                # If we have a pending SQL statement, save it
+                # If we have a pending SQL statement, run it
                 if current_sql.strip():
-                    schema_statements.append(current_sql.strip())
+                    execute_statement(current_sql.strip())
                     current_sql = ""
                 
                 if line.startswith('-- DATA_START:'):
@@ -582,13 +1513,12 @@ class DatabaseBackupRestore:
                     except Exception as e:
                         if verbose:
                             print(f"   ⚠️  Error parsing row on line {line_num}: {e}")
+                    if len(current_rows) >= batch_size:
+                        flush_rows()
                 elif line.startswith('-- DATA_END:'):
                     if current_table and current_columns:
-                        data_sections.append({
-                            'table': current_table,
-                            'columns': current_columns,
-                            'rows': current_rows
-                        })
+                        flush_rows()
+                        tables_restored += 1
                     current_table = None
                     current_columns = []
                     current_rows = []
@@ -602,80 +1532,22 @@ class DatabaseBackupRestore:
                 
                 # If statement ends with semicolon, it's complete
                 if line.endswith(';'):
-                    schema_statements.append(current_sql[:-1])  # Remove semicolon
+                    execute_statement(current_sql[:-1])  # Remove semicolon
                     current_sql = ""
         
         # Don't forget the last statement if it doesn't end with semicolon
         if current_sql.strip():
-            schema_statements.append(current_sql.strip())
+            execute_statement(current_sql.strip())
         
-        # Separate sequence updates from regular schema statements
-        sequence_updates = []
-        regular_schema = []
+        if current_table is not None:
+            print(f"   ⚠️  Backup ended inside the data section of {current_table}; its last {len(current_rows)} rows were skipped")
         
-        for stmt in schema_statements:
-            if 'setval(' in stmt.lower():
-                sequence_updates.append(stmt)
-            else:
-                regular_schema.append(stmt)
-        
-        # Execute regular schema statements first
         if verbose:
-            print(f"   📝 Executing {len(regular_schema)} schema statements")
-        schema_errors = 0
-        
-        for i, sql in enumerate(regular_schema):
-            if not sql.strip():
-                continue
-            
-            try:
-                cursor.execute(sql)
-            except Exception as e:
-                schema_errors += 1
-                if verbose:
-                    error_msg = str(e).replace('\n', ' ')[:100]
-                    print(f"   ⚠️  Schema error #{schema_errors}: {error_msg}...")
-                    
-                    # For debugging, show the problematic SQL
-                    if schema_errors <= 3:  # Only show first few errors
-                        print(f"        SQL: {sql[:200]}...")
-        
+            print(f"   📝 Executed {schema_statements} schema statements")
         if schema_errors > 0 and verbose:
             print(f"   ⚠️  Had {schema_errors} schema errors (this may be normal)")
-        
-        # Execute data inserts with FAST bulk loading
-        total_rows_restored = sum(len(section['rows']) for section in data_sections)
-        if verbose:
-            print(f"   📊 Restoring data for {len(data_sections)} tables (FAST MODE)")
-        else:
-            print(f"   📊 Restoring {total_rows_restored:,} rows to {len(data_sections)} tables")
-        
-        for section in data_sections:
-            table = section['table']
-            columns = section['columns']
-            rows = section['rows']
-            
-            if not rows:
-                if verbose:
-                    print(f"   📋 No data for table {table}")
-                continue
-            
-            if verbose:
-                print(f"   💾 FAST restoring {len(rows)} rows to {table}")
-            
-            try:
-                # Method 1: Try COPY FROM (fastest possible)
-                if self._try_copy_from_restore(cursor, table, columns, rows, verbose):
-                    if verbose:
-                        print(f"     ⚡ Used COPY FROM - maximum speed!")
-                    continue
-                    
-                # Method 2: Fallback to batch inserts (still much faster than individual)
-                self._batch_insert_restore(cursor, table, columns, rows, verbose)
-                    
-            except Exception as e:
-                if verbose:
-                    print(f"   ❌ Failed to restore {table}: {e}")
+        if tables_restored:
+            print(f"   📊 Restored {total_rows_restored:,} rows to {tables_restored} tables")
         
         # Finally, execute sequence updates
         if sequence_updates:
@@ -698,6 +1570,28 @@ class DatabaseBackupRestore:
             elif verbose:
                 print(f"   ⚠️  {seq_errors} sequence update errors")
 
+    def _restore_rows(self, cursor, table: str, columns: List[str], rows: List[dict], verbose: bool = False):
+        """Load one batch of rows, preferring COPY FROM and falling back to batch inserts"""
+        if verbose:
+            print(f"   💾 FAST restoring {len(rows)} rows to {table}")
+        
+        # A failed COPY aborts the transaction, so roll back to a savepoint before falling back
+        cursor.execute("SAVEPOINT restore_batch")
+        try:
+            # Method 1: Try COPY FROM (fastest possible)
+            if self._try_copy_from_restore(cursor, table, columns, rows, verbose):
+                cursor.execute("RELEASE SAVEPOINT restore_batch")
+                return
+            cursor.execute("ROLLBACK TO SAVEPOINT restore_batch")
+            
+            # Method 2: Fallback to batch inserts (still much faster than individual)
+            self._batch_insert_restore(cursor, table, columns, rows, verbose)
+            cursor.execute("RELEASE SAVEPOINT restore_batch")
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT restore_batch")
+            if verbose:
+                print(f"   ❌ Failed to restore {table}: {e}")
+
     def _try_copy_from_restore(self, cursor, table: str, columns: List[str], rows: List[dict], verbose: bool = False) -> bool:
         """Try to use COPY FROM for maximum speed (10-100x faster than INSERT)"""
         try:
@@ -840,7 +1734,8 @@ class DatabaseBackupRestore:
         if verbose:
             print(f"     ✅ Batch insert: {total_inserted} rows inserted, {len(rows) - total_inserted} errors")
 
-    def _create_backup_metadata(self, backup_file: str, schema_only: bool, compressed: bool):
+    def _create_backup_metadata(self, backup_file: str, schema_only: bool, compressed: bool,
+                                backup_method: str = 'python-psycopg2-simplified', parent: Optional[str] = None):
         """Create metadata file alongside backup"""
         metadata = {
             'created_at': datetime.datetime.now().isoformat(),
@@ -848,11 +1743,13 @@ class DatabaseBackupRestore:
             'database_name': self.parsed_url.path.lstrip('/'),
             'schema_only': schema_only,
             'compressed': compressed,
-            'file_size': os.path.getsize(backup_file),
-            'backup_method': 'python-psycopg2-simplified',
+            'file_size': self._path_size(backup_file),
+            'backup_method': backup_method,
         }
+        if parent is not None:
+            metadata['parent'] = parent
         
-        metadata_file = backup_file + '.meta.json'
+        metadata_file = backup_file.rstrip(os.sep) + '.meta.json'
         with open(metadata_file, 'w') as f:
             json.dump(metadata, f, indent=2)
 
@@ -871,6 +1768,31 @@ def list_backups(backup_dir: str = "./backups"):
         return
     
     backups = []
+    for file in sorted(backup_path.iterdir()):
+        if file.name.endswith('.meta.json') or not is_copy_archive(str(file)):
+            continue
+        # Archives describe themselves; only the manifest is read
+        try:
+            with _CopyArchiveReader(str(file)) as archive:
+                manifest = archive.manifest()
+        except Exception:
+            continue
+        diff = manifest.get('format') == DIFF_ARCHIVE_FORMAT
+        backups.append({
+            'file': file,
+            'metadata': {
+                'database_host': manifest.get('database_host'),
+                'schema_only': manifest.get('schema_only', False),
+                'compressed': _archive_compression(manifest) or False,
+                'backup_method': 'diff' if diff else 'copy',
+                'parent': manifest.get('parent'),
+                'rows': sum(member['rows'] for member in manifest['tables']),
+                'tables': len(manifest['tables']),
+            },
+            'size': DatabaseBackupRestore._path_size(str(file)),
+            'modified': datetime.datetime.fromtimestamp(file.stat().st_mtime)
+        })
+    
     for file in backup_path.glob("*.sql*"):
         if file.suffix in ['.sql', '.gz'] and not file.name.endswith('.meta.json'):
             metadata_file = file.with_suffix(file.suffix + '.meta.json')
@@ -906,11 +1828,129 @@ def list_backups(backup_dir: str = "./backups"):
         
         if metadata:
             print(f"   🗄️  Database: {metadata.get('database_host', 'unknown')}")
-            print(f"   📋 Type: {'Schema only' if metadata.get('schema_only') else 'Full backup'}")
+            if metadata.get('schema_only'):
+                backup_type = 'Schema only'
+            elif metadata.get('backup_method') == 'diff':
+                backup_type = 'Differential backup'
+            else:
+                backup_type = 'Full backup'
+            print(f"   📋 Type: {backup_type}")
             print(f"   🗜️  Compressed: {metadata.get('compressed', False)}")
+            if metadata.get('backup_method') == 'copy':
+                print(f"   📦 Format: COPY archive")
+            elif metadata.get('backup_method') == 'diff':
+                print(f"   📦 Format: differential backup of {metadata.get('parent', 'unknown')}")
+            if 'rows' in metadata:
+                print(f"   📊 Rows: {metadata['rows']:,} in {metadata['tables']} tables")
         print()
 
 
+def verify_backup(path: str, jobs: int = 4, verbose: bool = False) -> bool:
+    """Check a backup's integrity without restoring it
+    
+    zstd members of COPY archives are checked chunk by chunk against the sha256 stored in
+    the manifest, on `jobs` threads and without decompressing anything. Members without a
+    chunk index and .sql.gz backups are decompressed in full (gzip checks its own CRC);
+    uncompressed members are only checked for presence.
+    
+    Returns:
+        True if every member is present and intact
+    """
+    if not os.path.exists(path):
+        print(f"❌ Backup file not found: {path}")
+        return False
+    
+    print(f"🔍 Verifying backup: {path}")
+    if not is_copy_archive(path):
+        if not path.endswith('.gz'):
+            print("   ℹ️  Uncompressed .sql backups carry no checksums; nothing to verify")
+            return True
+        try:
+            with gzip.open(path, 'rb') as f:
+                while f.read(1024 * 1024):
+                    pass
+        except Exception as e:
+            print(f"❌ Backup is corrupt: {e}")
+            return False
+        print("✅ Backup is intact")
+        return True
+    
+    with _CopyArchiveReader(path) as archive:
+        manifest = archive.manifest()
+    compression = _archive_compression(manifest)
+    
+    members = []
+    for member in manifest['tables']:
+        members.append((member['file'], member.get('chunks')))
+        if member.get('fingerprints'):
+            members.append((member['fingerprints'], member.get('fingerprint_chunks')))
+        if member.get('changes'):
+            members.append((member['changes'], None))
+    
+    def check(name: str, chunks: Optional[list]) -> Optional[str]:
+        with _CopyArchiveReader(path) as archive:
+            if not archive.exists(name):
+                return f"{name}: missing"
+            try:
+                if chunks is not None:
+                    with archive.open(name) as raw:
+                        for index, (offset, size, _, digest) in enumerate(chunks):
+                            raw.seek(offset)
+                            if hashlib.sha256(raw.read(size)).hexdigest() != digest:
+                                return f"{name}: chunk {index} checksum mismatch"
+                elif compression is not None:
+                    with archive.open(name, compression) as f:
+                        while f.read(1024 * 1024):
+                            pass
+            except Exception as e:
+                return f"{name}: {e}"
+        return None
+    
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        results = list(executor.map(lambda m: check(*m), members))
+    
+    errors = [error for error in results if error]
+    for (name, _), error in zip(members, results):
+        if error:
+            print(f"   ❌ {error}")
+        elif verbose:
+            print(f"   ✅ {name}")
+    if errors:
+        print(f"❌ {len(errors)} of {len(members)} members are missing or corrupt")
+        return False
+    chunk_count = sum(len(chunks) for _, chunks in members if chunks)
+    print(f"✅ Backup is intact: {len(members)} members" + (f", {chunk_count} checksummed chunks" if chunk_count else ""))
+    return True
+
+
+def find_latest_chain_backup(backup_dir: str = "./backups") -> Optional[Tuple[str, int]]:
+    """Find the newest backup in backup_dir that a differential backup can be taken against
+    
+    Returns:
+        (path, number of diffs between it and its base), or None if there is no fingerprinted
+        COPY archive or differential backup in backup_dir
+    """
+    backup_path = Path(backup_dir)
+    if not backup_path.exists():
+        return None
+    
+    latest = None
+    for file in backup_path.iterdir():
+        if file.name.endswith('.meta.json') or not is_copy_archive(str(file)):
+            continue
+        try:
+            with _CopyArchiveReader(str(file)) as archive:
+                manifest = archive.manifest()
+        except Exception:
+            continue
+        usable = (manifest.get('format') == DIFF_ARCHIVE_FORMAT or
+                  (manifest.get('format') == COPY_ARCHIVE_FORMAT and manifest.get('fingerprints')))
+        if usable and (latest is None or manifest['created_at'] > latest[0]):
+            latest = (manifest['created_at'], str(file), manifest.get('chain_length', 0))
+    
+    return (latest[1], latest[2]) if latest else None
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Simplified database backup and restore utility",
@@ -932,6 +1972,21 @@ Examples:
   # Restore from backup (filename + backup dir)
   python label_pizza/backup_restore.py restore --database-url-name DBURL --backup-dir ./backups --input mybackup.sql.gz --force
   
+  # Parallel COPY backup from one consistent snapshot (directory, or tar if the name ends in .tar)
+  python label_pizza/backup_restore.py backup --database-url-name DBURL --backup-dir ./backups --auto-name --format copy --jobs 8
+  
+  # Parallel restore of a COPY archive, reporting time spent per phase
+  python label_pizza/backup_restore.py restore --database-url-name DBURL --input ./backups/mybackup.tar --jobs 8 --force
+  
+  # Differential backup against the newest COPY/differential backup; restoring it replays the chain
+  python label_pizza/backup_restore.py backup --database-url-name DBURL --backup-dir ./backups --auto-name --format diff
+  python label_pizza/backup_restore.py restore --database-url-name DBURL --input ./backups/diff_20250101_120000.tar --force
+  
+  # zstd COPY archive with checksummed chunks; verify it and restore one table from it
+  python label_pizza/backup_restore.py backup --database-url-name DBURL --output ./backups/mybackup.tar --format copy --compress --compression zstd
+  python label_pizza/backup_restore.py verify --input ./backups/mybackup.tar
+  python label_pizza/backup_restore.py restore --database-url-name DBURL --input ./backups/mybackup.tar --table annotator_answers --force
+  
   # Schema-only backup
   python label_pizza/backup_restore.py backup --database-url-name DBURL --backup-dir ./backups --output schema.sql --schema-only
   
@@ -951,8 +2006,16 @@ Dependencies:
     backup_parser.add_argument('--output', help='Output file path')
     backup_parser.add_argument('--auto-name', action='store_true', help='Auto-generate timestamped filename')
     backup_parser.add_argument('--compress', action='store_true', help='Compress backup with gzip')
+    backup_parser.add_argument('--compression', choices=list(COPY_COMPRESSIONS), default='gzip',
+                               help='Codec for --format copy --compress; zstd writes checksummed chunks compressed on --jobs threads')
     backup_parser.add_argument('--schema-only', action='store_true', help='Backup schema only (no data)')
     backup_parser.add_argument('--backup-dir', default='./backups', help='Backup directory for auto-named files')
+    backup_parser.add_argument('--format', choices=['sql', 'copy', 'diff'], default='sql',
+                               help='sql: single JSON-row .sql file; copy: parallel COPY archive (directory, or tar if --output ends in .tar); '
+                                    'diff: rows changed since --parent')
+    backup_parser.add_argument('--parent', help='Parent COPY or differential backup for --format diff (default: newest in --backup-dir)')
+    backup_parser.add_argument('--jobs', type=int, default=4, help='Parallel worker connections for --format copy')
+    backup_parser.add_argument('--copy-format', choices=list(COPY_FORMATS), default='binary', help='COPY data format for --format copy')
     
     # Restore command
     restore_parser = subparsers.add_parser('restore', help='Restore from a database backup')
@@ -960,6 +2023,17 @@ Dependencies:
     restore_parser.add_argument('--input', required=True, help='Input backup file path (filename or full path)')
     restore_parser.add_argument('--backup-dir', default='./backups', help='Backup directory (if --input is just filename)')
     restore_parser.add_argument('--force', action='store_true', help='Skip confirmation prompts')
+    restore_parser.add_argument('--table', action='append', dest='tables',
+                                help='Restore only this table from a COPY or differential backup (repeatable)')
+    restore_parser.add_argument('--jobs', type=int, default=1,
+                                help='Restore a COPY archive over this many connections, building indexes after the data (default: 1)')
+    
+    # Verify command
+    verify_parser = subparsers.add_parser('verify', help='Check a backup for missing or corrupt members without restoring it')
+    verify_parser.add_argument('--input', required=True, help='Backup file path (filename or full path)')
+    verify_parser.add_argument('--backup-dir', default='./backups', help='Backup directory (if --input is just filename)')
+    verify_parser.add_argument('--jobs', type=int, default=4, help='Threads checking members in parallel')
+    verify_parser.add_argument('--verbose', '-v', action='store_true', help='Report every member checked')
     
     # List command
     list_parser = subparsers.add_parser('list', help='List available backups')
@@ -975,6 +2049,12 @@ Dependencies:
         list_backups(args.backup_dir)
         return
     
+    if args.command == 'verify':
+        input_file = args.input
+        if not os.path.sep in input_file and not os.path.isabs(input_file):
+            input_file = os.path.join(args.backup_dir, input_file)
+        sys.exit(0 if verify_backup(input_file, jobs=args.jobs, verbose=args.verbose) else 1)
+    
     # Get database URL from environment
     db_url = os.getenv(args.database_url_name)
     if not db_url:
@@ -991,8 +2071,11 @@ Dependencies:
             backup_dir = Path(args.backup_dir)
             backup_dir.mkdir(exist_ok=True)
             
-            prefix = "schema" if args.schema_only else "backup"
-            extension = ".sql.gz" if args.compress else ".sql"
+            prefix = "schema" if args.schema_only else ("diff" if args.format == 'diff' else "backup")
+            if args.format in ('copy', 'diff'):
+                extension = ".tar"
+            else:
+                extension = ".sql.gz" if args.compress else ".sql"
             filename = create_timestamped_filename(prefix, extension)
             output_file = str(backup_dir / filename)
         elif args.output:
@@ -1007,11 +2090,34 @@ Dependencies:
             print("❌ Either --output or --auto-name must be specified")
             sys.exit(1)
         
-        success = handler.create_backup(
-            output_file=output_file,
-            compress=args.compress,
-            schema_only=args.schema_only
-        )
+        if args.format == 'diff':
+            parent = args.parent
+            if parent is None:
+                latest = find_latest_chain_backup(args.backup_dir)
+                if latest is None:
+                    print(f"❌ No COPY or differential backup in {args.backup_dir} to diff against; create one with --format copy")
+                    sys.exit(1)
+                parent = latest[0]
+            success = handler.create_diff_backup(
+                output_path=output_file,
+                parent_path=parent,
+                compress=args.compress
+            )
+        elif args.format == 'copy':
+            success = handler.create_copy_backup(
+                output_path=output_file,
+                jobs=args.jobs,
+                compress=args.compress,
+                schema_only=args.schema_only,
+                copy_format=args.copy_format,
+                compression=args.compression
+            )
+        else:
+            success = handler.create_backup(
+                output_file=output_file,
+                compress=args.compress,
+                schema_only=args.schema_only
+            )
         sys.exit(0 if success else 1)
     
     elif args.command == 'restore':
@@ -1024,7 +2130,9 @@ Dependencies:
         
         success = handler.restore_backup(
             input_file=input_file,
-            force=args.force
+            force=args.force,
+            jobs=args.jobs,
+            tables=args.tables
         )
         sys.exit(0 if success else 1)
 
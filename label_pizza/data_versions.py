@@ -0,0 +1,284 @@
+"""
+Per-project data versions for cache invalidation.
+
+Caches of project data (answers, ground truth, annotators, accuracy, ...)
+used to be keyed by a per-login session id and expire on fixed TTLs, so they
+served stale data for up to an hour. Every project now has a row in
+project_data_versions whose version is bumped in the same transaction as any
+write to the project's data. Caches put the version in their key, so an entry
+can live as long as it is useful and is never served after a write.
+
+Writes are tracked with Session events, so service code does not bump
+versions itself:
+
+* before_flush maps every new, changed or deleted ORM object to the projects
+  it affects: an answer or role to its project, a question to the projects
+  whose schema uses it, a video to the projects containing it, and so on.
+* do_orm_execute catches INSERT/UPDATE/DELETE statements run through
+  session.execute. An UPDATE or DELETE restricted to project_id = / IN (...)
+  bumps those projects; anything else (raw SQL from the admin override tools,
+  snapshot undo, batch renames) bumps every project.
+* before_commit flushes, then bumps all collected projects in one statement,
+  so version rows are only locked while the transaction commits.
+
+Writes that bypass the Session (psycopg2 restores, migration scripts) are not
+tracked; restart the app after them, as before.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event, literal, select, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter, BooleanClauseList, TextClause
+
+from label_pizza.models import (
+    AnnotatorAnswer, AnswerReview, Project, ProjectDataVersion, ProjectUserRole, ProjectVideo,
+    Question, QuestionGroup, QuestionGroupQuestion, Schema, SchemaQuestionGroup, User, Video, VideoTag
+)
+
+
+ALL_PROJECTS = "*"
+WRITE_KEYWORDS = ("INSERT", "UPDATE", "DELETE", "TRUNCATE", "MERGE")
+# How long a version read from the database is reused; commits in this process forget it at once
+VERSION_MAX_AGE_SECONDS = 1.0
+
+_PENDING_KEY = "project_data_versions_pending"
+_BUMPED_KEY = "project_data_versions_bumped"
+_BUMPING_KEY = "project_data_versions_bumping"
+
+_recent_versions: Dict[int, Tuple[float, int]] = {}
+_recent_generation = 0
+_recent_lock = threading.Lock()
+
+
+###############################################################################
+# Reading and bumping versions
+###############################################################################
+
+def get_project_version(session: Session, project_id: int, max_age: float = VERSION_MAX_AGE_SECONDS) -> int:
+    """Get a project's data version (0 until its data is first written).
+
+    Args:
+        session: Database session
+        project_id: The ID of the project
+        max_age: Reuse a version read within this many seconds (0 always reads the database)
+
+    Returns:
+        The project's data version
+    """
+    started = time.monotonic()
+    with _recent_lock:
+        recent = _recent_versions.get(project_id)
+        generation = _recent_generation
+    if recent is not None and started - recent[0] < max_age:
+        return recent[1]
+
+    version = session.scalar(
+        select(ProjectDataVersion.version).where(ProjectDataVersion.project_id == project_id)
+    ) or 0
+
+    with _recent_lock:
+        # A commit forgot versions while we were reading, so ours may already be old
+        if generation == _recent_generation:
+            _recent_versions[project_id] = (started, version)
+    return version
+
+
+def bump_project_versions(session: Session, project_ids: Optional[Iterable[int]] = None) -> None:
+    """Bump the data versions of some projects, or of every project, in the session's transaction.
+
+    Args:
+        session: Database session
+        project_ids: The IDs of the projects (default: every project)
+    """
+    table = ProjectDataVersion.__table__
+    dialect_insert = postgresql.insert if session.get_bind().dialect.name == "postgresql" else sqlite.insert
+    bumped_at = datetime.utcnow()
+
+    if project_ids is None:
+        # The WHERE keeps SQLite from reading ON CONFLICT as a join constraint
+        statement = dialect_insert(table).from_select(
+            ["project_id", "version", "updated_at"],
+            select(Project.id, literal(1), literal(bumped_at, table.c.updated_at.type))
+            .where(true()).order_by(Project.id)
+        )
+    else:
+        # Sorted, so concurrent bumps lock version rows in the same order
+        project_ids = sorted(set(project_ids))
+        if not project_ids:
+            return
+        statement = dialect_insert(table).values([
+            {"project_id": project_id, "version": 1, "updated_at": bumped_at} for project_id in project_ids
+        ])
+
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.project_id],
+        set_={"version": table.c.version + 1, "updated_at": statement.excluded.updated_at},
+    )
+    session.info[_BUMPING_KEY] = True
+    try:
+        session.execute(statement)
+    finally:
+        session.info.pop(_BUMPING_KEY, None)
+
+
+def forget_recent_versions(project_ids: Optional[Iterable[int]] = None) -> None:
+    """Drop remembered versions of some projects (default: all), so the next read hits the database"""
+    global _recent_generation
+    with _recent_lock:
+        _recent_generation += 1
+        if project_ids is None:
+            _recent_versions.clear()
+        else:
+            for project_id in project_ids:
+                _recent_versions.pop(project_id, None)
+
+
+###############################################################################
+# Finding the projects a write affects
+###############################################################################
+
+def projects_affected_by(session: Session, objects: Iterable[object]) -> Set[int]:
+    """Get the IDs of the projects whose data depends on the given ORM objects.
+
+    Args:
+        session: Database session
+        objects: New, changed or deleted model instances
+
+    Returns:
+        Set of project IDs
+    """
+    project_ids, answer_ids, schema_ids, group_ids, question_ids, video_ids, user_ids = (set() for _ in range(7))
+
+    for obj in objects:
+        if isinstance(obj, ProjectDataVersion):
+            continue
+        if isinstance(obj, Project):
+            project_ids.add(obj.id)
+        elif hasattr(obj, "project_id"):
+            project_ids.add(obj.project_id)
+        elif isinstance(obj, AnswerReview):
+            answer_ids.add(obj.answer_id)
+        elif isinstance(obj, Schema):
+            schema_ids.add(obj.id)
+        elif isinstance(obj, SchemaQuestionGroup):
+            schema_ids.add(obj.schema_id)
+        elif isinstance(obj, QuestionGroup):
+            group_ids.add(obj.id)
+        elif isinstance(obj, QuestionGroupQuestion):
+            group_ids.add(obj.question_group_id)
+        elif isinstance(obj, Question):
+            question_ids.add(obj.id)
+        elif isinstance(obj, Video):
+            video_ids.add(obj.id)
+        elif isinstance(obj, VideoTag):
+            video_ids.add(obj.video_id)
+        elif isinstance(obj, User):
+            user_ids.add(obj.id)
+
+    def lookup(column, key_column, keys: Set) -> Set[int]:
+        keys.discard(None)
+        if not keys:
+            return set()
+        return set(session.scalars(select(column).where(key_column.in_(keys)).distinct()))
+
+    with session.no_autoflush:
+        group_ids |= lookup(QuestionGroupQuestion.question_group_id, QuestionGroupQuestion.question_id, question_ids)
+        schema_ids |= lookup(SchemaQuestionGroup.schema_id, SchemaQuestionGroup.question_group_id, group_ids)
+        project_ids |= lookup(Project.id, Project.schema_id, schema_ids)
+        project_ids |= lookup(AnnotatorAnswer.project_id, AnnotatorAnswer.id, answer_ids)
+        project_ids |= lookup(ProjectVideo.project_id, ProjectVideo.video_id, video_ids)
+        project_ids |= lookup(ProjectUserRole.project_id, ProjectUserRole.user_id, user_ids)
+
+    project_ids.discard(None)
+    return project_ids
+
+
+def _project_ids_in_criteria(statement) -> Optional[Set[int]]:
+    """Project IDs an UPDATE or DELETE is restricted to by project_id = / IN criteria, or None"""
+    table = getattr(statement, "table", None)
+    whereclause = getattr(statement, "whereclause", None)
+    if statement.is_insert or table is None or whereclause is None or "project_id" not in table.c:
+        return None
+
+    if isinstance(whereclause, BooleanClauseList) and whereclause.operator is operators.and_:
+        conditions = whereclause.clauses
+    else:
+        conditions = [whereclause]
+
+    for condition in conditions:
+        if not (isinstance(condition, BinaryExpression) and isinstance(condition.right, BindParameter)):
+            continue
+        column = condition.left
+        if getattr(column, "name", None) != "project_id" or getattr(getattr(column, "table", None), "name", None) != table.name:
+            continue
+        value = condition.right.effective_value
+        if condition.operator is operators.eq:
+            return {value}
+        if condition.operator is operators.in_op:
+            return set(value)
+    return None
+
+
+###############################################################################
+# Session events
+###############################################################################
+
+def _pending(session: Session) -> set:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_flushed_writes(session, flush_context, instances):
+    objects = [*session.new, *session.deleted, *(obj for obj in session.dirty if session.is_modified(obj))]
+    if objects:
+        _pending(session).update(projects_affected_by(session, objects))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_writes(orm_execute_state):
+    session = orm_execute_state.session
+    if session.info.get(_BUMPING_KEY):
+        return
+
+    statement = orm_execute_state.statement
+    if isinstance(statement, TextClause):
+        words = statement.text.split(None, 1)
+        if words and words[0].upper() in WRITE_KEYWORDS:
+            _pending(session).add(ALL_PROJECTS)
+    elif orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _pending(session).update(_project_ids_in_criteria(statement) or {ALL_PROJECTS})
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_on_commit(session):
+    if session.in_nested_transaction():
+        return
+    # Flush first, so the commit's own final flush has nothing left to collect
+    session.flush()
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    if ALL_PROJECTS in pending:
+        bump_project_versions(session)
+    else:
+        bump_project_versions(session, pending)
+    session.info[_BUMPED_KEY] = pending
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_committed_versions(session):
+    bumped = session.info.pop(_BUMPED_KEY, None)
+    if bumped:
+        forget_recent_versions(None if ALL_PROJECTS in bumped else bumped)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_uncommitted_writes(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
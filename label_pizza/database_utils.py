@@ -14,6 +14,8 @@ import label_pizza.db
 if label_pizza.db.SessionLocal is None:
     raise ValueError("SessionLocal is not initialized")
 from label_pizza.ui_components import custom_info
+from label_pizza.answer_cube import ProjectAnswerCube
+from label_pizza.data_versions import get_project_version, forget_recent_versions
 import functools
 import inspect
 from typing import Callable, Any
@@ -81,6 +83,25 @@ def handle_database_errors(func):
 # CACHED DATA LOADERS
 ###############################################################################
 
+# Project loaders take the project's data version as their last argument: every
+# committed write to a project bumps it, so a cached entry is never served stale
+# and is shared by all sessions working on the project.
+
+def get_project_data_version(project_id: int) -> int:
+    """Get the project's data version - changes whenever the project's data is written"""
+    with get_db_session() as session:
+        return get_project_version(session, project_id)
+
+def _session_cached_by_version(cache_key: str, project_id: int, load: Callable[[int], Any]) -> Any:
+    """Keep load(data_version) in session state until the project's data version changes"""
+    data_version = get_project_data_version(project_id)
+    cached = st.session_state.get(cache_key)
+
+    if cached is None or cached[0] != data_version:
+        st.session_state[cache_key] = (data_version, load(data_version))
+
+    return st.session_state[cache_key][1]
+
 @st.cache_data(ttl=3600)  # Cache for 1 hour
 def get_cached_all_users(session_id: str) -> pd.DataFrame:
     """Cache all users data - changes infrequently"""
@@ -91,8 +112,8 @@ def get_cached_all_users(session_id: str) -> pd.DataFrame:
             print(f"Error in get_cached_all_users: {e}")
             return pd.DataFrame()
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour  
-def get_cached_project_questions(project_id: int, session_id: str) -> List[Dict]:
+@st.cache_data(ttl=86400, max_entries=256)  # Keyed by data version - never stale, TTL only frees memory
+def get_cached_project_questions(project_id: int, data_version: int) -> List[Dict]:
     """Cache project questions - changes infrequently"""
     with get_db_session() as session:
         try:
@@ -103,11 +124,10 @@ def get_cached_project_questions(project_id: int, session_id: str) -> List[Dict]
 
 def get_project_questions_cached(project_id: int) -> List[Dict]:
     """Get project questions with caching"""
-    session_id = get_session_cache_key()
-    return get_cached_project_questions(project_id, session_id)
+    return get_cached_project_questions(project_id, get_project_data_version(project_id))
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
-def get_cached_question_answers(project_id: int, session_id: str) -> pd.DataFrame:
+@st.cache_data(ttl=86400, max_entries=256)  # Keyed by data version - never stale, TTL only frees memory
+def get_cached_question_answers(project_id: int, data_version: int) -> pd.DataFrame:
     """Cache ALL annotator answers for a project - annotator answers rarely change"""
     with get_db_session() as session:
         try:
@@ -136,8 +156,8 @@ def get_cached_question_answers(project_id: int, session_id: str) -> pd.DataFram
             print(f"Error in get_cached_question_answers: {e}")
             return pd.DataFrame()
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
-def get_cached_project_annotators(project_id: int, session_id: str) -> Dict[str, Dict]:
+@st.cache_data(ttl=86400, max_entries=256)  # Keyed by data version - never stale, TTL only frees memory
+def get_cached_project_annotators(project_id: int, data_version: int) -> Dict[str, Dict]:
     """Cache project annotators info - changes infrequently"""
     with get_db_session() as session:
         try:
@@ -187,8 +207,8 @@ def get_cached_project_annotators(project_id: int, session_id: str) -> Dict[str,
             return {}
 
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
-def get_cached_project_videos(project_id: int, session_id: str) -> List[Dict]:
+@st.cache_data(ttl=86400, max_entries=256)  # Keyed by data version - never stale, TTL only frees memory
+def get_cached_project_videos(project_id: int, data_version: int) -> List[Dict]:
     """Cache project videos - changes infrequently"""
     with get_db_session() as session:
         try:
@@ -197,8 +217,8 @@ def get_cached_project_videos(project_id: int, session_id: str) -> List[Dict]:
             print(f"Error in get_cached_project_videos: {e}")
             return []
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
-def get_cached_bulk_reviewer_data(project_id: int, session_id: str) -> Dict:
+@st.cache_data(ttl=86400, max_entries=256)  # Keyed by data version - never stale, TTL only frees memory
+def get_cached_bulk_reviewer_data(project_id: int, data_version: int) -> Dict:
     """Cache ALL reviewer data for entire project to minimize repeated queries"""
     with get_db_session() as session:
         try:
@@ -316,8 +336,7 @@ def get_cached_bulk_reviewer_data(project_id: int, session_id: str) -> Dict:
 
 def get_video_reviewer_data_from_bulk(video_id: int, project_id: int, annotator_user_ids: List[int]) -> Dict:
     """Get reviewer data for a specific video from bulk cache"""
-    session_id = get_session_cache_key()
-    bulk_data = get_cached_bulk_reviewer_data(project_id, session_id)
+    bulk_data = get_cached_bulk_reviewer_data(project_id, get_project_data_version(project_id))
     
     if not bulk_data:
         return {}
@@ -375,8 +394,8 @@ def get_video_reviewer_data_from_bulk(video_id: int, project_id: int, annotator_
     
     return video_data
 
-@st.cache_data(ttl=600)  # Cache for 10 minutes
-def get_cached_video_reviewer_data(video_id: int, project_id: int, annotator_user_ids: List[int], session_id: str) -> Dict:
+@st.cache_data(ttl=86400, max_entries=4096)  # Keyed by data version - never stale, TTL only frees memory
+def get_cached_video_reviewer_data(video_id: int, project_id: int, annotator_user_ids: List[int], data_version: int) -> Dict:
     """Cache ALL reviewer data for a specific video to minimize repeated queries"""
     with get_db_session() as session:
         try:
@@ -470,6 +489,10 @@ def get_cached_video_reviewer_data(video_id: int, project_id: int, annotator_use
             print(f"Error in get_cached_video_reviewer_data: {e}")
             return {}
 
+def get_video_reviewer_data_cached(video_id: int, project_id: int, annotator_user_ids: List[int]) -> Dict:
+    """Get reviewer data for a specific video with caching"""
+    return get_cached_video_reviewer_data(video_id, project_id, annotator_user_ids, get_project_data_version(project_id))
+
 @st.cache_data(ttl=3600)  # Cache for 1 hour - questions rarely change
 def get_cached_questions_by_group(group_id: int, session_id: str) -> List[Dict]:
     """Cache questions by group - questions rarely change once project is running"""
@@ -486,8 +509,8 @@ def get_questions_by_group_cached(group_id: int) -> List[Dict]:
     return get_cached_questions_by_group(group_id, session_id)
 
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def get_cached_project_metadata(project_id: int, session_id: str) -> Dict:
+@st.cache_data(ttl=86400, max_entries=256)  # Keyed by data version - never stale, TTL only frees memory
+def get_cached_project_metadata(project_id: int, data_version: int) -> Dict:
     """Cache project metadata - changes infrequently"""
     with get_db_session() as session:
         try:
@@ -498,37 +521,37 @@ def get_cached_project_metadata(project_id: int, session_id: str) -> Dict:
 
 def get_project_metadata_cached(project_id: int) -> Dict:
     """Get project metadata with caching"""
-    session_id = get_session_cache_key()
-    return get_cached_project_metadata(project_id, session_id)
+    return get_cached_project_metadata(project_id, get_project_data_version(project_id))
 
 def get_cached_user_completion_progress(project_id: int) -> Dict[int, float]:
     """Cache completion progress for all users in a project"""
-    cache_key = f"completion_progress_{project_id}"
-    
-    if cache_key not in st.session_state:
-        try:
-            annotators = get_session_cached_project_annotators(project_id=project_id)
-            progress_map = {}
-            
-            for annotator_display, annotator_info in annotators.items():
-                user_id = annotator_info.get('id')
-                if user_id:
-                    try:
-                        progress = calculate_user_overall_progress(user_id=user_id, project_id=project_id)
-                        progress_map[user_id] = progress
-                    except:
-                        print(f"Error calculating progress for user {user_id}: {e}")
-                        progress_map[user_id] = 0.0
-            
-            st.session_state[cache_key] = progress_map
-        except:
-            print(f"Error caching completion progress for project {project_id}: {e}")
-            st.session_state[cache_key] = {}
-    
-    return st.session_state[cache_key]
+    return _session_cached_by_version(
+        f"completion_progress_{project_id}", project_id, lambda data_version: _load_user_completion_progress(project_id)
+    )
+
+def _load_user_completion_progress(project_id: int) -> Dict[int, float]:
+    """Completion progress of every annotator in a project"""
+    try:
+        annotators = get_session_cached_project_annotators(project_id=project_id)
+        progress_map = {}
+        
+        for annotator_display, annotator_info in annotators.items():
+            user_id = annotator_info.get('id')
+            if user_id:
+                try:
+                    progress = calculate_user_overall_progress(user_id=user_id, project_id=project_id)
+                    progress_map[user_id] = progress
+                except Exception as e:
+                    print(f"Error calculating progress for user {user_id}: {e}")
+                    progress_map[user_id] = 0.0
+        
+        return progress_map
+    except Exception as e:
+        print(f"Error caching completion progress for project {project_id}: {e}")
+        return {}
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour - custom display changes rarely
-def get_cached_custom_display_data(project_id: int, session_id: str) -> Dict[str, Any]:
+@st.cache_data(ttl=86400, max_entries=256)  # Keyed by data version - never stale, TTL only frees memory
+def get_cached_custom_display_data(project_id: int, data_version: int) -> Dict[str, Any]:
     """Cache all custom display data for a project to minimize database calls"""
     with get_db_session() as session:
         try:
@@ -575,13 +598,10 @@ def get_cached_custom_display_data(project_id: int, session_id: str) -> Dict[str
 
 def get_project_custom_display_data(project_id: int) -> Dict[str, Any]:
     """Get custom display data for project with session state caching"""
-    cache_key = f"custom_display_data_{project_id}"
-    
-    if cache_key not in st.session_state:
-        session_id = get_session_cache_key()
-        st.session_state[cache_key] = get_cached_custom_display_data(project_id, session_id)
-    
-    return st.session_state[cache_key]
+    return _session_cached_by_version(
+        f"custom_display_data_{project_id}", project_id,
+        lambda data_version: get_cached_custom_display_data(project_id, data_version)
+    )
 
 def get_questions_by_group_with_custom_display_cached(
     group_id: int, 
@@ -645,8 +665,8 @@ def clear_custom_display_cache(project_id: int):
     if cache_key in st.session_state:
         del st.session_state[cache_key]
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour - ground truth state changes infrequently
-def get_cached_project_has_full_ground_truth(project_id: int, session_id: str) -> bool:
+@st.cache_data(ttl=86400, max_entries=256)  # Keyed by data version - never stale, TTL only frees memory
+def get_cached_project_has_full_ground_truth(project_id: int, data_version: int) -> bool:
     """Cache project full ground truth check - changes infrequently"""
     with get_db_session() as session:
         try:
@@ -655,8 +675,8 @@ def get_cached_project_has_full_ground_truth(project_id: int, session_id: str) -
             print(f"Error in get_cached_project_has_full_ground_truth: {e}")
             return False
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes - accuracy data changes infrequently  
-def get_cached_annotator_accuracy(project_id: int, session_id: str) -> Dict[int, Dict[int, Dict[str, int]]]:
+@st.cache_data(ttl=86400, max_entries=256)  # Keyed by data version - never stale, TTL only frees memory
+def get_cached_annotator_accuracy(project_id: int, data_version: int) -> Dict[int, Dict[int, Dict[str, int]]]:
     """Cache annotator accuracy data - changes infrequently"""
     with get_db_session() as session:
         try:
@@ -665,8 +685,8 @@ def get_cached_annotator_accuracy(project_id: int, session_id: str) -> Dict[int,
             print(f"Error in get_cached_annotator_accuracy: {e}")
             return {}
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes - reviewer accuracy data changes infrequently
-def get_cached_reviewer_accuracy(project_id: int, session_id: str) -> Dict[int, Dict[int, Dict[str, int]]]:
+@st.cache_data(ttl=86400, max_entries=256)  # Keyed by data version - never stale, TTL only frees memory
+def get_cached_reviewer_accuracy(project_id: int, data_version: int) -> Dict[int, Dict[int, Dict[str, int]]]:
     """Cache reviewer accuracy data - changes infrequently"""
     with get_db_session() as session:
         try:
@@ -698,18 +718,15 @@ def get_optimized_annotator_user_ids(display_names: List[str], project_id: int)
 
 def get_project_has_full_ground_truth_cached(project_id: int) -> bool:
     """Get project full ground truth status with caching"""
-    session_id = get_session_cache_key()
-    return get_cached_project_has_full_ground_truth(project_id, session_id)
+    return get_cached_project_has_full_ground_truth(project_id, get_project_data_version(project_id))
 
 def get_annotator_accuracy_cached(project_id: int) -> Dict[int, Dict[int, Dict[str, int]]]:
     """Get annotator accuracy data with caching"""
-    session_id = get_session_cache_key()
-    return get_cached_annotator_accuracy(project_id, session_id)
+    return get_cached_annotator_accuracy(project_id, get_project_data_version(project_id))
 
 def get_reviewer_accuracy_cached(project_id: int) -> Dict[int, Dict[int, Dict[str, int]]]:
     """Get reviewer accuracy data with caching"""
-    session_id = get_session_cache_key()
-    return get_cached_reviewer_accuracy(project_id, session_id)
+    return get_cached_reviewer_accuracy(project_id, get_project_data_version(project_id))
 
 
 
@@ -724,18 +741,55 @@ def calculate_user_overall_progress(user_id: int, project_id: int) -> float:
 
 def get_optimized_all_project_annotators(project_id: int) -> Dict[str, Dict]:
     """Optimized version of get_all_project_annotators using caching"""
-    session_id = get_session_cache_key()
-    return get_cached_project_annotators(project_id, session_id)
+    return get_cached_project_annotators(project_id, get_project_data_version(project_id))
 
 
 def get_session_cached_project_annotators(project_id: int) -> Dict[str, Dict]:
     """Get project annotators with session state caching"""
-    cache_key = f"cached_annotators_{project_id}"
+    return _session_cached_by_version(
+        f"cached_annotators_{project_id}", project_id,
+        lambda data_version: get_cached_project_annotators(project_id, data_version)
+    )
+
+def get_project_answer_cube(project_id: int) -> ProjectAnswerCube:
+    """Get a project's encoded answers and ground truth - rebuilt when the project's data changes"""
+    def build(data_version: int) -> ProjectAnswerCube:
+        with get_db_session() as session:
+            return ProjectAnswerCube.build(project_id=project_id, session=session)
     
-    if cache_key not in st.session_state:
-        st.session_state[cache_key] = get_optimized_all_project_annotators(project_id=project_id)
+    return _session_cached_by_version(f"cache_project_{project_id}_answer_cube", project_id, build)
+
+def update_project_answer_cube(project_id: int, video_id: int, answers: Dict[str, str], questions: List[Dict],
+                               user_id: int = None, ground_truth: bool = False):
+    """Record submitted answers (keyed by question text) in the project's answer cube, if it was built"""
+    cache_key = f"cache_project_{project_id}_answer_cube"
+    cached = st.session_state.get(cache_key)
+    if cached is None:
+        return
     
-    return st.session_state[cache_key]
+    # The submit bumped the data version once; any other bump is someone else's write
+    cube_version, cube = cached
+    data_version = get_project_data_version(project_id)
+    if data_version - cube_version not in (0, 1):
+        del st.session_state[cache_key]
+        return
+    
+    question_ids = {question["text"]: question["id"] for question in questions}
+    answers_by_id = {
+        question_ids[question_text]: value
+        for question_text, value in answers.items()
+        if question_text in question_ids and value is not None
+    }
+    try:
+        if ground_truth:
+            cube.set_ground_truths(video_id=video_id, answers=answers_by_id)
+        else:
+            cube.set_answers(video_id=video_id, user_id=user_id, answers=answers_by_id)
+        st.session_state[cache_key] = (data_version, cube)
+    except Exception as e:
+        # A cube that cannot be updated is rebuilt on next use
+        print(f"Error updating answer cube for project {project_id}: {e}")
+        del st.session_state[cache_key]
 
 def get_schema_question_groups(schema_id: int) -> List[Dict]:
     """Get question groups in a schema - with caching"""
@@ -753,8 +807,7 @@ def get_schema_question_groups(schema_id: int) -> List[Dict]:
 
 def get_project_videos(project_id: int) -> List[Dict]:
     """Get videos in a project - with caching"""
-    session_id = get_session_cache_key()
-    return get_cached_project_videos(project_id, session_id)
+    return get_cached_project_videos(project_id, get_project_data_version(project_id))
 
 def get_project_groups_with_projects(user_id: int, role: str) -> Dict:
     """Get project groups with their projects for a user - OPTIMIZED VERSION"""
@@ -835,27 +888,13 @@ def get_user_assignment_dates(user_id: int) -> Dict[int, Dict[str, str]]:
 ###############################################################################
 
 def clear_accuracy_cache_for_project(project_id: int):
-    """Clear accuracy cache for a specific project"""
-    session_id = get_session_cache_key()
-    
-    # Try to clear each function individually
-    try:
-        get_cached_project_has_full_ground_truth.clear(project_id, session_id)
-    except Exception:
-        print(f"Error clearing project has full ground truth cache: {e}")
-        pass  # Function may not have been called yet
+    """Make the project's cached data re-check its data version on next use
     
-    try:
-        get_cached_annotator_accuracy.clear(project_id, session_id)
-    except Exception:
-        print(f"Error clearing annotator accuracy cache: {e}")
-        pass  # Function may not have been called yet
-    
-    try:
-        get_cached_reviewer_accuracy.clear(project_id, session_id)
-    except Exception:
-        print(f"Error clearing reviewer accuracy cache: {e}")
-        pass  # Function may not have been called yet
+    Cached entries are keyed by the data version, which every write bumps, so
+    nothing has to be deleted; this only drops the briefly remembered version
+    so writes made by other processes are picked up at once.
+    """
+    forget_recent_versions([project_id])
 
 
 def clear_project_cache(project_id: int):
@@ -888,15 +927,8 @@ def clear_project_cache(project_id: int):
     for key in cache_keys_to_clear:
         del st.session_state[key]
     
-    # Clear accuracy cache
+    # Re-check the project's data version, which keys the streamlit caches
     clear_accuracy_cache_for_project(project_id)
-    
-    # Clear streamlit cache for this project
-    session_id = get_session_cache_key()
-    try:
-        get_cached_project_metadata.clear(project_id, session_id)
-    except:
-        pass
 
 def get_session_cache_key():
     """Generate a session-based cache key that changes when user logs in/out"""
@@ -12,6 +12,7 @@ Base = declarative_base()
 
 # Import models to ensure they are registered with Base
 from label_pizza.models import *  # This ensures all models are registered with Base
+import label_pizza.data_versions  # Registers the session events that bump project data versions
 
 # Placeholder variables that will be set by init_database()
 engine = None
@@ -26,13 +26,15 @@ from label_pizza.database_utils import (
     get_cached_user_completion_progress, get_optimized_all_project_annotators,
     get_project_custom_display_data, get_questions_by_group_with_custom_display_cached,
     clear_custom_display_cache, get_project_metadata_cached, get_project_questions_cached,
-    get_video_reviewer_data_from_bulk
+    get_video_reviewer_data_from_bulk, get_project_answer_cube, update_project_answer_cube
 )
 from label_pizza.autosubmit_features import (
     display_manual_auto_submit_controls, run_project_wide_auto_submit_on_entry,
     display_annotator_checkboxes
 )
 from label_pizza.accuracy_analytics import display_user_accuracy_simple, display_accuracy_button_for_project
+from label_pizza.answer_cube import ProjectAnswerCube
+from label_pizza.sort_metrics import ProjectSortMetrics
 
 ###############################################################################
 # Video Display Functions
@@ -44,11 +46,16 @@ def display_video_answer_pair(video: Dict, project_id: int, user_id: int, role:
     try:
         selected_annotators = st.session_state.get("selected_annotators", []) if role in ["reviewer", "meta_reviewer"] else None
         
-        with get_db_session() as session:
-            bulk_video_data = GroundTruthService.get_complete_video_data_for_display(
-                video_id=video["id"], project_id=project_id, user_id=user_id, role=role, session=session,
-                selected_annotators=selected_annotators
-            )
+        # Use the page-level prefetch on the first render; fragment reruns fetch fresh data
+        prefetched = st.session_state.get(f"page_video_data_{project_id}_{role}", {}).pop(video["id"], None)
+        if prefetched:
+            bulk_video_data = prefetched
+        else:
+            with get_db_session() as session:
+                bulk_video_data = GroundTruthService.get_complete_video_data_for_display(
+                    video_id=video["id"], project_id=project_id, user_id=user_id, role=role, session=session,
+                    selected_annotators=selected_annotators
+                )
         
         if not bulk_video_data:
             st.error("Error loading video data")
@@ -431,6 +438,7 @@ def display_question_group_in_fixed_container(video: Dict, project_id: int, user
                                 video_id=video["id"], project_id=project_id, user_id=user_id,
                                 question_group_id=group_id, answers=answers, session=session
                             )
+                        update_project_answer_cube(project_id, video["id"], answers, questions, user_id=user_id)
                         
                         try:
                             overall_progress = calculate_user_overall_progress(user_id=user_id, project_id=project_id)
@@ -450,6 +458,7 @@ def display_question_group_in_fixed_container(video: Dict, project_id: int, user
                                     video_id=video["id"], project_id=project_id, question_group_id=group_id,
                                     admin_id=user_id, answers=answers, session=session
                                 )
+                            update_project_answer_cube(project_id, video["id"], answers, questions, ground_truth=True)
                             
                             if answer_reviews:
                                 submit_answer_reviews(answer_reviews, video["id"], project_id, user_id)
@@ -476,6 +485,7 @@ def display_question_group_in_fixed_container(video: Dict, project_id: int, user
                                     video_id=video["id"], project_id=project_id, reviewer_id=user_id,
                                     question_group_id=group_id, answers=editable_answers, session=session
                                 )
+                                update_project_answer_cube(project_id, video["id"], editable_answers, questions, ground_truth=True)
                             
                             if answer_reviews:
                                 submit_answer_reviews(answer_reviews, video["id"], project_id, user_id)
@@ -2968,55 +2978,30 @@ def check_question_group_completion(video_id: int, project_id: int, user_id: int
 # PROJECT VIEW FUNCTIONS
 ###############################################################################
 
-def get_model_confidence_scores_enhanced(project_id: int, model_user_ids: List[int], question_ids: List[int]) -> Dict[int, float]:
+def _project_video_scores(project_id: int, scores: Dict[int, float]) -> Dict[int, float]:
+    """Score of every video in the project, 0.0 for videos without data"""
+    return {video["id"]: scores.get(video["id"], 0.0) for video in get_project_videos(project_id=project_id)}
+
+def _load_sort_metrics(project_id: int, question_ids: Optional[List[int]] = None) -> ProjectSortMetrics:
+    """Load a project's answers, review statuses and ground truth once for the per-user sort metrics"""
+    with get_db_session() as session:
+        return ProjectSortMetrics.load(project_id=project_id, session=session, question_ids=question_ids)
+
+def get_model_confidence_scores_enhanced(project_id: int, model_user_ids: List[int], question_ids: List[int],
+                                         metrics: ProjectAnswerCube = None) -> Dict[int, float]:
     """Get confidence scores for specific model users on specific questions"""
     try:
         if not model_user_ids or not question_ids:
             return {}
         
-        confidence_scores = {}
-        videos = get_project_videos(project_id=project_id)
-        
-        with get_db_session() as session:
-            for video in videos:
-                video_id = video["id"]
-                total_confidence = 0.0
-                answer_count = 0
-                
-                for model_user_id in model_user_ids:
-                    for question_id in question_ids:
-                        try:
-                            # Use AnnotatorService to get answers
-                            answers_df = AnnotatorService.get_question_answers(
-                                question_id=question_id, project_id=project_id, session=session
-                            )
-                            
-                            if not answers_df.empty:
-                                # Filter for this model user and video
-                                user_video_answers = answers_df[
-                                    (answers_df["User ID"] == model_user_id) & 
-                                    (answers_df["Video ID"] == video_id)
-                                ]
-                                
-                                if not user_video_answers.empty:
-                                    confidence = user_video_answers.iloc[0]["Confidence Score"]
-                                    if confidence is not None:
-                                        total_confidence += confidence
-                                        answer_count += 1
-                        except Exception:
-                            continue
-                
-                if answer_count > 0:
-                    confidence_scores[video_id] = total_confidence / answer_count
-                else:
-                    confidence_scores[video_id] = 0.0
-        
-        return confidence_scores
+        metrics = metrics if metrics is not None else get_project_answer_cube(project_id)
+        return _project_video_scores(project_id, metrics.model_confidence(model_user_ids, question_ids))
     except Exception as e:
         st.error(f"Error getting model confidence scores: {str(e)}")
         return {}
 
-def get_annotator_consensus_rates_enhanced(project_id: int, selected_annotators: List[str], question_ids: List[int]) -> Dict[int, float]:
+def get_annotator_consensus_rates_enhanced(project_id: int, selected_annotators: List[str], question_ids: List[int],
+                                           metrics: ProjectAnswerCube = None) -> Dict[int, float]:
     """Calculate consensus rates with proper handling of incomplete annotations"""
     try:
         if not selected_annotators or not question_ids or len(selected_annotators) < 2:
@@ -3026,56 +3011,19 @@ def get_annotator_consensus_rates_enhanced(project_id: int, selected_annotators:
             annotator_user_ids = AuthService.get_annotator_user_ids_from_display_names(
                 display_names=selected_annotators, project_id=project_id, session=session
             )
-            
-            if len(annotator_user_ids) < 2:
-                return {}
-            
-            consensus_rates = {}
-            videos = get_project_videos(project_id=project_id)
-            
-            for video in videos:
-                video_id = video["id"]
-                total_questions_with_multiple_answers = 0
-                consensus_count = 0
-                
-                for question_id in question_ids:
-                    try:
-                        answers_df = AnnotatorService.get_question_answers(
-                            question_id=question_id, project_id=project_id, session=session
-                        )
-                        
-                        if not answers_df.empty:
-                            video_answers = answers_df[
-                                (answers_df["Video ID"] == video_id) & 
-                                (answers_df["User ID"].isin(annotator_user_ids))
-                            ]
-                            
-                            # Only consider questions where at least 2 annotators answered
-                            if len(video_answers) >= 2:
-                                total_questions_with_multiple_answers += 1
-                                answer_values = video_answers["Answer Value"].tolist()
-                                
-                                from collections import Counter
-                                answer_counts = Counter(answer_values)
-                                most_common_count = answer_counts.most_common(1)[0][1]
-                                consensus_rate = most_common_count / len(answer_values)
-                                
-                                if consensus_rate >= 0.5:  # Majority agreement
-                                    consensus_count += 1
-                    except Exception:
-                        continue
-                
-                if total_questions_with_multiple_answers > 0:
-                    consensus_rates[video_id] = consensus_count / total_questions_with_multiple_answers
-                else:
-                    consensus_rates[video_id] = 0.0
         
-        return consensus_rates
+        if len(annotator_user_ids) < 2:
+            return {}
+        
+        # Only questions where at least 2 annotators answered count; a question agrees on a majority answer
+        metrics = metrics if metrics is not None else get_project_answer_cube(project_id)
+        return _project_video_scores(project_id, metrics.consensus_rates(annotator_user_ids, question_ids))
     except Exception as e:
         st.error(f"Error calculating consensus rates: {str(e)}")
         return {}
 
-def get_video_accuracy_rates(project_id: int, selected_annotators: List[str], question_ids: List[int]) -> Dict[int, float]:
+def get_video_accuracy_rates(project_id: int, selected_annotators: List[str], question_ids: List[int],
+                             metrics: ProjectAnswerCube = None) -> Dict[int, float]:
     """Calculate accuracy rates with proper handling of incomplete annotations"""
     try:
         if not selected_annotators or not question_ids:
@@ -3085,93 +3033,26 @@ def get_video_accuracy_rates(project_id: int, selected_annotators: List[str], qu
             annotator_user_ids = AuthService.get_annotator_user_ids_from_display_names(
                 display_names=selected_annotators, project_id=project_id, session=session
             )
-            
-            if not annotator_user_ids:
-                return {}
-            
-            accuracy_rates = {}
-            videos = get_project_videos(project_id=project_id)
-            
-            for video in videos:
-                video_id = video["id"]
-                total_comparisons = 0
-                correct_comparisons = 0
-                
-                try:
-                    gt_df = GroundTruthService.get_ground_truth(
-                        video_id=video_id, project_id=project_id, session=session
-                    )
-                    
-                    if gt_df.empty:
-                        accuracy_rates[video_id] = 0.0
-                        continue
-                    
-                    for question_id in question_ids:
-                        question_gt = gt_df[gt_df["Question ID"] == question_id]
-                        if question_gt.empty:
-                            continue
-                        
-                        gt_answer = question_gt.iloc[0]["Answer Value"]
-                        
-                        answers_df = AnnotatorService.get_question_answers(
-                            question_id=question_id, project_id=project_id, session=session
-                        )
-                        
-                        if not answers_df.empty:
-                            video_answers = answers_df[
-                                (answers_df["Video ID"] == video_id) & 
-                                (answers_df["User ID"].isin(annotator_user_ids))
-                            ]
-                            
-                            # Count all annotator answers for this question/video
-                            for _, answer_row in video_answers.iterrows():
-                                total_comparisons += 1
-                                if answer_row["Answer Value"] == gt_answer:
-                                    correct_comparisons += 1
-                    
-                    if total_comparisons > 0:
-                        accuracy_rates[video_id] = correct_comparisons / total_comparisons
-                    else:
-                        accuracy_rates[video_id] = 0.0
-                        
-                except Exception:
-                    accuracy_rates[video_id] = 0.0
         
-        return accuracy_rates
+        if not annotator_user_ids:
+            return {}
+        
+        # Every annotator answer on a question with ground truth is one comparison
+        metrics = metrics if metrics is not None else get_project_answer_cube(project_id)
+        return _project_video_scores(project_id, metrics.accuracy_rates(annotator_user_ids, question_ids))
     except Exception as e:
         st.error(f"Error calculating accuracy rates: {str(e)}")
         return {}
     
-def get_video_completion_rates_enhanced(project_id: int, question_ids: List[int]) -> Dict[int, float]:
+def get_video_completion_rates_enhanced(project_id: int, question_ids: List[int],
+                                        metrics: ProjectAnswerCube = None) -> Dict[int, float]:
     """Get completion rates for each video based on specific questions"""
     try:
         if not question_ids:
             return {}
-            
-        videos = get_project_videos(project_id=project_id)
-        completion_rates = {}
         
-        with get_db_session() as session:
-            for video in videos:
-                video_id = video["id"]
-                completed_questions = 0
-                
-                for question_id in question_ids:
-                    try:
-                        # Check if this question has ground truth for this video
-                        gt_df = GroundTruthService.get_ground_truth(
-                            video_id=video_id, project_id=project_id, session=session
-                        )
-                        if not gt_df.empty:
-                            question_answers = gt_df[gt_df["Question ID"] == question_id]
-                            if not question_answers.empty:
-                                completed_questions += 1
-                    except:
-                        continue
-                
-                completion_rates[video_id] = (completed_questions / len(question_ids)) * 100 if question_ids else 0.0
-        
-        return completion_rates
+        metrics = metrics if metrics is not None else get_project_answer_cube(project_id)
+        return _project_video_scores(project_id, metrics.completion_rates(question_ids))
     except Exception as e:
         st.error(f"Error calculating video completion rates: {str(e)}")
         return {}
@@ -3184,95 +3065,58 @@ def apply_video_sorting_and_filtering_enhanced(videos: List[Dict], sort_by: str,
     try:
         sort_config = sort_config or {}
         
+        # Only apply advanced sorting if it was explicitly applied by user
+        score_sort = sort_by != "Default" and st.session_state.get(f"sort_applied_{project_id}", False)
+        
         # For Default sorting, we still need to respect ascending/descending order
         # Sort by video ID as a stable sort key
-        if sort_by == "Default":
+        if not score_sort:
             reverse = (sort_order == "Descending")
             videos.sort(key=lambda x: x.get("id", 0), reverse=reverse)
-        else:
-            # Only apply advanced sorting if it was explicitly applied by user
-            sort_applied = st.session_state.get(f"sort_applied_{project_id}", False)
-            
-            if not sort_applied:
-                # If sort hasn't been applied yet, use default order
-                reverse = (sort_order == "Descending")
-                videos.sort(key=lambda x: x.get("id", 0), reverse=reverse)
-            else:
-                # Get sorting data based on configuration
-                if sort_by == "Model Confidence":
-                    model_user_ids = sort_config.get("model_user_ids", [])
-                    question_ids = sort_config.get("question_ids", [])
-                    if model_user_ids and question_ids:
-                        confidence_scores = get_model_confidence_scores_enhanced(
-                            project_id=project_id, model_user_ids=model_user_ids, 
-                            question_ids=question_ids
-                        )
-                    else:
-                        confidence_scores = {}
-                elif sort_by == "Annotator Consensus":
-                    question_ids = sort_config.get("question_ids", [])
-                    if question_ids and len(selected_annotators) >= 2:
-                        consensus_rates = get_annotator_consensus_rates_enhanced(
-                            project_id=project_id, selected_annotators=selected_annotators, 
-                            question_ids=question_ids
-                        )
-                    else:
-                        consensus_rates = {}
-                elif sort_by == "Completion Rate":
-                    question_ids = sort_config.get("question_ids", [])
-                    if question_ids:
-                        completion_rates = get_video_completion_rates_enhanced(
-                            project_id=project_id, question_ids=question_ids
-                        )
-                    else:
-                        completion_rates = {}
-                elif sort_by == "Accuracy Rate":
-                    question_ids = sort_config.get("question_ids", [])
-                    if question_ids and selected_annotators:
-                        accuracy_rates = get_video_accuracy_rates(
-                            project_id=project_id, selected_annotators=selected_annotators, 
-                            question_ids=question_ids
-                        )
-                    else:
-                        accuracy_rates = {}
+        
+        # The project's answer cube is shared by the sort scores and the filter
+        metrics = get_project_answer_cube(project_id) if (score_sort or filter_by_gt) else None
+        
+        scores = {}
+        if score_sort:
+            # Get sorting data based on configuration
+            question_ids = sort_config.get("question_ids", [])
+            if sort_by == "Model Confidence":
+                model_user_ids = sort_config.get("model_user_ids", [])
+                if model_user_ids and question_ids:
+                    scores = get_model_confidence_scores_enhanced(
+                        project_id=project_id, model_user_ids=model_user_ids, 
+                        question_ids=question_ids, metrics=metrics
+                    )
+            elif sort_by == "Annotator Consensus":
+                if question_ids and len(selected_annotators) >= 2:
+                    scores = get_annotator_consensus_rates_enhanced(
+                        project_id=project_id, selected_annotators=selected_annotators, 
+                        question_ids=question_ids, metrics=metrics
+                    )
+            elif sort_by == "Completion Rate":
+                if question_ids:
+                    scores = get_video_completion_rates_enhanced(
+                        project_id=project_id, question_ids=question_ids, metrics=metrics
+                    )
+            elif sort_by == "Accuracy Rate":
+                if question_ids and selected_annotators:
+                    scores = get_video_accuracy_rates(
+                        project_id=project_id, selected_annotators=selected_annotators, 
+                        question_ids=question_ids, metrics=metrics
+                    )
         
         # Apply ground truth filtering
-        filtered_videos = []
-        with get_db_session() as session:
-            for video in videos:
-                video_id = video["id"]
-                include_video = True
-                
-                if filter_by_gt:
-                    try:
-                        gt_df = GroundTruthService.get_ground_truth(video_id=video_id, project_id=project_id, session=session)
-                        if gt_df.empty:
-                            include_video = False
-                        else:
-                            for question_id, required_answer in filter_by_gt.items():
-                                question_gt = gt_df[gt_df["Question ID"] == question_id]
-                                if question_gt.empty or question_gt.iloc[0]["Answer Value"] != required_answer:
-                                    include_video = False
-                                    break
-                    except:
-                        include_video = False
-                
-                if include_video:
-                    # Add sorting score to video (only for non-default sorts)
-                    if sort_by != "Default" and st.session_state.get(f"sort_applied_{project_id}", False):
-                        if sort_by == "Model Confidence":
-                            video["sort_score"] = confidence_scores.get(video_id, 0)
-                        elif sort_by == "Annotator Consensus":
-                            video["sort_score"] = consensus_rates.get(video_id, 0)
-                        elif sort_by == "Completion Rate":
-                            video["sort_score"] = completion_rates.get(video_id, 0)
-                        elif sort_by == "Accuracy Rate":
-                            video["sort_score"] = accuracy_rates.get(video_id, 0)
-                    
-                    filtered_videos.append(video)
-            
+        if filter_by_gt:
+            matching_video_ids = metrics.videos_matching_ground_truth(filter_by_gt)
+            filtered_videos = [video for video in videos if video["id"] in matching_video_ids]
+        else:
+            filtered_videos = list(videos)
+        
         # Sort videos by score if not default
-        if sort_by != "Default" and st.session_state.get(f"sort_applied_{project_id}", False):
+        if score_sort:
+            for video in filtered_videos:
+                video["sort_score"] = scores.get(video["id"], 0)
             reverse = (sort_order == "Descending")
             filtered_videos.sort(key=lambda x: x.get("sort_score", 0), reverse=reverse)
         
@@ -3313,142 +3157,13 @@ def apply_annotator_video_sorting(videos: List[Dict], sort_by: str, sort_order:
         if not question_ids:
             return videos
         
-        # Calculate scores for each video
-        video_scores = {}
-        with get_db_session() as session:
-            for video in videos:
-                video_id = video["id"]
-                
-                if sort_by == "Completion Rate":
-                    # Calculate completion rate for this user
-                    completed_questions = 0
-                    for question_id in question_ids:
-                        try:
-                            answers_df = AnnotatorService.get_question_answers(
-                                question_id=question_id, project_id=project_id, session=session
-                            )
-                            if not answers_df.empty:
-                                user_answers = answers_df[
-                                    (answers_df["User ID"] == user_id) & 
-                                    (answers_df["Video ID"] == video_id)
-                                ]
-                                if not user_answers.empty:
-                                    completed_questions += 1
-                        except:
-                            continue
-                    
-                    video_scores[video_id] = (completed_questions / len(question_ids)) * 100 if question_ids else 0
-                    
-                # else:  # Accuracy Rate
-                #     # Calculate accuracy rate vs ground truth for this user
-                #     correct_count = 0
-                #     total_count = 0
-                    
-                #     try:
-                #         gt_df = GroundTruthService.get_ground_truth(
-                #             video_id=video_id, project_id=project_id, session=session
-                #         )
-                        
-                #         if not gt_df.empty:
-                #             for question_id in question_ids:
-                #                 # Get ground truth for this question
-                #                 question_gt = gt_df[gt_df["Question ID"] == question_id]
-                #                 if question_gt.empty:
-                #                     continue
-                                
-                #                 gt_answer = question_gt.iloc[0]["Answer Value"]
-                                
-                #                 # Get user's answer
-                #                 answers_df = AnnotatorService.get_question_answers(
-                #                     question_id=question_id, project_id=project_id, session=session
-                #                 )
-                                
-                #                 if not answers_df.empty:
-                #                     user_answers = answers_df[
-                #                         (answers_df["User ID"] == user_id) & 
-                #                         (answers_df["Video ID"] == video_id)
-                #                     ]
-                                    
-                #                     if not user_answers.empty:
-                #                         user_answer = user_answers.iloc[0]["Answer Value"]
-                #                         total_count += 1
-                #                         if user_answer == gt_answer:
-                #                             correct_count += 1
-                        
-                #         video_scores[video_id] = (correct_count / total_count) * 100 if total_count > 0 else 0
-                #     except:
-                #         video_scores[video_id] = 0
-                else:  # Accuracy Rate
-                    # Calculate accuracy rate vs ground truth for this user
-                    correct_count = 0
-                    total_count = 0
-                    
-                    try:
-                        for question_id in question_ids:
-                            # Get question details using service
-                            question_info = QuestionService.get_question_by_id(
-                                question_id=question_id, session=session
-                            )
-                            
-                            if question_info["type"] == "single":
-                                # Handle single-choice questions
-                                gt_df = GroundTruthService.get_ground_truth(
-                                    video_id=video_id, project_id=project_id, session=session
-                                )
-                                
-                                if not gt_df.empty:
-                                    question_gt = gt_df[gt_df["Question ID"] == question_id]
-                                    if not question_gt.empty:
-                                        gt_answer = question_gt.iloc[0]["Answer Value"]
-                                        
-                                        # FIXED: Use get_answers() which includes Answer ID
-                                        answers_df = AnnotatorService.get_answers(
-                                            video_id=video_id, project_id=project_id, session=session
-                                        )
-                                        
-                                        if not answers_df.empty:
-                                            user_answer = answers_df[
-                                                (answers_df["User ID"] == user_id) & 
-                                                (answers_df["Question ID"] == question_id)  # FIXED: Filter by Question ID
-                                            ]
-                                            
-                                            if not user_answer.empty:
-                                                total_count += 1
-                                                if user_answer.iloc[0]["Answer Value"] == gt_answer:
-                                                    correct_count += 1
-                                                    
-                            elif question_info["type"] == "description":
-                                # Handle description questions with review status
-                                # FIXED: Use get_answers() which includes Answer ID
-                                answers_df = AnnotatorService.get_answers(
-                                    video_id=video_id, project_id=project_id, session=session
-                                )
-                                
-                                if not answers_df.empty:
-                                    user_answer = answers_df[
-                                        (answers_df["User ID"] == user_id) & 
-                                        (answers_df["Question ID"] == question_id)  # FIXED: Filter by Question ID
-                                    ]
-                                    
-                                    if not user_answer.empty:
-                                        answer_id = user_answer.iloc[0]["Answer ID"]  # Now this will work!
-                                        
-                                        # Get review status using service
-                                        review = GroundTruthService.get_answer_review(
-                                            answer_id=answer_id, session=session
-                                        )
-                                        
-                                        if review and review.get("status") in ["approved", "rejected"]:
-                                            total_count += 1
-                                            if review.get("status") == "approved":
-                                                correct_count += 1
-                                        # If pending or no review, don't count towards accuracy
-                        
-                        video_scores[video_id] = (correct_count / total_count * 100) if total_count > 0 else 0
-                        
-                    except Exception as e:
-                        print(f"Error calculating accuracy for video {video_id}: {e}")
-                        video_scores[video_id] = 0.0
+        # Calculate scores for all videos from one load of the project's answers and ground truth
+        metrics = _load_sort_metrics(project_id, question_ids)
+        if sort_by == "Completion Rate":
+            video_scores = metrics.user_completion_rates(user_id, question_ids)
+        else:  # Accuracy Rate
+            # Single-choice answers are compared to ground truth, description answers use their review status
+            video_scores = metrics.user_accuracy_rates(user_id, question_ids)
 
         # Add scores to videos and sort
         for video in videos:
@@ -3456,10 +3171,6 @@ def apply_annotator_video_sorting(videos: List[Dict], sort_by: str, sort_order:
         
         reverse = (sort_order == "Descending")
         videos.sort(key=lambda x: x.get("sort_score", 0), reverse=reverse)
-        # # print first five videos and their scores
-        # print(f"Sorting by {sort_by} with {sort_order} order")
-        # for video in videos[:5]:
-        #     print(f"Video ID: {video['id']}, Score: {video['sort_score']}")
         return videos
         
     except Exception as e:
@@ -3765,6 +3476,14 @@ def display_project_view(user_id: int, role: str):
     video_list_info_str = f"Showing videos {start_idx + 1}-{end_idx} of {len(videos)}"
     display_pagination_controls(current_page, total_pages, page_key, role, project_id, "top", video_list_info_str)
 
+    # Prefetch display data for the whole page with a constant number of queries
+    selected_annotators = st.session_state.get("selected_annotators", []) if role in ["reviewer", "meta_reviewer"] else None
+    with get_db_session() as session:
+        st.session_state[f"page_video_data_{project_id}_{role}"] = GroundTruthService.batch_get_complete_video_data_for_display(
+            video_ids=[video["id"] for video in page_videos], project_id=project_id, user_id=user_id, role=role,
+            session=session, selected_annotators=selected_annotators
+        )
+
     # Display videos
     for i in range(0, len(page_videos), video_pairs_per_row):
         row_videos = page_videos[i:i + video_pairs_per_row]
@@ -2,20 +2,24 @@
 """
 Ground Truth Export Script
 
-This script exports ground truth data from one or more projects to JSON or Excel format.
+This script exports ground truth data from one or more projects to JSON, NDJSON or Excel format.
+JSON and NDJSON exports are streamed from the database straight to the output file (or stdout);
+Excel exports are streamed row by row in openpyxl write-only mode.
 It validates that reusable question groups have consistent answers across projects before exporting.
 Supports both project IDs (integers) and project names (strings).
 
 Usage:
-    python label_pizza/export.py [projects...] --format [json|excel] --output output_file
+    python label_pizza/export.py [projects...] --format [json|ndjson|excel] --output output_file
 
 Examples:
     python label_pizza/export.py 1 2 3 --format json --output export.json
     python label_pizza/export.py "Project Alpha" "Project Beta" --format excel --output results.xlsx
     python label_pizza/export.py 1 "Project Beta" 3 --format json --output mixed.json
+    python label_pizza/export.py 1 2 --format ndjson --output - | head
 """
 
 import argparse
+import contextlib
 import os
 import json
 import sys
@@ -24,7 +28,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 from dotenv import load_dotenv
 
-from label_pizza.services import GroundTruthExportService, ProjectService, save_export_as_json, save_export_as_excel
+from label_pizza.services import GroundTruthExportService, ProjectService, save_export_as_excel, write_json_array, write_ndjson
 from label_pizza.db import init_database
 
 def resolve_projects_to_ids(projects, session):
@@ -75,6 +79,7 @@ Examples:
   %(prog)s 1 2 3 --format json --output export.json
   %(prog)s "Project Alpha" "Project Beta" --format excel --output results.xlsx
   %(prog)s 1 "Project Beta" 3 --format json --output mixed.json
+  %(prog)s 1 2 --format ndjson --output -
 
 The script will validate that reusable question groups have consistent answers
 across projects before exporting. If inconsistencies are found, the export will
@@ -93,15 +98,15 @@ should be quoted.
     
     parser.add_argument(
         "--format", 
-        choices=["json", "excel"], 
+        choices=["json", "ndjson", "excel"], 
         default="json", 
-        help="Export format (default: json)"
+        help="Export format (default: json). ndjson writes one video per line"
     )
     
     parser.add_argument(
         "--output", "-o", 
         required=True, 
-        help="Output file path"
+        help="Output file path, or - to stream JSON/NDJSON to stdout"
     )
     
     parser.add_argument(
@@ -118,34 +123,49 @@ should be quoted.
     
     args = parser.parse_args()
     
+    to_stdout = args.output == "-"
+    if to_stdout and args.format == "excel":
+        print("Error: Excel exports cannot be written to stdout")
+        return 1
+    
+    # Messages go to stderr when the export itself is streamed to stdout
+    log = sys.stderr if to_stdout else sys.stdout
 
     load_dotenv(".env")  # loads DBURL
     if args.verbose:
-        print("Loading database URL from .env file")
+        print("Loading database URL from .env file", file=log)
 
     # Initialize database
     try:
-        init_database(args.database_url_name)
+        with contextlib.redirect_stdout(log):
+            init_database(args.database_url_name)
         if args.verbose:
-            print(f"Database initialized using {args.database_url_name}")
+            print(f"Database initialized using {args.database_url_name}", file=log)
         import label_pizza.db
     except Exception as e:
-        print(f"Error initializing database: {e}")
+        print(f"Error initializing database: {e}", file=log)
         return 1
     
     # Validate and prepare output path
     output_path = Path(args.output)
-    if args.format == "json" and not output_path.suffix.lower() == ".json":
+    if to_stdout:
+        pass
+    elif args.format == "json" and not output_path.suffix.lower() == ".json":
         output_path = output_path.with_suffix(".json")
         if args.verbose:
             print(f"Auto-corrected output path to: {output_path}")
+    elif args.format == "ndjson" and not output_path.suffix.lower() == ".ndjson":
+        output_path = output_path.with_suffix(".ndjson")
+        if args.verbose:
+            print(f"Auto-corrected output path to: {output_path}")
     elif args.format == "excel" and not output_path.suffix.lower() in [".xlsx", ".xls"]:
         output_path = output_path.with_suffix(".xlsx")
         if args.verbose:
             print(f"Auto-corrected output path to: {output_path}")
     
     # Create output directory if it doesn't exist
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if not to_stdout:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
     
     
     try:
@@ -167,55 +187,65 @@ should be quoted.
                         project_display.append(f"ID:{proj}")
                     else:
                         project_display.append(f"'{proj}'")
-                print(f"Exporting ground truth data from projects: {', '.join(project_display)}")
+                print(f"Exporting ground truth data from projects: {', '.join(project_display)}", file=log)
             
             # Resolve project names to IDs
             try:
                 project_ids = resolve_projects_to_ids(projects, session)
                 if args.verbose:
-                    print(f"Resolved to project IDs: {project_ids}")
+                    print(f"Resolved to project IDs: {project_ids}", file=log)
             except ValueError as e:
-                print(f"✗ Error resolving projects: {e}")
+                print(f"✗ Error resolving projects: {e}", file=log)
                 return 1
             
-            # Export data with validation using existing service
-            export_data = GroundTruthExportService.export_ground_truth_data(project_ids, session)
+            # Export data with validation using existing service; videos are streamed
+            records = GroundTruthExportService.iter_ground_truth_data(project_ids, session)
             
-            if args.verbose:
-                print(f"Found {len(export_data)} videos with ground truth data")
-                
-                # Show summary of questions found
-                all_questions = set()
-                for video in export_data:
-                    all_questions.update(video["answers"].keys())
-                print(f"Total unique questions: {len(all_questions)}")
+            # Collect summary statistics while the records stream past
+            all_questions = set()
+            total_answers = 0
+            
+            def counted(videos):
+                nonlocal total_answers
+                for video in videos:
+                    total_answers += len(video["answers"])
+                    if args.verbose:
+                        all_questions.update(video["answers"].keys())
+                    yield video
             
-            # Save data in requested format using existing functions
+            target = "-" if to_stdout else str(output_path)
             if args.format == "json":
-                save_export_as_json(export_data, str(output_path))
-                print(f"✓ Successfully exported to JSON: {output_path}")
+                video_count = write_json_array(counted(records), target, indent=2)
+                print(f"✓ Successfully exported to JSON: {output_path}", file=log)
+            elif args.format == "ndjson":
+                video_count = write_ndjson(counted(records), target)
+                print(f"✓ Successfully exported to NDJSON: {output_path}", file=log)
             else:  # excel
-                save_export_as_excel(export_data, str(output_path))
-                print(f"✓ Successfully exported to Excel: {output_path}")
+                questions = GroundTruthExportService.get_export_question_texts(project_ids, session)
+                video_count = save_export_as_excel(counted(records), str(output_path), questions=questions)
+                print(f"✓ Successfully exported to Excel: {output_path}", file=log)
+            
+            if args.verbose:
+                print(f"Found {video_count} videos with ground truth data", file=log)
+                print(f"Total unique questions: {len(all_questions)}", file=log)
             
             # Show some statistics
-            if export_data:
-                total_answers = sum(len(video["answers"]) for video in export_data)
-                print(f"Export summary:")
-                print(f"  - Videos: {len(export_data)}")
-                print(f"  - Total answers: {total_answers}")
-                print(f"  - Average answers per video: {total_answers/len(export_data):.1f}")
+            if video_count:
+                print(f"Export summary:", file=log)
+                print(f"  - Videos: {video_count}", file=log)
+                print(f"  - Total answers: {total_answers}", file=log)
+                print(f"  - Average answers per video: {total_answers/video_count:.1f}", file=log)
             else:
-                print("Warning: No ground truth data found for the specified projects")
+                print("Warning: No ground truth data found for the specified projects", file=log)
     
     except ValueError as e:
-        print(f"✗ Export failed: {e}")
+        print(f"✗ Export failed: {e}", file=log)
         return 1
     except KeyboardInterrupt:
-        print("\n✗ Export cancelled by user")
+        print("\n✗ Export cancelled by user", file=log)
         return 1
     except Exception as e:
-        print(f"✗ Unexpected error: {e}")
+        print(f"✗ Unexpected error: {e}", file=log)
         if args.verbose:
             import traceback
             traceback.print_exc()
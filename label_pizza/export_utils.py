@@ -1,16 +1,41 @@
 from sqlalchemy import select, insert, update, func, delete, exists, join, distinct, and_, or_, case, text
-from sqlalchemy.orm import Session, selectinload, joinedload, contains_eager  
+from sqlalchemy.orm import Session, selectinload, joinedload, contains_eager, aliased
 import label_pizza.db
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 import pandas as pd
 import json
 import os
+import queue
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import groupby
+from datetime import datetime, timedelta, timezone
 from label_pizza.models import (
     Video, Project, ProjectVideo, Schema, QuestionGroup,
     Question, ProjectUserRole, AnnotatorAnswer, ReviewerGroundTruth, User, AnswerReview,
     QuestionGroupQuestion, SchemaQuestionGroup, ProjectGroup, ProjectGroupProject,
     ProjectVideoQuestionDisplay
 )
+from label_pizza.services import write_json_array, write_ndjson, ArrowExportService
+
+
+def _user_record(user: User) -> Dict[str, Any]:
+    return {
+        "user_id": user.user_id_str,
+        "email": user.email,
+        "password": user.password_hash,
+        "user_type": user.user_type,
+        "is_active": not user.is_archived
+    }
+
+
+def _video_record(video: Video) -> Dict[str, Any]:
+    return {
+        "video_uid": video.video_uid,
+        "url": video.url,
+        "metadata": video.video_metadata,
+        "is_active": not video.is_archived
+    }
 
 
 def export_users(output_path: str = None):
@@ -20,15 +45,7 @@ def export_users(output_path: str = None):
         users = session.execute(stmt).scalars().all()
 
         # Convert to desired format
-        users_data = []
-        for user in users:
-            users_data.append({
-                "user_id": user.user_id_str,
-                "email": user.email,
-                "password": user.password_hash,
-                "user_type": user.user_type,
-                "is_active": not user.is_archived
-            })
+        users_data = [_user_record(user) for user in users]
 
         # Write to JSON file
         with open(output_path, "w", encoding="utf-8") as f:
@@ -44,14 +61,7 @@ def export_videos(output_path: str = None):
         videos = session.execute(stmt).scalars().all()
         
         # Convert to desired format
-        videos_data = []
-        for video in videos:
-            videos_data.append({
-                "video_uid": video.video_uid,
-                "url": video.url,
-                "metadata": video.video_metadata,
-                "is_active": not video.is_archived
-            })
+        videos_data = [_video_record(video) for video in videos]
         
         # Write to JSON file
         with open(output_path, "w", encoding="utf-8") as f:
@@ -355,165 +365,352 @@ def export_assignments(output_path: str = None):
         print(f"Exported {len(final_assignments)} assignments to {output_path}")
     
 
-def export_annotations(output_folder: str = None):
-    """Export all annotations grouped by question group to separate JSON files"""
-    with label_pizza.db.SessionLocal() as session:
-        # Create output folder if it doesn't exist
-        os.makedirs(output_folder, exist_ok=True)
+def iter_annotations_by_question_group(session: Session, question_group_ids: Optional[List[int]] = None,
+                                       batch_size: int = 1000, changed_since: Optional[datetime] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (question_group_id, record) annotation pairs from one scan of annotator_answers.
+    
+    Answers are joined to question group membership and read through a server-side cursor
+    ordered by question group, project, user and video, so each record is complete as soon
+    as the next key starts and nothing else is kept. With changed_since, only complete
+    records for (project, user, video) keys with an answer modified after it are emitted.
+    """
+    stmt = (
+        select(
+            QuestionGroupQuestion.question_group_id, QuestionGroup.title, Question.text,
+            AnnotatorAnswer.answer_value, AnnotatorAnswer.confidence_score,
+            User.user_id_str, Project.name, Video.video_uid
+        )
+        .join(QuestionGroupQuestion, QuestionGroupQuestion.question_id == AnnotatorAnswer.question_id)
+        .join(QuestionGroup, QuestionGroup.id == QuestionGroupQuestion.question_group_id)
+        .join(Question, Question.id == AnnotatorAnswer.question_id)
+        .join(User, AnnotatorAnswer.user_id == User.id)
+        .join(Project, AnnotatorAnswer.project_id == Project.id)
+        .join(Video, AnnotatorAnswer.video_id == Video.id)
+        .order_by(
+            QuestionGroupQuestion.question_group_id, Project.name, User.user_id_str, Video.video_uid,
+            QuestionGroupQuestion.display_order
+        )
+        .execution_options(yield_per=batch_size)
+    )
+    if question_group_ids is not None:
+        stmt = stmt.where(QuestionGroupQuestion.question_group_id.in_(question_group_ids))
+    if changed_since is not None:
+        changed = aliased(AnnotatorAnswer)
+        stmt = stmt.where(exists().where(
+            changed.project_id == AnnotatorAnswer.project_id,
+            changed.user_id == AnnotatorAnswer.user_id,
+            changed.video_id == AnnotatorAnswer.video_id,
+            changed.modified_at > changed_since
+        ))
+    
+    current_key = None
+    annotation_data = None
+    for group_id, group_title, question_text, answer_value, confidence_score, user_name, project_name, video_uid in session.execute(stmt):
+        key = (group_id, project_name, user_name, video_uid)
+        if key != current_key:
+            if annotation_data is not None:
+                yield current_key[0], annotation_data
+            current_key = key
+            annotation_data = {
+                "question_group_title": group_title,
+                "project_name": project_name,
+                "user_name": user_name,
+                "video_uid": video_uid,
+                "answers": {},
+                "is_ground_truth": False
+            }
         
-        # Get all question groups
-        stmt_qgroups = select(QuestionGroup)
-        question_groups = session.execute(stmt_qgroups).scalars().all()
+        annotation_data["answers"][question_text] = answer_value
         
-        for qg in question_groups:
-            annotations_data = []
-            
-            # Get questions in this question group
-            stmt_questions = (
-                select(Question.id, Question.text)
-                .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
-                .where(QuestionGroupQuestion.question_group_id == qg.id)
-                .order_by(QuestionGroupQuestion.display_order)
-            )
-            questions = session.execute(stmt_questions).all()
-            question_ids = [q.id for q in questions]
-            question_texts = {q.id: q.text for q in questions}
-            
-            # Get annotator answers for these questions
-            stmt_annotations = (
-                select(AnnotatorAnswer, User.user_id_str, Project.name, Video.video_uid)
-                .join(User, AnnotatorAnswer.user_id == User.id)
-                .join(Project, AnnotatorAnswer.project_id == Project.id)
-                .join(Video, AnnotatorAnswer.video_id == Video.id)
-                .where(AnnotatorAnswer.question_id.in_(question_ids))
-                .order_by(Project.name, User.user_id_str, Video.video_uid)
+        # Only add confidence_scores if there are any
+        if confidence_score is not None:
+            annotation_data.setdefault("confidence_scores", {})[question_text] = confidence_score
+    
+    if annotation_data is not None:
+        yield current_key[0], annotation_data
+
+
+def iter_ground_truths_by_question_group(session: Session, question_group_ids: Optional[List[int]] = None,
+                                         batch_size: int = 1000, changed_since: Optional[datetime] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (question_group_id, record) ground truth pairs from one scan of reviewer_ground_truth.
+    
+    Same streaming strategy and changed_since semantics as iter_annotations_by_question_group;
+    a ground truth row counts as changed when it was created, modified or overridden by an admin.
+    """
+    stmt = (
+        select(
+            QuestionGroupQuestion.question_group_id, QuestionGroup.title, Question.text,
+            ReviewerGroundTruth.answer_value, User.user_id_str, Project.name, Video.video_uid
+        )
+        .join(QuestionGroupQuestion, QuestionGroupQuestion.question_id == ReviewerGroundTruth.question_id)
+        .join(QuestionGroup, QuestionGroup.id == QuestionGroupQuestion.question_group_id)
+        .join(Question, Question.id == ReviewerGroundTruth.question_id)
+        .join(User, ReviewerGroundTruth.reviewer_id == User.id)
+        .join(Project, ReviewerGroundTruth.project_id == Project.id)
+        .join(Video, ReviewerGroundTruth.video_id == Video.id)
+        .order_by(
+            QuestionGroupQuestion.question_group_id, Project.name, User.user_id_str, Video.video_uid,
+            QuestionGroupQuestion.display_order
+        )
+        .execution_options(yield_per=batch_size)
+    )
+    if question_group_ids is not None:
+        stmt = stmt.where(QuestionGroupQuestion.question_group_id.in_(question_group_ids))
+    if changed_since is not None:
+        changed = aliased(ReviewerGroundTruth)
+        stmt = stmt.where(exists().where(
+            changed.project_id == ReviewerGroundTruth.project_id,
+            changed.reviewer_id == ReviewerGroundTruth.reviewer_id,
+            changed.video_id == ReviewerGroundTruth.video_id,
+            or_(
+                changed.created_at > changed_since,
+                changed.modified_at > changed_since,
+                changed.modified_by_admin_at > changed_since
             )
-            annotator_results = session.execute(stmt_annotations).all()
-            
-            # Group answers by (project, user, video)
-            grouped_answers = {}
-            
-            # Process annotator answers
-            for answer, user_name, project_name, video_uid in annotator_results:
-                key = (project_name, user_name, video_uid, False)  # False = not ground truth
-                if key not in grouped_answers:
-                    grouped_answers[key] = {}
-                
-                # Store both answer value and confidence score
-                answer_data = {
-                    "value": answer.answer_value
-                }
-                
-                # Only include confidence_score if it's not None
-                if answer.confidence_score is not None:
-                    answer_data["confidence_score"] = answer.confidence_score
-                
-                grouped_answers[key][answer.question_id] = answer_data
-            
-            # Convert to output format
-            for (project_name, user_name, video_uid, is_gt), answers in grouped_answers.items():
-                # Build answers and confidence_scores dictionaries separately
-                formatted_answers = {}
-                confidence_scores = {}
-                has_confidence_scores = False
-                
-                for q_id, answer_data in answers.items():
-                    question_text = question_texts[q_id]
-                    formatted_answers[question_text] = answer_data["value"]
-                    
-                    if "confidence_score" in answer_data:
-                        confidence_scores[question_text] = answer_data["confidence_score"]
-                        has_confidence_scores = True
-                
-                annotation_data = {
-                    "question_group_title": qg.title,
-                    "project_name": project_name,
-                    "user_name": user_name,
-                    "video_uid": video_uid,
-                    "answers": formatted_answers,
-                    "is_ground_truth": is_gt
-                }
-                
-                # Only add confidence_scores if there are any
-                if has_confidence_scores:
-                    annotation_data["confidence_scores"] = confidence_scores
-                
-                annotations_data.append(annotation_data)
-            
-            # Write to file
-            filename = f"{qg.title.replace(' ', '_').replace('/', '_')}_annotations.json"
-            filepath = os.path.join(output_folder, filename)
-            
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(annotations_data, f, indent=2, ensure_ascii=False)
+        ))
+    
+    current_key = None
+    gt_data = None
+    for group_id, group_title, question_text, answer_value, user_name, project_name, video_uid in session.execute(stmt):
+        key = (group_id, project_name, user_name, video_uid)
+        if key != current_key:
+            if gt_data is not None:
+                yield current_key[0], gt_data
+            current_key = key
+            gt_data = {
+                "question_group_title": group_title,
+                "project_name": project_name,
+                "user_name": user_name,
+                "video_uid": video_uid,
+                "answers": {},
+                "is_ground_truth": True
+            }
+        gt_data["answers"][question_text] = answer_value
+    
+    if gt_data is not None:
+        yield current_key[0], gt_data
+
+
+def iter_question_group_annotations(session: Session, question_group: QuestionGroup, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """Yield one annotation record per (project, user, video) for a question group."""
+    for _, record in iter_annotations_by_question_group(session, [question_group.id], batch_size):
+        yield record
+
+
+def iter_question_group_ground_truths(session: Session, question_group: QuestionGroup, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """Yield one ground truth record per (project, reviewer, video) for a question group."""
+    for _, record in iter_ground_truths_by_question_group(session, [question_group.id], batch_size):
+        yield record
+
+
+def _write_question_group_file(records: Iterator[Dict[str, Any]], output_folder: str, base_name: str, format: str) -> int:
+    """Stream one question group's records to <base_name>.json or <base_name>.ndjson."""
+    if format == "ndjson":
+        return write_ndjson(records, os.path.join(output_folder, f"{base_name}.ndjson"))
+    return write_json_array(records, os.path.join(output_folder, f"{base_name}.json"), indent=2)
+
+
+def _question_group_base_name(title: str, suffix: str) -> str:
+    return f"{title.replace(' ', '_').replace('/', '_')}_{suffix}"
+
+
+_END_OF_GROUP = object()
+
+
+def _drain_queue(records: "queue.Queue") -> Iterator[Dict[str, Any]]:
+    while True:
+        record = records.get()
+        if record is _END_OF_GROUP:
+            return
+        yield record
+
+
+def _put_record(records: "queue.Queue", record: Any, writer: Future) -> None:
+    """Queue a record for a writer, surfacing the writer's error instead of blocking on a full queue."""
+    while True:
+        try:
+            records.put(record, timeout=1)
+            return
+        except queue.Full:
+            if writer.done():
+                writer.result()
+                return
+
+
+def _export_partitioned_records(session: Session, records_by_group: Iterator[Tuple[int, Dict[str, Any]]],
+                                output_folder: str, suffix: str, format: str, max_workers: int,
+                                include_empty: bool = True) -> int:
+    """Fan (question_group_id, record) pairs out to one file per question group.
+    
+    Pairs must arrive grouped by question group. With max_workers > 0, serialization and
+    file writes run on a thread pool fed through bounded queues while the database cursor
+    keeps reading on the calling thread. Question groups without records still get an
+    empty file unless include_empty is False. Returns the number of question group files written.
+    """
+    question_groups = session.execute(select(QuestionGroup.id, QuestionGroup.title)).all()
+    os.makedirs(output_folder, exist_ok=True)
+    
+    written = set()
+    executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 0 else None
+    futures = []
+    titles = dict(question_groups)
+    try:
+        if executor is None:
+            for group_id, group_records in groupby(records_by_group, key=lambda pair: pair[0]):
+                written.add(group_id)
+                _write_question_group_file(
+                    (record for _, record in group_records), output_folder,
+                    _question_group_base_name(titles[group_id], suffix), format
+                )
+        else:
+            for group_id, group_records in groupby(records_by_group, key=lambda pair: pair[0]):
+                written.add(group_id)
+                records = queue.Queue(maxsize=1000)
+                futures.append(executor.submit(
+                    _write_question_group_file, _drain_queue(records), output_folder,
+                    _question_group_base_name(titles[group_id], suffix), format
+                ))
+                try:
+                    for _, record in group_records:
+                        _put_record(records, record, futures[-1])
+                finally:
+                    # Always terminate the group so its writer can finish
+                    _put_record(records, _END_OF_GROUP, futures[-1])
         
-        print(f"Exported annotations for {len(question_groups)} question groups to {output_folder}")
+        if include_empty:
+            for group_id, title in question_groups:
+                if group_id not in written:
+                    _write_question_group_file(iter(()), output_folder, _question_group_base_name(title, suffix), format)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
+    for future in futures:
+        future.result()
+    return len(question_groups) if include_empty else len(written)
+
+
+def export_annotations(output_folder: str = None, format: str = "json", max_workers: int = 0):
+    """Export all annotations grouped by question group to separate JSON files
+    
+    All answers are read in a single ordered scan and fanned out to one file per question
+    group, so memory use does not grow with the number of answers. Use format="ndjson" to
+    write one record per line instead of a JSON array, and max_workers to serialize files
+    on a thread pool while the scan continues.
+    """
+    if format not in ("json", "ndjson"):
+        raise ValueError(f"Unsupported format: {format}")
+    
+    with label_pizza.db.SessionLocal() as session:
+        group_count = _export_partitioned_records(
+            session, iter_annotations_by_question_group(session), output_folder, "annotations", format, max_workers
+        )
+        print(f"Exported annotations for {group_count} question groups to {output_folder}")
 
 
-def export_ground_truths(output_folder: str = None):
-    """Export all ground truth annotations grouped by question group to separate JSON files"""
+def export_ground_truths(output_folder: str = None, format: str = "json", max_workers: int = 0):
+    """Export all ground truth annotations grouped by question group to separate JSON files
+    
+    Records are streamed from a single scan; see export_annotations.
+    """
+    if format not in ("json", "ndjson"):
+        raise ValueError(f"Unsupported format: {format}")
+    
+    with label_pizza.db.SessionLocal() as session:
+        group_count = _export_partitioned_records(
+            session, iter_ground_truths_by_question_group(session), output_folder, "ground_truths", format, max_workers
+        )
+        print(f"Exported ground truths for {group_count} question groups to {output_folder}")
+
+
+def _write_partitioned_parquet(batches, dataset_folder: str, schema, row_group_size: int, compression: str) -> int:
+    """Write record batches ordered by (project_name, question_group_title) as a hive-partitioned dataset.
+    
+    Batches are read on the calling thread (they share the caller's database session), and
+    rows are buffered per partition so each row group holds up to row_group_size rows.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from urllib.parse import quote
+    
+    file_schema = schema.remove(schema.get_field_index("question_group_title")).remove(schema.get_field_index("project_name"))
+    writer = None
+    current_key = None
+    pending = []
+    pending_rows = 0
+    row_count = 0
+    
+    def flush():
+        nonlocal pending, pending_rows
+        if pending:
+            writer.write_table(pa.Table.from_batches(pending, schema=file_schema), row_group_size=row_group_size)
+        pending, pending_rows = [], 0
+    
+    try:
+        for batch in batches:
+            projects = batch.column(0).to_pylist()
+            groups = batch.column(1).to_pylist()
+            data = batch.drop_columns(["project_name", "question_group_title"])
+            start = 0
+            while start < batch.num_rows:
+                key = (projects[start], groups[start])
+                end = start + 1
+                while end < batch.num_rows and (projects[end], groups[end]) == key:
+                    end += 1
+                if key != current_key:
+                    if writer is not None:
+                        flush()
+                        writer.close()
+                    partition_folder = os.path.join(
+                        dataset_folder, f"project_name={quote(key[0], safe='')}",
+                        f"question_group_title={quote(key[1], safe='')}"
+                    )
+                    os.makedirs(partition_folder, exist_ok=True)
+                    writer = pq.ParquetWriter(
+                        os.path.join(partition_folder, "part-0.parquet"), file_schema, compression=compression
+                    )
+                    current_key = key
+                pending.append(data.slice(start, end - start))
+                pending_rows += end - start
+                row_count += end - start
+                if pending_rows >= row_group_size:
+                    flush()
+                start = end
+        if writer is not None:
+            flush()
+    finally:
+        if writer is not None:
+            writer.close()
+    return row_count
+
+
+def export_parquet_datasets(output_folder: str = None, project_ids: Optional[List[int]] = None,
+                            row_group_size: int = 128 * 1024, compression: str = "zstd"):
+    """Export answers, ground truth and reviews as partitioned Parquet datasets
+    
+    Writes answers/, ground_truths/ and reviews/ under output_folder, each hive-partitioned
+    by project_name and question_group_title (read back with
+    pyarrow.dataset.dataset(path, partitioning="hive")). Rows are streamed from the database
+    in Arrow record batches, so memory stays bounded by the row group size. Requires pyarrow.
+    """
+    ArrowExportService._require_pyarrow()
+    
+    datasets = [
+        ("answers", ArrowExportService.iter_answer_batches, ArrowExportService.answers_schema()),
+        ("ground_truths", ArrowExportService.iter_ground_truth_batches, ArrowExportService.ground_truth_schema()),
+        ("reviews", ArrowExportService.iter_review_batches, ArrowExportService.reviews_schema()),
+    ]
+    
     with label_pizza.db.SessionLocal() as session:
-        # Create output folder if it doesn't exist
         os.makedirs(output_folder, exist_ok=True)
-        
-        # Get all question groups
-        stmt_qgroups = select(QuestionGroup)
-        question_groups = session.execute(stmt_qgroups).scalars().all()
-        
-        for qg in question_groups:
-            ground_truths_data = []
-            
-            # Get questions in this question group
-            stmt_questions = (
-                select(Question.id, Question.text)
-                .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
-                .where(QuestionGroupQuestion.question_group_id == qg.id)
-                .order_by(QuestionGroupQuestion.display_order)
+        for name, iter_batches, schema in datasets:
+            dataset_folder = os.path.join(output_folder, name)
+            if os.path.isdir(dataset_folder):
+                shutil.rmtree(dataset_folder)
+            row_count = _write_partitioned_parquet(
+                iter_batches(session, project_ids), dataset_folder, schema, row_group_size, compression
             )
-            questions = session.execute(stmt_questions).all()
-            question_ids = [q.id for q in questions]
-            question_texts = {q.id: q.text for q in questions}
-            
-            # Get ground truth answers for these questions
-            stmt_gt = (
-                select(ReviewerGroundTruth, User.user_id_str, Project.name, Video.video_uid)
-                .join(User, ReviewerGroundTruth.reviewer_id == User.id)
-                .join(Project, ReviewerGroundTruth.project_id == Project.id)
-                .join(Video, ReviewerGroundTruth.video_id == Video.id)
-                .where(ReviewerGroundTruth.question_id.in_(question_ids))
-                .order_by(Project.name, User.user_id_str, Video.video_uid)
-            )
-            gt_results = session.execute(stmt_gt).all()
-            
-            # Group ground truth answers by (project, user, video)
-            grouped_gts = {}
-            
-            for gt, user_name, project_name, video_uid in gt_results:
-                key = (project_name, user_name, video_uid)
-                if key not in grouped_gts:
-                    grouped_gts[key] = {}
-                grouped_gts[key][gt.question_id] = gt.answer_value
-            
-            # Convert to output format
-            for (project_name, user_name, video_uid), answers in grouped_gts.items():
-                gt_data = {
-                    "question_group_title": qg.title,
-                    "project_name": project_name,
-                    "user_name": user_name,
-                    "video_uid": video_uid,
-                    "answers": {question_texts[q_id]: answer for q_id, answer in answers.items()},
-                    "is_ground_truth": True
-                }
-                ground_truths_data.append(gt_data)
-            
-            # Write to file
-            filename = f"{qg.title.replace(' ', '_').replace('/', '_')}_ground_truths.json"
-            filepath = os.path.join(output_folder, filename)
-            
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(ground_truths_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"Exported ground truths for {len(question_groups)} question groups to {output_folder}")
+            print(f"Exported {row_count} rows to {dataset_folder}")
 
 
 def export_workspace(output_folder: str = None):
@@ -539,3 +736,194 @@ def export_workspace(output_folder: str = None):
     ground_truths_folder = os.path.join(output_folder, 'ground_truths')
     os.makedirs(ground_truths_folder, exist_ok=True)
     export_ground_truths(ground_truths_folder)
+
+
+EXPORT_STATE_FILE = ".export_state.json"
+
+
+def _load_export_state(output_folder: str) -> Optional[Dict[str, Any]]:
+    path = os.path.join(output_folder, EXPORT_STATE_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_export_state(output_folder: str, state: Dict[str, Any]) -> None:
+    # Write then rename so an interrupted run never leaves a truncated state file
+    path = os.path.join(output_folder, EXPORT_STATE_FILE)
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(f"{path}.tmp", path)
+
+
+def _to_watermark(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _current_watermarks(session: Session) -> Dict[str, Optional[str]]:
+    """High-water marks of the change-tracking columns of each incrementally exported entity."""
+    gt_marks = session.execute(select(
+        func.max(ReviewerGroundTruth.created_at),
+        func.max(ReviewerGroundTruth.modified_at),
+        func.max(ReviewerGroundTruth.modified_by_admin_at)
+    )).one()
+    gt_marks = [_to_watermark(mark) for mark in gt_marks if mark is not None]
+    return {
+        "users": _to_watermark(session.scalar(select(func.max(User.updated_at)))),
+        "videos": _to_watermark(session.scalar(select(func.max(Video.updated_at)))),
+        "annotations": _to_watermark(session.scalar(select(func.max(AnnotatorAnswer.modified_at)))),
+        "ground_truths": max(gt_marks) if gt_marks else None
+    }
+
+
+def export_workspace_incremental(output_folder: str = None, overlap_seconds: int = 300, max_workers: int = 0) -> str:
+    """Export only what changed since the last run of this function into output_folder
+    
+    The first run performs a full export_workspace and records a high-water mark per entity
+    in output_folder/.export_state.json. Later runs write users, videos, annotations and
+    ground truths changed after the stored marks to output_folder/deltas/<timestamp>/, laid
+    out like the workspace itself; the small configuration files (question groups, schemas,
+    projects, project groups, assignments) are re-exported in full. Marks are rewound by
+    overlap_seconds so rows committed late by long transactions are not missed; the resulting
+    duplicates are harmless because compact_workspace upserts by key.
+    
+    Deletions are not tracked by watermarks; run export_workspace to pick them up.
+    
+    Returns:
+        Path of the delta folder written, or output_folder after a full export
+    """
+    state = _load_export_state(output_folder)
+    
+    with label_pizza.db.SessionLocal() as session:
+        # Read the marks before exporting so rows changed during the run are picked up next time
+        watermarks = _current_watermarks(session)
+    
+    if state is None:
+        export_workspace(output_folder)
+        _save_export_state(output_folder, {"watermarks": watermarks, "deltas": []})
+        return output_folder
+    
+    def since(entity: str) -> Optional[datetime]:
+        mark = state["watermarks"].get(entity)
+        if mark is None:
+            return None
+        return datetime.fromisoformat(mark) - timedelta(seconds=overlap_seconds)
+    
+    delta_name = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    delta_folder = os.path.join(output_folder, "deltas", delta_name)
+    os.makedirs(delta_folder, exist_ok=True)
+    
+    with label_pizza.db.SessionLocal() as session:
+        stmt = select(User)
+        if since("users") is not None:
+            stmt = stmt.where(User.updated_at > since("users"))
+        user_count = write_json_array(
+            (_user_record(user) for user in session.execute(stmt).scalars()),
+            os.path.join(delta_folder, "users.json")
+        )
+        
+        stmt = select(Video)
+        if since("videos") is not None:
+            stmt = stmt.where(Video.updated_at > since("videos"))
+        video_count = write_json_array(
+            (_video_record(video) for video in session.execute(stmt.execution_options(yield_per=1000)).scalars()),
+            os.path.join(delta_folder, "videos.json")
+        )
+        
+        annotation_files = _export_partitioned_records(
+            session, iter_annotations_by_question_group(session, changed_since=since("annotations")),
+            os.path.join(delta_folder, "annotations"), "annotations", "json", max_workers, include_empty=False
+        )
+        ground_truth_files = _export_partitioned_records(
+            session, iter_ground_truths_by_question_group(session, changed_since=since("ground_truths")),
+            os.path.join(delta_folder, "ground_truths"), "ground_truths", "json", max_workers, include_empty=False
+        )
+    
+    question_group_folder = os.path.join(output_folder, 'question_groups')
+    os.makedirs(question_group_folder, exist_ok=True)
+    export_question_groups(question_group_folder)
+    export_schemas(os.path.join(output_folder, 'schemas.json'))
+    export_projects(os.path.join(output_folder, 'projects.json'))
+    export_project_groups(os.path.join(output_folder, 'project_groups.json'))
+    export_assignments(os.path.join(output_folder, 'assignments.json'))
+    
+    # Only advance the marks once the delta is complete
+    state["watermarks"] = {
+        entity: mark if mark is not None else state["watermarks"].get(entity)
+        for entity, mark in watermarks.items()
+    }
+    state["deltas"].append(delta_name)
+    _save_export_state(output_folder, state)
+    
+    print(f"Exported delta {delta_name}: {user_count} users, {video_count} videos, "
+          f"{annotation_files} annotation files, {ground_truth_files} ground truth files")
+    return delta_folder
+
+
+def _upsert_json_file(base_path: str, delta_path: str, key_fields: Tuple[str, ...], sort: bool) -> int:
+    """Merge delta records into a base JSON array file by key, returning the number of records upserted."""
+    base = []
+    if os.path.exists(base_path):
+        with open(base_path, "r", encoding="utf-8") as f:
+            base = json.load(f)
+    with open(delta_path, "r", encoding="utf-8") as f:
+        delta = json.load(f)
+    if not delta:
+        return 0
+    
+    merged = {tuple(record[field] for field in key_fields): record for record in base}
+    for record in delta:
+        merged[tuple(record[field] for field in key_fields)] = record
+    records = sorted(merged.items()) if sort else merged.items()
+    write_json_array((record for _, record in records), base_path, indent=2)
+    return len(delta)
+
+
+def compact_workspace(output_folder: str = None) -> int:
+    """Fold the deltas written by export_workspace_incremental into the full snapshot files
+    
+    Deltas are applied oldest first. Users and videos are upserted by user_id / video_uid,
+    annotations and ground truths by (project_name, user_name, video_uid) within their
+    question group file. Applied delta folders are removed.
+    
+    Returns:
+        Number of deltas compacted
+    """
+    state = _load_export_state(output_folder)
+    if state is None:
+        raise ValueError(f"No incremental export state found in {output_folder}")
+    
+    record_key = ("project_name", "user_name", "video_uid")
+    deltas = list(state["deltas"])
+    for index, delta_name in enumerate(deltas):
+        delta_folder = os.path.join(output_folder, "deltas", delta_name)
+        if not os.path.isdir(delta_folder):
+            raise ValueError(f"Delta folder {delta_folder} is missing")
+        
+        _upsert_json_file(os.path.join(output_folder, "users.json"), os.path.join(delta_folder, "users.json"), ("user_id",), sort=False)
+        _upsert_json_file(os.path.join(output_folder, "videos.json"), os.path.join(delta_folder, "videos.json"), ("video_uid",), sort=False)
+        for sub_folder in ("annotations", "ground_truths"):
+            delta_sub_folder = os.path.join(delta_folder, sub_folder)
+            if not os.path.isdir(delta_sub_folder):
+                continue
+            os.makedirs(os.path.join(output_folder, sub_folder), exist_ok=True)
+            for filename in sorted(os.listdir(delta_sub_folder)):
+                _upsert_json_file(
+                    os.path.join(output_folder, sub_folder, filename),
+                    os.path.join(delta_sub_folder, filename), record_key, sort=True
+                )
+        
+        # Record progress after each delta so an interrupted compaction can resume
+        state["deltas"] = deltas[index + 1:]
+        _save_export_state(output_folder, state)
+        shutil.rmtree(delta_folder)
+    
+    print(f"Compacted {len(deltas)} deltas into {output_folder}")
+    return len(deltas)
@@ -20,10 +20,11 @@ Features:
 import os
 import sys
 import json
+import hashlib
 import gspread
 import argparse
+import threading
 import time
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 from google.auth.transport.requests import Request
@@ -34,6 +35,12 @@ from googleapiclient.discovery import build
 # Add the parent directory to the path so we can import from label_pizza
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from label_pizza.sheet_reports import (
+    has_activity, manual_column_positions, master_rows, user_sheet_name, user_tab_rows
+)
+from label_pizza.sheets_batch import SpreadsheetBatch
+from label_pizza.sheets_rate_limiter import SheetsRateLimiter, run_in_workers
+
 
 class GoogleSheetExporter:
     """Export annotation statistics to Google Sheets with comprehensive tracking"""
@@ -44,8 +51,12 @@ class GoogleSheetExporter:
         'https://www.googleapis.com/auth/drive'
     ]
     
-    def __init__(self, credentials_file: str, database_url_name: str):
-        """Initialize the Google Sheets exporter"""
+    def __init__(self, credentials_file: str, database_url_name: str, rate_limiter: SheetsRateLimiter = None):
+        """Initialize the Google Sheets exporter
+        
+        rate_limiter is shared by every API call of the export; by default it follows
+        the standard per-minute Sheets quotas.
+        """
         self.database_url_name = database_url_name
         
         # Initialize database first
@@ -62,14 +73,33 @@ class GoogleSheetExporter:
         self.AuthService = AuthService
         self.User = User
         
-        # Initialize Google Sheets API
+        # Initialize Google Sheets API; API services are built per thread on first use
+        self.credentials_file = credentials_file
+        self._thread_local = threading.local()
         self.client = self._setup_google_sheets_client(credentials_file)
-        self.sheets_service = self._setup_sheets_api(credentials_file)
-        self.drive_service = self._setup_drive_api(credentials_file)
+        self.sheets_service
+        self.drive_service
+        
+        # Shared by all worker threads so concurrent exports stay under quota
+        self.rate_limiter = rate_limiter or SheetsRateLimiter()
         
         # Track export failures
         self.export_failures = []
     
+    @property
+    def sheets_service(self):
+        """Sheets API service of the current thread (googleapiclient services are not thread-safe)"""
+        if not hasattr(self._thread_local, 'sheets_service'):
+            self._thread_local.sheets_service = self._setup_sheets_api(self.credentials_file)
+        return self._thread_local.sheets_service
+    
+    @property
+    def drive_service(self):
+        """Drive API service of the current thread"""
+        if not hasattr(self._thread_local, 'drive_service'):
+            self._thread_local.drive_service = self._setup_drive_api(self.credentials_file)
+        return self._thread_local.drive_service
+    
     def _setup_google_sheets_client(self, credentials_file: str):
         """Setup Google Sheets client with gspread"""
         creds = self._get_credentials(credentials_file)
@@ -211,14 +241,21 @@ class GoogleSheetExporter:
     #                     raise Exception(f"Rate limit exceeded after {max_retries} attempts during {operation_name}")
     #             else:
     #                 raise
-    def _api_call_with_retry(self, func, *args, max_retries=5, operation_name="API call", **kwargs):
-        """Execute API call with retry logic for rate limiting"""
+    def _api_call_with_retry(self, func, *args, max_retries=5, operation_name="API call", quota="write", **kwargs):
+        """Execute API call with retry logic for rate limiting
+        
+        Each attempt first takes a token from the shared rate limiter's quota
+        ("read", "write" or "drive"; None is not limited).
+        """
         for attempt in range(max_retries):
+            self.rate_limiter.acquire(quota)
             try:
                 return func(*args, **kwargs)
             except Exception as e:
                 error_str = str(e).lower()
                 if "429" in str(e) or "quota" in error_str or "rate" in error_str:
+                    # Make every worker back off, not just this one
+                    self.rate_limiter.drain(quota)
                     # Exponential backoff with longer waits: 5, 10, 20, 40, 80 seconds
                     wait_time = 5 * (2 ** attempt)
                     print(f"      ⏳ Rate limit hit during {operation_name}, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})...")
@@ -237,23 +274,141 @@ class GoogleSheetExporter:
             col_num //= 26
         return result
     
-    def _format_timestamp(self, timestamp):
-        """Format timestamp for display"""
-        if not timestamp:
-            return ""
-        if isinstance(timestamp, str):
-            return timestamp
-        return timestamp.strftime("%Y-%m-%d %H:%M")
+    def _read_tab_values(self, spreadsheet_id: str, tab_names: List[str]) -> Dict[str, List[List[str]]]:
+        """Read the current displayed values of several tabs with a single batchGet call"""
+        response = self._api_call_with_retry(
+            self.sheets_service.spreadsheets().values().batchGet,
+            spreadsheetId=spreadsheet_id,
+            ranges=["'{}'".format(tab.replace("'", "''")) for tab in tab_names],
+            valueRenderOption='FORMATTED_VALUE',
+            operation_name="reading current sheet values",
+            quota="read"
+        ).execute()
+        
+        value_ranges = response.get('valueRanges', [])
+        return {tab: value_range.get('values', []) for tab, value_range in zip(tab_names, value_ranges)}
+    
+    def _normalize_cell(self, value) -> str:
+        """Normalize a cell so a written value compares equal to its displayed read-back"""
+        text = "" if value is None else str(value).strip()
+        # Number formats such as #,##0 display thousands separators
+        unseparated = text.replace(",", "")
+        if unseparated != text and unseparated.lstrip("-").replace(".", "", 1).isdigit():
+            return unseparated
+        return text
+    
+    def _row_hash(self, row: List, width: int) -> str:
+        """Hash the first width cells of a row"""
+        cells = [self._normalize_cell(row[i]) if i < len(row) else "" for i in range(width)]
+        return hashlib.sha1("\x1f".join(cells).encode("utf-8")).hexdigest()
+    
+    def _build_changed_ranges(self, tab_name: str, existing_rows: List[List], desired_rows: List[List],
+                              keep_columns: Tuple[int, ...] = ()) -> List[Dict]:
+        """Build the value ranges needed to turn existing_rows into desired_rows
+        
+        Rows are compared by hash; each changed row is written as runs of adjacent
+        changed cells. Rows past the end of desired_rows are blanked. Cells in
+        keep_columns that already hold a value are left untouched.
+        """
+        width = max((len(row) for row in desired_rows), default=0)
+        if width == 0:
+            return []
+        
+        quoted_tab = "'{}'".format(tab_name.replace("'", "''"))
+        value_ranges = []
+        
+        for row_idx in range(max(len(existing_rows), len(desired_rows))):
+            existing = existing_rows[row_idx] if row_idx < len(existing_rows) else []
+            if row_idx < len(desired_rows):
+                desired = list(desired_rows[row_idx]) + [""] * (width - len(desired_rows[row_idx]))
+                for col_idx in keep_columns:
+                    if col_idx < len(existing) and col_idx < width and self._normalize_cell(existing[col_idx]):
+                        desired[col_idx] = existing[col_idx]
+            else:
+                desired = [""] * width
+            
+            if self._row_hash(existing, width) == self._row_hash(desired, width):
+                continue
+            
+            run_start = None
+            for col_idx in range(width + 1):
+                changed = False
+                if col_idx < width:
+                    old_value = existing[col_idx] if col_idx < len(existing) else ""
+                    changed = self._normalize_cell(old_value) != self._normalize_cell(desired[col_idx])
+                
+                if changed and run_start is None:
+                    run_start = col_idx
+                elif not changed and run_start is not None:
+                    start_cell = f"{self._col_num_to_letter(run_start + 1)}{row_idx + 1}"
+                    end_cell = f"{self._col_num_to_letter(col_idx)}{row_idx + 1}"
+                    value_ranges.append({
+                        "range": f"{quoted_tab}!{start_cell}:{end_cell}",
+                        "values": [desired[run_start:col_idx]]
+                    })
+                    run_start = None
+        
+        return value_ranges
+    
+    def _write_changed_ranges(self, spreadsheet_id: str, value_ranges: List[Dict], operation_name: str,
+                              value_input_option: str = "RAW"):
+        """Send all changed ranges of a tab in one values.batchUpdate call"""
+        if not value_ranges:
+            return
+        
+        self._api_call_with_retry(
+            self.sheets_service.spreadsheets().values().batchUpdate,
+            spreadsheetId=spreadsheet_id,
+            body={"valueInputOption": value_input_option, "data": value_ranges},
+            operation_name=operation_name
+        ).execute()
+    
+    def _flush_batch(self, batch: SpreadsheetBatch, operation_name: str) -> bool:
+        """Send a spreadsheet's collected formatting and link requests in one batchUpdate call"""
+        try:
+            count = batch.flush(lambda body: self._api_call_with_retry(
+                self.sheets_service.spreadsheets().batchUpdate,
+                spreadsheetId=batch.spreadsheet_id,
+                body=body,
+                operation_name=operation_name
+            ).execute())
+            if count:
+                print(f"      ✅ Applied {count} requests for {operation_name} in one batch")
+            return True
+        except Exception as e:
+            print(f"      ⚠️ Could not apply {operation_name}: {e}")
+            return False
+    
+    def _shape_changed(self, existing_rows: List[List], desired_rows: List[List], header_rows: int) -> bool:
+        """Whether the row count or the header rows differ, which is when formatting must be re-applied"""
+        if len(existing_rows) != len(desired_rows):
+            return True
+        width = max((len(row) for row in desired_rows), default=0)
+        return any(
+            self._row_hash(existing_rows[i], width) != self._row_hash(desired_rows[i], width)
+            for i in range(min(header_rows, len(desired_rows)))
+        )
     
-    def export_all_sheets(self, master_sheet_id: str, skip_individual: bool = False, resume_from: str = None, sheet_prefix: str = "Pizza"):
-        """Export all data to Google Sheets"""
+    def export_all_sheets(self, master_sheet_id: str, skip_individual: bool = False, resume_from: str = None,
+                          sheet_prefix: str = "Pizza", max_workers: int = 4):
+        """Export all data to Google Sheets
+        
+        Up to max_workers user sheets are exported concurrently; the shared rate
+        limiter keeps all of them under the API quotas together.
+        """
         
         print("="*60)
         print("STARTING GOOGLE SHEETS EXPORT")
         print("="*60)
         
+        # Compute all statistics up front with a few grouped queries
+        with self.get_db_session() as session:
+            master_data = self._get_master_data(session)
+            if not skip_individual:
+                project_data_by_role = self._get_project_data_by_role(session)
+        
         # Export master sheet
-        self._export_master_sheet(master_sheet_id)
+        self._export_master_sheet(master_sheet_id, master_data)
         
         # Manage master sheet permissions
         print("Managing master sheet permissions...")
@@ -264,71 +419,46 @@ class GoogleSheetExporter:
             return
         
         # Export individual user sheets
-        with self.get_db_session() as session:
-            annotator_data = self.GoogleSheetsExportService.get_master_sheet_annotator_data(session)
-            reviewer_data = self.GoogleSheetsExportService.get_master_sheet_reviewer_data(session)
-            meta_reviewer_data = self.GoogleSheetsExportService.get_master_sheet_meta_reviewer_data(session)
-        
         all_users = []
-        for user in annotator_data:
-            if self._has_activity(user):
-                all_users.append((user, "Annotator"))
-        for user in reviewer_data:
-            if self._has_activity(user):
-                all_users.append((user, "Reviewer"))
-        for user in meta_reviewer_data:
-            if self._has_activity(user):
-                all_users.append((user, "Meta-Reviewer"))
+        for role in ("Annotator", "Reviewer", "Meta-Reviewer"):
+            for user in master_data[role]:
+                if has_activity(user):
+                    all_users.append((user, role))
+        
+        # Skip users until we reach the resume point
+        if resume_from is not None:
+            keys = [f"{sheet_prefix}-{user['user_name']} {role}" for user, role in all_users]
+            start = keys.index(resume_from) if resume_from in keys else len(keys)
+            for key in keys[:start]:
+                print(f"⏭️  Skipping {key} (resuming from {resume_from})")
+            if start < len(keys):
+                print(f"🔄 Resuming from: {resume_from}")
+            all_users = all_users[start:]
         
         total_users = len(all_users)
-        current_user = 0
+        print(f"\nExporting individual user sheets ({total_users} total, {max_workers} at a time)...")
+        
+        def export_user(item):
+            index, (user_data, role) = item
+            print(f"\n[{index}/{total_users}] Processing {user_data['user_name']} {role}...")
+            project_data = project_data_by_role[role].get(user_data['user_id'], [])
+            return self._export_one_user(user_data, role, master_sheet_id, sheet_prefix, project_data)
         
-        print(f"\nExporting individual user sheets ({total_users} total)...")
-        print("⚠️  Note: Processing slowly to avoid Google Sheets rate limits...")
+        results = run_in_workers(list(enumerate(all_users, start=1)), export_user, max_workers)
         
         # Store sheet IDs for hyperlinks
         user_sheet_ids = {}
-        
-        # Determine where to start based on resume_from parameter
-        skip_until_found = resume_from is not None
-
-        for user_data, role in all_users:
-            current_user += 1
-            sheet_key = f"{sheet_prefix}-{user_data['user_name']} {role}"  # Add prefix to key
-            
-            # Skip users until we reach the resume point
-            if skip_until_found:
-                if sheet_key == resume_from:
-                    skip_until_found = False
-                    print(f"🔄 Resuming from: {sheet_key}")
-                else:
-                    print(f"⏭️  Skipping {sheet_key} (resuming from {resume_from})")
-                    continue
-            
-            print(f"\n[{current_user}/{total_users}] Processing {user_data['user_name']} {role}...")
-            
-            # Add delay between users to prevent rate limits
-            if current_user > 1:
-                print("    ⏳ Pausing 3 seconds between users...")
-                time.sleep(3)
-            
-            try:
-                sheet_id = self._export_user_sheet(user_data, role, master_sheet_id, sheet_prefix)
+        for (_, (user_data, role)), sheet_id, error in results:
+            sheet_key = f"{sheet_prefix}-{user_data['user_name']} {role}"
+            if error is None:
                 user_sheet_ids[sheet_key] = sheet_id
-                
-                # Manage permissions for this sheet
-                self._manage_sheet_permissions(sheet_id, f"{sheet_prefix}-{user_data['user_name']} {role}")
-                
-                print(f"    ✅ Successfully exported {sheet_prefix}-{user_data['user_name']} {role}")
-            except Exception as e:
-                print(f"    ❌ Failed to export {sheet_prefix}-{user_data['user_name']} {role}: {e}")
-                self.export_failures.append(f"Failed to export {sheet_prefix}-{user_data['user_name']} {role}: {str(e)}")
+            else:
+                print(f"    ❌ Failed to export {sheet_key}: {error}")
+                self.export_failures.append(f"Failed to export {sheet_key}: {str(error)}")
 
         # Update master sheet with correct hyperlinks
         if user_sheet_ids:
-            print(f"\n⏳ Pausing 5 seconds before updating master sheet links...")
-            time.sleep(5)
-            print("Updating master sheet hyperlinks...")
+            print("\nUpdating master sheet hyperlinks...")
             try:
                 self._update_master_sheet_links(master_sheet_id, user_sheet_ids, sheet_prefix)
             except Exception as e:
@@ -350,16 +480,39 @@ class GoogleSheetExporter:
         print(f"📊 Master Sheet: https://docs.google.com/spreadsheets/d/{master_sheet_id}/edit")
         print("="*60)
     
-    def _has_activity(self, user_data: Dict) -> bool:
-        """Check if user has any activity"""
-        return (user_data.get('projects_started', 0) > 0 or 
-                user_data.get('assigned_projects', 0) > 0)
+    def _export_one_user(self, user_data: Dict, role: str, master_sheet_id: str, sheet_prefix: str,
+                         project_data: List[Dict]) -> str:
+        """Export one user sheet and manage its permissions; returns the sheet ID"""
+        sheet_name = user_sheet_name(sheet_prefix, user_data['user_name'], role)
+        sheet_id = self._export_user_sheet(user_data, role, master_sheet_id, sheet_prefix, project_data)
+        
+        # Manage permissions for this sheet
+        self._manage_sheet_permissions(sheet_id, sheet_name)
+        
+        print(f"    ✅ Successfully exported {sheet_name}")
+        return sheet_id
+    
+    def _get_master_data(self, session) -> Dict[str, List[Dict]]:
+        """Master sheet rows of every role, keyed by role"""
+        return {
+            "Annotator": self.GoogleSheetsExportService.get_master_sheet_annotator_data(session),
+            "Reviewer": self.GoogleSheetsExportService.get_master_sheet_reviewer_data(session),
+            "Meta-Reviewer": self.GoogleSheetsExportService.get_master_sheet_meta_reviewer_data(session),
+        }
+    
+    def _get_project_data_by_role(self, session) -> Dict[str, Dict[int, List[Dict]]]:
+        """Per-project rows of every user sheet, keyed by role and then user ID"""
+        return {
+            "Annotator": self.GoogleSheetsExportService.get_annotator_project_data_by_user(session),
+            "Reviewer": self.GoogleSheetsExportService.get_reviewer_project_data_by_user(session),
+            "Meta-Reviewer": self.GoogleSheetsExportService.get_meta_reviewer_project_data_by_user(session),
+        }
     
-    def _export_master_sheet(self, sheet_id: str):
+    def _export_master_sheet(self, sheet_id: str, master_data: Dict[str, List[Dict]] = None):
         """Export the master sheet with annotator, reviewer, and meta-reviewer tabs"""
         try:
             sheet = self._api_call_with_retry(self.client.open_by_key, sheet_id, 
-                                            operation_name="opening master sheet")
+                                            operation_name="opening master sheet", quota="read")
         except Exception as e:
             print(f"❌ Error: Could not open master sheet with ID {sheet_id}")
             print(f"   Details: {str(e)}")
@@ -371,24 +524,37 @@ class GoogleSheetExporter:
         
         print("Exporting master sheet...")
         
-        with self.get_db_session() as session:
-            # Export Annotators tab
-            annotator_data = self.GoogleSheetsExportService.get_master_sheet_annotator_data(session)
-            self._export_master_tab(sheet, "Annotators", annotator_data, "Annotator")
-            
-            # Export Reviewers tab
-            reviewer_data = self.GoogleSheetsExportService.get_master_sheet_reviewer_data(session)
-            self._export_master_tab(sheet, "Reviewers", reviewer_data, "Reviewer")
-            
-            # Export Meta-Reviewers tab
-            meta_reviewer_data = self.GoogleSheetsExportService.get_master_sheet_meta_reviewer_data(session)
-            self._export_master_tab(sheet, "Meta-Reviewers", meta_reviewer_data, "Meta-Reviewer")
+        if master_data is None:
+            with self.get_db_session() as session:
+                master_data = self._get_master_data(session)
+        
+        # Read all three tabs in one call; a tab that does not exist yet is read after it is created
+        try:
+            existing_values = self._read_tab_values(sheet.id, ["Annotators", "Reviewers", "Meta-Reviewers"])
+        except Exception:
+            existing_values = {}
+        
+        # Formatting of all three tabs is sent together at the end
+        batch = SpreadsheetBatch(sheet.id)
+        self._export_master_tab(sheet, "Annotators", master_data["Annotator"], "Annotator",
+                                existing_values.get("Annotators"), batch)
+        self._export_master_tab(sheet, "Reviewers", master_data["Reviewer"], "Reviewer",
+                                existing_values.get("Reviewers"), batch)
+        self._export_master_tab(sheet, "Meta-Reviewers", master_data["Meta-Reviewer"], "Meta-Reviewer",
+                                existing_values.get("Meta-Reviewers"), batch)
+        self._flush_batch(batch, "master sheet formatting")
     
-    def _export_master_tab(self, sheet, tab_name: str, user_data: List[Dict], role: str):
-        """Export a single tab in the master sheet"""
+    def _export_master_tab(self, sheet, tab_name: str, user_data: List[Dict], role: str,
+                           existing_values: List[List[str]] = None, batch: SpreadsheetBatch = None):
+        """Export a single tab in the master sheet, writing only the cells that changed
+        
+        existing_values is the tab's current content; it is read when omitted.
+        Formatting is added to batch, or sent right away when no batch is given.
+        """
         print(f"  Exporting {tab_name} tab...")
         
         try:
+            self.rate_limiter.acquire("read")
             worksheet = sheet.worksheet(tab_name)
             print(f"    Found existing {tab_name} tab")
         except gspread.exceptions.WorksheetNotFound:
@@ -396,58 +562,28 @@ class GoogleSheetExporter:
             worksheet = self._api_call_with_retry(sheet.add_worksheet, title=tab_name, rows=100, cols=20, 
                                                 operation_name=f"creating {tab_name} tab")
         
-        # FIXED: Shortened header texts for master sheet
-        if role == "Annotator":
-            headers = [
-                "User Name", "Email", "Role", "Annotation Sheet", "Last Annotated Time",
-                "Assigned Projects", "Started Projects", "Completed Projects"  # SHORTENED
-            ]
-        elif role == "Reviewer":
-            headers = [
-                "User Name", "Email", "Role", "Review Sheet", "Last Review Time",
-                "Assigned Projects", "Started Projects"  # SHORTENED
-            ]
-        else:  # Meta-Reviewer
-            headers = [
-                "User Name", "Email", "Role", "Meta-Review Sheet", "Last Modified Time",
-                "Assigned Projects", "Started Projects"  # FIXED: Added missing Started Projects column
-            ]
-        
-        # Prepare data rows
-        rows = [headers]
-        for user in user_data:
-            if not self._has_activity(user):
-                continue
-            
-            row = [
-                user['user_name'],
-                user['email'],
-                user['role'],
-                f"Link to {user['user_name']} Sheet",  # Placeholder for hyperlink
-                self._format_timestamp(user.get('last_annotation_time') or user.get('last_review_time') or user.get('last_modified_time')),
-                user.get('assigned_projects', 0),
-                user.get('projects_started', 0)
-            ]
-            
-            if role == "Annotator":
-                row.append(user.get('projects_completed', 0))
-            
-            rows.append(row)
-        
-        # Update sheet
-        if rows:
-            end_col = self._col_num_to_letter(len(headers))
-            self._api_call_with_retry(
-                worksheet.update, 
-                values=rows, 
-                range_name=f'A1:{end_col}{len(rows)}', 
-                operation_name=f"updating {len(rows)-1} user records"
-            )
-            
-            # Apply master sheet formatting
-            self._apply_master_sheet_formatting(worksheet, len(rows)-1, len(headers))
-            
-            print(f"    ✅ Successfully updated {len(rows)-1} users in {tab_name} tab")
+        rows = master_rows(user_data, role)
+        
+        if existing_values is None:
+            try:
+                existing_values = self._read_tab_values(sheet.id, [tab_name])[tab_name]
+            except Exception as e:
+                print(f"    ⚠️ Could not read current {tab_name} values, rewriting the tab: {e}")
+                existing_values = []
+        
+        # Update only the changed cells; link chips in the sheet link column are kept
+        link_col_idx = 3
+        value_ranges = self._build_changed_ranges(tab_name, existing_values, rows, keep_columns=(link_col_idx,))
+        self._write_changed_ranges(sheet.id, value_ranges, f"updating {len(value_ranges)} ranges of user records")
+        
+        # Formatting only depends on the tab's shape
+        if self._shape_changed(existing_values, rows, header_rows=1):
+            tab_batch = batch if batch is not None else SpreadsheetBatch(sheet.id)
+            self._add_master_sheet_formatting(tab_batch, worksheet, len(rows)-1, len(rows[0]))
+            if batch is None:
+                self._flush_batch(tab_batch, f"{tab_name} formatting")
+        
+        print(f"    ✅ Successfully updated {len(rows)-1} users in {tab_name} tab ({len(value_ranges)} changed ranges)")
     
     # def _export_user_sheet(self, user_data: Dict, role: str, master_sheet_id: str, sheet_prefix: str) -> str:
     #     """Export individual user sheet and return sheet ID"""
@@ -573,16 +709,22 @@ class GoogleSheetExporter:
     #         print(f"    ⚠️ Unexpected error looking for sheet: {type(e).__name__}: {str(e)[:100]}")
     #         raise
         
-    def _export_user_sheet(self, user_data: Dict, role: str, master_sheet_id: str, sheet_prefix: str) -> str:
-        """Export individual user sheet and return sheet ID"""
-        sheet_name = f"{sheet_prefix}-{user_data['user_name']} {role}"
+    def _export_user_sheet(self, user_data: Dict, role: str, master_sheet_id: str, sheet_prefix: str,
+                           project_data: List[Dict] = None) -> str:
+        """Export individual user sheet and return sheet ID
+        
+        project_data is the user's precomputed per-project rows; it is queried when omitted.
+        """
+        sheet_name = user_sheet_name(sheet_prefix, user_data['user_name'], role)
         print(f"  Exporting {sheet_name} sheet...")
         
         sheet = None
         
         # Try to find existing sheet by listing all spreadsheets
         try:
-            # First try direct open (fastest)
+            # First try direct open (fastest); it lists Drive files and then reads the sheet
+            self.rate_limiter.acquire("drive")
+            self.rate_limiter.acquire("read")
             sheet = self.client.open(sheet_name)
             print(f"    Found existing sheet: {sheet_name}")
         except gspread.exceptions.SpreadsheetNotFound:
@@ -597,6 +739,8 @@ class GoogleSheetExporter:
                 time.sleep(10)
                 # Retry once
                 try:
+                    self.rate_limiter.acquire("drive")
+                    self.rate_limiter.acquire("read")
                     sheet = self.client.open(sheet_name)
                     print(f"    Found existing sheet after retry: {sheet_name}")
                 except gspread.exceptions.SpreadsheetNotFound:
@@ -610,15 +754,15 @@ class GoogleSheetExporter:
             print(f"    ⚠️ Unexpected error looking for sheet: {type(e).__name__}: {str(e)[:100]}")
             raise
 
-        # ========== THIS ENTIRE SECTION IS MISSING ==========
-        # Get user project data
-        with self.get_db_session() as session:
-            if role == "Annotator":
-                project_data = self.GoogleSheetsExportService.get_user_project_data_annotator(user_data['user_id'], session)
-            elif role == "Reviewer":
-                project_data = self.GoogleSheetsExportService.get_user_project_data_reviewer(user_data['user_id'], session)
-            else:  # Meta-Reviewer
-                project_data = self.GoogleSheetsExportService.get_user_project_data_meta_reviewer(user_data['user_id'], session)
+        # Get user project data unless it was computed for the whole export
+        if project_data is None:
+            with self.get_db_session() as session:
+                if role == "Annotator":
+                    project_data = self.GoogleSheetsExportService.get_user_project_data_annotator(user_data['user_id'], session)
+                elif role == "Reviewer":
+                    project_data = self.GoogleSheetsExportService.get_user_project_data_reviewer(user_data['user_id'], session)
+                else:  # Meta-Reviewer
+                    project_data = self.GoogleSheetsExportService.get_user_project_data_meta_reviewer(user_data['user_id'], session)
         
         # Calculate required rows (headers + data + padding) - handle massive scale
         header_rows = 2  # All roles now have 2-row headers
@@ -638,7 +782,8 @@ class GoogleSheetExporter:
             sheet_metadata = self._api_call_with_retry(
                 self.sheets_service.spreadsheets().get,
                 spreadsheetId=sheet.id,
-                operation_name="getting sheet properties"
+                operation_name="getting sheet properties",
+                quota="read"
             ).execute()
             
             first_sheet_props = sheet_metadata.get('sheets', [{}])[0].get('properties', {}).get('gridProperties', {})
@@ -657,29 +802,41 @@ class GoogleSheetExporter:
         except Exception as e:
             print(f"    ⚠️  Could not resize sheet: {e}")
         
-        # Export Payment tab
-        try:
-            payment_worksheet = self._get_or_create_worksheet(sheet, "Payment")
-            self._export_user_tab(payment_worksheet, project_data, role, include_payment=True)
-            print(f"    ✅ Payment tab updated")
-        except Exception as e:
-            print(f"    ❌ Failed to update Payment tab: {e}")
-            self.export_failures.append(f"Payment tab for {sheet_name}: {str(e)}")
+        # Get or create the Payment and Feedback tabs, then read both in one call
+        worksheets = {}
+        for tab_name in ("Payment", "Feedback"):
+            try:
+                worksheets[tab_name] = self._get_or_create_worksheet(sheet, tab_name)
+            except Exception as e:
+                print(f"    ❌ Failed to update {tab_name} tab: {e}")
+                self.export_failures.append(f"{tab_name} tab for {sheet_name}: {str(e)}")
         
-        # Export Feedback tab
         try:
-            feedback_worksheet = self._get_or_create_worksheet(sheet, "Feedback")
-            self._export_user_tab(feedback_worksheet, project_data, role, include_payment=False)
-            print(f"    ✅ Feedback tab updated")
+            existing_values = self._read_tab_values(sheet.id, list(worksheets))
         except Exception as e:
-            print(f"    ❌ Failed to update Feedback tab: {e}")
-            self.export_failures.append(f"Feedback tab for {sheet_name}: {str(e)}")
+            # Each tab retries its own read, so manual columns are never overwritten blindly
+            print(f"    ⚠️ Could not read current tab values: {e}")
+            existing_values = {}
+        
+        # Export Payment and Feedback tabs; formatting of both is sent together
+        batch = SpreadsheetBatch(sheet.id)
+        for tab_name, worksheet in worksheets.items():
+            try:
+                self._export_user_tab(worksheet, project_data, role, include_payment=(tab_name == "Payment"),
+                                      existing_values=existing_values.get(tab_name), batch=batch)
+                print(f"    ✅ {tab_name} tab updated")
+            except Exception as e:
+                print(f"    ❌ Failed to update {tab_name} tab: {e}")
+                self.export_failures.append(f"{tab_name} tab for {sheet_name}: {str(e)}")
+        
+        self._flush_batch(batch, f"formatting of {sheet_name}")
         
         return sheet.id
 
     def _get_or_create_worksheet(self, sheet, tab_name: str):
         """Get existing worksheet or create new one"""
         try:
+            self.rate_limiter.acquire("read")
             return sheet.worksheet(tab_name)
         except gspread.exceptions.WorksheetNotFound:
             return self._api_call_with_retry(
@@ -709,7 +866,7 @@ class GoogleSheetExporter:
     #         if i < len(existing_data):
     #             preserved_data = existing_data[i]
     #             # Determine the manual column positions based on role and payment tab
-    #             manual_col_positions = self._get_manual_column_positions(role, include_payment)
+    #             manual_col_positions = manual_column_positions(role, include_payment)
                 
     #             # Preserve data in manual columns
     #             for pos in manual_col_positions:
@@ -726,788 +883,479 @@ class GoogleSheetExporter:
     #     # Apply formatting
     #     self._apply_user_sheet_formatting(worksheet, len(data_rows), role, include_payment)
     
-    def _get_existing_manual_data_mapped_to_projects(self, worksheet, role: str, include_payment: bool) -> Dict[str, Dict]:
-        """Get existing manual data mapped to project names for preservation during sorting"""
-        try:
-            all_values = worksheet.get_all_values()
-            if len(all_values) <= 2:  # No data rows (only headers)
-                return {}
-            
-            project_manual_data = {}
-            start_row = 2  # Skip 2-row headers (0-indexed, so row 3 in 1-indexed)
-            manual_col_positions = self._get_manual_column_positions(role, include_payment)
-            
-            # Map each project name to its manual data
-            for row_idx in range(start_row, len(all_values)):
-                row = all_values[row_idx]
-                if len(row) > 0 and row[0]:  # Has project name
-                    project_name = row[0].strip()
-                    if project_name:
-                        # Extract manual data from this row
-                        manual_data = {}
-                        for pos in manual_col_positions:
-                            if pos < len(row):
-                                manual_data[pos] = row[pos]
-                        project_manual_data[project_name] = manual_data
-            
-            return project_manual_data
-        except Exception as e:
-            print(f"      ⚠️ Could not read existing manual data: {e}")
-            return {}
-
-    def _export_user_tab(self, worksheet, project_data: List[Dict], role: str, include_payment: bool):
-        """Export individual user sheet tab with sorting and project-aware manual data preservation"""
+    def _export_user_tab(self, worksheet, project_data: List[Dict], role: str, include_payment: bool,
+                         existing_values: List[List[str]] = None, batch: SpreadsheetBatch = None):
+        """Export individual user sheet tab with sorting and project-aware manual data preservation
+        
+        existing_values is the tab's current content; it is read when omitted. Only the
+        cells that changed are written, and formatting is re-applied only when the tab's
+        shape changes. Formatting is added to batch, or sent right away when no batch is given.
+        """
         if not project_data:
             return
         
-        # STEP 1: Get existing manual data mapped to project names (BEFORE sorting)
-        existing_manual_data = self._get_existing_manual_data_mapped_to_projects(worksheet, role, include_payment)
-        
-        # STEP 2: Sort projects by most recent activity (NOW SAFE TO SORT)
-        if role == "Meta-Reviewer":
-            # Sort by last_modified for meta-reviewers
-            project_data.sort(key=lambda x: x.get('last_modified') or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
-        else:
-            # Sort by last_submitted for annotators and reviewers
-            project_data.sort(key=lambda x: x.get('last_submitted') or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
-        
-        # STEP 3: Create headers
-        self._create_user_sheet_headers(worksheet, role, include_payment)
-        
-        # STEP 4: Build data rows with project-aware manual data preservation
-        data_rows = []
-        manual_col_positions = self._get_manual_column_positions(role, include_payment)
+        # Read the tab once; its manual columns are carried over to the rows of the same projects
+        if existing_values is None:
+            existing_values = self._read_tab_values(worksheet.spreadsheet.id, [worksheet.title])[worksheet.title]
         
-        for project in project_data:
-            # Create base row with automatic data
-            row = self._create_project_row(project, role, include_payment)
-            
-            # Apply preserved manual data for this specific project
-            project_name = project['project_name']
-            if project_name in existing_manual_data:
-                preserved_data = existing_manual_data[project_name]
-                
-                # Restore manual data to correct columns for this project
-                for pos in manual_col_positions:
-                    if pos in preserved_data and pos < len(row) and preserved_data[pos].strip():
-                        row[pos] = preserved_data[pos]
-            
-            data_rows.append(row)
+        # Build the headers and the sorted project rows
+        rows = user_tab_rows(project_data, role, include_payment, existing_values)
+        row1, row2 = rows[0], rows[1]
+        data_rows = rows[2:]
         
-        # STEP 5: Update sheet with sorted data and preserved manual columns
-        if data_rows:
-            start_row = 3  # After 2-row headers
-            self._update_data_with_preservation(worksheet, data_rows, start_row)
+        # Write only the changed cells of the headers and sorted data
+        value_ranges = self._build_changed_ranges(worksheet.title, existing_values, rows)
+        self._write_changed_ranges(
+            worksheet.spreadsheet.id, value_ranges,
+            f"updating {len(value_ranges)} ranges of project data"
+        )
+        print(f"      📝 {len(value_ranges)} changed ranges written")
         
-        # STEP 6: Apply formatting
-        self._apply_user_sheet_formatting(worksheet, len(data_rows), role, include_payment)
+        # Apply formatting only when the shape changed
+        if self._shape_changed(existing_values, rows, header_rows=2):
+            print(f"      🎨 Applying formatting...")
+            tab_batch = batch if batch is not None else SpreadsheetBatch(worksheet.spreadsheet.id)
+            self._add_header_merging(tab_batch, worksheet, row1, row2)
+            self._add_header_formatting(tab_batch, worksheet, len(row1))
+            self._add_user_sheet_formatting(tab_batch, worksheet, len(data_rows), role, include_payment)
+            if batch is None:
+                self._flush_batch(tab_batch, f"{worksheet.title} formatting")
 
 
-    def _get_manual_column_positions(self, role: str, include_payment: bool) -> List[int]:
-        """Get the column positions for manual data that should be preserved"""
-        positions = []
+    def _add_header_formatting(self, batch: SpreadsheetBatch, worksheet, num_columns: int):
+        """Add color formatting and styling of the headers to the batch"""
+        sheet_id = worksheet._properties['sheetId']
+        
+        # Apply header background color and text formatting
+        header_format_requests = []
+        
+        # Header background color (light blue)
+        header_format_requests.append({
+            "repeatCell": {
+                "range": {
+                    "sheetId": sheet_id,
+                    "startRowIndex": 0,
+                    "endRowIndex": 2,  # Both header rows
+                    "startColumnIndex": 0,
+                    "endColumnIndex": num_columns
+                },
+                "cell": {
+                    "userEnteredFormat": {
+                        "backgroundColor": {
+                            "red": 0.85,
+                            "green": 0.92,
+                            "blue": 1.0
+                        },
+                        "textFormat": {
+                            "bold": True,
+                            "fontSize": 10
+                        },
+                        "horizontalAlignment": "CENTER",
+                        "verticalAlignment": "MIDDLE"
+                    }
+                },
+                "fields": "userEnteredFormat(backgroundColor,textFormat,horizontalAlignment,verticalAlignment)"
+            }
+        })
         
-        if role == "Annotator":
-            # Columns: Project Name, Schema Name, Video Count, Last Submitted, [Payment/Feedback], [Overall Stats...]
-            if include_payment:
-                positions = [4, 5, 6]  # Payment Time, Base Salary, Bonus Salary
-            else:
-                positions = [4]  # Feedback
-        elif role == "Reviewer":
-            # Columns: Project Name, Schema Name, Video Count, GT%, All GT%, Review%, All Rev%, Last Submitted, [Payment/Feedback], [Overall Stats...]
-            if include_payment:
-                positions = [8, 9, 10]  # Payment Time, Base Salary, Bonus Salary
-            else:
-                positions = [8]  # Feedback
-        else:  # Meta-Reviewer - UPDATED: Modified Ratio By columns moved to end
-            # Columns: Project Name, Schema Name, Video Count, Last Modified, [Payment/Feedback], Modified Ratio By User%, Modified Ratio By All%
-            if include_payment:
-                positions = [4, 5, 6]  # Payment Time, Base Salary, Bonus Salary
+        batch.extend(header_format_requests)
+    
+    def _add_header_merging(self, batch: SpreadsheetBatch, worksheet, row1: List[str], row2: List[str]):
+        """FIXED: Add proper header merging for spans and single cells to the batch"""
+        # Get the sheet ID from the worksheet
+        sheet_id = worksheet._properties['sheetId']
+        
+        # First unmerge the entire header area; requests of one batch are applied in order
+        batch.add({
+            'unmergeCells': {
+                'range': {
+                    'sheetId': sheet_id,
+                    'startRowIndex': 0,
+                    'endRowIndex': 2,
+                    'startColumnIndex': 0,
+                    'endColumnIndex': len(row1)
+                }
+            }
+        })
+        
+        # Now add new merges
+        merge_requests = []
+        
+        # Handle spanning headers first ("Overall Stats" and "Modified Ratio By")
+        i = 0
+        while i < len(row1):
+            if row1[i] in ["Overall Stats", "Modified Ratio By"]:
+                start_col = i
+                end_col = i
+                
+                # For "Overall Stats", span 6 columns
+                # For "Modified Ratio By", span 2 columns  
+                if row1[i] == "Overall Stats":
+                    end_col = i + 5  # Span 6 columns (i to i+5)
+                elif row1[i] == "Modified Ratio By":
+                    end_col = i + 1  # Span 2 columns (i to i+1)
+                
+                # Ensure we don't go beyond the row length
+                end_col = min(end_col, len(row1) - 1)
+                
+                if end_col > start_col:
+                    merge_requests.append({
+                        'mergeCells': {
+                            'range': {
+                                'sheetId': sheet_id,
+                                'startRowIndex': 0,
+                                'endRowIndex': 1,  # Only merge the first row for spanning headers
+                                'startColumnIndex': start_col,
+                                'endColumnIndex': end_col + 1
+                            },
+                            'mergeType': 'MERGE_ALL'
+                        }
+                    })
+                
+                i = end_col + 1  # Skip to after the merged range
             else:
-                positions = [4]  # Feedback
+                # Handle single-cell headers that span both rows
+                if row1[i] and (i >= len(row2) or not row2[i]):
+                    # This cell has content in row1 but empty in row2, so merge vertically
+                    merge_requests.append({
+                        'mergeCells': {
+                            'range': {
+                                'sheetId': sheet_id,
+                                'startRowIndex': 0,
+                                'endRowIndex': 2,  # Merge both rows for this cell
+                                'startColumnIndex': i,
+                                'endColumnIndex': i + 1
+                            },
+                            'mergeType': 'MERGE_ALL'
+                        }
+                    })
+                i += 1
         
-        return positions
+        batch.extend(merge_requests)
     
-    def _create_user_sheet_headers(self, worksheet, role: str, include_payment: bool):
-        """FIXED: Create properly structured headers for user sheets"""
-        # Create the proper header structure for each role
-        if role == "Annotator":
-            row1 = ["Project Name", "Schema Name", "Video Count", "Last Submitted"]
-            if include_payment:
-                row1.extend(["Payment Time", "Base Salary", "Bonus Salary"])
-            else:
-                row1.append("Feedback")
-            # Add Overall Stats spanning headers
-            row1.extend(["Overall Stats", "", "", "", "", ""])
-            
-            # Row 2 has sub-headers only for Overall Stats
-            row2 = [""] * (len(row1) - 6)  # Empty for first columns
-            row2.extend(["Accuracy%", "Completion%", "Reviewed%", "Completed", "Reviewed", "Wrong"])  # FIXED: "Reviewed%" 
-            
-        elif role == "Reviewer":
-            row1 = ["Project Name", "Schema Name", "Video Count", "GT%", "All GT%", "Review%", "All Rev%", "Last Submitted"]
-            if include_payment:
-                row1.extend(["Payment Time", "Base Salary", "Bonus Salary"])
-            else:
-                row1.append("Feedback")
-            # Add Overall Stats spanning headers
-            row1.extend(["Overall Stats", "", "", "", "", ""])
-            
-            # Row 2 has sub-headers only for Overall Stats
-            row2 = [""] * (len(row1) - 6)  # Empty for first columns
-            row2.extend(["GT%", "GT Acc%", "Review%", "GT Done", "GT Wrong", "Rev Done"])
-            
-        else:  # Meta-Reviewer - UPDATED: Modified Ratio By columns moved to end
-            row1 = ["Project Name", "Schema Name", "Video Count", "Last Modified"]
-            if include_payment:
-                row1.extend(["Payment Time", "Base Salary", "Bonus Salary"])
-            else:
-                row1.append("Feedback")
-            # Add Modified Ratio By columns at the end
-            row1.extend(["Modified Ratio By", ""])
-            
-            # Row 2 has sub-headers for Modified Ratio By at the end
-            row2 = ["", "", "", ""]  # First 4 columns
-            if include_payment:
-                row2.extend(["", "", ""])  # Payment columns
-            else:
-                row2.append("")  # Feedback column
-            row2.extend(["User %", "All %"])  # Modified Ratio By sub-headers
+    def _add_alternating_row_colors(self, batch: SpreadsheetBatch, worksheet, data_rows_count: int, header_rows: int):
+        """Add alternating row colors to the batch; add them LAST so they override earlier backgrounds"""
+        if data_rows_count <= 0:
+            return
         
-        # Update headers
-        end_col = self._col_num_to_letter(len(row1))
-        self._api_call_with_retry(
-            worksheet.update, 
-            values=[row1, row2], 
-            range_name=f'A1:{end_col}2', 
-            operation_name="updating headers"
-        )
+        sheet_id = worksheet._properties['sheetId']
         
-        # Apply header merging and formatting
-        self._apply_header_merging(worksheet, row1, row2)
-        self._apply_header_formatting(worksheet, len(row1))
-    
-    def _apply_header_formatting(self, worksheet, num_columns: int):
-        """Apply color formatting and styling to headers"""
-        try:
-            sheet_id = worksheet._properties['sheetId']
+        # Define colors
+        light_blue_color = {
+            "red": 0.95,
+            "green": 0.98, 
+            "blue": 1.0
+        }
+        
+        white_color = {
+            "red": 1.0,
+            "green": 1.0,
+            "blue": 1.0
+        }
+        
+        # Calculate the range of data rows (after headers)
+        first_data_row = header_rows  # 0-indexed (row 3 in 1-indexed becomes 2 in 0-indexed)
+        
+        # Apply colors to ALL data rows (both blue and white explicitly)
+        for row_index in range(first_data_row, header_rows + data_rows_count):
+            # Determine if this should be colored (every other row)
+            is_colored_row = (row_index - first_data_row) % 2 == 1  # 0, 2, 4... = white; 1, 3, 5... = blue
             
-            # Apply header background color and text formatting
-            header_format_requests = []
+            background_color = light_blue_color if is_colored_row else white_color
             
-            # Header background color (light blue)
-            header_format_requests.append({
+            batch.add({
                 "repeatCell": {
                     "range": {
                         "sheetId": sheet_id,
-                        "startRowIndex": 0,
-                        "endRowIndex": 2,  # Both header rows
+                        "startRowIndex": row_index,
+                        "endRowIndex": row_index + 1,
                         "startColumnIndex": 0,
-                        "endColumnIndex": num_columns
+                        "endColumnIndex": 50  # Cover all relevant columns
                     },
                     "cell": {
                         "userEnteredFormat": {
-                            "backgroundColor": {
-                                "red": 0.85,
-                                "green": 0.92,
-                                "blue": 1.0
-                            },
-                            "textFormat": {
-                                "bold": True,
-                                "fontSize": 10
-                            },
-                            "horizontalAlignment": "CENTER",
-                            "verticalAlignment": "MIDDLE"
+                            "backgroundColor": background_color
                         }
                     },
-                    "fields": "userEnteredFormat(backgroundColor,textFormat,horizontalAlignment,verticalAlignment)"
+                    "fields": "userEnteredFormat.backgroundColor"
                 }
             })
-            
-            # Apply formatting
-            if header_format_requests:
-                batch_request = {"requests": header_format_requests}
-                self._api_call_with_retry(
-                    self.sheets_service.spreadsheets().batchUpdate,
-                    spreadsheetId=worksheet.spreadsheet.id,
-                    body=batch_request,
-                    operation_name="applying header formatting"
-                ).execute()
-                
-        except Exception as e:
-            print(f"      ⚠️ Could not apply header formatting: {e}")
-    
-    def _apply_header_merging(self, worksheet, row1: List[str], row2: List[str]):
-        """FIXED: Apply proper header merging for spans and single cells"""
-        try:
-            # Get the sheet ID from the worksheet
-            sheet_id = worksheet._properties['sheetId']
-            
-            # First, try to unmerge ALL existing merged cells in the header area using a more robust approach
-            try:
-                # Clear all merges in the first 2 rows by unmerging the entire header area
-                unmerge_requests = [{
-                    'unmergeCells': {
-                        'range': {
-                            'sheetId': sheet_id,
-                            'startRowIndex': 0,
-                            'endRowIndex': 2,
-                            'startColumnIndex': 0,
-                            'endColumnIndex': len(row1)
-                        }
-                    }
-                }]
-                
-                unmerge_batch_request = {'requests': unmerge_requests}
-                self._api_call_with_retry(
-                    self.sheets_service.spreadsheets().batchUpdate,
-                    spreadsheetId=worksheet.spreadsheet.id,
-                    body=unmerge_batch_request,
-                    operation_name="unmerging entire header area"
-                ).execute()
-                    
-            except Exception as e:
-                # If unmerging fails, that's usually because there are no merges to unmerge, which is fine
-                print(f"      ℹ️  No existing merges to unmerge (this is normal): {str(e)[:100]}...")
-            
-            # Small delay to ensure unmerge is processed
-            import time
-            time.sleep(0.5)
-            
-            # Now apply new merges
-            merge_requests = []
-            
-            # Handle spanning headers first ("Overall Stats" and "Modified Ratio By")
-            i = 0
-            while i < len(row1):
-                if row1[i] in ["Overall Stats", "Modified Ratio By"]:
-                    start_col = i
-                    end_col = i
-                    
-                    # For "Overall Stats", span 6 columns
-                    # For "Modified Ratio By", span 2 columns  
-                    if row1[i] == "Overall Stats":
-                        end_col = i + 5  # Span 6 columns (i to i+5)
-                    elif row1[i] == "Modified Ratio By":
-                        end_col = i + 1  # Span 2 columns (i to i+1)
-                    
-                    # Ensure we don't go beyond the row length
-                    end_col = min(end_col, len(row1) - 1)
-                    
-                    if end_col > start_col:
-                        merge_requests.append({
-                            'mergeCells': {
-                                'range': {
-                                    'sheetId': sheet_id,
-                                    'startRowIndex': 0,
-                                    'endRowIndex': 1,  # Only merge the first row for spanning headers
-                                    'startColumnIndex': start_col,
-                                    'endColumnIndex': end_col + 1
-                                },
-                                'mergeType': 'MERGE_ALL'
-                            }
-                        })
-                    
-                    i = end_col + 1  # Skip to after the merged range
-                else:
-                    # Handle single-cell headers that span both rows
-                    if row1[i] and (i >= len(row2) or not row2[i]):
-                        # This cell has content in row1 but empty in row2, so merge vertically
-                        merge_requests.append({
-                            'mergeCells': {
-                                'range': {
-                                    'sheetId': sheet_id,
-                                    'startRowIndex': 0,
-                                    'endRowIndex': 2,  # Merge both rows for this cell
-                                    'startColumnIndex': i,
-                                    'endColumnIndex': i + 1
-                                },
-                                'mergeType': 'MERGE_ALL'
-                            }
-                        })
-                    i += 1
-            
-            # Apply merge requests if any
-            if merge_requests:
-                batch_update_request = {
-                    'requests': merge_requests
-                }
-                
-                self._api_call_with_retry(
-                    self.sheets_service.spreadsheets().batchUpdate,
-                    spreadsheetId=worksheet.spreadsheet.id,
-                    body=batch_update_request,
-                    operation_name="merging header cells"
-                ).execute()
-                
-                print(f"      ✅ Applied {len(merge_requests)} header merges successfully")
-                
-        except Exception as e:
-            print(f"      ⚠️ Could not apply header merging: {e}")
-            # Continue without merging - the sheet will still function, just without fancy header merging
-    
 
-    
-    def _create_project_row(self, project: Dict, role: str, include_payment: bool) -> List:
-        """Create a project data row with correct column alignment"""
+    def _add_user_sheet_formatting(self, batch: SpreadsheetBatch, worksheet, data_rows_count: int, role: str, include_payment: bool):
+        """Add professional formatting of a user sheet tab, with robust alternating colors, to the batch"""
+        header_rows = 2  # All roles have 2-row headers
+        last_row = header_rows + data_rows_count
+        
+        # STEP 1: Add all other formatting FIRST (column widths, etc.)
+        column_widths = [
+            {"startIndex": 0, "endIndex": 1, "pixelSize": 150},   # A: Project Name
+            {"startIndex": 1, "endIndex": 2, "pixelSize": 120},   # B: Schema Name
+            {"startIndex": 2, "endIndex": 3, "pixelSize": 90},    # C: Video Count
+        ]
+        
+        # Role-specific columns
+        current_col = 3
         if role == "Annotator":
-            row = [
-                project['project_name'],
-                project['schema_name'],
-                project['video_count'],  # NEW: Video Count
-                self._format_timestamp(project['last_submitted'])
-            ]
-            # Add payment/feedback placeholder
-            if include_payment:
-                row.extend(['', '', ''])  # Payment Time, Base Salary, Bonus Salary
-            else:
-                row.append('')  # Feedback column
-            
-            # Add overall statistics
-            row.extend([
-                f"{project['accuracy']:.0f}%",
-                f"{project['completion']:.0f}%",
-                f"{project['reviewed_ratio']:.0f}%",  # FIXED: Use reviewed_ratio as percentage
-                project['completed'],
-                project['reviewed'],
-                project['wrong']
+            column_widths.extend([
+                {"startIndex": current_col, "endIndex": current_col + 1, "pixelSize": 132}, # D: Last Submitted
             ])
-            
+            current_col += 1
         elif role == "Reviewer":
-            row = [
-                project['project_name'],
-                project['schema_name'],
-                project['video_count'],  # NEW: Video Count
-                f"{project['gt_ratio']:.0f}%",
-                f"{project['all_gt_ratio']:.0f}%",
-                f"{project['review_ratio']:.0f}%",
-                f"{project['all_review_ratio']:.0f}%",
-                self._format_timestamp(project['last_submitted'])
-            ]
-            # Add payment/feedback placeholder
-            if include_payment:
-                row.extend(['', '', ''])  # Payment Time, Base Salary, Bonus Salary
-            else:
-                row.append('')  # Feedback column
-            
-            # Add overall statistics
-            row.extend([
-                f"{project['gt_completion']:.0f}%",
-                f"{project['gt_accuracy']:.0f}%",
-                f"{project['review_completion']:.0f}%",
-                project['gt_completed'],
-                project['gt_wrong'],
-                project['review_completed']
+            column_widths.extend([
+                {"startIndex": current_col, "endIndex": current_col + 1, "pixelSize": 60},    # D: GT%
+                {"startIndex": current_col + 1, "endIndex": current_col + 2, "pixelSize": 60}, # E: All GT%
+                {"startIndex": current_col + 2, "endIndex": current_col + 3, "pixelSize": 60}, # F: Review%
+                {"startIndex": current_col + 3, "endIndex": current_col + 4, "pixelSize": 60}, # G: All Rev%
+                {"startIndex": current_col + 4, "endIndex": current_col + 5, "pixelSize": 132}, # H: Last Submitted
             ])
-            
-        else:  # Meta-Reviewer - UPDATED: Modified Ratio By columns moved to end
-            row = [
-                project['project_name'],
-                project['schema_name'],
-                project['video_count'],  # NEW: Video Count
-                self._format_timestamp(project['last_modified'])
-            ]
-            # Add payment/feedback placeholder
-            if include_payment:
-                row.extend(['', '', ''])  # Payment Time, Base Salary, Bonus Salary
-            else:
-                row.append('')  # Feedback column
-            
-            # Add Modified Ratio By columns at the end
-            row.extend([
-                f"{project['ratio_modified_by_user']:.0f}%",
-                f"{project['ratio_modified_by_all']:.0f}%"
+            current_col += 5
+        else:  # Meta-Reviewer
+            column_widths.extend([
+                {"startIndex": current_col, "endIndex": current_col + 1, "pixelSize": 132}, # D: Last Modified
             ])
+            current_col += 1
+        
+        # Payment/Feedback columns
+        if include_payment:
+            column_widths.extend([
+                {"startIndex": current_col, "endIndex": current_col + 1, "pixelSize": 120},      # Payment Time
+                {"startIndex": current_col + 1, "endIndex": current_col + 2, "pixelSize": 99},   # Base Salary
+                {"startIndex": current_col + 2, "endIndex": current_col + 3, "pixelSize": 99},   # Bonus Salary
+            ])
+            current_col += 3
+        else:
+            column_widths.extend([
+                {"startIndex": current_col, "endIndex": current_col + 1, "pixelSize": 300},      # Feedback
+            ])
+            current_col += 1
+        
+        # Overall stats columns 
+        if role in ["Annotator", "Reviewer"]:
+            remaining_cols = 6
+            for i in range(remaining_cols):
+                column_widths.append({
+                    "startIndex": current_col + i, 
+                    "endIndex": current_col + i + 1, 
+                    "pixelSize": 80
+                })
+        else:  # Meta-Reviewer: Modified Ratio By columns
+            for i in range(2):  
+                column_widths.append({
+                    "startIndex": current_col + i, 
+                    "endIndex": current_col + i + 1, 
+                    "pixelSize": 80
+                })
         
-        return row
-    
-    def _update_data_with_preservation(self, worksheet, data_rows: List[List], start_row: int):
-        """Update data rows while preserving manual columns"""
-        if not data_rows:
-            return
+        # Apply column widths and other formatting
+        requests = []
+        for width_spec in column_widths:
+            requests.append({
+                "updateDimensionProperties": {
+                    "range": {
+                        "sheetId": worksheet._properties['sheetId'],
+                        "dimension": "COLUMNS",
+                        "startIndex": width_spec["startIndex"],
+                        "endIndex": width_spec["endIndex"]
+                    },
+                    "properties": {
+                        "pixelSize": width_spec["pixelSize"]
+                    },
+                    "fields": "pixelSize"
+                }
+            })
         
-        end_row = start_row + len(data_rows) - 1
-        end_col = self._col_num_to_letter(len(data_rows[0]))
+        # Apply row heights and freeze panes
+        requests.append({
+            "updateDimensionProperties": {
+                "range": {
+                    "sheetId": worksheet._properties['sheetId'],
+                    "dimension": "ROWS",
+                    "startIndex": 0,
+                    "endIndex": header_rows
+                },
+                "properties": {
+                    "pixelSize": 35
+                },
+                "fields": "pixelSize"
+            }
+        })
         
-        self._api_call_with_retry(
-            worksheet.update, 
-            values=data_rows, 
-            range_name=f'A{start_row}:{end_col}{end_row}',
-            operation_name="updating project data"
-        )
-    
-    def _apply_alternating_row_colors(self, worksheet, data_rows_count: int, header_rows: int):
-        """Apply alternating row colors as the FINAL formatting step to ensure they stick"""
-        if data_rows_count <= 0:
-            return
+        # Set feedback row heights
+        if not include_payment and data_rows_count > 0:  # Feedback tab
+            for row_index in range(header_rows, header_rows + data_rows_count):
+                requests.append({
+                    "updateDimensionProperties": {
+                        "range": {
+                            "sheetId": worksheet._properties['sheetId'],
+                            "dimension": "ROWS",
+                            "startIndex": row_index,
+                            "endIndex": row_index + 1
+                        },
+                        "properties": {
+                            "pixelSize": 60  # 60px tall for feedback
+                        },
+                        "fields": "pixelSize"
+                    }
+                })
         
-        try:
-            sheet_id = worksheet._properties['sheetId']
-            
-            # Define colors
-            light_blue_color = {
-                "red": 0.95,
-                "green": 0.98, 
-                "blue": 1.0
+        # Freeze header rows
+        requests.append({
+            "updateSheetProperties": {
+                "properties": {
+                    "sheetId": worksheet._properties['sheetId'],
+                    "gridProperties": {
+                        "frozenRowCount": header_rows
+                    }
+                },
+                "fields": "gridProperties.frozenRowCount"
             }
-            
-            white_color = {
-                "red": 1.0,
-                "green": 1.0,
-                "blue": 1.0
+        })
+        
+        # STEP 2: Add all structural formatting first
+        batch.extend(requests)
+        
+        # STEP 3: Format specific columns (Video Count)
+        video_count_col = 2  # Column C (0-indexed)
+        video_count_format_requests = [{
+            "repeatCell": {
+                "range": {
+                    "sheetId": worksheet._properties['sheetId'],
+                    "startRowIndex": header_rows,
+                    "endRowIndex": header_rows + data_rows_count,
+                    "startColumnIndex": video_count_col,
+                    "endColumnIndex": video_count_col + 1
+                },
+                "cell": {
+                    "userEnteredFormat": {
+                        "numberFormat": {
+                            "type": "NUMBER",
+                            "pattern": "#,##0"
+                        },
+                        "horizontalAlignment": "CENTER"
+                        # NOTE: No backgroundColor here - will be overridden by alternating colors
+                    }
+                },
+                "fields": "userEnteredFormat(numberFormat,horizontalAlignment)"  # Don't override backgroundColor
             }
-            
-            # Build comprehensive alternating color requests
-            alternating_requests = []
-            
-            # Calculate the range of data rows (after headers)
-            first_data_row = header_rows  # 0-indexed (row 3 in 1-indexed becomes 2 in 0-indexed)
-            last_data_row = header_rows + data_rows_count - 1
-            
-            # Apply colors to ALL data rows (both blue and white explicitly)
-            for row_index in range(first_data_row, header_rows + data_rows_count):
-                # Determine if this should be colored (every other row)
-                is_colored_row = (row_index - first_data_row) % 2 == 1  # 0, 2, 4... = white; 1, 3, 5... = blue
-                
-                background_color = light_blue_color if is_colored_row else white_color
-                
-                alternating_requests.append({
+        }]
+        batch.extend(video_count_format_requests)
+        
+        # STEP 4: Format feedback column (if feedback tab)
+        if not include_payment:  # Feedback tab
+            feedback_col_positions = manual_column_positions(role, include_payment)
+            if feedback_col_positions and data_rows_count > 0:
+                feedback_col = feedback_col_positions[0]  # 0-indexed
+                batch.add({
                     "repeatCell": {
                         "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": row_index,
-                            "endRowIndex": row_index + 1,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 50  # Cover all relevant columns
+                            "sheetId": worksheet._properties['sheetId'],
+                            "startRowIndex": header_rows,
+                            "endRowIndex": last_row,
+                            "startColumnIndex": feedback_col,
+                            "endColumnIndex": feedback_col + 1
                         },
                         "cell": {
                             "userEnteredFormat": {
-                                "backgroundColor": background_color
+                                "wrapStrategy": "WRAP",
+                                "verticalAlignment": "TOP",
+                                "textFormat": {"fontSize": 9}
+                                # NOTE: No backgroundColor here - will be overridden by alternating colors
                             }
                         },
-                        "fields": "userEnteredFormat.backgroundColor"
+                        "fields": "userEnteredFormat(wrapStrategy,verticalAlignment,textFormat)"
                     }
                 })
-            
-            # Apply all alternating colors in one batch (HIGHER PRIORITY)
-            if alternating_requests:
-                alternating_batch_request = {"requests": alternating_requests}
-                self._api_call_with_retry(
-                    self.sheets_service.spreadsheets().batchUpdate,
-                    spreadsheetId=worksheet.spreadsheet.id,
-                    body=alternating_batch_request,
-                    operation_name="applying robust alternating row colors"
-                ).execute()
-                
-                print(f"      ✅ Applied alternating colors to {data_rows_count} rows (pattern agnostic)")
-                
-        except Exception as e:
-            print(f"      ⚠️ Could not apply alternating row colors: {e}")
+        
+        # STEP 5: Add alternating row colors LAST (this is the key!)
+        self._add_alternating_row_colors(batch, worksheet, data_rows_count, header_rows)
 
-    def _apply_user_sheet_formatting(self, worksheet, data_rows_count: int, role: str, include_payment: bool):
-        """Apply professional formatting to user sheets with robust alternating colors"""
-        try:
-            print(f"      🎨 Applying formatting...")
-            
-            header_rows = 2  # All roles have 2-row headers
-            last_row = header_rows + data_rows_count
-            
-            # STEP 1: Apply all other formatting FIRST (column widths, etc.)
-            column_widths = [
-                {"startIndex": 0, "endIndex": 1, "pixelSize": 150},   # A: Project Name
-                {"startIndex": 1, "endIndex": 2, "pixelSize": 120},   # B: Schema Name
-                {"startIndex": 2, "endIndex": 3, "pixelSize": 90},    # C: Video Count
-            ]
-            
-            # Role-specific columns
-            current_col = 3
-            if role == "Annotator":
-                column_widths.extend([
-                    {"startIndex": current_col, "endIndex": current_col + 1, "pixelSize": 132}, # D: Last Submitted
-                ])
-                current_col += 1
-            elif role == "Reviewer":
-                column_widths.extend([
-                    {"startIndex": current_col, "endIndex": current_col + 1, "pixelSize": 60},    # D: GT%
-                    {"startIndex": current_col + 1, "endIndex": current_col + 2, "pixelSize": 60}, # E: All GT%
-                    {"startIndex": current_col + 2, "endIndex": current_col + 3, "pixelSize": 60}, # F: Review%
-                    {"startIndex": current_col + 3, "endIndex": current_col + 4, "pixelSize": 60}, # G: All Rev%
-                    {"startIndex": current_col + 4, "endIndex": current_col + 5, "pixelSize": 132}, # H: Last Submitted
-                ])
-                current_col += 5
-            else:  # Meta-Reviewer
-                column_widths.extend([
-                    {"startIndex": current_col, "endIndex": current_col + 1, "pixelSize": 132}, # D: Last Modified
-                ])
-                current_col += 1
-            
-            # Payment/Feedback columns
-            if include_payment:
-                column_widths.extend([
-                    {"startIndex": current_col, "endIndex": current_col + 1, "pixelSize": 120},      # Payment Time
-                    {"startIndex": current_col + 1, "endIndex": current_col + 2, "pixelSize": 99},   # Base Salary
-                    {"startIndex": current_col + 2, "endIndex": current_col + 3, "pixelSize": 99},   # Bonus Salary
-                ])
-                current_col += 3
+    def _add_master_sheet_formatting(self, batch: SpreadsheetBatch, worksheet, data_rows_count: int, headers_count: int):
+        """Add formatting of a master sheet tab, with robust alternating colors, to the batch"""
+        last_row = 1 + data_rows_count
+        header_rows = 1  # Master sheet has 1 header row
+        
+        # STEP 1: Add structural formatting first
+        column_widths = [
+            {"startIndex": 0, "endIndex": 1, "pixelSize": 150},   # User Name
+            {"startIndex": 1, "endIndex": 2, "pixelSize": 200},   # Email
+            {"startIndex": 2, "endIndex": 3, "pixelSize": 80},    # Role
+            {"startIndex": 3, "endIndex": 4, "pixelSize": 200},   # Sheet Link
+            {"startIndex": 4, "endIndex": 5, "pixelSize": 132},   # Last Time
+            {"startIndex": 5, "endIndex": 6, "pixelSize": 130},   # Assigned Projects
+            {"startIndex": 6, "endIndex": 7, "pixelSize": 130},   # Started Projects
+        ]
+        
+        # Add remaining columns
+        for i in range(7, headers_count):
+            if i == 7:  # Completed Projects column
+                column_widths.append({
+                    "startIndex": i, 
+                    "endIndex": i + 1, 
+                    "pixelSize": 140
+                })
             else:
-                column_widths.extend([
-                    {"startIndex": current_col, "endIndex": current_col + 1, "pixelSize": 300},      # Feedback
-                ])
-                current_col += 1
-            
-            # Overall stats columns 
-            if role in ["Annotator", "Reviewer"]:
-                remaining_cols = 6
-                for i in range(remaining_cols):
-                    column_widths.append({
-                        "startIndex": current_col + i, 
-                        "endIndex": current_col + i + 1, 
-                        "pixelSize": 80
-                    })
-            else:  # Meta-Reviewer: Modified Ratio By columns
-                for i in range(2):  
-                    column_widths.append({
-                        "startIndex": current_col + i, 
-                        "endIndex": current_col + i + 1, 
-                        "pixelSize": 80
-                    })
-            
-            # Apply column widths and other formatting
-            requests = []
-            for width_spec in column_widths:
-                requests.append({
-                    "updateDimensionProperties": {
-                        "range": {
-                            "sheetId": worksheet._properties['sheetId'],
-                            "dimension": "COLUMNS",
-                            "startIndex": width_spec["startIndex"],
-                            "endIndex": width_spec["endIndex"]
-                        },
-                        "properties": {
-                            "pixelSize": width_spec["pixelSize"]
-                        },
-                        "fields": "pixelSize"
-                    }
+                column_widths.append({
+                    "startIndex": i, 
+                    "endIndex": i + 1, 
+                    "pixelSize": 100
                 })
-            
-            # Apply row heights and freeze panes
+        
+        requests = []
+        for width_spec in column_widths:
             requests.append({
                 "updateDimensionProperties": {
                     "range": {
                         "sheetId": worksheet._properties['sheetId'],
-                        "dimension": "ROWS",
-                        "startIndex": 0,
-                        "endIndex": header_rows
+                        "dimension": "COLUMNS",
+                        "startIndex": width_spec["startIndex"],
+                        "endIndex": width_spec["endIndex"]
                     },
                     "properties": {
-                        "pixelSize": 35
+                        "pixelSize": width_spec["pixelSize"]
                     },
                     "fields": "pixelSize"
                 }
             })
-            
-            # Set feedback row heights
-            if not include_payment and data_rows_count > 0:  # Feedback tab
-                for row_index in range(header_rows, header_rows + data_rows_count):
-                    requests.append({
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": worksheet._properties['sheetId'],
-                                "dimension": "ROWS",
-                                "startIndex": row_index,
-                                "endIndex": row_index + 1
-                            },
-                            "properties": {
-                                "pixelSize": 60  # 60px tall for feedback
-                            },
-                            "fields": "pixelSize"
-                        }
-                    })
-            
-            # Freeze header rows
-            requests.append({
-                "updateSheetProperties": {
-                    "properties": {
-                        "sheetId": worksheet._properties['sheetId'],
-                        "gridProperties": {
-                            "frozenRowCount": header_rows
-                        }
-                    },
-                    "fields": "gridProperties.frozenRowCount"
-                }
-            })
-            
-            # STEP 2: Apply all structural formatting first
-            if requests:
-                batch_request = {"requests": requests}
-                self._api_call_with_retry(
-                    self.sheets_service.spreadsheets().batchUpdate,
-                    spreadsheetId=worksheet.spreadsheet.id,
-                    body=batch_request,
-                    operation_name="applying column widths and structural formatting"
-                ).execute()
-            
-            # STEP 3: Format specific columns (Video Count)
-            video_count_col = 2  # Column C (0-indexed)
-            video_count_format_requests = [{
-                "repeatCell": {
-                    "range": {
-                        "sheetId": worksheet._properties['sheetId'],
-                        "startRowIndex": header_rows,
-                        "endRowIndex": header_rows + data_rows_count,
-                        "startColumnIndex": video_count_col,
-                        "endColumnIndex": video_count_col + 1
-                    },
-                    "cell": {
-                        "userEnteredFormat": {
-                            "numberFormat": {
-                                "type": "NUMBER",
-                                "pattern": "#,##0"
-                            },
-                            "horizontalAlignment": "CENTER"
-                            # NOTE: No backgroundColor here - will be overridden by alternating colors
-                        }
-                    },
-                    "fields": "userEnteredFormat(numberFormat,horizontalAlignment)"  # Don't override backgroundColor
-                }
-            }]
-            
-            video_count_batch_request = {"requests": video_count_format_requests}
-            self._api_call_with_retry(
-                self.sheets_service.spreadsheets().batchUpdate,
-                spreadsheetId=worksheet.spreadsheet.id,
-                body=video_count_batch_request,
-                operation_name="formatting video count column"
-            ).execute()
-            
-            # STEP 4: Format feedback column (if feedback tab)
-            if not include_payment:  # Feedback tab
-                feedback_col_positions = self._get_manual_column_positions(role, include_payment)
-                if feedback_col_positions:
-                    feedback_col_num = feedback_col_positions[0] + 1  # Convert to 1-indexed
-                    feedback_col = self._col_num_to_letter(feedback_col_num)
-                    
-                    feedback_format = {
-                        "wrapStrategy": "WRAP",
-                        "verticalAlignment": "TOP",
-                        "textFormat": {"fontSize": 9}
-                        # NOTE: No backgroundColor here - will be overridden by alternating colors
-                    }
-                    self._api_call_with_retry(
-                        worksheet.format, 
-                        f"{feedback_col}{header_rows + 1}:{feedback_col}{last_row}", 
-                        feedback_format,
-                        operation_name="formatting feedback column with text wrapping"
-                    )
-            
-            # STEP 5: Apply alternating row colors LAST (this is the key!)
-            self._apply_alternating_row_colors(worksheet, data_rows_count, header_rows)
-            
-            print(f"      ✅ Applied comprehensive formatting with robust alternating rows")
-            
-        except Exception as e:
-            print(f"      ⚠️ Worksheet formatting failed: {e}")
-
-    def _apply_master_sheet_formatting(self, worksheet, data_rows_count: int, headers_count: int):
-        """Apply formatting to master sheet with robust alternating colors"""
-        try:
-            last_row = 1 + data_rows_count
-            header_rows = 1  # Master sheet has 1 header row
-            
-            # STEP 1: Apply structural formatting first
-            column_widths = [
-                {"startIndex": 0, "endIndex": 1, "pixelSize": 150},   # User Name
-                {"startIndex": 1, "endIndex": 2, "pixelSize": 200},   # Email
-                {"startIndex": 2, "endIndex": 3, "pixelSize": 80},    # Role
-                {"startIndex": 3, "endIndex": 4, "pixelSize": 200},   # Sheet Link
-                {"startIndex": 4, "endIndex": 5, "pixelSize": 132},   # Last Time
-                {"startIndex": 5, "endIndex": 6, "pixelSize": 130},   # Assigned Projects
-                {"startIndex": 6, "endIndex": 7, "pixelSize": 130},   # Started Projects
-            ]
-            
-            # Add remaining columns
-            for i in range(7, headers_count):
-                if i == 7:  # Completed Projects column
-                    column_widths.append({
-                        "startIndex": i, 
-                        "endIndex": i + 1, 
-                        "pixelSize": 140
-                    })
-                else:
-                    column_widths.append({
-                        "startIndex": i, 
-                        "endIndex": i + 1, 
-                        "pixelSize": 100
-                    })
-            
-            requests = []
-            for width_spec in column_widths:
-                requests.append({
-                    "updateDimensionProperties": {
-                        "range": {
-                            "sheetId": worksheet._properties['sheetId'],
-                            "dimension": "COLUMNS",
-                            "startIndex": width_spec["startIndex"],
-                            "endIndex": width_spec["endIndex"]
+        
+        # Apply header formatting
+        requests.append({
+            "repeatCell": {
+                "range": {
+                    "sheetId": worksheet._properties['sheetId'],
+                    "startRowIndex": 0,
+                    "endRowIndex": 1,
+                    "startColumnIndex": 0,
+                    "endColumnIndex": headers_count
+                },
+                "cell": {
+                    "userEnteredFormat": {
+                        "backgroundColor": {
+                            "red": 0.2,
+                            "green": 0.4,
+                            "blue": 0.8
                         },
-                        "properties": {
-                            "pixelSize": width_spec["pixelSize"]
+                        "textFormat": {
+                            "bold": True,
+                            "fontSize": 10,
+                            "foregroundColor": {
+                                "red": 1,
+                                "green": 1,
+                                "blue": 1
+                            }
                         },
-                        "fields": "pixelSize"
+                        "horizontalAlignment": "CENTER",
+                        "verticalAlignment": "MIDDLE"
                     }
-                })
-            
-            # Apply header formatting
-            requests.append({
-                "repeatCell": {
-                    "range": {
-                        "sheetId": worksheet._properties['sheetId'],
-                        "startRowIndex": 0,
-                        "endRowIndex": 1,
-                        "startColumnIndex": 0,
-                        "endColumnIndex": headers_count
-                    },
-                    "cell": {
-                        "userEnteredFormat": {
-                            "backgroundColor": {
-                                "red": 0.2,
-                                "green": 0.4,
-                                "blue": 0.8
-                            },
-                            "textFormat": {
-                                "bold": True,
-                                "fontSize": 10,
-                                "foregroundColor": {
-                                    "red": 1,
-                                    "green": 1,
-                                    "blue": 1
-                                }
-                            },
-                            "horizontalAlignment": "CENTER",
-                            "verticalAlignment": "MIDDLE"
-                        }
-                    },
-                    "fields": "userEnteredFormat(backgroundColor,textFormat,horizontalAlignment,verticalAlignment)"
-                }
-            })
-            
-            # STEP 2: Apply structural formatting
-            if requests:
-                batch_request = {"requests": requests}
-                self._api_call_with_retry(
-                    self.sheets_service.spreadsheets().batchUpdate,
-                    spreadsheetId=worksheet.spreadsheet.id,
-                    body=batch_request,
-                    operation_name="applying master sheet structural formatting"
-                ).execute()
-            
-            # STEP 3: Apply alternating row colors LAST
-            self._apply_alternating_row_colors(worksheet, data_rows_count, header_rows)
-            
-            print(f"      ✅ Applied master sheet formatting with robust alternating rows")
-            
-        except Exception as e:
-            print(f"      ⚠️ Master sheet formatting failed: {e}")
+                },
+                "fields": "userEnteredFormat(backgroundColor,textFormat,horizontalAlignment,verticalAlignment)"
+            }
+        })
+        
+        # STEP 2: Add structural formatting
+        batch.extend(requests)
+        
+        # STEP 3: Add alternating row colors LAST
+        self._add_alternating_row_colors(batch, worksheet, data_rows_count, header_rows)
 
     
     # def _apply_user_sheet_formatting(self, worksheet, data_rows_count: int, role: str, include_payment: bool):
@@ -1739,7 +1587,7 @@ class GoogleSheetExporter:
     #         # NEW: Format feedback column with text wrapping (like Script 2)
     #         if not include_payment:  # Feedback tab
     #             # Calculate feedback column based on role and structure
-    #             feedback_col_positions = self._get_manual_column_positions(role, include_payment)
+    #             feedback_col_positions = manual_column_positions(role, include_payment)
     #             if feedback_col_positions:
     #                 feedback_col_num = feedback_col_positions[0] + 1  # Convert to 1-indexed
     #                 feedback_col = self._col_num_to_letter(feedback_col_num)
@@ -2095,164 +1943,109 @@ class GoogleSheetExporter:
     #             print(f"      ⚠️ Could not update links for {tab_name}: {e}")
 
     def _update_master_sheet_links(self, master_sheet_id: str, user_sheet_ids: Dict, sheet_prefix: str):
-        """Update master sheet with smart chip links to user sheets - BATCHED VERSION"""
+        """Update master sheet with smart chip links to user sheets in one batchUpdate call"""
         try:
             sheet = self._api_call_with_retry(self.client.open_by_key, master_sheet_id,
-                                            operation_name="opening master sheet for links")
-        except:
+                                            operation_name="opening master sheet for links", quota="read")
+            tab_names = ["Annotators", "Reviewers", "Meta-Reviewers"]
+            self.rate_limiter.acquire("read")
+            worksheets = {worksheet.title: worksheet for worksheet in sheet.worksheets()}
+            all_values = self._read_tab_values(sheet.id, [tab for tab in tab_names if tab in worksheets])
+        except Exception as e:
+            print(f"      ⚠️ Could not read master sheet for links: {e}")
             return
-
-        # Update each tab with smart chip links
-        for tab_name in ["Annotators", "Reviewers", "Meta-Reviewers"]:
-            try:
-                worksheet = sheet.worksheet(tab_name)
-                all_data = worksheet.get_all_values()
-                
-                if len(all_data) < 2:
-                    continue
-                
-                # Find the sheet link column (usually column 4: D)
-                link_col_idx = 3  # Column D (0-indexed)
-                
-                # BATCH: Collect all smart chip requests for this tab
-                # Store as tuples of (row_idx, sheet_url, user_name) for better error handling
-                links_to_update = []
-                
-                # Process each user row
-                for row_idx, row in enumerate(all_data[1:], start=2):  # Skip header
-                    if len(row) > 0 and row[0]:  # Has user name
-                        user_name = row[0]
-                        role_name = tab_name[:-1]  # Remove 's' from tab name
-                        sheet_key = f"{sheet_prefix}-{user_name} {role_name}"
-                        
-                        sheet_id = user_sheet_ids.get(sheet_key)
-                        
-                        if sheet_id:
-                            sheet_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/edit"
-                            links_to_update.append((row_idx, sheet_url, user_name))
-                
-                if not links_to_update:
-                    print(f"      ℹ️ No links to update in {tab_name}")
-                    continue
-                
-                # Build smart chip requests
-                smart_chip_requests = []
-                for row_idx, sheet_url, user_name in links_to_update:
-                    smart_chip_requests.append({
-                        "updateCells": {
-                            "rows": [{
-                                "values": [{
-                                    "userEnteredValue": {
-                                        "stringValue": "@"
-                                    },
-                                    "chipRuns": [{
-                                        "startIndex": 0,
-                                        "chip": {
-                                            "richLinkProperties": {
-                                                "uri": sheet_url
-                                            }
-                                        }
-                                    }]
-                                }]
-                            }],
-                            "fields": "userEnteredValue,chipRuns",
-                            "range": {
-                                "sheetId": worksheet._properties['sheetId'],
-                                "startRowIndex": row_idx - 1,  # Convert to 0-indexed
-                                "startColumnIndex": link_col_idx,
-                                "endRowIndex": row_idx,
-                                "endColumnIndex": link_col_idx + 1
-                            }
-                        }
-                    })
-                
-                # Execute batch in chunks to avoid rate limits (max ~30 per batch for safety)
-                BATCH_SIZE = 30
-                total_updated = 0
-                
-                for i in range(0, len(smart_chip_requests), BATCH_SIZE):
-                    batch_chunk = smart_chip_requests[i:i + BATCH_SIZE]
-                    batch_links = links_to_update[i:i + BATCH_SIZE]
-                    
-                    try:
-                        self._api_call_with_retry(
-                            self.sheets_service.spreadsheets().batchUpdate,
-                            spreadsheetId=sheet.id,
-                            body={"requests": batch_chunk},
-                            operation_name=f"batch updating {len(batch_chunk)} smart chips for {tab_name}"
-                        ).execute()
-                        total_updated += len(batch_chunk)
-                        print(f"        ✅ Updated {len(batch_chunk)} smart chip links")
-                    except Exception as e:
-                        error_str = str(e)
-                        print(f"        ⚠️ Smart chip batch failed: {error_str[:100]}")
-                        
-                        # Fallback: try hyperlinks for this batch
-                        print(f"        🔄 Falling back to HYPERLINK formulas...")
-                        fallback_updates = []
-                        for row_idx, sheet_url, user_name in batch_links:
-                            cell_address = f"{self._col_num_to_letter(link_col_idx + 1)}{row_idx}"
-                            role_name = tab_name[:-1]
-                            hyperlink_formula = f'=HYPERLINK("{sheet_url}", "📊 {user_name}")'
-                            fallback_updates.append({
-                                'range': cell_address,
-                                'values': [[hyperlink_formula]]
-                            })
-                        
-                        if fallback_updates:
-                            try:
-                                self._api_call_with_retry(
-                                    worksheet.batch_update,
-                                    fallback_updates,
-                                    value_input_option='USER_ENTERED',
-                                    operation_name=f"batch hyperlink fallback for {len(fallback_updates)} cells"
-                                )
-                                total_updated += len(fallback_updates)
-                                print(f"        ✅ Updated {len(fallback_updates)} links via HYPERLINK fallback")
-                            except Exception as e2:
-                                print(f"        ❌ Fallback also failed: {str(e2)[:100]}")
-                    
-                    # Small delay between batches
-                    if i + BATCH_SIZE < len(smart_chip_requests):
-                        time.sleep(2)
-                
-                print(f"      ✅ Updated {total_updated}/{len(links_to_update)} links in {tab_name}")
-                
-            except Exception as e:
-                print(f"      ⚠️ Could not update links for {tab_name}: {e}")
-
-    def _fallback_hyperlink_batch(self, worksheet, all_data, user_sheet_ids, sheet_prefix, tab_name, link_col_idx, start_idx, end_idx):
-        """Batch update hyperlinks as fallback"""
-        role_name = tab_name[:-1]
-        updates = []
         
-        row_offset = 2  # Data starts at row 2 (1-indexed)
-        for idx in range(start_idx, end_idx):
-            row_idx = row_offset + idx
-            if row_idx - 1 < len(all_data):
-                row = all_data[row_idx - 1]
-                if len(row) > 0 and row[0]:
+        # Find the sheet link column (usually column 4: D)
+        link_col_idx = 3  # Column D (0-indexed)
+        
+        # BATCH: Collect the smart chip requests of every tab
+        # Store as tuples of (tab_name, row_idx, sheet_url, user_name) for the fallback
+        batch = SpreadsheetBatch(sheet.id)
+        links_to_update = []
+        
+        for tab_name, all_data in all_values.items():
+            role_name = tab_name[:-1]  # Remove 's' from tab name
+            tab_links = 0
+            
+            # Process each user row
+            for row_idx, row in enumerate(all_data[1:], start=2):  # Skip header
+                if len(row) > 0 and row[0]:  # Has user name
                     user_name = row[0]
                     sheet_key = f"{sheet_prefix}-{user_name} {role_name}"
+                    
                     sheet_id = user_sheet_ids.get(sheet_key)
+                    
                     if sheet_id:
-                        cell_address = f"{self._col_num_to_letter(link_col_idx + 1)}{row_idx}"
-                        hyperlink_formula = f'=HYPERLINK("https://docs.google.com/spreadsheets/d/{sheet_id}/edit", "📊 {user_name} {role_name}")'
-                        updates.append({
-                            'range': cell_address,
-                            'values': [[hyperlink_formula]]
-                        })
-        
-        if updates:
-            try:
-                self._api_call_with_retry(
-                    worksheet.batch_update,
-                    updates,
-                    value_input_option='USER_ENTERED',
-                    operation_name=f"batch hyperlink fallback for {len(updates)} cells"
-                )
-            except Exception as e:
-                print(f"        ⚠️ Fallback hyperlink batch also failed: {e}")
+                        sheet_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/edit"
+                        links_to_update.append((tab_name, row_idx, sheet_url, user_name))
+                        batch.add(self._smart_chip_request(worksheets[tab_name], row_idx, link_col_idx, sheet_url))
+                        tab_links += 1
+            
+            if not tab_links:
+                print(f"      ℹ️ No links to update in {tab_name}")
+        
+        if not links_to_update:
+            return
+        
+        if self._flush_batch(batch, f"{len(links_to_update)} smart chip links"):
+            print(f"      ✅ Updated {len(links_to_update)} smart chip links")
+            return
+        
+        # Fallback: write HYPERLINK formulas for every link in one values.batchUpdate call
+        print(f"        🔄 Falling back to HYPERLINK formulas...")
+        try:
+            fallback_updates = self._fallback_hyperlink_ranges(links_to_update, link_col_idx)
+            self._write_changed_ranges(
+                sheet.id, fallback_updates,
+                f"batch hyperlink fallback for {len(fallback_updates)} cells",
+                value_input_option='USER_ENTERED'
+            )
+            print(f"        ✅ Updated {len(fallback_updates)} links via HYPERLINK fallback")
+        except Exception as e:
+            print(f"        ❌ Fallback also failed: {str(e)[:100]}")
+    
+    def _smart_chip_request(self, worksheet, row_idx: int, link_col_idx: int, sheet_url: str) -> Dict:
+        """Build the updateCells request that puts a smart chip link in one cell (row_idx is 1-indexed)"""
+        return {
+            "updateCells": {
+                "rows": [{
+                    "values": [{
+                        "userEnteredValue": {
+                            "stringValue": "@"
+                        },
+                        "chipRuns": [{
+                            "startIndex": 0,
+                            "chip": {
+                                "richLinkProperties": {
+                                    "uri": sheet_url
+                                }
+                            }
+                        }]
+                    }]
+                }],
+                "fields": "userEnteredValue,chipRuns",
+                "range": {
+                    "sheetId": worksheet._properties['sheetId'],
+                    "startRowIndex": row_idx - 1,  # Convert to 0-indexed
+                    "startColumnIndex": link_col_idx,
+                    "endRowIndex": row_idx,
+                    "endColumnIndex": link_col_idx + 1
+                }
+            }
+        }
+    
+    def _fallback_hyperlink_ranges(self, links_to_update: List[Tuple], link_col_idx: int) -> List[Dict]:
+        """Build HYPERLINK formula value ranges for (tab_name, row_idx, sheet_url, user_name) links"""
+        col_letter = self._col_num_to_letter(link_col_idx + 1)
+        updates = []
+        for tab_name, row_idx, sheet_url, user_name in links_to_update:
+            quoted_tab = "'{}'".format(tab_name.replace("'", "''"))
+            updates.append({
+                'range': f"{quoted_tab}!{col_letter}{row_idx}",
+                'values': [[f'=HYPERLINK("{sheet_url}", "📊 {user_name}")']]
+            })
+        return updates
+    
     # def _manage_sheet_permissions(self, sheet_id: str, sheet_name: str):
     #     """Manage sheet permissions based on database admin status"""
     #     try:
@@ -2315,7 +2108,8 @@ class GoogleSheetExporter:
                         fileId=sheet_id,
                         fields="permissions(id,role,type,emailAddress,displayName)"
                     ).execute(),
-                    operation_name=f"listing permissions for {sheet_name}"
+                    operation_name=f"listing permissions for {sheet_name}",
+                    quota="drive"
                 )
             except Exception as e:
                 print(f"        ⚠️ Could not list permissions: {e}")
@@ -2364,51 +2158,73 @@ class GoogleSheetExporter:
                 else:
                     print(f"        ⏭️ Skipping {email} - already has appropriate access")
             
-            # STEP 4: Execute permission changes (only when necessary)
+            # STEP 4: Execute permission changes (only when necessary) in one Drive batch request
             changes_made = 0
             
-            # Add new permissions
-            for email in emails_to_add:
-                try:
-                    self._api_call_with_retry(
-                        lambda e=email: self.drive_service.permissions().create(
+            def on_created(request_id, response, exception):
+                nonlocal changes_made
+                email = request_id.split(":", 1)[1]
+                if exception is None:
+                    print(f"        ✅ Added writer access for {email}")
+                    changes_made += 1
+                    return
+                error_msg = str(exception).lower()
+                # Check if error is because permission already exists
+                if any(phrase in error_msg for phrase in [
+                    'already exists', 'duplicate', 'already has access', 
+                    'already a collaborator', 'permission already granted'
+                ]):
+                    print(f"        ⏭️ {email} already has access (confirmed by API)")
+                else:
+                    print(f"        ⚠️ Could not add writer access for {email}: {exception}")
+            
+            def on_updated(request_id, response, exception):
+                nonlocal changes_made
+                email = request_id.split(":", 1)[1]
+                if exception is None:
+                    print(f"        ✅ Updated {email} to writer access")
+                    changes_made += 1
+                else:
+                    print(f"        ⚠️ Could not update permission for {email}: {exception}")
+            
+            if emails_to_add or permissions_to_update:
+                permission_batch = self.drive_service.new_batch_http_request()
+                
+                # Add new permissions
+                for email in emails_to_add:
+                    permission_batch.add(
+                        self.drive_service.permissions().create(
                             fileId=sheet_id,
                             body={
                                 'type': 'user',
                                 'role': 'writer',
-                                'emailAddress': e
+                                'emailAddress': email
                             }
-                        ).execute(),
-                        operation_name=f"adding writer permission for {email}"
+                        ),
+                        callback=on_created,
+                        request_id=f"add:{email}"
                     )
-                    print(f"        ✅ Added writer access for {email}")
-                    changes_made += 1
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    # Check if error is because permission already exists
-                    if any(phrase in error_msg for phrase in [
-                        'already exists', 'duplicate', 'already has access', 
-                        'already a collaborator', 'permission already granted'
-                    ]):
-                        print(f"        ⏭️ {email} already has access (confirmed by API)")
-                    else:
-                        print(f"        ⚠️ Could not add writer access for {email}: {e}")
-            
-            # Update existing permissions
-            for perm_id, new_role, email in permissions_to_update:
-                try:
-                    self._api_call_with_retry(
-                        lambda pid=perm_id, role=new_role: self.drive_service.permissions().update(
+                
+                # Update existing permissions
+                for perm_id, new_role, email in permissions_to_update:
+                    permission_batch.add(
+                        self.drive_service.permissions().update(
                             fileId=sheet_id,
-                            permissionId=pid,
-                            body={'role': role}
-                        ).execute(),
-                        operation_name=f"updating permission for {email} to {new_role}"
+                            permissionId=perm_id,
+                            body={'role': new_role}
+                        ),
+                        callback=on_updated,
+                        request_id=f"update:{email}"
                     )
-                    print(f"        ✅ Updated {email} to writer access")
-                    changes_made += 1
-                except Exception as e:
-                    print(f"        ⚠️ Could not update permission for {email}: {e}")
+                
+                # Each request of the batch still counts against the Drive quota
+                for _ in range(len(emails_to_add) + len(permissions_to_update) - 1):
+                    self.rate_limiter.acquire("drive")
+                self._api_call_with_retry(
+                    permission_batch.execute,
+                    operation_name=f"batch updating {len(emails_to_add) + len(permissions_to_update)} permissions",
+                    quota="drive"
+                )
             
             # STEP 5: Summary
             if changes_made == 0:
@@ -2436,6 +2252,8 @@ def main():
                        help="Resume from specific user (format: 'User Name Role')")
     parser.add_argument("--sheet-prefix", type=str, default="Pizza",
                        help="Prefix for all individual sheet names (default: 'Pizza')")
+    parser.add_argument("--workers", type=int, default=4,
+                       help="Number of user sheets exported concurrently (default: 4)")
     
     args = parser.parse_args()
     
@@ -2467,7 +2285,8 @@ def main():
         master_sheet_id=args.master_sheet_id,
         skip_individual=args.skip_individual,
         resume_from=args.resume_from,
-        sheet_prefix=args.sheet_prefix
+        sheet_prefix=args.sheet_prefix,
+        max_workers=args.workers
     )
     
     print("\n" + "="*60)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Incremental Workspace Export Script
+
+Exports only the users, videos, annotations and ground truths that changed since the
+previous run as delta files, and compacts accumulated deltas into the full workspace
+snapshot. The first export into an empty folder is a full export_workspace.
+
+Usage:
+    python label_pizza/incremental_export.py export --output ./workspace
+    python label_pizza/incremental_export.py compact --output ./workspace
+
+Examples:
+    # Nightly job: write a delta, then fold it into the snapshot
+    python label_pizza/incremental_export.py export --output ./workspace --compact
+"""
+
+import argparse
+import sys
+from dotenv import load_dotenv
+
+from label_pizza.db import init_database
+
+
+def main():
+    """Main script entry point."""
+    parser = argparse.ArgumentParser(description="Incremental workspace export and delta compaction")
+    parser.add_argument("command", choices=["export", "compact"], help="export writes a delta, compact folds deltas into the snapshot")
+    parser.add_argument("--output", "-o", required=True, help="Workspace folder")
+    parser.add_argument("--compact", action="store_true", help="Compact deltas right after exporting")
+    parser.add_argument("--overlap-seconds", type=int, default=300,
+                        help="Re-export rows changed this long before the last watermark (default: 300)")
+    parser.add_argument("--max-workers", type=int, default=0, help="Threads for writing per-group files (default: 0)")
+    parser.add_argument("--database-url-name", default="DBURL",
+                        help="Environment variable name for database URL (default: DBURL)")
+    args = parser.parse_args()
+
+    load_dotenv(".env")
+    try:
+        init_database(args.database_url_name)
+    except Exception as e:
+        print(f"Error initializing database: {e}")
+        return 1
+
+    from label_pizza.export_utils import export_workspace_incremental, compact_workspace
+
+    try:
+        if args.command == "export":
+            export_workspace_incremental(args.output, overlap_seconds=args.overlap_seconds, max_workers=args.max_workers)
+        if args.command == "compact" or args.compact:
+            compact_workspace(args.output)
+    except ValueError as e:
+        print(f"✗ {e}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -49,7 +49,7 @@ except ImportError as e:
 
 # Import backup functionality
 try:
-    from label_pizza.backup_restore import DatabaseBackupRestore
+    from label_pizza.backup_restore import DatabaseBackupRestore, find_latest_chain_backup, DIFF_CHAIN_LIMIT
     BACKUP_AVAILABLE = True
 except ImportError:
     print("⚠️  backup_restore.py not found. Backup functionality disabled.")
@@ -516,8 +516,16 @@ class NuclearDatabaseManager:
             return False
             
 def create_backup_if_requested(db_url: str, backup_dir: str = "./backups", 
-                             backup_file: Optional[str] = None, compress: bool = True) -> Optional[str]:
-    """Create a backup before reset if requested"""
+                             backup_file: Optional[str] = None, compress: bool = True,
+                             differential: Optional[bool] = None) -> Optional[str]:
+    """Create a backup before reset if requested
+    
+    With an auto-generated filename and differential=None, the backup is a differential
+    backup against the newest COPY or differential backup in backup_dir when there is one
+    (and its chain is shorter than DIFF_CHAIN_LIMIT), and a full .sql backup otherwise.
+    differential=True starts a new COPY base instead of the full .sql backup;
+    differential=False always takes a full .sql backup.
+    """
     if not BACKUP_AVAILABLE:
         print("❌ Backup functionality not available (backup_restore.py not found)")
         return None
@@ -533,6 +541,27 @@ def create_backup_if_requested(db_url: str, backup_dir: str = "./backups",
         if backup_file is None:
             # Auto-generate timestamped filename
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            
+            if differential is not False:
+                latest = find_latest_chain_backup(backup_dir)
+                if latest is not None and latest[1] < DIFF_CHAIN_LIMIT:
+                    output_file = str(backup_path / f"diff_{timestamp}.tar")
+                    print(f"💾 Creating differential backup against {os.path.basename(latest[0])}: {output_file}")
+                    success = handler.create_diff_backup(output_file, latest[0], compress=compress)
+                elif differential or latest is not None:
+                    output_file = str(backup_path / f"backup_{timestamp}.tar")
+                    print(f"💾 Creating base backup for differential backups: {output_file}")
+                    success = handler.create_copy_backup(output_file, compress=compress)
+                else:
+                    output_file = None
+                
+                if output_file is not None:
+                    if success:
+                        print(f"   ✅ Backup created: {output_file}")
+                        return output_file
+                    print("   ❌ Backup failed")
+                    return None
+            
             extension = ".sql.gz" if compress else ".sql"
             backup_file = f"backup_before_nuclear_{timestamp}{extension}"
         
@@ -263,6 +263,13 @@ class AnswerReview(Base):
     comment = Column(Text)
     reviewed_at = Column(DateTime(timezone=True), default=now)
 
+class ProjectDataVersion(Base):
+    """Counter bumped by every committed write to a project's data; caches key on it."""
+    __tablename__ = "project_data_versions"
+    project_id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), default=now, onupdate=now)
+
 # ---------------- create & smoke-test -------------------------------------
 if __name__ == "__main__":
     import os
@@ -11,23 +11,56 @@ IMPORTANT: Always run these two lines first before using any functions:
     from label_pizza.db import init_database
     init_database("DBURL")
 
-All delete functions support backup parameters:
-- backup_first=True - Create automatic backup before deletion
+All delete and rename functions support backup parameters:
+- backup_first=True - Snapshot the affected rows before the change
 - backup_dir="./backups" - Default backup directory  
 - backup_file=None - Auto-generated timestamp filename
 - compress=True - Enable gzip compression
+
+Snapshots hold only the rows a delete or rename touches, so they take milliseconds.
+Undo a change from its snapshot with undo_snapshot(path), or from the shell:
+
+    python -m label_pizza.override_utils undo ./backups/snapshot_20250101_120000_000000.json.gz
+
+Set BACKUP_SCOPE = "database" to take a full database backup instead.
+
+batch_rename(entity, manifest) and batch_delete(entity, manifest) apply a whole CSV or
+JSON manifest with one confirmation, one snapshot and one transaction:
+
+    python -m label_pizza.override_utils rename video ./video_renames.csv
+    python -m label_pizza.override_utils delete user ./users_to_remove.json
 """
 
 from typing import List, Tuple, Dict, Any, Optional, NamedTuple
 from dataclasses import dataclass
 from datetime import datetime
+from collections import Counter, defaultdict
+import argparse
+import csv
+import gzip
+import json
+import sys
 import label_pizza.db
 from sqlalchemy.orm import Session
-from sqlalchemy import text, and_
+from sqlalchemy import text, and_, select, DateTime, String
 from label_pizza.manage_db import create_backup_if_requested
+from label_pizza.models import Base
 import os
 
 
+SNAPSHOT_FORMAT = "label-pizza-snapshot"
+
+# What backup_first=True saves before a change: "rows" snapshots only the rows the
+# change touches (undo with undo_snapshot), "database" takes a full database backup
+BACKUP_SCOPE = "rows"
+
+# Requested operations listed one by one in confirmation prompts
+MAX_LISTED_OPERATIONS = 20
+
+# Values per IN (...) list when resolving or seeding rows in bulk
+BULK_LOOKUP_CHUNK = 1000
+
+
 def get_db_url_for_backup():
     """Get database URL using the same environment variable used in init_database"""
     import label_pizza.db
@@ -67,6 +100,109 @@ DELETION_ORDER = [
 ]
 
 
+# Table name and primary key columns for every entry in DELETION_ORDER
+DELETE_PLAN_TABLES = {
+    'AnswerReview': ('answer_reviews', ('id',)),
+    'ReviewerGroundTruth': ('reviewer_ground_truth', ('video_id', 'question_id', 'project_id')),
+    'ProjectVideoQuestionDisplay': ('project_video_question_displays', ('project_id', 'video_id', 'question_id')),
+    'ProjectGroupProject': ('project_group_projects', ('project_group_id', 'project_id')),
+    'VideoTag': ('video_tags', ('video_id', 'tag')),
+    'AnnotatorAnswer': ('annotator_answers', ('id',)),
+    'ProjectGroup': ('project_groups', ('id',)),
+    'ProjectVideo': ('project_videos', ('project_id', 'video_id')),
+    'ProjectUserRole': ('project_user_roles', ('project_id', 'user_id', 'role')),
+    'QuestionGroupQuestion': ('question_group_questions', ('question_group_id', 'question_id')),
+    'SchemaQuestionGroup': ('schema_question_groups', ('schema_id', 'question_group_id')),
+    'Video': ('videos', ('id',)),
+    'Question': ('questions', ('id',)),
+    'QuestionGroup': ('question_groups', ('id',)),
+    'Project': ('projects', ('id',)),
+    'User': ('users', ('id',)),
+    'Schema': ('schemas', ('id',)),
+}
+
+# (project_id, question_id) pairs whose answers belong to a staged question group
+# link or schema link: the question is asked in the project through that link
+_LINKED_QUESTION_SCOPE_SQL = """
+    SELECT p.id AS project_id, d.question_id
+    FROM _del_question_group_questions d
+    JOIN schema_question_groups sqg ON sqg.question_group_id = d.question_group_id
+    JOIN projects p ON p.schema_id = sqg.schema_id
+    UNION
+    SELECT p.id AS project_id, qgq.question_id
+    FROM _del_schema_question_groups d
+    JOIN projects p ON p.schema_id = d.schema_id
+    JOIN question_group_questions qgq ON qgq.question_group_id = d.question_group_id
+"""
+
+# Cascade rules as (child table, SELECT of child keys). Each rule stages the children
+# of rows already staged with one INSERT ... SELECT; rules run parents-first so a
+# table's staged keys are complete before its children are read.
+CASCADE_DELETE_RULES = [
+    # Schemas, question groups and questions
+    ('SchemaQuestionGroup', "SELECT c.schema_id, c.question_group_id FROM schema_question_groups c JOIN _del_schemas d ON d.id = c.schema_id"),
+    ('Project', "SELECT c.id FROM projects c JOIN _del_schemas d ON d.id = c.schema_id"),
+    ('QuestionGroupQuestion', "SELECT c.question_group_id, c.question_id FROM question_group_questions c JOIN _del_question_groups d ON d.id = c.question_group_id"),
+    ('SchemaQuestionGroup', "SELECT c.schema_id, c.question_group_id FROM schema_question_groups c JOIN _del_question_groups d ON d.id = c.question_group_id"),
+    ('QuestionGroupQuestion', "SELECT c.question_group_id, c.question_id FROM question_group_questions c JOIN _del_questions d ON d.id = c.question_id"),
+    # Project, user, video and project group memberships
+    ('ProjectVideo', "SELECT c.project_id, c.video_id FROM project_videos c JOIN _del_projects d ON d.id = c.project_id"),
+    ('ProjectUserRole', "SELECT c.project_id, c.user_id, c.role FROM project_user_roles c JOIN _del_projects d ON d.id = c.project_id"),
+    ('ProjectGroupProject', "SELECT c.project_group_id, c.project_id FROM project_group_projects c JOIN _del_projects d ON d.id = c.project_id"),
+    ('ProjectUserRole', "SELECT c.project_id, c.user_id, c.role FROM project_user_roles c JOIN _del_users d ON d.id = c.user_id"),
+    ('VideoTag', "SELECT c.video_id, c.tag FROM video_tags c JOIN _del_videos d ON d.id = c.video_id"),
+    ('ProjectVideo', "SELECT c.project_id, c.video_id FROM project_videos c JOIN _del_videos d ON d.id = c.video_id"),
+    ('ProjectGroupProject', "SELECT c.project_group_id, c.project_id FROM project_group_projects c JOIN _del_project_groups d ON d.id = c.project_group_id"),
+    # Removing an annotator or model role removes the reviewer role, which removes the admin role
+    ('ProjectUserRole', """SELECT c.project_id, c.user_id, c.role FROM project_user_roles c
+        JOIN _del_project_user_roles d ON d.project_id = c.project_id AND d.user_id = c.user_id
+        WHERE d.role IN ('annotator', 'model') AND c.role = 'reviewer'"""),
+    ('ProjectUserRole', """SELECT c.project_id, c.user_id, c.role FROM project_user_roles c
+        JOIN _del_project_user_roles d ON d.project_id = c.project_id AND d.user_id = c.user_id
+        WHERE d.role = 'reviewer' AND c.role = 'admin'"""),
+    # Answers, ground truths and displays of removed questions in affected projects
+    ('AnnotatorAnswer', f"""SELECT c.id FROM annotator_answers c
+        JOIN ({_LINKED_QUESTION_SCOPE_SQL}) s ON s.project_id = c.project_id AND s.question_id = c.question_id"""),
+    ('ReviewerGroundTruth', f"""SELECT c.video_id, c.question_id, c.project_id FROM reviewer_ground_truth c
+        JOIN ({_LINKED_QUESTION_SCOPE_SQL}) s ON s.project_id = c.project_id AND s.question_id = c.question_id"""),
+    ('ProjectVideoQuestionDisplay', f"""SELECT c.project_id, c.video_id, c.question_id FROM project_video_question_displays c
+        JOIN ({_LINKED_QUESTION_SCOPE_SQL}) s ON s.project_id = c.project_id AND s.question_id = c.question_id"""),
+    # Answers, ground truths and displays of removed project videos
+    ('AnnotatorAnswer', "SELECT c.id FROM annotator_answers c JOIN _del_project_videos d ON d.project_id = c.project_id AND d.video_id = c.video_id"),
+    ('ReviewerGroundTruth', "SELECT c.video_id, c.question_id, c.project_id FROM reviewer_ground_truth c JOIN _del_project_videos d ON d.project_id = c.project_id AND d.video_id = c.video_id"),
+    ('ProjectVideoQuestionDisplay', "SELECT c.project_id, c.video_id, c.question_id FROM project_video_question_displays c JOIN _del_project_videos d ON d.project_id = c.project_id AND d.video_id = c.video_id"),
+    # Work of removed reviewer, annotator and model roles in their project
+    ('ReviewerGroundTruth', """SELECT c.video_id, c.question_id, c.project_id FROM reviewer_ground_truth c
+        JOIN _del_project_user_roles d ON d.project_id = c.project_id AND d.user_id = c.reviewer_id
+        WHERE d.role = 'reviewer'"""),
+    ('AnswerReview', """SELECT c.id FROM answer_reviews c
+        JOIN annotator_answers a ON a.id = c.answer_id
+        JOIN _del_project_user_roles d ON d.project_id = a.project_id AND d.user_id = c.reviewer_id
+        WHERE d.role = 'reviewer'"""),
+    ('AnnotatorAnswer', """SELECT c.id FROM annotator_answers c
+        JOIN _del_project_user_roles d ON d.project_id = c.project_id AND d.user_id = c.user_id
+        WHERE d.role IN ('annotator', 'model')"""),
+    # Reviews of removed answers
+    ('AnswerReview', "SELECT c.id FROM answer_reviews c JOIN _del_annotator_answers d ON d.id = c.answer_id"),
+]
+
+
+@dataclass
+class DeletePlan:
+    """Full cascade closure of a set of root delete operations.
+
+    The keys of every row to delete are staged in one temporary table per
+    database table (``_del_<table>``) on the session that built the plan.
+    """
+    operations: List[DeleteOperation]
+    counts: Dict[str, int]  # Rows to delete per table, in DELETION_ORDER
+    admin_reverts: int = 0  # Ground truths modified by removed admin roles
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.counts.values())
+
+
 def _get_deletion_priority(table: str) -> int:
     """Get deletion priority (lower number = delete first)"""
     try:
@@ -94,24 +230,30 @@ def _collect_delete_operations(operations: List[DeleteOperation]) -> List[Delete
     return deduplicated
 
 
-def _confirm_cascade_deletion(operations: List[DeleteOperation]) -> bool:
-    """Ask user to confirm cascade deletion operations"""
-    if not operations:
+def _confirm_delete_plan(plan: DeletePlan, session: Optional[Session] = None) -> bool:
+    """Show per-table row counts of a delete plan and ask user to confirm"""
+    if plan.total_rows == 0:
         print("No operations to perform.")
         return True
     
-    print("🚨 CASCADE DELETE OPERATIONS")
+    print("🚨 CASCADE DELETE PLAN")
     print("=" * 50)
-    print("The following delete operations will be executed in sequence:")
-    print()
+    print("Requested deletions:")
+    for i, op in enumerate(plan.operations[:MAX_LISTED_OPERATIONS], 1):
+        print(f"{i:2d}. {_get_readable_operation_name(op, session)}")
+    if len(plan.operations) > MAX_LISTED_OPERATIONS:
+        print(f"    ... and {len(plan.operations) - MAX_LISTED_OPERATIONS:,} more")
     
-    for i, op in enumerate(operations, 1):
-        table = op.table
-        readable_name = _get_readable_operation_name(op)
-        print(f"{i:2d}. {readable_name}")
+    print()
+    print("Rows to delete, in execution order:")
+    for table, count in plan.counts.items():
+        if count:
+            print(f"   {DELETE_PLAN_TABLES[table][0]:<34} {count:>10,}")
+    if plan.admin_reverts:
+        print(f"   {'admin ground truth edits reverted':<34} {plan.admin_reverts:>10,}")
     
     print()
-    print(f"Total operations: {len(operations)}")
+    print(f"Total rows: {plan.total_rows:,}")
     print("⚠️  This will permanently delete data from the database!")
     print()
     
@@ -119,117 +261,123 @@ def _confirm_cascade_deletion(operations: List[DeleteOperation]) -> bool:
     return response.strip() == 'DELETE'
 
 
-def _get_readable_operation_name(op: DeleteOperation) -> str:
-    """Convert delete operation to human-readable name"""
+def _get_readable_operation_name(op: DeleteOperation, session: Optional[Session] = None) -> str:
+    """Convert delete operation to human-readable name, looking names up on session if given"""
     table = op.table
     identifier = op.identifier
     
+    if session is None:
+        try:
+            with label_pizza.db.SessionLocal() as session:
+                return _get_readable_operation_name(op, session)
+        except Exception as e:
+            return f"Delete {table.lower()} (ID: {identifier[0]})"
+    
     try:
-        with label_pizza.db.SessionLocal() as session:
-            if table == 'User':
-                user_name = _get_name_from_id(session, 'users', 'user_id_str', identifier[0])
-                return f"Delete user '{user_name}'"
-                
-            elif table == 'Video':
-                video_name = _get_name_from_id(session, 'videos', 'video_uid', identifier[0])
-                return f"Delete video '{video_name}'"
-                
-            elif table == 'QuestionGroup':
-                group_name = _get_name_from_id(session, 'question_groups', 'title', identifier[0])
-                return f"Delete question group '{group_name}'"
-                
-            elif table == 'Question':
-                question_text = _get_name_from_id(session, 'questions', 'text', identifier[0])
-                return f"Delete question '{question_text[:50]}{'...' if len(question_text) > 50 else ''}'"
-                
-            elif table == 'Schema':
-                schema_name = _get_name_from_id(session, 'schemas', 'name', identifier[0])
-                return f"Delete schema '{schema_name}'"
-                
-            elif table == 'Project':
-                project_name = _get_name_from_id(session, 'projects', 'name', identifier[0])
-                return f"Delete project '{project_name}'"
-                
-            elif table == 'ProjectGroup':
-                group_name = _get_name_from_id(session, 'project_groups', 'name', identifier[0])
-                return f"Delete project group '{group_name}'"
-                
-            elif table == 'ProjectVideo':
-                project_name = _get_name_from_id(session, 'projects', 'name', identifier[0])
-                video_name = _get_name_from_id(session, 'videos', 'video_uid', identifier[1])
-                return f"Remove video '{video_name}' from project '{project_name}'"
-                
-            elif table == 'ProjectUserRole':
-                project_name = _get_name_from_id(session, 'projects', 'name', identifier[0])
-                user_name = _get_name_from_id(session, 'users', 'user_id_str', identifier[1])
-                role = identifier[2]
-                return f"Remove {role} '{user_name}' from project '{project_name}'"
-                
-            elif table == 'ProjectGroupProject':
-                group_name = _get_name_from_id(session, 'project_groups', 'name', identifier[0])
-                project_name = _get_name_from_id(session, 'projects', 'name', identifier[1])
-                return f"Remove project '{project_name}' from group '{group_name}'"
-                
-            elif table == 'QuestionGroupQuestion':
-                group_name = _get_name_from_id(session, 'question_groups', 'title', identifier[0])
-                question_text = _get_name_from_id(session, 'questions', 'text', identifier[1])
-                return f"Remove question from group '{group_name}'"
-                
-            elif table == 'SchemaQuestionGroup':
-                schema_name = _get_name_from_id(session, 'schemas', 'name', identifier[0])
-                group_name = _get_name_from_id(session, 'question_groups', 'title', identifier[1])
-                return f"Remove group '{group_name}' from schema '{schema_name}'"
-                
-            elif table == 'ProjectVideoQuestionDisplay':
-                project_name = _get_name_from_id(session, 'projects', 'name', identifier[0])
-                video_name = _get_name_from_id(session, 'videos', 'video_uid', identifier[1])
-                question_text = _get_name_from_id(session, 'questions', 'text', identifier[2])
-                return f"Delete custom display for '{question_text[:30]}...' in '{project_name}'"
-                
-            elif table == 'AnnotatorAnswer':
-                # Get detailed info about the annotation
-                result = session.execute(text("""
-                    SELECT u.user_id_str, v.video_uid, q.text, p.name
-                    FROM annotator_answers aa
-                    JOIN users u ON aa.user_id = u.id
-                    JOIN videos v ON aa.video_id = v.id  
-                    JOIN questions q ON aa.question_id = q.id
-                    JOIN projects p ON aa.project_id = p.id
-                    WHERE aa.id = :id
-                """), {"id": identifier[0]})
-                row = result.fetchone()
-                if row:
-                    user_name, video_name, question_text, project_name = row
-                    return f"Delete '{user_name}' annotation for '{question_text[:30]}...' in '{project_name}'"
-                return f"Delete annotation (ID: {identifier[0]})"
-                
-            elif table == 'ReviewerGroundTruth':
-                video_name = _get_name_from_id(session, 'videos', 'video_uid', identifier[0])
-                question_text = _get_name_from_id(session, 'questions', 'text', identifier[1])
-                project_name = _get_name_from_id(session, 'projects', 'name', identifier[2])
-                return f"Delete ground truth for '{question_text[:30]}...' in '{project_name}'"
-                
-            elif table == 'AnswerReview':
-                # Get detailed info about the review
-                result = session.execute(text("""
-                    SELECT reviewer.user_id_str, annotator.user_id_str, q.text
-                    FROM answer_reviews ar
-                    JOIN annotator_answers aa ON ar.answer_id = aa.id
-                    JOIN users reviewer ON ar.reviewer_id = reviewer.id
-                    JOIN users annotator ON aa.user_id = annotator.id
-                    JOIN questions q ON aa.question_id = q.id
-                    WHERE ar.id = :id
-                """), {"id": identifier[0]})
-                row = result.fetchone()
-                if row:
-                    reviewer_name, annotator_name, question_text = row
-                    return f"Delete '{reviewer_name}' review of '{annotator_name}' annotation"
-                return f"Delete answer review (ID: {identifier[0]})"
-                
-            else:
-                # Fallback for unknown table types
-                return f"Delete {table.lower()} (ID: {identifier[0]})"
-                
+        if table == 'User':
+            user_name = _get_name_from_id(session, 'users', 'user_id_str', identifier[0])
+            return f"Delete user '{user_name}'"
+            
+        elif table == 'Video':
+            video_name = _get_name_from_id(session, 'videos', 'video_uid', identifier[0])
+            return f"Delete video '{video_name}'"
+            
+        elif table == 'QuestionGroup':
+            group_name = _get_name_from_id(session, 'question_groups', 'title', identifier[0])
+            return f"Delete question group '{group_name}'"
+            
+        elif table == 'Question':
+            question_text = _get_name_from_id(session, 'questions', 'text', identifier[0])
+            return f"Delete question '{question_text[:50]}{'...' if len(question_text) > 50 else ''}'"
+            
+        elif table == 'Schema':
+            schema_name = _get_name_from_id(session, 'schemas', 'name', identifier[0])
+            return f"Delete schema '{schema_name}'"
+            
+        elif table == 'Project':
+            project_name = _get_name_from_id(session, 'projects', 'name', identifier[0])
+            return f"Delete project '{project_name}'"
+            
+        elif table == 'ProjectGroup':
+            group_name = _get_name_from_id(session, 'project_groups', 'name', identifier[0])
+            return f"Delete project group '{group_name}'"
+            
+        elif table == 'ProjectVideo':
+            project_name = _get_name_from_id(session, 'projects', 'name', identifier[0])
+            video_name = _get_name_from_id(session, 'videos', 'video_uid', identifier[1])
+            return f"Remove video '{video_name}' from project '{project_name}'"
+            
+        elif table == 'ProjectUserRole':
+            project_name = _get_name_from_id(session, 'projects', 'name', identifier[0])
+            user_name = _get_name_from_id(session, 'users', 'user_id_str', identifier[1])
+            role = identifier[2]
+            return f"Remove {role} '{user_name}' from project '{project_name}'"
+            
+        elif table == 'ProjectGroupProject':
+            group_name = _get_name_from_id(session, 'project_groups', 'name', identifier[0])
+            project_name = _get_name_from_id(session, 'projects', 'name', identifier[1])
+            return f"Remove project '{project_name}' from group '{group_name}'"
+            
+        elif table == 'QuestionGroupQuestion':
+            group_name = _get_name_from_id(session, 'question_groups', 'title', identifier[0])
+            question_text = _get_name_from_id(session, 'questions', 'text', identifier[1])
+            return f"Remove question from group '{group_name}'"
+            
+        elif table == 'SchemaQuestionGroup':
+            schema_name = _get_name_from_id(session, 'schemas', 'name', identifier[0])
+            group_name = _get_name_from_id(session, 'question_groups', 'title', identifier[1])
+            return f"Remove group '{group_name}' from schema '{schema_name}'"
+            
+        elif table == 'ProjectVideoQuestionDisplay':
+            project_name = _get_name_from_id(session, 'projects', 'name', identifier[0])
+            video_name = _get_name_from_id(session, 'videos', 'video_uid', identifier[1])
+            question_text = _get_name_from_id(session, 'questions', 'text', identifier[2])
+            return f"Delete custom display for '{question_text[:30]}...' in '{project_name}'"
+            
+        elif table == 'AnnotatorAnswer':
+            # Get detailed info about the annotation
+            result = session.execute(text("""
+                SELECT u.user_id_str, v.video_uid, q.text, p.name
+                FROM annotator_answers aa
+                JOIN users u ON aa.user_id = u.id
+                JOIN videos v ON aa.video_id = v.id  
+                JOIN questions q ON aa.question_id = q.id
+                JOIN projects p ON aa.project_id = p.id
+                WHERE aa.id = :id
+            """), {"id": identifier[0]})
+            row = result.fetchone()
+            if row:
+                user_name, video_name, question_text, project_name = row
+                return f"Delete '{user_name}' annotation for '{question_text[:30]}...' in '{project_name}'"
+            return f"Delete annotation (ID: {identifier[0]})"
+            
+        elif table == 'ReviewerGroundTruth':
+            video_name = _get_name_from_id(session, 'videos', 'video_uid', identifier[0])
+            question_text = _get_name_from_id(session, 'questions', 'text', identifier[1])
+            project_name = _get_name_from_id(session, 'projects', 'name', identifier[2])
+            return f"Delete ground truth for '{question_text[:30]}...' in '{project_name}'"
+            
+        elif table == 'AnswerReview':
+            # Get detailed info about the review
+            result = session.execute(text("""
+                SELECT reviewer.user_id_str, annotator.user_id_str, q.text
+                FROM answer_reviews ar
+                JOIN annotator_answers aa ON ar.answer_id = aa.id
+                JOIN users reviewer ON ar.reviewer_id = reviewer.id
+                JOIN users annotator ON aa.user_id = annotator.id
+                JOIN questions q ON aa.question_id = q.id
+                WHERE ar.id = :id
+            """), {"id": identifier[0]})
+            row = result.fetchone()
+            if row:
+                reviewer_name, annotator_name, question_text = row
+                return f"Delete '{reviewer_name}' review of '{annotator_name}' annotation"
+            return f"Delete answer review (ID: {identifier[0]})"
+            
+        else:
+            # Fallback for unknown table types
+            return f"Delete {table.lower()} (ID: {identifier[0]})"
+            
     except Exception as e:
         # Fallback if name lookup fails
         return f"Delete {table.lower()} (ID: {identifier[0]})"
@@ -245,136 +393,359 @@ def _get_name_from_id(session: Session, table: str, name_column: str, id_value:
         return f"ID_{id_value}"
 
 
-def _execute_delete_operations(operations: List[DeleteOperation]) -> bool:
-    """Execute the delete operations in order"""
-    if not operations:
+def _key_filter_sql(keys: Tuple[str, ...]) -> str:
+    """Build 'col0 = :k0 AND col1 = :k1 ...' for a table's key columns"""
+    return " AND ".join(f"{col} = :k{i}" for i, col in enumerate(keys))
+
+
+def _in_list_sql(values: List[Any], prefix: str = "v") -> Tuple[str, Dict[str, Any]]:
+    """Build ':v0, :v1, ...' and its parameters for an IN (...) list"""
+    params = {f"{prefix}{i}": value for i, value in enumerate(values)}
+    return ", ".join(f":{name}" for name in params), params
+
+
+def _stage_delete_keys(session: Session, table: str, select_sql: str, params: Optional[Dict[str, Any]] = None):
+    """Add the keys returned by select_sql to the staging table of a table, skipping keys already staged"""
+    name, keys = DELETE_PLAN_TABLES[table]
+    columns = ", ".join(keys)
+    session.execute(text(f"""
+        INSERT INTO _del_{name} ({columns})
+        {select_sql}
+        EXCEPT SELECT {columns} FROM _del_{name}
+    """), params or {})
+
+
+def _drop_delete_plan_tables(session: Session):
+    """Drop the temporary staging tables of a delete plan"""
+    for table in DELETION_ORDER:
+        session.execute(text(f"DROP TABLE IF EXISTS _del_{DELETE_PLAN_TABLES[table][0]}"))
+
+
+def _build_delete_plan(session: Session, operations: List[DeleteOperation]) -> DeletePlan:
+    """Compute the cascade closure of the root operations with bulk queries.
+    
+    Stages the keys of every affected row in temporary tables on the session,
+    one INSERT ... SELECT per cascade rule, then counts them in a single query.
+    
+    Args:
+        session: Database session; the plan must be executed on the same session
+        operations: Root delete operations
+        
+    Returns:
+        DeletePlan with per-table row counts
+    """
+    for table in DELETION_ORDER:
+        name, keys = DELETE_PLAN_TABLES[table]
+        session.execute(text(f"CREATE TEMP TABLE _del_{name} AS SELECT {', '.join(keys)} FROM {name} WHERE 1 = 0"))
+    
+    # Seed the roots, keeping only rows that exist; single-column keys are seeded in bulk
+    single_key_roots = defaultdict(list)
+    for op in operations:
+        if op.table not in DELETE_PLAN_TABLES:
+            raise ValueError(f"Unknown table for using_id deletion: {op.table}")
+        name, keys = DELETE_PLAN_TABLES[op.table]
+        if len(keys) == 1:
+            single_key_roots[op.table].append(op.identifier[0])
+            continue
+        params = {f"k{i}": value for i, value in enumerate(op.identifier)}
+        _stage_delete_keys(session, op.table, f"SELECT {', '.join(keys)} FROM {name} WHERE {_key_filter_sql(keys)}", params)
+    
+    for table, values in single_key_roots.items():
+        name, (key,) = DELETE_PLAN_TABLES[table]
+        for start in range(0, len(values), BULK_LOOKUP_CHUNK):
+            in_sql, params = _in_list_sql(values[start:start + BULK_LOOKUP_CHUNK])
+            _stage_delete_keys(session, table, f"SELECT {key} FROM {name} WHERE {key} IN ({in_sql})", params)
+    
+    for table, select_sql in CASCADE_DELETE_RULES:
+        _stage_delete_keys(session, table, select_sql)
+    
+    count_sql = " UNION ALL ".join(
+        f"SELECT '{table}', COUNT(*) FROM _del_{DELETE_PLAN_TABLES[table][0]}" for table in DELETION_ORDER
+    )
+    counts = {table: 0 for table in DELETION_ORDER}
+    for table, count in session.execute(text(count_sql)).fetchall():
+        counts[table] = count
+    
+    admin_reverts = session.execute(text("""
+        SELECT COUNT(*) FROM reviewer_ground_truth g
+        JOIN _del_project_user_roles d ON d.project_id = g.project_id AND d.user_id = g.modified_by_admin_id
+        WHERE d.role = 'admin'
+    """)).scalar()
+    
+    return DeletePlan(operations, counts, admin_reverts)
+
+
+def _execute_delete_plan(session: Session, plan: DeletePlan) -> bool:
+    """Execute a delete plan with one DELETE per table inside a single transaction"""
+    if plan.total_rows == 0:
         return True
     
     # Create backup if any operation requests it
     backup_created = None
-    for op in operations:
-        if op.backup_params.get('backup_first', False):
-            try:
-                db_url = get_db_url_for_backup()
-                backup_created = create_backup_if_requested(
-                    str(db_url),
-                    op.backup_params.get('backup_dir', './backups'),
-                    op.backup_params.get('backup_file', None),
-                    op.backup_params.get('compress', True)
-                )
-                print(f"💾 Backup created successfully: {backup_created}")
-                break  # Only need one backup
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Deletion cancelled due to backup failure")
-                    return False
-                break
-    
-    success_count = 0
+    backup_params = next((op.backup_params for op in plan.operations if op.backup_params.get('backup_first', False)), None)
+    if backup_params is not None:
+        if len(plan.operations) == 1:
+            description = _get_readable_operation_name(plan.operations[0], session)
+        else:
+            description = f"Delete {len(plan.operations)} requested rows"
+        proceed, backup_created = _backup_before_change(session, description, _delete_plan_snapshot_selections(plan), backup_params)
+        if not proceed:
+            print("❌ Deletion cancelled due to backup failure")
+            return False
     
     try:
-        with label_pizza.db.SessionLocal() as session:
-            # Handle admin reversion operations first
-            for op in operations:
-                if op.table == 'ProjectUserRole' and len(op.identifier) == 3 and op.identifier[2] == 'admin':
-                    # This is an admin role deletion, need to revert ground truths first
-                    # This logic reverts any ground truth modifications made by this admin
-                    project_id, user_id, role = op.identifier
-                    try:
-                        result = session.execute(text("""
-                            UPDATE reviewer_ground_truth 
-                            SET answer_value = original_answer_value, 
-                                modified_at = NULL, 
-                                modified_by_admin_id = NULL, 
-                                modified_by_admin_at = NULL 
-                            WHERE project_id = :p_id AND modified_by_admin_id = :u_id
-                        """), {"p_id": project_id, "u_id": user_id})
-                        rows_affected = result.rowcount
-                        if rows_affected > 0:
-                            print(f"✅ Reverted {rows_affected} admin modifications for user {user_id} in project {project_id}")
-                    except Exception as e:
-                        print(f"❌ Failed to revert admin modifications: {e}")
-                        session.rollback()
-                        return False
-            
-            # Now execute the actual delete operations
-            for op in operations:
-                try:
-                    _execute_single_delete_operation(session, op)
-                    success_count += 1
-                    readable_name = _get_readable_operation_name(op)
-                    print(f"✅ {readable_name}")
-                except Exception as e:
-                    readable_name = _get_readable_operation_name(op)
-                    print(f"❌ Failed: {readable_name} - {e}")
-                    session.rollback()
-                    return False
-            
-            session.commit()
-            
+        # Revert ground truth modifications made by removed admin roles first
+        result = session.execute(text("""
+            UPDATE reviewer_ground_truth 
+            SET answer_value = original_answer_value, 
+                modified_at = NULL, 
+                modified_by_admin_id = NULL, 
+                modified_by_admin_at = NULL 
+            WHERE (project_id, modified_by_admin_id) IN (
+                SELECT project_id, user_id FROM _del_project_user_roles WHERE role = 'admin'
+            )
+        """))
+        if result.rowcount > 0:
+            print(f"✅ Reverted {result.rowcount} admin modifications")
+        
+        # Children before parents, one statement per table
+        for table in DELETION_ORDER:
+            if not plan.counts.get(table):
+                continue
+            name, keys = DELETE_PLAN_TABLES[table]
+            columns = ", ".join(keys)
+            result = session.execute(text(f"DELETE FROM {name} WHERE ({columns}) IN (SELECT {columns} FROM _del_{name})"))
+            print(f"✅ Deleted {result.rowcount:,} rows from {name}")
+        
+        _drop_delete_plan_tables(session)
+        session.commit()
+        
     except Exception as e:
         print(f"❌ Transaction failed: {e}")
         return False
     
-    print(f"\n🎉 Successfully completed {success_count} delete operations")
+    print(f"\n🎉 Successfully deleted {plan.total_rows:,} rows")
     if backup_created:
         print(f"💾 Backup saved to: {backup_created}")
     
     return True
 
 
-def _execute_single_delete_operation(session: Session, op: DeleteOperation):
-    """Execute a single delete operation"""
-    table = op.table.lower()
-    
-    if op.operation_type == 'using_id':
-        if table == 'user':
-            session.execute(text("DELETE FROM users WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'video':
-            session.execute(text("DELETE FROM videos WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'videotag':
-            session.execute(text("DELETE FROM video_tags WHERE video_id = :video_id AND tag = :tag"), 
-                          {"video_id": op.identifier[0], "tag": op.identifier[1]})
-        elif table == 'questiongroup':
-            session.execute(text("DELETE FROM question_groups WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'question':
-            session.execute(text("DELETE FROM questions WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'questiongroupquestion':
-            session.execute(text("DELETE FROM question_group_questions WHERE question_group_id = :qg_id AND question_id = :q_id"),
-                          {"qg_id": op.identifier[0], "q_id": op.identifier[1]})
-        elif table == 'schema':
-            session.execute(text("DELETE FROM schemas WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'schemaquestiongroup':
-            session.execute(text("DELETE FROM schema_question_groups WHERE schema_id = :s_id AND question_group_id = :qg_id"),
-                          {"s_id": op.identifier[0], "qg_id": op.identifier[1]})
-        elif table == 'project':
-            session.execute(text("DELETE FROM projects WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'projectvideo':
-            session.execute(text("DELETE FROM project_videos WHERE project_id = :p_id AND video_id = :v_id"),
-                          {"p_id": op.identifier[0], "v_id": op.identifier[1]})
-        elif table == 'projectuserrole':
-            session.execute(text("DELETE FROM project_user_roles WHERE project_id = :p_id AND user_id = :u_id AND role = :role"),
-                          {"p_id": op.identifier[0], "u_id": op.identifier[1], "role": op.identifier[2]})
-        elif table == 'projectgroup':
-            session.execute(text("DELETE FROM project_groups WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'projectgroupproject':
-            session.execute(text("DELETE FROM project_group_projects WHERE project_group_id = :pg_id AND project_id = :p_id"),
-                          {"pg_id": op.identifier[0], "p_id": op.identifier[1]})
-        elif table == 'projectvideoquestiondisplay':
-            session.execute(text("DELETE FROM project_video_question_displays WHERE project_id = :p_id AND video_id = :v_id AND question_id = :q_id"),
-                          {"p_id": op.identifier[0], "v_id": op.identifier[1], "q_id": op.identifier[2]})
-        elif table == 'annotatoranswer':
-            session.execute(text("DELETE FROM annotator_answers WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'reviewergroundtruth':
-            session.execute(text("DELETE FROM reviewer_ground_truth WHERE video_id = :v_id AND question_id = :q_id AND project_id = :p_id"),
-                          {"v_id": op.identifier[0], "q_id": op.identifier[1], "p_id": op.identifier[2]})
-        elif table == 'answerreview':
-            session.execute(text("DELETE FROM answer_reviews WHERE id = :id"), {"id": op.identifier[0]})
+def _run_delete_plan(session: Session, operations: List[DeleteOperation]) -> bool:
+    """Plan, confirm and execute a cascade deletion of the root operations"""
+    try:
+        plan = _build_delete_plan(session, _collect_delete_operations(operations))
+        
+        if not _confirm_delete_plan(plan, session):
+            print("❌ Deletion cancelled")
+            return False
+        
+        return _execute_delete_plan(session, plan)
+    finally:
+        # Rolled-back staging tables vanish on Postgres but not on SQLite
+        session.rollback()
+        _drop_delete_plan_tables(session)
+
+
+# ============================================================================
+# SCOPED SNAPSHOTS AND UNDO
+# ============================================================================
+
+def _snapshot_path(backup_dir: str, backup_file: Optional[str], compress: bool) -> str:
+    """Resolve the snapshot file path, auto-generating a timestamped name"""
+    if backup_file is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        backup_file = f"snapshot_{timestamp}.json.gz" if compress else f"snapshot_{timestamp}.json"
+    
+    if os.path.sep not in backup_file and not os.path.isabs(backup_file):
+        os.makedirs(backup_dir, exist_ok=True)
+        return os.path.join(backup_dir, backup_file)
+    return backup_file
+
+
+def _open_snapshot(path: str, mode: str):
+    """Open a snapshot file, gzip-compressed when it ends in .gz"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _write_snapshot(session: Session, description: str, selections: List[Tuple[str, str, str, Dict[str, Any]]],
+                    backup_params: Dict[str, Any]) -> str:
+    """Write the current version of the selected rows to a snapshot file.
+    
+    Args:
+        session: Database session (sees the delete plan staging tables)
+        description: Human-readable description of the change
+        selections: (table name, mode, WHERE clause, params) per table. Mode 'insert' marks
+            rows the change deletes, 'replace' marks rows it updates in place
+        backup_params: backup_dir, backup_file and compress of the calling function
+        
+    Returns:
+        Path of the snapshot file
+    """
+    tables = []
+    for table_name, mode, where_sql, params in selections:
+        table = Base.metadata.tables[table_name]
+        rows = session.execute(select(table).where(text(where_sql)), params).fetchall()
+        if rows:
+            tables.append({
+                "table": table_name,
+                "mode": mode,
+                "columns": [column.name for column in table.columns],
+                "key_columns": [column.name for column in table.primary_key.columns],
+                "rows": [list(row) for row in rows],
+            })
+    
+    snapshot = {
+        "format": SNAPSHOT_FORMAT,
+        "version": 1,
+        "created_at": datetime.now().isoformat(),
+        "description": description,
+        "tables": tables,
+    }
+    
+    path = _snapshot_path(backup_params.get('backup_dir', './backups'), backup_params.get('backup_file'),
+                          backup_params.get('compress', True))
+    with _open_snapshot(path, "wt") as f:
+        json.dump(snapshot, f, default=lambda value: value.isoformat())
+    return path
+
+
+def _backup_before_change(session: Session, description: str, selections: List[Tuple[str, str, str, Dict[str, Any]]],
+                          backup_params: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Snapshot the affected rows (or back up the whole database) before a change
+    
+    Returns:
+        (proceed, backup path). proceed is False when the backup failed and the user
+        did not choose to continue without it.
+    """
+    try:
+        if BACKUP_SCOPE == "rows":
+            backup_created = _write_snapshot(session, description, selections, backup_params)
         else:
-            raise ValueError(f"Unknown table for using_id deletion: {table}")
+            db_url = get_db_url_for_backup()
+            backup_created = create_backup_if_requested(
+                str(db_url),
+                backup_params.get('backup_dir', './backups'),
+                backup_params.get('backup_file', None),
+                backup_params.get('compress', True)
+            )
+        print(f"💾 Backup created successfully: {backup_created}")
+        return True, backup_created
+    except Exception as e:
+        print(f"❌ Failed to create backup: {e}")
+        print("⚠️  Backup creation failed, but backup_first=True was requested.")
+        response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
+        return response.strip() == 'CONTINUE', None
+
+
+def _delete_plan_snapshot_selections(plan: DeletePlan) -> List[Tuple[str, str, str, Dict[str, Any]]]:
+    """Snapshot selections for a delete plan: the staged rows, plus ground truths reverted but kept"""
+    selections = []
+    if plan.admin_reverts:
+        selections.append(("reviewer_ground_truth", "replace", """
+            (project_id, modified_by_admin_id) IN (
+                SELECT project_id, user_id FROM _del_project_user_roles WHERE role = 'admin'
+            )
+            AND (video_id, question_id, project_id) NOT IN (
+                SELECT video_id, question_id, project_id FROM _del_reviewer_ground_truth
+            )
+        """, {}))
+    
+    # Parents first, so undo re-inserts in that order
+    for table in reversed(DELETION_ORDER):
+        if plan.counts.get(table):
+            name, keys = DELETE_PLAN_TABLES[table]
+            columns = ", ".join(keys)
+            selections.append((name, "insert", f"({columns}) IN (SELECT {columns} FROM _del_{name})", {}))
+    return selections
+
+
+def _decode_snapshot_row(table, columns: List[str], values: List[Any]) -> Dict[str, Any]:
+    """Turn a snapshot row back into column values, parsing timestamps"""
+    row = dict(zip(columns, values))
+    for name, value in row.items():
+        if isinstance(value, str) and isinstance(table.c[name].type, DateTime):
+            row[name] = datetime.fromisoformat(value)
+    return row
+
+
+def undo_snapshot(snapshot_file: str, confirm: bool = True) -> bool:
+    """Undo a delete or rename by putting back the rows captured in its snapshot
+    
+    Deleted rows are inserted again and updated rows get their captured values back,
+    all in one transaction. Nothing changes if any deleted row's key is in use again.
+    
+    Args:
+        snapshot_file: Snapshot written before the change (snapshot_*.json[.gz])
+        confirm: Ask the user to type 'UNDO' before applying
+        
+    Returns:
+        True if the snapshot was applied
+    """
+    try:
+        with _open_snapshot(snapshot_file, "rt") as f:
+            snapshot = json.load(f)
+    except Exception as e:
+        print(f"❌ Failed to read snapshot: {e}")
+        return False
+    
+    if not isinstance(snapshot, dict) or snapshot.get("format") != SNAPSHOT_FORMAT:
+        print(f"❌ Not a Label Pizza snapshot: {snapshot_file}")
+        return False
+    
+    print("↩️  UNDO FROM SNAPSHOT")
+    print("=" * 50)
+    print(f"Snapshot: {snapshot_file}")
+    print(f"Taken:    {snapshot['created_at']}")
+    print(f"Change:   {snapshot['description']}")
+    print()
+    for entry in snapshot["tables"]:
+        action = "Re-insert" if entry["mode"] == "insert" else "Restore"
+        print(f"   {action:<10} {len(entry['rows']):>10,} rows in {entry['table']}")
+    print()
+    
+    if confirm:
+        response = input("Confirm undo? Type 'UNDO' to proceed: ")
+        if response.strip() != 'UNDO':
+            print("❌ Undo cancelled")
+            return False
+    
+    try:
+        with label_pizza.db.SessionLocal() as session:
+            for entry in snapshot["tables"]:
+                table = Base.metadata.tables[entry["table"]]
+                rows = [_decode_snapshot_row(table, entry["columns"], values) for values in entry["rows"]]
+                
+                if entry["mode"] == "insert":
+                    session.execute(table.insert(), rows)
+                    print(f"✅ Re-inserted {len(rows):,} rows into {entry['table']}")
+                else:
+                    keys = [and_(*(table.c[column] == row[column] for column in entry["key_columns"])) for row in rows]
+                    
+                    # Park unique names first, so swapped names can be restored row by row
+                    unique_columns = [column.name for column in table.columns
+                                      if column.unique and isinstance(column.type, String) and column.name in entry["columns"]]
+                    if len(rows) > 1 and unique_columns:
+                        for i, key in enumerate(keys):
+                            session.execute(table.update().where(key).values({name: f"__undo_{i}__" for name in unique_columns}))
+                    
+                    restored = 0
+                    for key, row in zip(keys, rows):
+                        restored += session.execute(table.update().where(key).values(row)).rowcount
+                    print(f"✅ Restored {restored:,} rows in {entry['table']}")
+                    if restored < len(rows):
+                        print(f"⚠️  {len(rows) - restored:,} rows no longer exist in {entry['table']}")
+            
+            session.commit()
+            
+    except Exception as e:
+        print(f"❌ Undo failed, no changes were made: {e}")
+        return False
+    
+    print(f"\n🎉 Undo completed: {snapshot['description']}")
+    return True
 
 
 # ============================================================================
@@ -444,301 +815,6 @@ def _get_project_group_id_from_name(session: Session, name: str) -> int:
     return row[0]
 
 
-def _collect_answer_review_dependencies(session: Session, answer_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for AnnotatorAnswer deletion"""
-    operations = []
-    
-    # Find all AnswerReviews for this answer
-    result = session.execute(text("SELECT id FROM answer_reviews WHERE answer_id = :answer_id"), {"answer_id": answer_id})
-    for row in result.fetchall():
-        operations.append(DeleteOperation('AnswerReview', 'using_id', (row[0],), backup_params))
-    
-    return operations
-
-
-def _collect_project_group_dependencies(session: Session, project_group_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for ProjectGroup deletion"""
-    operations = []
-    
-    # Find all ProjectGroupProjects for this project group
-    result = session.execute(text("SELECT project_id FROM project_group_projects WHERE project_group_id = :pg_id"), {"pg_id": project_group_id})
-    for row in result.fetchall():
-        operations.append(DeleteOperation('ProjectGroupProject', 'using_id', (project_group_id, row[0]), backup_params))
-    
-    return operations
-
-
-def _collect_project_video_dependencies(session: Session, project_id: int, video_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for ProjectVideo deletion"""
-    operations = []
-    
-    # Find AnnotatorAnswers for this project+video
-    result = session.execute(text("SELECT id FROM annotator_answers WHERE project_id = :p_id AND video_id = :v_id"), 
-                           {"p_id": project_id, "v_id": video_id})
-    for row in result.fetchall():
-        operations.extend(_collect_annotator_answer_dependencies(session, row[0], backup_params))
-        operations.append(DeleteOperation('AnnotatorAnswer', 'using_id', (row[0],), backup_params))
-    
-    # Find ReviewerGroundTruth for this project+video
-    result = session.execute(text("SELECT question_id FROM reviewer_ground_truth WHERE project_id = :p_id AND video_id = :v_id"),
-                           {"p_id": project_id, "v_id": video_id})
-    for row in result.fetchall():
-        operations.append(DeleteOperation('ReviewerGroundTruth', 'using_id', (video_id, row[0], project_id), backup_params))
-    
-    # Find ProjectVideoQuestionDisplays for this project+video
-    result = session.execute(text("SELECT question_id FROM project_video_question_displays WHERE project_id = :p_id AND video_id = :v_id"),
-                           {"p_id": project_id, "v_id": video_id})
-    for row in result.fetchall():
-        operations.append(DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (project_id, video_id, row[0]), backup_params))
-    
-    return operations
-
-
-def _collect_project_user_role_dependencies(session: Session, project_id: int, user_id: int, role: str, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for ProjectUserRole deletion with role-specific logic"""
-    operations = []
-    
-    if role == "admin":
-        # If deleting admin role, ground truth reversion is handled automatically
-        # in _execute_delete_operations() before any actual deletions occur
-        pass
-        
-    elif role == "reviewer":
-        # If deleting reviewer role, delete their ground truths and reviews
-        # First check if they also have admin role
-        admin_role_result = session.execute(text("""
-            SELECT 1 FROM project_user_roles 
-            WHERE project_id = :p_id AND user_id = :u_id AND role = 'admin'
-        """), {"p_id": project_id, "u_id": user_id})
-        
-        if admin_role_result.fetchone():
-            operations.append(DeleteOperation('ProjectUserRole', 'using_id', (project_id, user_id, 'admin'), backup_params))
-        
-        # Delete reviewer ground truths
-        result = session.execute(text("SELECT video_id, question_id FROM reviewer_ground_truth WHERE project_id = :p_id AND reviewer_id = :u_id"),
-                               {"p_id": project_id, "u_id": user_id})
-        for row in result.fetchall():
-            operations.append(DeleteOperation('ReviewerGroundTruth', 'using_id', (row[0], row[1], project_id), backup_params))
-        
-        # Delete answer reviews by this reviewer
-        result = session.execute(text("""
-            SELECT ar.id FROM answer_reviews ar
-            JOIN annotator_answers aa ON ar.answer_id = aa.id
-            WHERE aa.project_id = :p_id AND ar.reviewer_id = :u_id
-        """), {"p_id": project_id, "u_id": user_id})
-        for row in result.fetchall():
-            operations.append(DeleteOperation('AnswerReview', 'using_id', (row[0],), backup_params))
-            
-    elif role in ["annotator", "model"]:
-        # If deleting annotator/model role, delete their annotations
-        # First check if they also have reviewer role
-        reviewer_role_result = session.execute(text("""
-            SELECT 1 FROM project_user_roles 
-            WHERE project_id = :p_id AND user_id = :u_id AND role = 'reviewer'
-        """), {"p_id": project_id, "u_id": user_id})
-        
-        if reviewer_role_result.fetchone():
-            operations.extend(_collect_project_user_role_dependencies(session, project_id, user_id, 'reviewer', backup_params))
-            operations.append(DeleteOperation('ProjectUserRole', 'using_id', (project_id, user_id, 'reviewer'), backup_params))
-        
-        # Delete annotator answers
-        result = session.execute(text("SELECT id FROM annotator_answers WHERE project_id = :p_id AND user_id = :u_id"),
-                               {"p_id": project_id, "u_id": user_id})
-        for row in result.fetchall():
-            operations.extend(_collect_annotator_answer_dependencies(session, row[0], backup_params))
-            operations.append(DeleteOperation('AnnotatorAnswer', 'using_id', (row[0],), backup_params))
-    
-    return operations
-
-
-def _collect_annotator_answer_dependencies(session: Session, answer_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for AnnotatorAnswer deletion"""
-    return _collect_answer_review_dependencies(session, answer_id, backup_params)
-
-
-def _collect_question_group_question_dependencies(session: Session, question_group_id: int, question_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for QuestionGroupQuestion deletion"""
-    operations = []
-    
-    # Step 1: Get all schemas using this question group
-    schema_result = session.execute(text("SELECT schema_id FROM schema_question_groups WHERE question_group_id = :qg_id"), 
-                                  {"qg_id": question_group_id})
-    schema_ids = [row[0] for row in schema_result.fetchall()]
-    
-    # Step 2: Get all projects using those schemas
-    project_ids = []
-    for schema_id in schema_ids:
-        project_result = session.execute(text("SELECT id FROM projects WHERE schema_id = :s_id"), {"s_id": schema_id})
-        project_ids.extend([row[0] for row in project_result.fetchall()])
-    
-    # Step 3: Delete related answers and displays for each project
-    for project_id in project_ids:
-        # Delete AnnotatorAnswers
-        result = session.execute(text("SELECT id FROM annotator_answers WHERE project_id = :p_id AND question_id = :q_id"),
-                               {"p_id": project_id, "q_id": question_id})
-        for row in result.fetchall():
-            operations.extend(_collect_annotator_answer_dependencies(session, row[0], backup_params))
-            operations.append(DeleteOperation('AnnotatorAnswer', 'using_id', (row[0],), backup_params))
-        
-        # Delete ReviewerGroundTruth
-        result = session.execute(text("SELECT video_id FROM reviewer_ground_truth WHERE project_id = :p_id AND question_id = :q_id"),
-                               {"p_id": project_id, "q_id": question_id})
-        for row in result.fetchall():
-            operations.append(DeleteOperation('ReviewerGroundTruth', 'using_id', (row[0], question_id, project_id), backup_params))
-        
-        # Delete ProjectVideoQuestionDisplay
-        result = session.execute(text("SELECT video_id FROM project_video_question_displays WHERE project_id = :p_id AND question_id = :q_id"),
-                               {"p_id": project_id, "q_id": question_id})
-        for row in result.fetchall():
-            operations.append(DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (project_id, row[0], question_id), backup_params))
-    
-    return operations
-
-
-def _collect_schema_question_group_dependencies(session: Session, schema_id: int, question_group_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for SchemaQuestionGroup deletion"""
-    operations = []
-    
-    # Step 1: Get all projects using this schema
-    project_result = session.execute(text("SELECT id FROM projects WHERE schema_id = :s_id"), {"s_id": schema_id})
-    project_ids = [row[0] for row in project_result.fetchall()]
-    
-    # Step 2: Get all questions from this question group
-    question_result = session.execute(text("SELECT question_id FROM question_group_questions WHERE question_group_id = :qg_id"), 
-                                    {"qg_id": question_group_id})
-    question_ids = [row[0] for row in question_result.fetchall()]
-    
-    # Step 3: Delete related answers and displays for each project+question combination
-    for project_id in project_ids:
-        for question_id in question_ids:
-            # Delete AnnotatorAnswers
-            result = session.execute(text("SELECT id FROM annotator_answers WHERE project_id = :p_id AND question_id = :q_id"),
-                                   {"p_id": project_id, "q_id": question_id})
-            for row in result.fetchall():
-                operations.extend(_collect_annotator_answer_dependencies(session, row[0], backup_params))
-                operations.append(DeleteOperation('AnnotatorAnswer', 'using_id', (row[0],), backup_params))
-            
-            # Delete ReviewerGroundTruth
-            result = session.execute(text("SELECT video_id FROM reviewer_ground_truth WHERE project_id = :p_id AND question_id = :q_id"),
-                                   {"p_id": project_id, "q_id": question_id})
-            for row in result.fetchall():
-                operations.append(DeleteOperation('ReviewerGroundTruth', 'using_id', (row[0], question_id, project_id), backup_params))
-            
-            # Delete ProjectVideoQuestionDisplay
-            result = session.execute(text("SELECT video_id FROM project_video_question_displays WHERE project_id = :p_id AND question_id = :q_id"),
-                                   {"p_id": project_id, "q_id": question_id})
-            for row in result.fetchall():
-                operations.append(DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (project_id, row[0], question_id), backup_params))
-    
-    return operations
-
-
-def _collect_video_dependencies(session: Session, video_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for Video deletion"""
-    operations = []
-    
-    # Delete VideoTags
-    result = session.execute(text("SELECT tag FROM video_tags WHERE video_id = :v_id"), {"v_id": video_id})
-    for row in result.fetchall():
-        operations.append(DeleteOperation('VideoTag', 'using_id', (video_id, row[0]), backup_params))
-    
-    # Delete ProjectVideos (and their dependencies)
-    result = session.execute(text("SELECT project_id FROM project_videos WHERE video_id = :v_id"), {"v_id": video_id})
-    for row in result.fetchall():
-        operations.extend(_collect_project_video_dependencies(session, row[0], video_id, backup_params))
-        operations.append(DeleteOperation('ProjectVideo', 'using_id', (row[0], video_id), backup_params))
-    
-    return operations
-
-
-def _collect_question_dependencies(session: Session, question_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for Question deletion"""
-    operations = []
-    
-    # Delete QuestionGroupQuestions (and their dependencies)
-    result = session.execute(text("SELECT question_group_id FROM question_group_questions WHERE question_id = :q_id"), {"q_id": question_id})
-    for row in result.fetchall():
-        operations.extend(_collect_question_group_question_dependencies(session, row[0], question_id, backup_params))
-        operations.append(DeleteOperation('QuestionGroupQuestion', 'using_id', (row[0], question_id), backup_params))
-    
-    return operations
-
-
-def _collect_question_group_dependencies(session: Session, question_group_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for QuestionGroup deletion"""
-    operations = []
-    
-    # Delete QuestionGroupQuestions (and their dependencies)
-    result = session.execute(text("SELECT question_id FROM question_group_questions WHERE question_group_id = :qg_id"), {"qg_id": question_group_id})
-    for row in result.fetchall():
-        operations.extend(_collect_question_group_question_dependencies(session, question_group_id, row[0], backup_params))
-        operations.append(DeleteOperation('QuestionGroupQuestion', 'using_id', (question_group_id, row[0]), backup_params))
-    
-    # Delete SchemaQuestionGroups (and their dependencies)
-    result = session.execute(text("SELECT schema_id FROM schema_question_groups WHERE question_group_id = :qg_id"), {"qg_id": question_group_id})
-    for row in result.fetchall():
-        operations.extend(_collect_schema_question_group_dependencies(session, row[0], question_group_id, backup_params))
-        operations.append(DeleteOperation('SchemaQuestionGroup', 'using_id', (row[0], question_group_id), backup_params))
-    
-    return operations
-
-
-def _collect_project_dependencies(session: Session, project_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for Project deletion"""
-    operations = []
-    
-    # Delete ProjectVideos (and their dependencies)
-    result = session.execute(text("SELECT video_id FROM project_videos WHERE project_id = :p_id"), {"p_id": project_id})
-    for row in result.fetchall():
-        operations.extend(_collect_project_video_dependencies(session, project_id, row[0], backup_params))
-        operations.append(DeleteOperation('ProjectVideo', 'using_id', (project_id, row[0]), backup_params))
-    
-    # Delete ProjectUserRoles (and their dependencies)
-    result = session.execute(text("SELECT user_id, role FROM project_user_roles WHERE project_id = :p_id"), {"p_id": project_id})
-    for row in result.fetchall():
-        operations.extend(_collect_project_user_role_dependencies(session, project_id, row[0], row[1], backup_params))
-        operations.append(DeleteOperation('ProjectUserRole', 'using_id', (project_id, row[0], row[1]), backup_params))
-    
-    # Delete ProjectGroupProjects
-    result = session.execute(text("SELECT project_group_id FROM project_group_projects WHERE project_id = :p_id"), {"p_id": project_id})
-    for row in result.fetchall():
-        operations.append(DeleteOperation('ProjectGroupProject', 'using_id', (row[0], project_id), backup_params))
-    
-    return operations
-
-
-def _collect_user_dependencies(session: Session, user_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for User deletion"""
-    operations = []
-    
-    # Delete ProjectUserRoles (and their dependencies)
-    result = session.execute(text("SELECT project_id, role FROM project_user_roles WHERE user_id = :u_id"), {"u_id": user_id})
-    for row in result.fetchall():
-        operations.extend(_collect_project_user_role_dependencies(session, row[0], user_id, row[1], backup_params))
-        operations.append(DeleteOperation('ProjectUserRole', 'using_id', (row[0], user_id, row[1]), backup_params))
-    
-    return operations
-
-
-def _collect_schema_dependencies(session: Session, schema_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
-    """Collect dependencies for Schema deletion"""
-    operations = []
-    
-    # Delete SchemaQuestionGroups (and their dependencies)
-    result = session.execute(text("SELECT question_group_id FROM schema_question_groups WHERE schema_id = :s_id"), {"s_id": schema_id})
-    for row in result.fetchall():
-        operations.extend(_collect_schema_question_group_dependencies(session, schema_id, row[0], backup_params))
-        operations.append(DeleteOperation('SchemaQuestionGroup', 'using_id', (schema_id, row[0]), backup_params))
-    
-    # Delete Projects (and their dependencies)
-    result = session.execute(text("SELECT id FROM projects WHERE schema_id = :s_id"), {"s_id": schema_id})
-    for row in result.fetchall():
-        operations.extend(_collect_project_dependencies(session, row[0], backup_params))
-        operations.append(DeleteOperation('Project', 'using_id', (row[0],), backup_params))
-    
-    return operations
-
-
 # ============================================================================
 # DELETE USING ID FUNCTIONS
 # ============================================================================
@@ -759,19 +835,9 @@ def delete_user_using_id(user_id: int, backup_first: bool = True, backup_dir: st
             
             print(f"🔍 Collecting dependencies for User ID {user_id} ('{row[0]}')")
             
-            # Collect all dependent operations
-            operations = _collect_user_dependencies(session, user_id, backup_params)
-            operations.append(DeleteOperation('User', 'using_id', (user_id,), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('User', 'using_id', (user_id,), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting user: {e}")
@@ -794,19 +860,9 @@ def delete_video_using_id(video_id: int, backup_first: bool = True, backup_dir:
             
             print(f"🔍 Collecting dependencies for Video ID {video_id} ('{row[0]}')")
             
-            # Collect all dependent operations
-            operations = _collect_video_dependencies(session, video_id, backup_params)
-            operations.append(DeleteOperation('Video', 'using_id', (video_id,), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('Video', 'using_id', (video_id,), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting video: {e}")
@@ -829,13 +885,7 @@ def delete_video_tag_using_id(video_id: int, tag: str, backup_first: bool = True
             print(f"🔍 Deleting VideoTag: video_id={video_id}, tag='{tag}'")
             
             operations = [DeleteOperation('VideoTag', 'using_id', (video_id, tag), backup_params)]
-            sorted_operations = _collect_delete_operations(operations)
-            
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting video tag: {e}")
@@ -858,19 +908,9 @@ def delete_question_group_using_id(question_group_id: int, backup_first: bool =
             
             print(f"🔍 Collecting dependencies for QuestionGroup ID {question_group_id} ('{row[0]}')")
             
-            # Collect all dependent operations
-            operations = _collect_question_group_dependencies(session, question_group_id, backup_params)
-            operations.append(DeleteOperation('QuestionGroup', 'using_id', (question_group_id,), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('QuestionGroup', 'using_id', (question_group_id,), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting question group: {e}")
@@ -893,19 +933,9 @@ def delete_question_using_id(question_id: int, backup_first: bool = True, backup
             
             print(f"🔍 Collecting dependencies for Question ID {question_id}")
             
-            # Collect all dependent operations
-            operations = _collect_question_dependencies(session, question_id, backup_params)
-            operations.append(DeleteOperation('Question', 'using_id', (question_id,), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('Question', 'using_id', (question_id,), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting question: {e}")
@@ -928,19 +958,9 @@ def delete_question_group_question_using_id(question_group_id: int, question_id:
             
             print(f"🔍 Collecting dependencies for QuestionGroupQuestion: question_group_id={question_group_id}, question_id={question_id}")
             
-            # Collect all dependent operations
-            operations = _collect_question_group_question_dependencies(session, question_group_id, question_id, backup_params)
-            operations.append(DeleteOperation('QuestionGroupQuestion', 'using_id', (question_group_id, question_id), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('QuestionGroupQuestion', 'using_id', (question_group_id, question_id), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting question group question: {e}")
@@ -963,19 +983,9 @@ def delete_schema_using_id(schema_id: int, backup_first: bool = True, backup_dir
             
             print(f"🔍 Collecting dependencies for Schema ID {schema_id} ('{row[0]}')")
             
-            # Collect all dependent operations
-            operations = _collect_schema_dependencies(session, schema_id, backup_params)
-            operations.append(DeleteOperation('Schema', 'using_id', (schema_id,), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('Schema', 'using_id', (schema_id,), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting schema: {e}")
@@ -998,19 +1008,9 @@ def delete_schema_question_group_using_id(schema_id: int, question_group_id: int
             
             print(f"🔍 Collecting dependencies for SchemaQuestionGroup: schema_id={schema_id}, question_group_id={question_group_id}")
             
-            # Collect all dependent operations
-            operations = _collect_schema_question_group_dependencies(session, schema_id, question_group_id, backup_params)
-            operations.append(DeleteOperation('SchemaQuestionGroup', 'using_id', (schema_id, question_group_id), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('SchemaQuestionGroup', 'using_id', (schema_id, question_group_id), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting schema question group: {e}")
@@ -1033,19 +1033,9 @@ def delete_project_using_id(project_id: int, backup_first: bool = True, backup_d
             
             print(f"🔍 Collecting dependencies for Project ID {project_id} ('{row[0]}')")
             
-            # Collect all dependent operations
-            operations = _collect_project_dependencies(session, project_id, backup_params)
-            operations.append(DeleteOperation('Project', 'using_id', (project_id,), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('Project', 'using_id', (project_id,), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting project: {e}")
@@ -1068,19 +1058,9 @@ def delete_project_video_using_id(project_id: int, video_id: int, backup_first:
             
             print(f"🔍 Collecting dependencies for ProjectVideo: project_id={project_id}, video_id={video_id}")
             
-            # Collect all dependent operations
-            operations = _collect_project_video_dependencies(session, project_id, video_id, backup_params)
-            operations.append(DeleteOperation('ProjectVideo', 'using_id', (project_id, video_id), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('ProjectVideo', 'using_id', (project_id, video_id), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting project video: {e}")
@@ -1103,19 +1083,9 @@ def delete_project_user_role_using_id(project_id: int, user_id: int, role: str,
             
             print(f"🔍 Collecting dependencies for ProjectUserRole: project_id={project_id}, user_id={user_id}, role='{role}'")
             
-            # Collect all dependent operations
-            operations = _collect_project_user_role_dependencies(session, project_id, user_id, role, backup_params)
-            operations.append(DeleteOperation('ProjectUserRole', 'using_id', (project_id, user_id, role), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('ProjectUserRole', 'using_id', (project_id, user_id, role), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting project user role: {e}")
@@ -1138,19 +1108,9 @@ def delete_project_group_using_id(project_group_id: int, backup_first: bool = Tr
             
             print(f"🔍 Collecting dependencies for ProjectGroup ID {project_group_id} ('{row[0]}')")
             
-            # Collect all dependent operations
-            operations = _collect_project_group_dependencies(session, project_group_id, backup_params)
-            operations.append(DeleteOperation('ProjectGroup', 'using_id', (project_group_id,), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('ProjectGroup', 'using_id', (project_group_id,), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting project group: {e}")
@@ -1174,13 +1134,7 @@ def delete_project_group_project_using_id(project_group_id: int, project_id: int
             print(f"🔍 Deleting ProjectGroupProject: project_group_id={project_group_id}, project_id={project_id}")
             
             operations = [DeleteOperation('ProjectGroupProject', 'using_id', (project_group_id, project_id), backup_params)]
-            sorted_operations = _collect_delete_operations(operations)
-            
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting project group project: {e}")
@@ -1204,13 +1158,7 @@ def delete_project_video_question_display_using_id(project_id: int, video_id: in
             print(f"🔍 Deleting ProjectVideoQuestionDisplay: project_id={project_id}, video_id={video_id}, question_id={question_id}")
             
             operations = [DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (project_id, video_id, question_id), backup_params)]
-            sorted_operations = _collect_delete_operations(operations)
-            
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting project video question display: {e}")
@@ -1233,19 +1181,9 @@ def delete_annotator_answer_using_id(answer_id: int, backup_first: bool = True,
             
             print(f"🔍 Collecting dependencies for AnnotatorAnswer ID {answer_id}")
             
-            # Collect all dependent operations
-            operations = _collect_annotator_answer_dependencies(session, answer_id, backup_params)
-            operations.append(DeleteOperation('AnnotatorAnswer', 'using_id', (answer_id,), backup_params))
-            
-            # Sort and deduplicate
-            sorted_operations = _collect_delete_operations(operations)
-            
-            # Confirm and execute
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            # Plan the cascade with bulk queries, confirm and execute
+            operations = [DeleteOperation('AnnotatorAnswer', 'using_id', (answer_id,), backup_params)]
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting annotator answer: {e}")
@@ -1270,13 +1208,7 @@ def delete_reviewer_ground_truth_using_id(video_id: int, question_id: int, proje
             print(f"🔍 Deleting ReviewerGroundTruth: video_id={video_id}, question_id={question_id}, project_id={project_id}")
             
             operations = [DeleteOperation('ReviewerGroundTruth', 'using_id', (video_id, question_id, project_id), backup_params)]
-            sorted_operations = _collect_delete_operations(operations)
-            
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting reviewer ground truth: {e}")
@@ -1300,13 +1232,7 @@ def delete_answer_review_using_id(answer_review_id: int, backup_first: bool = Tr
             print(f"🔍 Deleting AnswerReview ID {answer_review_id}")
             
             operations = [DeleteOperation('AnswerReview', 'using_id', (answer_review_id,), backup_params)]
-            sorted_operations = _collect_delete_operations(operations)
-            
-            if not _confirm_cascade_deletion(sorted_operations):
-                print("❌ Deletion cancelled")
-                return False
-            
-            return _execute_delete_operations(sorted_operations)
+            return _run_delete_plan(session, operations)
             
     except Exception as e:
         print(f"❌ Error deleting answer review: {e}")
@@ -1642,19 +1568,6 @@ def set_user_name_using_id(user_id: int, user_id_str: str, backup_first: bool =
                           backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set user_id_str for user ID"""
     try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
         with label_pizza.db.SessionLocal() as session:
             # Check if user exists
             result = session.execute(text("SELECT user_id_str FROM users WHERE id = :id"), {"id": user_id})
@@ -1672,6 +1585,15 @@ def set_user_name_using_id(user_id: int, user_id_str: str, backup_first: bool =
                 print(f"❌ User ID string '{user_id_str}' already exists")
                 return False
             
+            # Snapshot the row before changing it
+            if backup_first:
+                backup_params = {"backup_dir": backup_dir, "backup_file": backup_file, "compress": compress}
+                description = f"Rename user '{old_name}' to '{user_id_str}'"
+                proceed, _ = _backup_before_change(session, description, [("users", "replace", "id = :id", {"id": user_id})], backup_params)
+                if not proceed:
+                    print("❌ Operation cancelled due to backup failure")
+                    return False
+            
             # Update the name
             session.execute(text("UPDATE users SET user_id_str = :user_id_str WHERE id = :id"), 
                           {"user_id_str": user_id_str, "id": user_id})
@@ -1689,19 +1611,6 @@ def set_video_name_using_id(video_id: int, video_uid: str, backup_first: bool =
                            backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set video_uid for video ID"""
     try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
         with label_pizza.db.SessionLocal() as session:
             # Check if video exists
             result = session.execute(text("SELECT video_uid FROM videos WHERE id = :id"), {"id": video_id})
@@ -1719,6 +1628,15 @@ def set_video_name_using_id(video_id: int, video_uid: str, backup_first: bool =
                 print(f"❌ Video UID '{video_uid}' already exists")
                 return False
             
+            # Snapshot the row before changing it
+            if backup_first:
+                backup_params = {"backup_dir": backup_dir, "backup_file": backup_file, "compress": compress}
+                description = f"Rename video '{old_name}' to '{video_uid}'"
+                proceed, _ = _backup_before_change(session, description, [("videos", "replace", "id = :id", {"id": video_id})], backup_params)
+                if not proceed:
+                    print("❌ Operation cancelled due to backup failure")
+                    return False
+            
             # Update the name
             session.execute(text("UPDATE videos SET video_uid = :video_uid WHERE id = :id"), 
                           {"video_uid": video_uid, "id": video_id})
@@ -1736,19 +1654,6 @@ def set_question_group_name_using_id(question_group_id: int, title: str, backup_
                                     backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set title for question group ID"""
     try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
         with label_pizza.db.SessionLocal() as session:
             # Check if question group exists
             result = session.execute(text("SELECT title FROM question_groups WHERE id = :id"), {"id": question_group_id})
@@ -1766,6 +1671,15 @@ def set_question_group_name_using_id(question_group_id: int, title: str, backup_
                 print(f"❌ Question group title '{title}' already exists")
                 return False
             
+            # Snapshot the row before changing it
+            if backup_first:
+                backup_params = {"backup_dir": backup_dir, "backup_file": backup_file, "compress": compress}
+                description = f"Rename question group '{old_name}' to '{title}'"
+                proceed, _ = _backup_before_change(session, description, [("question_groups", "replace", "id = :id", {"id": question_group_id})], backup_params)
+                if not proceed:
+                    print("❌ Operation cancelled due to backup failure")
+                    return False
+            
             # Update the name
             session.execute(text("UPDATE question_groups SET title = :title WHERE id = :id"), 
                           {"title": title, "id": question_group_id})
@@ -1782,19 +1696,6 @@ def set_question_name_using_id(question_id: int, question_text: str, backup_firs
                               backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set text for question ID"""
     try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
         with label_pizza.db.SessionLocal() as session:
             # Check if question exists
             result = session.execute(text("SELECT text FROM questions WHERE id = :id"), {"id": question_id})
@@ -1812,6 +1713,15 @@ def set_question_name_using_id(question_id: int, question_text: str, backup_firs
                 print(f"❌ Question text already exists")
                 return False
             
+            # Snapshot the row before changing it
+            if backup_first:
+                backup_params = {"backup_dir": backup_dir, "backup_file": backup_file, "compress": compress}
+                description = f"Change text of question '{old_text}'"
+                proceed, _ = _backup_before_change(session, description, [("questions", "replace", "id = :id", {"id": question_id})], backup_params)
+                if not proceed:
+                    print("❌ Operation cancelled due to backup failure")
+                    return False
+            
             # Update the text
             session.execute(text("UPDATE questions SET text = :text WHERE id = :id"), 
                           {"text": question_text, "id": question_id})  # Fixed: use question_text parameter
@@ -1829,19 +1739,6 @@ def set_schema_name_using_id(schema_id: int, name: str, backup_first: bool = Tru
                             backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set name for schema ID"""
     try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
         with label_pizza.db.SessionLocal() as session:
             # Check if schema exists
             result = session.execute(text("SELECT name FROM schemas WHERE id = :id"), {"id": schema_id})
@@ -1859,6 +1756,15 @@ def set_schema_name_using_id(schema_id: int, name: str, backup_first: bool = Tru
                 print(f"❌ Schema name '{name}' already exists")
                 return False
             
+            # Snapshot the row before changing it
+            if backup_first:
+                backup_params = {"backup_dir": backup_dir, "backup_file": backup_file, "compress": compress}
+                description = f"Rename schema '{old_name}' to '{name}'"
+                proceed, _ = _backup_before_change(session, description, [("schemas", "replace", "id = :id", {"id": schema_id})], backup_params)
+                if not proceed:
+                    print("❌ Operation cancelled due to backup failure")
+                    return False
+            
             # Update the name
             session.execute(text("UPDATE schemas SET name = :name WHERE id = :id"), 
                           {"name": name, "id": schema_id})
@@ -1876,19 +1782,6 @@ def set_project_name_using_id(project_id: int, name: str, backup_first: bool = T
                              backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set name for project ID"""
     try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
         with label_pizza.db.SessionLocal() as session:
             # Check if project exists
             result = session.execute(text("SELECT name FROM projects WHERE id = :id"), {"id": project_id})
@@ -1906,6 +1799,15 @@ def set_project_name_using_id(project_id: int, name: str, backup_first: bool = T
                 print(f"❌ Project name '{name}' already exists")
                 return False
             
+            # Snapshot the row before changing it
+            if backup_first:
+                backup_params = {"backup_dir": backup_dir, "backup_file": backup_file, "compress": compress}
+                description = f"Rename project '{old_name}' to '{name}'"
+                proceed, _ = _backup_before_change(session, description, [("projects", "replace", "id = :id", {"id": project_id})], backup_params)
+                if not proceed:
+                    print("❌ Operation cancelled due to backup failure")
+                    return False
+            
             # Update the name
             session.execute(text("UPDATE projects SET name = :name WHERE id = :id"), 
                           {"name": name, "id": project_id})
@@ -1923,19 +1825,6 @@ def set_project_group_name_using_id(project_group_id: int, name: str, backup_fir
                                    backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set name for project group ID"""
     try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
         with label_pizza.db.SessionLocal() as session:
             # Check if project group exists
             result = session.execute(text("SELECT name FROM project_groups WHERE id = :id"), {"id": project_group_id})
@@ -1953,6 +1842,15 @@ def set_project_group_name_using_id(project_group_id: int, name: str, backup_fir
                 print(f"❌ Project group name '{name}' already exists")
                 return False
             
+            # Snapshot the row before changing it
+            if backup_first:
+                backup_params = {"backup_dir": backup_dir, "backup_file": backup_file, "compress": compress}
+                description = f"Rename project group '{old_name}' to '{name}'"
+                proceed, _ = _backup_before_change(session, description, [("project_groups", "replace", "id = :id", {"id": project_group_id})], backup_params)
+                if not proceed:
+                    print("❌ Operation cancelled due to backup failure")
+                    return False
+            
             # Update the name
             session.execute(text("UPDATE project_groups SET name = :name WHERE id = :id"), 
                           {"name": name, "id": project_group_id})
@@ -2054,14 +1952,296 @@ def set_project_group_name(old_name: str, new_name: str, backup_first: bool = Tr
         return False
 
 
+# ============================================================================
+# BATCH OPERATIONS FROM A MANIFEST
+# ============================================================================
+
+# Entities supported by batch_rename / batch_delete: (delete plan table, table, name column)
+BATCH_ENTITIES = {
+    "user": ("User", "users", "user_id_str"),
+    "video": ("Video", "videos", "video_uid"),
+    "question_group": ("QuestionGroup", "question_groups", "title"),
+    "question": ("Question", "questions", "text"),
+    "schema": ("Schema", "schemas", "name"),
+    "project": ("Project", "projects", "name"),
+    "project_group": ("ProjectGroup", "project_groups", "name"),
+}
+
+
+def _read_manifest(manifest_file: str, columns: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+    """Read the entries of a CSV or JSON manifest
+    
+    CSV manifests need a header row with the given columns. JSON manifests are a list of
+    objects with the same keys; a rename manifest may also be an {old_name: new_name}
+    object and a delete manifest a plain list of names.
+    
+    Args:
+        manifest_file: Path to a .csv or .json file
+        columns: Required columns, e.g. ("old_name", "new_name")
+        
+    Returns:
+        One tuple of values per entry, in file order
+        
+    Raises:
+        ValueError: If the file type, columns or an entry are invalid
+    """
+    if manifest_file.lower().endswith(".csv"):
+        with open(manifest_file, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            missing = [column for column in columns if column not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"Manifest is missing column(s): {', '.join(missing)}")
+            records = list(reader)
+    elif manifest_file.lower().endswith(".json"):
+        with open(manifest_file, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and len(columns) == 2:
+            records = [dict(zip(columns, item)) for item in data.items()]
+        elif isinstance(data, list):
+            records = [{columns[0]: item} if isinstance(item, str) and len(columns) == 1 else item for item in data]
+        else:
+            raise ValueError("JSON manifest must be a list of entries")
+    else:
+        raise ValueError(f"Manifest must be a .csv or .json file: {manifest_file}")
+    
+    entries = []
+    for i, record in enumerate(records, 1):
+        if not isinstance(record, dict) or not all(isinstance(record.get(column), str) and record[column] for column in columns):
+            raise ValueError(f"Entry {i} needs non-empty {', '.join(columns)}: {record}")
+        entries.append(tuple(record[column] for column in columns))
+    return entries
+
+
+def _resolve_names(session: Session, table: str, name_column: str, names: List[str]) -> Dict[str, int]:
+    """Look up the IDs of many names with one query per chunk; unknown names are left out"""
+    ids = {}
+    for start in range(0, len(names), BULK_LOOKUP_CHUNK):
+        in_sql, params = _in_list_sql(names[start:start + BULK_LOOKUP_CHUNK])
+        result = session.execute(text(f"SELECT {name_column}, id FROM {table} WHERE {name_column} IN ({in_sql})"), params)
+        ids.update(result.fetchall())
+    return ids
+
+
+def _print_problems(title: str, problems: List[str]):
+    """Print validation problems, listing at most MAX_LISTED_OPERATIONS"""
+    print(f"❌ {title}: {len(problems):,} problem(s), nothing was changed")
+    for problem in problems[:MAX_LISTED_OPERATIONS]:
+        print(f"   - {problem}")
+    if len(problems) > MAX_LISTED_OPERATIONS:
+        print(f"   ... and {len(problems) - MAX_LISTED_OPERATIONS:,} more")
+
+
+def _validate_batch_renames(session: Session, table: str, name_column: str,
+                            renames: List[Tuple[str, str]]) -> Tuple[Dict[str, int], List[str]]:
+    """Resolve and validate a batch of renames in memory
+    
+    Returns:
+        (IDs of the current names, problems). A new name may be one that another row
+        in the same batch gives up.
+    """
+    problems = []
+    for name, count in Counter(old for old, _ in renames).items():
+        if count > 1:
+            problems.append(f"'{name}' is renamed {count} times")
+    for name, count in Counter(new for _, new in renames).items():
+        if count > 1:
+            problems.append(f"New name '{name}' is used {count} times")
+    
+    ids = _resolve_names(session, table, name_column, [old for old, _ in renames])
+    problems.extend(f"'{old}' not found" for old, _ in renames if old not in ids)
+    
+    renamed_ids = set(ids.values())
+    taken = _resolve_names(session, table, name_column, [new for _, new in renames])
+    problems.extend(f"'{new}' already exists" for _, new in renames if new in taken and taken[new] not in renamed_ids)
+    return ids, problems
+
+
+def batch_rename(entity: str, manifest_file: str, backup_first: bool = True, backup_dir: str = "./backups",
+                 backup_file: Optional[str] = None, compress: bool = True, confirm: bool = True) -> bool:
+    """Rename many rows of one entity type from a manifest in a single transaction
+    
+    Every name is resolved and validated before anything changes. One snapshot of the
+    renamed rows is taken and all renames are applied together or not at all.
+    
+    Args:
+        entity: One of BATCH_ENTITIES, e.g. 'video' or 'user'
+        manifest_file: CSV with old_name,new_name columns, or JSON (see _read_manifest)
+        backup_first: Snapshot the renamed rows before the change
+        backup_dir: Directory for the snapshot
+        backup_file: Snapshot filename (auto-generated if None)
+        compress: Gzip the snapshot
+        confirm: Ask the user to type 'RENAME' before applying
+        
+    Returns:
+        True if all renames were applied
+    """
+    if entity not in BATCH_ENTITIES:
+        print(f"❌ Unknown entity '{entity}'. Choose from: {', '.join(BATCH_ENTITIES)}")
+        return False
+    _, table, name_column = BATCH_ENTITIES[entity]
+    
+    try:
+        renames = [(old, new) for old, new in _read_manifest(manifest_file, ("old_name", "new_name")) if old != new]
+    except (OSError, ValueError) as e:
+        print(f"❌ Failed to read manifest: {e}")
+        return False
+    
+    if not renames:
+        print("No renames to perform.")
+        return True
+    
+    try:
+        with label_pizza.db.SessionLocal() as session:
+            ids, problems = _validate_batch_renames(session, table, name_column, renames)
+            if problems:
+                _print_problems(f"Batch rename of {table}", problems)
+                return False
+            
+            if confirm:
+                print(f"✏️  BATCH RENAME: {len(renames):,} {table}")
+                print("=" * 50)
+                for old, new in renames[:MAX_LISTED_OPERATIONS]:
+                    print(f"   '{old}' → '{new}'")
+                if len(renames) > MAX_LISTED_OPERATIONS:
+                    print(f"   ... and {len(renames) - MAX_LISTED_OPERATIONS:,} more")
+                print()
+                response = input("Confirm batch rename? Type 'RENAME' to proceed: ")
+                if response.strip() != 'RENAME':
+                    print("❌ Batch rename cancelled")
+                    return False
+            
+            # Snapshot the rows before changing them
+            if backup_first:
+                backup_params = {"backup_dir": backup_dir, "backup_file": backup_file, "compress": compress}
+                in_sql, params = _in_list_sql(list(ids.values()))
+                description = f"Rename {len(renames):,} {table} from {os.path.basename(manifest_file)}"
+                proceed, _ = _backup_before_change(session, description, [(table, "replace", f"id IN ({in_sql})", params)], backup_params)
+                if not proceed:
+                    print("❌ Operation cancelled due to backup failure")
+                    return False
+            
+            update_sql = text(f"UPDATE {table} SET {name_column} = :name WHERE id = :id")
+            
+            # Park every row on a unique placeholder first when a new name is still held by another renamed row
+            if any(new in ids for _, new in renames):
+                session.execute(update_sql, [{"id": ids[old], "name": f"__renaming_{ids[old]}__"} for old, _ in renames])
+            session.execute(update_sql, [{"id": ids[old], "name": new} for old, new in renames])
+            session.commit()
+            
+            print(f"✅ Renamed {len(renames):,} {table}")
+            return True
+            
+    except Exception as e:
+        print(f"❌ Error in batch rename: {e}")
+        return False
+
+
+def batch_delete(entity: str, manifest_file: str, backup_first: bool = True, backup_dir: str = "./backups",
+                 backup_file: Optional[str] = None, compress: bool = True) -> bool:
+    """Delete many rows of one entity type from a manifest with cascade deletion
+    
+    All names are resolved with bulk queries and deleted as a single cascade plan:
+    one confirmation, one snapshot and one transaction.
+    
+    Args:
+        entity: One of BATCH_ENTITIES, e.g. 'video' or 'user'
+        manifest_file: CSV with a name column, or JSON (see _read_manifest)
+        backup_first: Snapshot the deleted rows before the change
+        backup_dir: Directory for the snapshot
+        backup_file: Snapshot filename (auto-generated if None)
+        compress: Gzip the snapshot
+        
+    Returns:
+        True if everything was deleted
+    """
+    if entity not in BATCH_ENTITIES:
+        print(f"❌ Unknown entity '{entity}'. Choose from: {', '.join(BATCH_ENTITIES)}")
+        return False
+    model, table, name_column = BATCH_ENTITIES[entity]
+    backup_params = {"backup_first": backup_first, "backup_dir": backup_dir, "backup_file": backup_file, "compress": compress}
+    
+    try:
+        names = list(dict.fromkeys(name for (name,) in _read_manifest(manifest_file, ("name",))))
+    except (OSError, ValueError) as e:
+        print(f"❌ Failed to read manifest: {e}")
+        return False
+    
+    if not names:
+        print("No operations to perform.")
+        return True
+    
+    try:
+        with label_pizza.db.SessionLocal() as session:
+            ids = _resolve_names(session, table, name_column, names)
+            missing = [f"'{name}' not found" for name in names if name not in ids]
+            if missing:
+                _print_problems(f"Batch delete of {table}", missing)
+                return False
+            
+            print(f"🔍 Collecting dependencies for {len(ids):,} {table}")
+            
+            operations = [DeleteOperation(model, 'using_id', (ids[name],), backup_params) for name in names]
+            return _run_delete_plan(session, operations)
+            
+    except Exception as e:
+        print(f"❌ Error in batch delete: {e}")
+        return False
+
+
+def main():
+    """Command line entry point: undo from a snapshot, or batch rename/delete from a manifest"""
+    from dotenv import load_dotenv
+    from label_pizza.db import init_database
+    
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--database-url-name", default="DBURL",
+                        help="Environment variable name for database URL (default: DBURL)")
+    batch = argparse.ArgumentParser(add_help=False, parents=[common])
+    batch.add_argument("entity", choices=list(BATCH_ENTITIES), help="Kind of rows named in the manifest")
+    batch.add_argument("manifest", help="CSV or JSON manifest file")
+    batch.add_argument("--no-backup", action="store_true", help="Do not snapshot the affected rows first")
+    batch.add_argument("--backup-dir", default="./backups", help="Snapshot directory (default: ./backups)")
+    
+    parser = argparse.ArgumentParser(description="Undo an override from its snapshot, or rename/delete in batch from a manifest")
+    commands = parser.add_subparsers(dest="command", required=True)
+    undo = commands.add_parser("undo", parents=[common], help="Put back the rows captured in a snapshot")
+    undo.add_argument("snapshot", help="Snapshot file written before the change")
+    undo.add_argument("--yes", "-y", action="store_true", help="Skip the confirmation prompt")
+    rename = commands.add_parser("rename", parents=[batch], help="Rename rows listed as old_name,new_name")
+    rename.add_argument("--yes", "-y", action="store_true", help="Skip the confirmation prompt")
+    commands.add_parser("delete", parents=[batch], help="Cascade delete rows listed by name")
+    args = parser.parse_args()
+    
+    load_dotenv(".env")
+    try:
+        init_database(args.database_url_name)
+    except Exception as e:
+        print(f"Error initializing database: {e}")
+        return 1
+    
+    if args.command == "undo":
+        success = undo_snapshot(args.snapshot, confirm=not args.yes)
+    elif args.command == "rename":
+        success = batch_rename(args.entity, args.manifest, backup_first=not args.no_backup,
+                               backup_dir=args.backup_dir, confirm=not args.yes)
+    else:
+        success = batch_delete(args.entity, args.manifest, backup_first=not args.no_backup, backup_dir=args.backup_dir)
+    return 0 if success else 1
+
+
 if __name__ == "__main__":
-    print("Label Pizza Override Utils")
-    print("=========================")
-    print()
-    print("This module provides cascade delete and name management functions.")
-    print("Before using any functions, always run:")
-    print()
-    print("    from label_pizza.db import init_database")
-    print("    init_database('DBURL')")
-    print()
-    print("See the module docstring for full usage examples.")
\ No newline at end of file
+    if len(sys.argv) == 1:
+        print("Label Pizza Override Utils")
+        print("=========================")
+        print()
+        print("This module provides cascade delete and name management functions.")
+        print("Before using any functions, always run:")
+        print()
+        print("    from label_pizza.db import init_database")
+        print("    init_database('DBURL')")
+        print()
+        print("See the module docstring for full usage examples.")
+        print("Undo a delete or rename with: python -m label_pizza.override_utils undo <snapshot>")
+        print("Rename or delete in batch with: python -m label_pizza.override_utils rename|delete <entity> <manifest>")
+    else:
+        sys.exit(main())
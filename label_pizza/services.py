@@ -1,7 +1,7 @@
-from sqlalchemy import select, insert, update, func, delete, exists, join, distinct, and_, or_, case, text
-from sqlalchemy.orm import Session, selectinload, joinedload, contains_eager  
+from sqlalchemy import select, insert, update, func, delete, exists, join, distinct, and_, or_, case, text, bindparam, cast, String
+from sqlalchemy.orm import Session, selectinload, joinedload, contains_eager, aliased
 from sqlalchemy.sql import literal_column
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Iterable, Iterator
 from label_pizza.models import (
     Video, Project, ProjectVideo, Schema, QuestionGroup,
     Question, ProjectUserRole, AnnotatorAnswer, ReviewerGroundTruth, User, AnswerReview,
@@ -14,6 +14,7 @@ import hashlib
 import os
 from dotenv import load_dotenv
 import importlib.util
+import itertools
 import sys
 from pathlib import Path
 
@@ -5444,6 +5445,58 @@ class QuestionGroupService:
         groups = session.scalars(query).all()
         return [{"id": g.id, "title": g.title, "display_title": g.display_title, "description": g.description, "archived": g.is_archived} for g in groups]
 
+# ---------------------------------------------------------------------------
+# Prebuilt statements for hot per-click readers.
+# These run on every widget interaction, so they are constructed once at import
+# time with bind parameters and reused; SQLAlchemy then hits its compiled cache
+# instead of rebuilding and re-traversing the select() on every call.
+# ---------------------------------------------------------------------------
+
+_USER_PROJECT_ROLES_STMT = (
+    select(ProjectUserRole.role)
+    .where(
+        ProjectUserRole.user_id == bindparam("user_id"),
+        ProjectUserRole.project_id == bindparam("project_id"),
+        ProjectUserRole.is_archived == False
+    )
+)
+
+_USER_GROUP_ANSWERS_STMT = (
+    select(Question.text, AnnotatorAnswer.answer_value)
+    .join(Question, AnnotatorAnswer.question_id == Question.id)
+    .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
+    .where(
+        AnnotatorAnswer.video_id == bindparam("video_id"),
+        AnnotatorAnswer.project_id == bindparam("project_id"),
+        AnnotatorAnswer.user_id == bindparam("user_id"),
+        QuestionGroupQuestion.question_group_id == bindparam("question_group_id")
+    )
+)
+
+_USER_GROUP_ANSWER_COUNT_STMT = (
+    select(func.count())
+    .select_from(AnnotatorAnswer)
+    .join(QuestionGroupQuestion, AnnotatorAnswer.question_id == QuestionGroupQuestion.question_id)
+    .where(
+        AnnotatorAnswer.video_id == bindparam("video_id"),
+        AnnotatorAnswer.project_id == bindparam("project_id"),
+        AnnotatorAnswer.user_id == bindparam("user_id"),
+        QuestionGroupQuestion.question_group_id == bindparam("question_group_id")
+    )
+)
+
+_GROUP_GROUND_TRUTH_STMT = (
+    select(ReviewerGroundTruth)
+    .join(QuestionGroupQuestion, ReviewerGroundTruth.question_id == QuestionGroupQuestion.question_id)
+    .where(
+        ReviewerGroundTruth.video_id == bindparam("video_id"),
+        ReviewerGroundTruth.project_id == bindparam("project_id"),
+        QuestionGroupQuestion.question_group_id == bindparam("question_group_id")
+    )
+    .order_by(QuestionGroupQuestion.display_order)
+)
+
+
 class BaseAnswerService:
     """Base class with shared functionality for answer submission services."""
     
@@ -5491,11 +5544,7 @@ class BaseAnswerService:
         """
         # Get all non-archived roles for the user in this project
         user_roles = session.scalars(
-            select(ProjectUserRole).where(
-                ProjectUserRole.user_id == user_id,
-                ProjectUserRole.project_id == project_id,
-                ProjectUserRole.is_archived == False
-            )
+            _USER_PROJECT_ROLES_STMT, {"user_id": user_id, "project_id": project_id}
         ).all()
         
         # Define role hierarchy
@@ -5506,7 +5555,7 @@ class BaseAnswerService:
         }
         
         # Check if user has any role that satisfies the requirement
-        if not user_roles or not any(role.role in role_hierarchy[required_role] for role in user_roles):
+        if not user_roles or not any(role in role_hierarchy[required_role] for role in user_roles):
             raise ValueError(f"User {user_id} does not have {required_role} role in project {project_id}")
 
     @staticmethod
@@ -6261,25 +6310,12 @@ class AnnotatorService(BaseAnswerService):
         Returns:
             Dictionary mapping question text to answer value
         """
-        answers = session.scalars(
-            select(AnnotatorAnswer)
-            .join(Question, AnnotatorAnswer.question_id == Question.id)
-            .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
-            .where(
-                AnnotatorAnswer.video_id == video_id,
-                AnnotatorAnswer.project_id == project_id,
-                AnnotatorAnswer.user_id == user_id,
-                QuestionGroupQuestion.question_group_id == question_group_id
-            )
+        rows = session.execute(
+            _USER_GROUP_ANSWERS_STMT,
+            {"video_id": video_id, "project_id": project_id, "user_id": user_id, "question_group_id": question_group_id}
         ).all()
         
-        result = {}
-        for answer in answers:
-            question = session.get(Question, answer.question_id)
-            if question:
-                result[question.text] = answer.answer_value
-        
-        return result
+        return {question_text: answer_value for question_text, answer_value in rows}
 
     @staticmethod
     def check_user_has_submitted_answers(video_id: int, project_id: int, user_id: int, question_group_id: int, session: Session) -> bool:
@@ -6296,16 +6332,8 @@ class AnnotatorService(BaseAnswerService):
             True if user has submitted answers, False otherwise
         """
         answer_count = session.scalar(
-            select(func.count())
-            .select_from(AnnotatorAnswer)
-            .join(Question, AnnotatorAnswer.question_id == Question.id)
-            .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
-            .where(
-                AnnotatorAnswer.video_id == video_id,
-                AnnotatorAnswer.project_id == project_id,
-                AnnotatorAnswer.user_id == user_id,
-                QuestionGroupQuestion.question_group_id == question_group_id
-            )
+            _USER_GROUP_ANSWER_COUNT_STMT,
+            {"video_id": video_id, "project_id": project_id, "user_id": user_id, "question_group_id": question_group_id}
         )
         
         return answer_count > 0
@@ -6584,267 +6612,358 @@ class GroundTruthService(BaseAnswerService):
         
         return result
             
+    @staticmethod
+    def _fetch_ground_truth_records(video_ids: List[int], project_id: int, session: Session) -> List[Any]:
+        """Fetch the ground truth of many videos with reviewer and admin names in one query.
+        
+        Args:
+            video_ids: IDs of the videos to fetch
+            project_id: The ID of the project
+            session: Database session
+            
+        Returns:
+            List of rows of (ReviewerGroundTruth, reviewer_name, admin_name)
+        """
+        if not video_ids:
+            return []
+        
+        reviewer_user = aliased(User)
+        admin_user = aliased(User)
+        return session.execute(
+            select(
+                ReviewerGroundTruth,
+                reviewer_user.user_id_str.label("reviewer_name"),
+                admin_user.user_id_str.label("admin_name")
+            )
+            .outerjoin(reviewer_user, reviewer_user.id == ReviewerGroundTruth.reviewer_id)
+            .outerjoin(admin_user, admin_user.id == ReviewerGroundTruth.modified_by_admin_id)
+            .where(
+                ReviewerGroundTruth.project_id == project_id,
+                ReviewerGroundTruth.video_id.in_(video_ids)
+            )
+        ).all()
+
+    @staticmethod
+    def _fetch_description_answer_rows(video_ids: List[int], project_id: int, description_question_ids: List[int], session: Session) -> List[Any]:
+        """Fetch every user's answers to description questions with their reviews for many videos in one query.
+        
+        Args:
+            video_ids: IDs of the videos to fetch
+            project_id: The ID of the project
+            description_question_ids: IDs of the description questions
+            session: Database session
+            
+        Returns:
+            List of rows with video_id, question_id, user_id, user_name, review_status,
+            review_reviewer_id and review_reviewer_name
+        """
+        if not video_ids or not description_question_ids:
+            return []
+        
+        annotator_user = aliased(User)
+        review_user = aliased(User)
+        return session.execute(
+            select(
+                AnnotatorAnswer.video_id,
+                AnnotatorAnswer.question_id,
+                AnnotatorAnswer.user_id,
+                annotator_user.user_id_str.label("user_name"),
+                AnswerReview.status.label("review_status"),
+                AnswerReview.reviewer_id.label("review_reviewer_id"),
+                review_user.user_id_str.label("review_reviewer_name")
+            )
+            .outerjoin(annotator_user, annotator_user.id == AnnotatorAnswer.user_id)
+            .outerjoin(AnswerReview, AnswerReview.answer_id == AnnotatorAnswer.id)
+            .outerjoin(review_user, review_user.id == AnswerReview.reviewer_id)
+            .where(
+                AnnotatorAnswer.project_id == project_id,
+                AnnotatorAnswer.video_id.in_(video_ids),
+                AnnotatorAnswer.question_id.in_(description_question_ids)
+            )
+        ).all()
+
+    @staticmethod
+    def _build_ground_truth_payload(gt_rows: List[Any], project_question_ids: set) -> Dict[str, Any]:
+        """Build the ground truth display payload from rows of _fetch_ground_truth_records.
+        
+        Args:
+            gt_rows: Rows of (ReviewerGroundTruth, reviewer_name, admin_name) for a single video
+            project_question_ids: IDs of all non-archived questions in the project
+            
+        Returns:
+            Dictionary in the format returned by get_all_ground_truth_data_for_video
+        """
+        gt_by_question = {row.ReviewerGroundTruth.question_id: row for row in gt_rows}
+        gt_records = {question_id: row.ReviewerGroundTruth for question_id, row in gt_by_question.items()}
+        gt_dict = {question_id: gt.answer_value for question_id, gt in gt_records.items()}
+        
+        admin_modifications = {}
+        for question_id, row in gt_by_question.items():
+            gt = row.ReviewerGroundTruth
+            is_modified = gt.modified_by_admin_id is not None
+            admin_modifications[question_id] = {
+                "is_modified": is_modified,
+                "admin_info": {
+                    "current_value": gt.answer_value,
+                    "original_value": gt.original_answer_value,
+                    "admin_id": gt.modified_by_admin_id,
+                    "admin_name": row.admin_name or f"Admin {gt.modified_by_admin_id}",
+                    "modified_at": gt.modified_by_admin_at
+                } if is_modified else None
+            }
+        
+        gt_status_by_question = {}
+        for question_id in project_question_ids:
+            row = gt_by_question.get(question_id)
+            if row is None:
+                gt_status_by_question[question_id] = "📭 No GT"
+                continue
+            
+            gt = row.ReviewerGroundTruth
+            reviewer_name = row.reviewer_name or f"User {gt.reviewer_id}"
+            if gt.modified_by_admin_id:
+                admin_name = row.admin_name or f"Admin {gt.modified_by_admin_id}"
+                gt_status_by_question[question_id] = f"🏆 GT by: {reviewer_name} (Overridden by {admin_name})"
+            else:
+                gt_status_by_question[question_id] = f"🏆 GT by: {reviewer_name}"
+        
+        return {
+            "ground_truth_dict": gt_dict,
+            "admin_modifications": admin_modifications,
+            "gt_status_by_question": gt_status_by_question,
+            "gt_records": gt_records,
+            "has_any_admin_modifications": any(mod["is_modified"] for mod in admin_modifications.values())
+        }
+
     @staticmethod
     def get_complete_video_data_for_display(video_id: int, project_id: int, user_id: int, role: str, session: Session, selected_annotators: List[str] = None) -> Dict[str, Any]:
         """Get ALL data needed to display a video with all its question groups in one massive batch operation"""
+        return GroundTruthService.batch_get_complete_video_data_for_display(
+            video_ids=[video_id], project_id=project_id, user_id=user_id, role=role,
+            session=session, selected_annotators=selected_annotators
+        ).get(video_id, {})
+
+    @staticmethod
+    def batch_get_complete_video_data_for_display(video_ids: List[int], project_id: int, user_id: int, role: str, session: Session, selected_annotators: List[str] = None) -> Dict[int, Dict[str, Any]]:
+        """Get display data for a page of videos with a constant number of queries.
+        
+        Project-level data (schema groups, questions, training mode) is loaded once,
+        and the page's ground truth, description answers with their reviews and an
+        annotator's own answers each come from a single query.
+        
+        Args:
+            video_ids: IDs of the videos on the page
+            project_id: The ID of the project
+            user_id: The ID of the current user
+            role: Current role ("annotator", "reviewer" or "meta_reviewer")
+            session: Database session
+            selected_annotators: Annotator display names selected by a reviewer
+            
+        Returns:
+            Dictionary mapping video ID to the payload of get_complete_video_data_for_display
+        """
         try:
-            # Get project and schema info
             project = ProjectService.get_project_by_id(project_id=project_id, session=session)
             
-            # Get all question groups for this schema
             question_groups = SchemaService.get_schema_question_groups_list(
                 schema_id=project.schema_id, session=session
             )
             
-            # Get ALL questions for this project at once
-            all_questions = ProjectService.get_project_questions(project_id=project_id, session=session)
+            # Questions and their schema group membership in one query
+            question_rows = session.execute(
+                select(Question, SchemaQuestionGroup.question_group_id)
+                .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
+                .join(SchemaQuestionGroup, QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id)
+                .where(
+                    SchemaQuestionGroup.schema_id == project.schema_id,
+                    Question.is_archived == False
+                )
+                .order_by(SchemaQuestionGroup.display_order, QuestionGroupQuestion.display_order)
+            ).all()
             
-            # Organize questions by group
+            all_questions = []
             questions_by_group = {}
             question_id_to_group = {}
-            all_question_ids = set()
-            
-            for question in all_questions:
-                all_question_ids.add(question["id"])
-                
-                # Find which groups this question belongs to
-                group_assignments = session.scalars(
-                    select(QuestionGroupQuestion)
-                    .where(QuestionGroupQuestion.question_id == question["id"])
-                ).all()
-                
-                for assignment in group_assignments:
-                    group_id = assignment.question_group_id
-                    if group_id not in questions_by_group:
-                        questions_by_group[group_id] = []
-                    questions_by_group[group_id].append(question)
-                    question_id_to_group[question["id"]] = group_id
-            
-            # BATCH 1: Get ALL ground truth data for this video
-            gt_data = {}
-            admin_modifications = {}
-            gt_status_by_question = {}
+            for question, group_id in question_rows:
+                question_dict = {
+                    'id': question.id,
+                    'text': question.text,
+                    'type': question.type,
+                    'display_text': question.display_text,
+                    'options': question.options,
+                    'display_values': question.display_values,
+                    'option_weights': question.option_weights,
+                    'default_option': question.default_option
+                }
+                if question.id not in question_id_to_group:
+                    all_questions.append(question_dict)
+                questions_by_group.setdefault(group_id, []).append(question_dict)
+                question_id_to_group[question.id] = group_id
             
-            if role in ["reviewer", "meta_reviewer"]:
-                gt_batch = GroundTruthService.get_all_ground_truth_data_for_video(
-                    video_id=video_id, project_id=project_id, session=session
-                )
-                gt_data = gt_batch["ground_truth_dict"]
-                admin_modifications = gt_batch["admin_modifications"]
-                gt_status_by_question = gt_batch["gt_status_by_question"]
+            project_question_ids = set(question_id_to_group)
+            is_reviewer = role in ["reviewer", "meta_reviewer"]
             
-            # BATCH 2: Get ALL annotator data for this video
-            annotator_data = {}
+            is_training = False
             if role == "annotator":
-                annotator_batch = AnnotatorService.get_all_annotator_data_for_video(
-                    video_id=video_id, project_id=project_id, user_id=user_id, session=session
+                is_training = ProjectService.check_project_has_full_ground_truth(
+                    project_id=project_id, session=session
                 )
-                annotator_data = annotator_batch
-            
-            # BATCH 3: Get ALL completion statuses for all groups at once
-            completion_status_by_group = {}
             
-            if role == "annotator":
-                # Check which groups have any answers
-                for group_id in questions_by_group.keys():
-                    group_questions = questions_by_group[group_id]
-                    group_question_ids = [q["id"] for q in group_questions]
-                    
-                    has_answers = any(
-                        qid in annotator_data.get("answers_by_question", {}) 
-                        for qid in group_question_ids
+            gt_rows_by_video = {video_id: [] for video_id in video_ids}
+            if is_reviewer or is_training:
+                for row in GroundTruthService._fetch_ground_truth_records(
+                    video_ids=video_ids, project_id=project_id, session=session
+                ):
+                    gt_rows_by_video[row.ReviewerGroundTruth.video_id].append(row)
+            
+            # Only description answers are fetched for reviewers
+            answer_rows_by_video = {video_id: [] for video_id in video_ids}
+            if is_reviewer:
+                for row in GroundTruthService._fetch_description_answer_rows(
+                    video_ids=video_ids,
+                    project_id=project_id,
+                    description_question_ids=[q["id"] for q in all_questions if q["type"] == "description"],
+                    session=session
+                ):
+                    answer_rows_by_video[row.video_id].append(row)
+            
+            # The annotator's own answers stay model instances, as in get_all_annotator_data_for_video
+            user_answers_by_video = {video_id: {} for video_id in video_ids}
+            if role == "annotator" and video_ids:
+                for answer in session.scalars(
+                    select(AnnotatorAnswer).where(
+                        AnnotatorAnswer.user_id == user_id,
+                        AnnotatorAnswer.project_id == project_id,
+                        AnnotatorAnswer.video_id.in_(video_ids)
                     )
-                    completion_status_by_group[group_id] = has_answers
-            else:
-                # Check which groups have ground truth
-                for group_id in questions_by_group.keys():
-                    group_questions = questions_by_group[group_id]
-                    group_question_ids = [q["id"] for q in group_questions]
-                    
-                    has_gt = any(qid in gt_data for qid in group_question_ids)
-                    completion_status_by_group[group_id] = has_gt
+                ):
+                    user_answers_by_video[answer.video_id][answer.question_id] = answer
             
-            # BATCH 4: Get training mode ground truth if needed
-            training_gt_by_group = {}
-            if role == "annotator":
-                # Check if this is training mode
-                is_training = ProjectService.check_project_has_full_ground_truth(
-                    project_id=project_id, session=session
-                )
+            # Selected annotators are resolved once for the whole page
+            annotator_user_ids = []
+            if is_reviewer and selected_annotators:
+                try:
+                    annotator_user_ids = AuthService.get_annotator_user_ids_from_display_names(
+                        display_names=selected_annotators, project_id=project_id, session=session
+                    )
+                except Exception as e:
+                    print(f"Error loading reviewer annotator data: {e}")
+            
+            results = {}
+            for video_id in video_ids:
+                gt_data = {}
+                admin_modifications = {}
+                gt_status_by_question = {}
+                annotator_data = {}
+                completion_status_by_group = {}
+                training_gt_by_group = {}
+                answer_reviews_by_group = {}
+                reviewer_annotator_data = {}
                 
-                if is_training:
-                    # Get ALL ground truth for training mode
-                    all_gt = session.scalars(
-                        select(ReviewerGroundTruth)
-                        .where(
-                            ReviewerGroundTruth.video_id == video_id,
-                            ReviewerGroundTruth.project_id == project_id
-                        )
-                    ).all()
-                    
-                    gt_by_question_id = {gt.question_id: gt.answer_value for gt in all_gt}
+                if is_reviewer:
+                    gt_batch = GroundTruthService._build_ground_truth_payload(
+                        gt_rows=gt_rows_by_video[video_id], project_question_ids=project_question_ids
+                    )
+                    gt_data = gt_batch["ground_truth_dict"]
+                    admin_modifications = gt_batch["admin_modifications"]
+                    gt_status_by_question = gt_batch["gt_status_by_question"]
+                
+                if role == "annotator":
+                    answers_by_question = user_answers_by_video[video_id]
+                    annotator_data = {
+                        "answer_dict": {
+                            q["text"]: answers_by_question[q["id"]].answer_value
+                            for q in all_questions if q["id"] in answers_by_question
+                        },
+                        "answers_by_question": answers_by_question,
+                        "submission_status_by_group": {
+                            group_id: any(q["id"] in answers_by_question for q in group_questions)
+                            for group_id, group_questions in questions_by_group.items()
+                        }
+                    }
+                    completion_status_by_group = dict(annotator_data["submission_status_by_group"])
                     
-                    # Organize by group
+                    if is_training:
+                        gt_by_question_id = {
+                            row.ReviewerGroundTruth.question_id: row.ReviewerGroundTruth.answer_value
+                            for row in gt_rows_by_video[video_id]
+                        }
+                        for group_id, group_questions in questions_by_group.items():
+                            training_gt_by_group[group_id] = {
+                                q["text"]: gt_by_question_id[q["id"]]
+                                for q in group_questions if q["id"] in gt_by_question_id
+                            }
+                else:
                     for group_id, group_questions in questions_by_group.items():
-                        training_gt_by_group[group_id] = {}
-                        for question in group_questions:
-                            if question["id"] in gt_by_question_id:
-                                training_gt_by_group[group_id][question["text"]] = gt_by_question_id[question["id"]]
-            
-            # BATCH 5: Get ALL answer reviews for description questions (FIXED)
-            answer_reviews_by_group = {}
-            reviewer_annotator_data = {}
-            if role in ["reviewer", "meta_reviewer"]:
-                # **NEW: Bulk load reviewer-specific data for selected annotators**
-                if selected_annotators:
-                    try:
-                        # Get annotator user IDs
-                        annotator_user_ids = AuthService.get_annotator_user_ids_from_display_names(
-                            display_names=selected_annotators, project_id=project_id, session=session
-                        )
-                        
-                        if annotator_user_ids:
-                            # Use existing bulk cache optimization
-                            from label_pizza.database_utils import get_cached_bulk_reviewer_data, get_video_reviewer_data_from_bulk, get_session_cache_key
+                        completion_status_by_group[group_id] = any(q["id"] in gt_data for q in group_questions)
+                
+                if is_reviewer:
+                    if annotator_user_ids:
+                        try:
+                            from label_pizza.database_utils import get_cached_bulk_reviewer_data, get_video_reviewer_data_from_bulk, get_project_data_version
                             
-                            bulk_data = get_cached_bulk_reviewer_data(project_id, get_session_cache_key())
+                            bulk_data = get_cached_bulk_reviewer_data(project_id, get_project_data_version(project_id))
                             if bulk_data:
                                 reviewer_annotator_data = get_video_reviewer_data_from_bulk(
-                                    video_id=video_id, project_id=project_id, 
+                                    video_id=video_id, project_id=project_id,
                                     annotator_user_ids=annotator_user_ids
                                 )
-                    except Exception as e:
-                        print(f"Error loading reviewer annotator data: {e}")
-                        reviewer_annotator_data = {}
-
-                description_questions = [q for q in all_questions if q["type"] == "description"]
-                
-                if description_questions:
-                    # 🚀 FIXED: Use AnnotatorService.get_answers() to get the correct "Answer ID" column
-                    try:
-                        answers_df = AnnotatorService.get_answers(video_id=video_id, project_id=project_id, session=session)
+                        except Exception as e:
+                            print(f"Error loading reviewer annotator data: {e}")
+                            reviewer_annotator_data = {}
+                    
+                    answer_rows_by_question = {}
+                    for row in answer_rows_by_video[video_id]:
+                        answer_rows_by_question.setdefault(row.question_id, []).append(row)
+                    
+                    description_questions = [q for q in all_questions if q["type"] == "description"] if answer_rows_by_question else []
+                    for question in description_questions:
+                        group_id = question_id_to_group.get(question["id"])
+                        if not group_id:
+                            continue
+                        answer_reviews_by_group.setdefault(group_id, {})
                         
-                        if not answers_df.empty:
-                            # Filter for description questions only
-                            description_question_ids = [q["id"] for q in description_questions]
-                            desc_answers = answers_df[answers_df["Question ID"].isin(description_question_ids)]
-                            
-                            if not desc_answers.empty:
-                                # Get all answer IDs for this video's description questions
-                                answer_ids = desc_answers["Answer ID"].tolist()
-                                
-                                # Get all reviews for these answers in one query
-                                reviews = session.scalars(
-                                    select(AnswerReview)
-                                    .where(AnswerReview.answer_id.in_(answer_ids))
-                                ).all()
-                                
-                                reviews_by_answer_id = {review.answer_id: review for review in reviews}
-                                
-                                # Get all user info for reviewers in one query
-                                reviewer_ids = {review.reviewer_id for review in reviews if review.reviewer_id}
-                                user_info_map = {}
-                                if reviewer_ids:
-                                    users = session.scalars(
-                                        select(User).where(User.id.in_(reviewer_ids))
-                                    ).all()
-                                    user_info_map = {user.id: user.user_id_str for user in users}
-                                
-                                # Get all annotator user info for answer owners
-                                annotator_ids = desc_answers["User ID"].unique().tolist()
-                                annotator_info_map = {}
-                                if annotator_ids:
-                                    annotators = session.scalars(
-                                        select(User).where(User.id.in_(annotator_ids))
-                                    ).all()
-                                    annotator_info_map = {user.id: user.user_id_str for user in annotators}
-                                
-                                # Organize by group and question
-                                for question in description_questions:
-                                    group_id = question_id_to_group.get(question["id"])
-                                    if group_id:
-                                        if group_id not in answer_reviews_by_group:
-                                            answer_reviews_by_group[group_id] = {}
-                                        
-                                        question_answers = desc_answers[desc_answers["Question ID"] == question["id"]]
-                                        
-                                        if not question_answers.empty:
-                                            answer_reviews_by_group[group_id][question["text"]] = {}
-                                            
-                                            for _, answer_row in question_answers.iterrows():
-                                                answer_id = answer_row["Answer ID"]
-                                                user_id_for_answer = answer_row["User ID"]
-                                                
-                                                # Get user display name
-                                                user_name = annotator_info_map.get(user_id_for_answer, f"User {user_id_for_answer}")
-                                                display_name, _ = AuthService.get_user_display_name_with_initials(user_name)
-                                                
-                                                if answer_id in reviews_by_answer_id:
-                                                    review = reviews_by_answer_id[answer_id]
-                                                    reviewer_name = user_info_map.get(review.reviewer_id)
-                                                    answer_reviews_by_group[group_id][question["text"]][display_name] = {
-                                                        "status": review.status,
-                                                        "reviewer_id": review.reviewer_id,
-                                                        "reviewer_name": reviewer_name
-                                                    }
-                                                else:
-                                                    answer_reviews_by_group[group_id][question["text"]][display_name] = {
-                                                        "status": "pending",
-                                                        "reviewer_id": None,
-                                                        "reviewer_name": None
-                                                    }
-                    except Exception as e:
-                        print(f"Error getting answer reviews: {e}")
-                        # Don't fail the whole function, just leave answer_reviews_by_group empty
-                        answer_reviews_by_group = {}
+                        question_answers = answer_rows_by_question.get(question["id"])
+                        if not question_answers:
+                            continue
+                        
+                        reviews_by_annotator = answer_reviews_by_group[group_id].setdefault(question["text"], {})
+                        for row in question_answers:
+                            user_name = row.user_name or f"User {row.user_id}"
+                            display_name, _ = AuthService.get_user_display_name_with_initials(user_name)
+                            reviews_by_annotator[display_name] = {
+                                "status": row.review_status or "pending",
+                                "reviewer_id": row.review_reviewer_id,
+                                "reviewer_name": row.review_reviewer_name
+                            }
+                
+                results[video_id] = {
+                    "project": project,
+                    "question_groups": question_groups,
+                    "questions_by_group": questions_by_group,
+                    "gt_data": gt_data,
+                    "admin_modifications": admin_modifications,
+                    "gt_status_by_question": gt_status_by_question,
+                    "annotator_data": annotator_data,
+                    "completion_status_by_group": completion_status_by_group,
+                    "training_gt_by_group": training_gt_by_group,
+                    "answer_reviews_by_group": answer_reviews_by_group,
+                    "is_training_mode": role == "annotator" and bool(training_gt_by_group),
+                    "reviewer_annotator_data": reviewer_annotator_data
+                }
             
-            return {
-                "project": project,
-                "question_groups": question_groups,
-                "questions_by_group": questions_by_group,
-                "gt_data": gt_data,
-                "admin_modifications": admin_modifications,
-                "gt_status_by_question": gt_status_by_question,
-                "annotator_data": annotator_data,
-                "completion_status_by_group": completion_status_by_group,
-                "training_gt_by_group": training_gt_by_group,
-                "answer_reviews_by_group": answer_reviews_by_group,
-                "is_training_mode": role == "annotator" and bool(training_gt_by_group),
-                "reviewer_annotator_data": reviewer_annotator_data
-            }
+            return results
             
         except Exception as e:
-            print(f"Error in get_complete_video_data_for_display: {e}")
+            print(f"Error in batch_get_complete_video_data_for_display: {e}")
             return {}
 
     @staticmethod
     def get_all_ground_truth_data_for_video(video_id: int, project_id: int, session: Session) -> Dict[str, Any]:
         """Get ALL ground truth related data for a video in a single batch operation"""
         try:
-            # Get all ground truth records for this video
-            ground_truths = session.scalars(
-                select(ReviewerGroundTruth)
-                .where(
-                    ReviewerGroundTruth.video_id == video_id,
-                    ReviewerGroundTruth.project_id == project_id
-                )
-            ).all()
-            
-            # Organize by question_id
-            gt_by_question = {}
-            gt_dict = {}
-            all_question_ids = set()
-            
-            for gt in ground_truths:
-                question_id = gt.question_id
-                all_question_ids.add(question_id)
-                
-                gt_by_question[question_id] = gt
-                gt_dict[question_id] = gt.answer_value
-            
-            # Get all questions for this project to check completion
-            questions = session.scalars(
-                select(Question)
+            project_question_ids = set(session.scalars(
+                select(Question.id)
                 .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
                 .join(SchemaQuestionGroup, QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id)
                 .join(Project, SchemaQuestionGroup.schema_id == Project.schema_id)
@@ -6852,52 +6971,16 @@ class GroundTruthService(BaseAnswerService):
                     Project.id == project_id,
                     Question.is_archived == False
                 )
-            ).all()
-            
-            project_question_ids = {q.id for q in questions}
-            
-            # Check admin modifications for all questions at once
-            admin_modifications = {}
-            if all_question_ids:
-                admin_modifications = GroundTruthService.batch_check_admin_modifications(
-                    video_id=video_id, project_id=project_id, 
-                    question_ids=list(all_question_ids), session=session
-                )
-            
-            # Get user info for all reviewers at once
-            reviewer_ids = {gt.reviewer_id for gt in ground_truths}
-            admin_ids = {gt.modified_by_admin_id for gt in ground_truths if gt.modified_by_admin_id}
-            all_user_ids = reviewer_ids | admin_ids
+            ).all())
             
-            user_info = {}
-            if all_user_ids:
-                users = session.scalars(
-                    select(User).where(User.id.in_(all_user_ids))
-                ).all()
-                user_info = {user.id: user.user_id_str for user in users}
-            
-            # Build GT status strings
-            gt_status_by_question = {}
-            for question_id in project_question_ids:
-                if question_id in gt_by_question:
-                    gt = gt_by_question[question_id]
-                    reviewer_name = user_info.get(gt.reviewer_id, f"User {gt.reviewer_id}")
-                    
-                    if gt.modified_by_admin_id:
-                        admin_name = user_info.get(gt.modified_by_admin_id, f"Admin {gt.modified_by_admin_id}")
-                        gt_status_by_question[question_id] = f"🏆 GT by: {reviewer_name} (Overridden by {admin_name})"
-                    else:
-                        gt_status_by_question[question_id] = f"🏆 GT by: {reviewer_name}"
-                else:
-                    gt_status_by_question[question_id] = "📭 No GT"
+            # Ground truth with reviewer and admin names in one query
+            gt_rows = GroundTruthService._fetch_ground_truth_records(
+                video_ids=[video_id], project_id=project_id, session=session
+            )
             
-            return {
-                "ground_truth_dict": gt_dict,
-                "admin_modifications": admin_modifications,
-                "gt_status_by_question": gt_status_by_question,
-                "gt_records": gt_by_question,
-                "has_any_admin_modifications": any(mod["is_modified"] for mod in admin_modifications.values())
-            }
+            return GroundTruthService._build_ground_truth_payload(
+                gt_rows=gt_rows, project_question_ids=project_question_ids
+            )
             
         except Exception as e:
             print(f"Error in get_all_ground_truth_data_for_video: {e}")
@@ -7179,22 +7262,11 @@ class GroundTruthService(BaseAnswerService):
     def get_ground_truth_for_question_group(video_id: int, project_id: int, question_group_id: int, session: Session) -> pd.DataFrame:
         """Get ground truth for all questions in a specific question group."""
         
-        # Use existing service method to get questions
         try:
-            questions = QuestionService.get_questions_by_group_id(group_id=question_group_id, session=session)
-            if not questions:
-                return pd.DataFrame()
-            
-            question_ids = [q["id"] for q in questions]
-            
-            # Get ground truth for these specific questions
+            # Join through group membership instead of loading the group's questions first
             gts = session.scalars(
-                select(ReviewerGroundTruth)
-                .where(
-                    ReviewerGroundTruth.video_id == video_id,
-                    ReviewerGroundTruth.project_id == project_id,
-                    ReviewerGroundTruth.question_id.in_(question_ids)
-                )
+                _GROUP_GROUND_TRUTH_STMT,
+                {"video_id": video_id, "project_id": project_id, "question_group_id": question_group_id}
             ).all()
             
             return pd.DataFrame([
@@ -9676,12 +9748,43 @@ class GroundTruthExportService:
         Raises:
             ValueError: If projects not found or reusable question groups have inconsistent answers
         """
-        # Validate all projects exist
+        return list(GroundTruthExportService.iter_ground_truth_data(project_ids, session))
+    
+    @staticmethod
+    def iter_ground_truth_data(project_ids: List[int], session: Session, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream exported video dictionaries one at a time as they are read from the database.
+        
+        Rows are streamed through a server-side cursor ordered by video, so each video is
+        yielded as soon as its last answer has been read and memory use stays flat.
+        Validation runs eagerly, before the returned iterator is consumed.
+        
+        Args:
+            project_ids: List of project IDs to export from
+            session: Database session
+            batch_size: Number of rows fetched from the cursor at a time
+            
+        Returns:
+            Iterator of video dictionaries with video_uid, url, and answers
+            
+        Raises:
+            ValueError: If projects not found or reusable question groups have inconsistent answers
+        """
+        if not project_ids:
+            return iter(())
+        
+        # Validate all projects exist and load their custom display flags in one query
+        project_rows = {
+            project.id: (project, has_custom_display)
+            for project, has_custom_display in session.execute(
+                select(Project, Schema.has_custom_display)
+                .outerjoin(Schema, Project.schema_id == Schema.id)
+                .where(Project.id.in_(project_ids))
+            ).all()
+        }
         for project_id in project_ids:
-            project = session.get(Project, project_id)
-            if not project:
+            if project_id not in project_rows:
                 raise ValueError(f"Project with ID {project_id} not found")
-            if project.is_archived:
+            if project_rows[project_id][0].is_archived:
                 raise ValueError(f"Project with ID {project_id} is archived")
         
         # Check reusable question group consistency before proceeding
@@ -9690,403 +9793,763 @@ class GroundTruthExportService:
         # Check non-reusable question group constraints
         GroundTruthExportService._validate_non_reusable_question_groups(project_ids, session)
         
-        # Get all unique videos across projects
-        all_videos = set()
-        for project_id in project_ids:
-            from label_pizza.models import ProjectVideo
-            videos = session.scalars(
-                select(ProjectVideo.video_id)
-                .where(ProjectVideo.project_id == project_id)
-            ).all()
-            all_videos.update(videos)
+        # Per-project overlay map of custom displays, only for schemas that enable them
+        custom_display_project_ids = [pid for pid, (_, has_custom) in project_rows.items() if has_custom]
+        overlays = {}
+        if custom_display_project_ids:
+            overlays = {
+                (d.project_id, d.video_id, d.question_id): d
+                for d in session.scalars(
+                    select(ProjectVideoQuestionDisplay)
+                    .where(ProjectVideoQuestionDisplay.project_id.in_(custom_display_project_ids))
+                ).all()
+            }
         
-        # Export data for each video
-        export_data = []
-        for video_id in sorted(all_videos):  # Sort for consistent ordering
-            video = session.get(Video, video_id)
-            if not video or video.is_archived:
-                continue
+        # Ground truth joined to its video and question for every project at once.
+        # Earlier projects in project_ids win when several projects answer the same question.
+        order_by = [ReviewerGroundTruth.video_id]
+        if len(project_ids) > 1:
+            project_rank = {project_id: rank for rank, project_id in enumerate(project_ids)}
+            order_by.append(case(project_rank, value=ReviewerGroundTruth.project_id))
+        order_by.append(ReviewerGroundTruth.question_id)
+        project_video_ids = (
+            select(ProjectVideo.video_id)
+            .where(ProjectVideo.project_id.in_(project_ids))
+            .scalar_subquery()
+        )
+        stmt = (
+            select(
+                ReviewerGroundTruth.project_id,
+                ReviewerGroundTruth.video_id,
+                ReviewerGroundTruth.question_id,
+                ReviewerGroundTruth.answer_value,
+                Video.video_uid,
+                Video.url,
+                Question.text,
+                Question.type,
+                Question.display_text,
+                Question.options,
+                Question.display_values
+            )
+            .join(Video, ReviewerGroundTruth.video_id == Video.id)
+            .join(Question, ReviewerGroundTruth.question_id == Question.id)
+            .where(
+                ReviewerGroundTruth.project_id.in_(project_ids),
+                ReviewerGroundTruth.video_id.in_(project_video_ids),
+                Video.is_archived == False,
+                Question.is_archived == False
+            )
+            .order_by(*order_by)
+            .execution_options(yield_per=batch_size)
+        )
+        
+        def generate_videos() -> Iterator[Dict[str, Any]]:
+            gt_rows = session.execute(stmt)
+            video_data = None
+            for row in gt_rows:
+                if video_data is None or row.video_uid != video_data["video_uid"]:
+                    if video_data is not None:
+                        yield video_data
+                    video_data = {
+                        "video_uid": row.video_uid,
+                        "url": row.url,
+                        "answers": {}, # question.text -> raw answer value
+                        "question_display_text": {}, # question.text -> display text shown
+                        "answer_display_values": {} # question.text -> display value shown
+                    }
                 
-            video_data = {
-                "video_uid": video.video_uid,
-                "url": video.url,
-                "answers": {}, # question.text -> raw answer value
-                "question_display_text": {}, # question.text -> display text shown
-                "answer_display_values": {} # question.text -> display value shown
-            }
-            
-            # Get all ground truth answers for this video across all projects
-            # Use a set to track which questions we've already processed to avoid duplicates
-            processed_questions = set()
-            
-            for project_id in project_ids:
-                gts = session.scalars(
-                    select(ReviewerGroundTruth)
-                    .where(
-                        ReviewerGroundTruth.video_id == video_id,
-                        ReviewerGroundTruth.project_id == project_id
-                    )
-                ).all()
+                # For reusable groups, we've already validated consistency,
+                # so we can safely take the first answer we encounter
+                if row.text in video_data["answers"]:
+                    continue
                 
-                for gt in gts:
-                    question = session.get(Question, gt.question_id)
-                    if question and not question.is_archived:
-                        # For reusable groups, we've already validated consistency,
-                        # so we can safely take the first answer we encounter
-                        if question.text not in processed_questions:
-                            # video_data["answers"][question.text] = gt.answer_value
-                            # processed_questions.add(question.text)
-                            try:
-                                question_with_display = CustomDisplayService.get_custom_display(
-                                    question_id=gt.question_id,
-                                    project_id=project_id,
-                                    video_id=video_id,
-                                    session=session
-                                )
-                                display_text = question_with_display["display_text"]
-                                
-                                # Get display value for the selected answer
-                                if question_with_display["type"] == "single" and question_with_display["display_values"]:
-                                    try:
-                                        option_index = question_with_display["options"].index(gt.answer_value)
-                                        display_value = question_with_display["display_values"][option_index]
-                                    except (ValueError, IndexError):
-                                        display_value = gt.answer_value  # Fallback to raw value
-                                else:
-                                    display_value = gt.answer_value  # For description type or no display values
-                                    
-                            except Exception:
-                                # Fallback to original display text if custom display fails
-                                display_text = question.display_text
-                                display_value = gt.answer_value
-                            
-                            # Store all the information
-                            video_data["answers"][question.text] = gt.answer_value
-                            video_data["question_display_text"][question.text] = display_text
-                            video_data["answer_display_values"][question.text] = display_value
-                            processed_questions.add(question.text)
-                            
-            if video_data["answers"]:  # Only include videos with answers
-                export_data.append(video_data)
+                display_text, display_value = GroundTruthExportService._resolve_export_display(
+                    row=row, overlay=overlays.get((row.project_id, row.video_id, row.question_id))
+                )
+                video_data["answers"][row.text] = row.answer_value
+                video_data["question_display_text"][row.text] = display_text
+                video_data["answer_display_values"][row.text] = display_value
+            
+            if video_data is not None:
+                yield video_data
+        
+        return generate_videos()
+    
+    @staticmethod
+    def get_export_question_texts(project_ids: List[int], session: Session) -> List[str]:
+        """Get the sorted question texts that appear in the ground truth export of these projects.
+        
+        Lets tabular writers lay out their columns before streaming iter_ground_truth_data.
+        
+        Args:
+            project_ids: List of project IDs to export from
+            session: Database session
+            
+        Returns:
+            Sorted list of question texts
+        """
+        project_video_ids = (
+            select(ProjectVideo.video_id)
+            .where(ProjectVideo.project_id.in_(project_ids))
+            .scalar_subquery()
+        )
+        texts = session.scalars(
+            select(Question.text).distinct()
+            .join(ReviewerGroundTruth, ReviewerGroundTruth.question_id == Question.id)
+            .join(Video, ReviewerGroundTruth.video_id == Video.id)
+            .where(
+                ReviewerGroundTruth.project_id.in_(project_ids),
+                ReviewerGroundTruth.video_id.in_(project_video_ids),
+                Video.is_archived == False,
+                Question.is_archived == False
+            )
+        ).all()
+        return sorted(texts)
+    
+    @staticmethod
+    def _resolve_export_display(row: Any, overlay: Optional[ProjectVideoQuestionDisplay]) -> Tuple[str, str]:
+        """Resolve the display text and display value of an exported ground truth answer.
+        
+        Mirrors CustomDisplayService.get_custom_display without touching the database.
+        
+        Args:
+            row: Ground truth row with question type, display_text, options and display_values
+            overlay: Custom display override for the project/video/question, if any
+            
+        Returns:
+            Tuple of (display_text, display_value)
+        """
+        display_text = row.display_text
+        display_values = row.display_values
+        
+        if overlay:
+            if overlay.custom_display_text:
+                display_text = overlay.custom_display_text
+            
+            if overlay.custom_option_display_map and row.type == "single" and row.options:
+                display_values = [
+                    overlay.custom_option_display_map.get(option_value)
+                    or (row.display_values[index] if row.display_values else option_value)
+                    for index, option_value in enumerate(row.options)
+                ]
         
-        return export_data
+        display_value = row.answer_value
+        if row.type == "single" and display_values:
+            try:
+                display_value = display_values[row.options.index(row.answer_value)]
+            except (ValueError, IndexError, AttributeError):
+                display_value = row.answer_value  # Fallback to raw value
+        
+        return display_text, display_value
     
     @staticmethod
     def _validate_reusable_question_groups(project_ids: List[int], session: Session) -> None:
         """Validate that reusable question groups have consistent answers across projects.
         
+        A single grouped query finds every (question, video) of a reusable group whose ground
+        truth differs between the non-archived projects in project_ids.
+        
         Raises:
             ValueError: If inconsistencies are found
         """
-        # Get all reusable question groups used in these projects
-        reusable_groups = session.scalars(
-            select(QuestionGroup)
-            .join(SchemaQuestionGroup, QuestionGroup.id == SchemaQuestionGroup.question_group_id)
-            .join(Project, SchemaQuestionGroup.schema_id == Project.schema_id)
+        conflicts = session.execute(
+            select(QuestionGroup.title, Question.text, Video.video_uid)
+            .select_from(ReviewerGroundTruth)
+            .join(Project, ReviewerGroundTruth.project_id == Project.id)
+            .join(QuestionGroupQuestion, QuestionGroupQuestion.question_id == ReviewerGroundTruth.question_id)
+            .join(SchemaQuestionGroup, and_(
+                SchemaQuestionGroup.schema_id == Project.schema_id,
+                SchemaQuestionGroup.question_group_id == QuestionGroupQuestion.question_group_id
+            ))
+            .join(QuestionGroup, QuestionGroup.id == QuestionGroupQuestion.question_group_id)
+            .join(Question, Question.id == ReviewerGroundTruth.question_id)
+            .join(Video, Video.id == ReviewerGroundTruth.video_id)
             .where(
-                Project.id.in_(project_ids),
+                ReviewerGroundTruth.project_id.in_(project_ids),
+                Project.is_archived == False,
                 QuestionGroup.is_reusable == True,
-                QuestionGroup.is_archived == False
+                QuestionGroup.is_archived == False,
+                Question.is_archived == False
             )
-            .distinct()
+            .group_by(QuestionGroup.id, QuestionGroup.title, Question.id, Question.text, Video.id, Video.video_uid)
+            .having(func.count(distinct(ReviewerGroundTruth.answer_value)) > 1)
+            .order_by(QuestionGroup.id, Question.id, Video.id)
         ).all()
         
-        if not reusable_groups:
-            return  # No reusable groups to validate
+        if not conflicts:
+            return
         
-        # Check consistency for each reusable group
+        # group title -> question text -> inconsistent video uids
         group_inconsistencies = {}
+        for group_title, question_text, video_uid in conflicts:
+            group_inconsistencies.setdefault(group_title, {}).setdefault(question_text, []).append(video_uid)
         
-        for group in reusable_groups:
-            # Get all questions in this group
-            questions = session.scalars(
-                select(Question)
-                .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
-                .where(
-                    QuestionGroupQuestion.question_group_id == group.id,
-                    Question.is_archived == False
-                )
-            ).all()
-            
-            # Find which projects use this reusable group
-            projects_using_group = session.scalars(
-                select(Project.id)
-                .join(SchemaQuestionGroup, Project.schema_id == SchemaQuestionGroup.schema_id)
-                .where(
-                    SchemaQuestionGroup.question_group_id == group.id,
-                    Project.id.in_(project_ids),
-                    Project.is_archived == False
-                )
-            ).all()
-            
-            if len(projects_using_group) < 2:
-                continue  # No conflict possible with only one project
-            
-            # For each question, check consistency across projects
-            for question in questions:
-                # Get all videos that have answers for this question across the relevant projects
-                video_answer_map = {}  # video_id -> {project_id -> answer_value}
-                
-                for project_id in projects_using_group:
-                    gts = session.scalars(
-                        select(ReviewerGroundTruth)
-                        .where(
-                            ReviewerGroundTruth.question_id == question.id,
-                            ReviewerGroundTruth.project_id == project_id
-                        )
-                    ).all()
-                    
-                    for gt in gts:
-                        video_id = gt.video_id
-                        if video_id not in video_answer_map:
-                            video_answer_map[video_id] = {}
-                        video_answer_map[video_id][project_id] = gt.answer_value
-                
-                # Check for inconsistencies - videos that appear in multiple projects with different answers
-                inconsistent_videos = []
-                for video_id, project_answers in video_answer_map.items():
-                    if len(project_answers) > 1:  # Video appears in multiple projects
-                        unique_answers = set(project_answers.values())
-                        if len(unique_answers) > 1:  # Different answers across projects
-                            video = session.get(Video, video_id)
-                            if video:
-                                inconsistent_videos.append(video.video_uid)
-                
-                if inconsistent_videos:
-                    if group.title not in group_inconsistencies:
-                        group_inconsistencies[group.title] = []
-                    group_inconsistencies[group.title].append({
-                        "question": question.text,
-                        "videos": inconsistent_videos
-                    })
+        error_parts = []
+        total_failing_videos = set()
         
-        if group_inconsistencies:
-            error_parts = []
-            total_failing_videos = set()
+        for group_name, inconsistencies in group_inconsistencies.items():
+            group_videos = set()
+            question_details = []
             
-            for group_name, inconsistencies in group_inconsistencies.items():
-                group_videos = set()
-                question_details = []
-                
-                for inc in inconsistencies:
-                    group_videos.update(inc['videos'])
-                    question_details.append(f"    Question '{inc['question']}': {len(inc['videos'])} videos")
-                
-                total_failing_videos.update(group_videos)
-                
-                error_parts.append(
-                    f"Reusable question group '{group_name}' ({len(group_videos)} failing videos):\n" +
-                    "\n".join(question_details)
-                )
+            for question_text, videos in inconsistencies.items():
+                group_videos.update(videos)
+                question_details.append(f"    Question '{question_text}': {len(videos)} videos")
             
-            failing_video_list = sorted(list(total_failing_videos))
+            total_failing_videos.update(group_videos)
             
-            raise ValueError(
-                f"Cannot export due to inconsistent answers in reusable question groups.\n"
-                f"Total videos with inconsistencies: {len(failing_video_list)}\n"
-                f"Failing videos: {', '.join(failing_video_list[:10])}"
-                f"{'...' if len(failing_video_list) > 10 else ''}\n\n"
-                f"Details:\n" + "\n\n".join(error_parts)
+            error_parts.append(
+                f"Reusable question group '{group_name}' ({len(group_videos)} failing videos):\n" +
+                "\n".join(question_details)
             )
+        
+        failing_video_list = sorted(list(total_failing_videos))
+        
+        raise ValueError(
+            f"Cannot export due to inconsistent answers in reusable question groups.\n"
+            f"Total videos with inconsistencies: {len(failing_video_list)}\n"
+            f"Failing videos: {', '.join(failing_video_list[:10])}"
+            f"{'...' if len(failing_video_list) > 10 else ''}\n\n"
+            f"Details:\n" + "\n\n".join(error_parts)
+        )
 
     @staticmethod
     def _validate_non_reusable_question_groups(project_ids: List[int], session: Session) -> None:
         """Validate that non-reusable question groups don't have videos appearing in multiple projects.
         
+        A single grouped query finds every video assigned to two or more of the non-archived
+        projects in project_ids that share a non-reusable group; project names are only
+        loaded when building the error.
+        
         Raises:
             ValueError: If any video appears in multiple projects sharing non-reusable question groups
         """
-        # Get all non-reusable question groups used in these projects
-        non_reusable_groups = session.scalars(
-            select(QuestionGroup)
-            .join(SchemaQuestionGroup, QuestionGroup.id == SchemaQuestionGroup.question_group_id)
+        non_reusable_usage = (
+            select(SchemaQuestionGroup.question_group_id, QuestionGroup.title, Project.id.label("project_id"))
             .join(Project, SchemaQuestionGroup.schema_id == Project.schema_id)
+            .join(QuestionGroup, QuestionGroup.id == SchemaQuestionGroup.question_group_id)
             .where(
                 Project.id.in_(project_ids),
+                Project.is_archived == False,
                 QuestionGroup.is_reusable == False,
                 QuestionGroup.is_archived == False
             )
-            .distinct()
+            .subquery()
+        )
+        overlaps = session.execute(
+            select(non_reusable_usage.c.question_group_id, non_reusable_usage.c.title, Video.video_uid)
+            .select_from(ProjectVideo)
+            .join(non_reusable_usage, non_reusable_usage.c.project_id == ProjectVideo.project_id)
+            .join(Video, Video.id == ProjectVideo.video_id)
+            .group_by(non_reusable_usage.c.question_group_id, non_reusable_usage.c.title, Video.id, Video.video_uid)
+            .having(func.count(distinct(ProjectVideo.project_id)) > 1)
+            .order_by(non_reusable_usage.c.question_group_id, Video.video_uid)
         ).all()
         
-        if not non_reusable_groups:
-            return  # No non-reusable groups to validate
+        if not overlaps:
+            return
         
-        # Check for violations for each non-reusable group
+        # group id -> (title, overlapping video uids)
         group_violations = {}
+        for group_id, group_title, video_uid in overlaps:
+            group_violations.setdefault(group_id, (group_title, []))[1].append(video_uid)
+        
+        # Projects using each violating group, for the error message
+        projects_by_group = {}
+        for group_id, project_id, project_name in session.execute(
+            select(non_reusable_usage.c.question_group_id, Project.id, Project.name)
+            .join(Project, Project.id == non_reusable_usage.c.project_id)
+            .where(non_reusable_usage.c.question_group_id.in_(list(group_violations)))
+            .order_by(Project.id)
+        ).all():
+            projects_by_group.setdefault(group_id, []).append(f"'{project_name}' (ID: {project_id})")
+        
+        error_parts = []
+        total_failing_videos = set()
+        
+        for group_id, (group_name, videos) in group_violations.items():
+            total_failing_videos.update(videos)
+            
+            error_parts.append(
+                f"Non-reusable question group '{group_name}' is used in multiple projects:\n"
+                f"    Projects: {', '.join(projects_by_group.get(group_id, []))}\n"
+                f"    Overlapping videos ({len(videos)}): {', '.join(videos[:10])}"
+                f"{'...' if len(videos) > 10 else ''}"
+            )
+        
+        raise ValueError(
+            f"Cannot export due to non-reusable question groups being shared across projects.\n"
+            f"Non-reusable groups should only be used in one project each.\n"
+            f"Total videos affected: {len(total_failing_videos)}\n\n"
+            f"Violations:\n" + "\n\n".join(error_parts)
+        )
+
+class ArrowExportService:
+    """Columnar (Apache Arrow) views of annotator answers, ground truth and reviews.
+    
+    Every row carries its project name and question group title so the tables can be
+    written as partitioned Parquet datasets. Repeated strings (names, question text,
+    option values) are dictionary-encoded. Requires the optional pyarrow dependency.
+    """
+    
+    @staticmethod
+    def _require_pyarrow():
+        """Import pyarrow or raise a helpful ImportError."""
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("pyarrow is required for columnar export. Install with: pip install pyarrow")
+        return pyarrow
+    
+    @staticmethod
+    def answers_schema():
+        """Arrow schema of the annotator answers table."""
+        pa = ArrowExportService._require_pyarrow()
+        dict_string = pa.dictionary(pa.int32(), pa.string())
+        timestamp = pa.timestamp("us", tz="UTC")
+        return pa.schema([
+            ("project_name", dict_string),
+            ("question_group_title", dict_string),
+            ("answer_id", pa.int64()),
+            ("project_id", pa.int32()),
+            ("video_id", pa.int32()),
+            ("question_id", pa.int32()),
+            ("user_id", pa.int32()),
+            ("video_uid", dict_string),
+            ("question_text", dict_string),
+            ("user_name", dict_string),
+            ("answer_type", dict_string),
+            ("answer_value", dict_string),
+            ("confidence_score", pa.float32()),
+            ("created_at", timestamp),
+            ("modified_at", timestamp),
+            ("notes", pa.string()),
+        ])
+    
+    @staticmethod
+    def ground_truth_schema():
+        """Arrow schema of the ground truth table."""
+        pa = ArrowExportService._require_pyarrow()
+        dict_string = pa.dictionary(pa.int32(), pa.string())
+        timestamp = pa.timestamp("us", tz="UTC")
+        return pa.schema([
+            ("project_name", dict_string),
+            ("question_group_title", dict_string),
+            ("project_id", pa.int32()),
+            ("video_id", pa.int32()),
+            ("question_id", pa.int32()),
+            ("reviewer_id", pa.int32()),
+            ("video_uid", dict_string),
+            ("question_text", dict_string),
+            ("reviewer_name", dict_string),
+            ("answer_type", dict_string),
+            ("answer_value", dict_string),
+            ("original_answer_value", dict_string),
+            ("confidence_score", pa.float32()),
+            ("modified_by_admin_name", dict_string),
+            ("created_at", timestamp),
+            ("modified_at", timestamp),
+            ("modified_by_admin_at", timestamp),
+            ("notes", pa.string()),
+        ])
+    
+    @staticmethod
+    def reviews_schema():
+        """Arrow schema of the answer reviews table."""
+        pa = ArrowExportService._require_pyarrow()
+        dict_string = pa.dictionary(pa.int32(), pa.string())
+        return pa.schema([
+            ("project_name", dict_string),
+            ("question_group_title", dict_string),
+            ("review_id", pa.int64()),
+            ("answer_id", pa.int64()),
+            ("video_uid", dict_string),
+            ("question_text", dict_string),
+            ("annotator_name", dict_string),
+            ("reviewer_name", dict_string),
+            ("status", dict_string),
+            ("comment", pa.string()),
+            ("reviewed_at", pa.timestamp("us", tz="UTC")),
+        ])
+    
+    @staticmethod
+    def _answers_statement(project_ids: Optional[List[int]]):
+        stmt = (
+            select(
+                Project.name, QuestionGroup.title, AnnotatorAnswer.id, AnnotatorAnswer.project_id,
+                AnnotatorAnswer.video_id, AnnotatorAnswer.question_id, AnnotatorAnswer.user_id,
+                Video.video_uid, Question.text, User.user_id_str, AnnotatorAnswer.answer_type,
+                AnnotatorAnswer.answer_value, AnnotatorAnswer.confidence_score,
+                AnnotatorAnswer.created_at, AnnotatorAnswer.modified_at, AnnotatorAnswer.notes
+            )
+            .join(Project, AnnotatorAnswer.project_id == Project.id)
+            .join(SchemaQuestionGroup, SchemaQuestionGroup.schema_id == Project.schema_id)
+            .join(QuestionGroupQuestion, and_(
+                QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id,
+                QuestionGroupQuestion.question_id == AnnotatorAnswer.question_id
+            ))
+            .join(QuestionGroup, QuestionGroup.id == QuestionGroupQuestion.question_group_id)
+            .join(Question, Question.id == AnnotatorAnswer.question_id)
+            .join(Video, Video.id == AnnotatorAnswer.video_id)
+            .join(User, User.id == AnnotatorAnswer.user_id)
+            .order_by(Project.name, QuestionGroup.title, AnnotatorAnswer.video_id)
+        )
+        if project_ids is not None:
+            stmt = stmt.where(AnnotatorAnswer.project_id.in_(project_ids))
+        return stmt
+    
+    @staticmethod
+    def _ground_truth_statement(project_ids: Optional[List[int]]):
+        reviewer = aliased(User)
+        admin = aliased(User)
+        stmt = (
+            select(
+                Project.name, QuestionGroup.title, ReviewerGroundTruth.project_id,
+                ReviewerGroundTruth.video_id, ReviewerGroundTruth.question_id, ReviewerGroundTruth.reviewer_id,
+                Video.video_uid, Question.text, reviewer.user_id_str, ReviewerGroundTruth.answer_type,
+                ReviewerGroundTruth.answer_value, ReviewerGroundTruth.original_answer_value,
+                ReviewerGroundTruth.confidence_score, admin.user_id_str,
+                ReviewerGroundTruth.created_at, ReviewerGroundTruth.modified_at,
+                ReviewerGroundTruth.modified_by_admin_at, ReviewerGroundTruth.notes
+            )
+            .join(Project, ReviewerGroundTruth.project_id == Project.id)
+            .join(SchemaQuestionGroup, SchemaQuestionGroup.schema_id == Project.schema_id)
+            .join(QuestionGroupQuestion, and_(
+                QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id,
+                QuestionGroupQuestion.question_id == ReviewerGroundTruth.question_id
+            ))
+            .join(QuestionGroup, QuestionGroup.id == QuestionGroupQuestion.question_group_id)
+            .join(Question, Question.id == ReviewerGroundTruth.question_id)
+            .join(Video, Video.id == ReviewerGroundTruth.video_id)
+            .outerjoin(reviewer, reviewer.id == ReviewerGroundTruth.reviewer_id)
+            .outerjoin(admin, admin.id == ReviewerGroundTruth.modified_by_admin_id)
+            .order_by(Project.name, QuestionGroup.title, ReviewerGroundTruth.video_id)
+        )
+        if project_ids is not None:
+            stmt = stmt.where(ReviewerGroundTruth.project_id.in_(project_ids))
+        return stmt
+    
+    @staticmethod
+    def _reviews_statement(project_ids: Optional[List[int]]):
+        annotator = aliased(User)
+        reviewer = aliased(User)
+        stmt = (
+            select(
+                Project.name, QuestionGroup.title, AnswerReview.id, AnswerReview.answer_id,
+                Video.video_uid, Question.text, annotator.user_id_str, reviewer.user_id_str,
+                cast(AnswerReview.status, String), AnswerReview.comment, AnswerReview.reviewed_at
+            )
+            .join(AnnotatorAnswer, AnnotatorAnswer.id == AnswerReview.answer_id)
+            .join(Project, AnnotatorAnswer.project_id == Project.id)
+            .join(SchemaQuestionGroup, SchemaQuestionGroup.schema_id == Project.schema_id)
+            .join(QuestionGroupQuestion, and_(
+                QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id,
+                QuestionGroupQuestion.question_id == AnnotatorAnswer.question_id
+            ))
+            .join(QuestionGroup, QuestionGroup.id == QuestionGroupQuestion.question_group_id)
+            .join(Question, Question.id == AnnotatorAnswer.question_id)
+            .join(Video, Video.id == AnnotatorAnswer.video_id)
+            .outerjoin(annotator, annotator.id == AnnotatorAnswer.user_id)
+            .outerjoin(reviewer, reviewer.id == AnswerReview.reviewer_id)
+            .order_by(Project.name, QuestionGroup.title, AnnotatorAnswer.video_id)
+        )
+        if project_ids is not None:
+            stmt = stmt.where(AnnotatorAnswer.project_id.in_(project_ids))
+        return stmt
+    
+    @staticmethod
+    def _iter_record_batches(stmt, schema, session: Session, batch_size: int):
+        """Execute stmt through a server-side cursor and yield Arrow record batches matching schema."""
+        pa = ArrowExportService._require_pyarrow()
+        result = session.execute(stmt.execution_options(yield_per=batch_size))
+        for rows in result.partitions(batch_size):
+            columns = list(zip(*rows))
+            arrays = []
+            for field, values in zip(schema, columns):
+                if pa.types.is_dictionary(field.type):
+                    arrays.append(pa.array(values, type=field.type.value_type).dictionary_encode().cast(field.type))
+                else:
+                    arrays.append(pa.array(values, type=field.type))
+            yield pa.record_batch(arrays, schema=schema)
+    
+    @staticmethod
+    def iter_answer_batches(session: Session, project_ids: Optional[List[int]] = None, batch_size: int = 65536):
+        """Yield annotator answers as Arrow record batches (see answers_schema)."""
+        return ArrowExportService._iter_record_batches(
+            ArrowExportService._answers_statement(project_ids), ArrowExportService.answers_schema(), session, batch_size
+        )
+    
+    @staticmethod
+    def iter_ground_truth_batches(session: Session, project_ids: Optional[List[int]] = None, batch_size: int = 65536):
+        """Yield ground truth as Arrow record batches (see ground_truth_schema)."""
+        return ArrowExportService._iter_record_batches(
+            ArrowExportService._ground_truth_statement(project_ids), ArrowExportService.ground_truth_schema(), session, batch_size
+        )
+    
+    @staticmethod
+    def iter_review_batches(session: Session, project_ids: Optional[List[int]] = None, batch_size: int = 65536):
+        """Yield answer reviews as Arrow record batches (see reviews_schema)."""
+        return ArrowExportService._iter_record_batches(
+            ArrowExportService._reviews_statement(project_ids), ArrowExportService.reviews_schema(), session, batch_size
+        )
+    
+    @staticmethod
+    def get_answers_table(session: Session, project_ids: Optional[List[int]] = None):
+        """Get annotator answers as an in-memory Arrow table.
         
-        for group in non_reusable_groups:
-            # Find which projects use this non-reusable group
-            projects_using_group = session.scalars(
-                select(Project.id)
-                .join(SchemaQuestionGroup, Project.schema_id == SchemaQuestionGroup.schema_id)
-                .where(
-                    SchemaQuestionGroup.question_group_id == group.id,
-                    Project.id.in_(project_ids),
-                    Project.is_archived == False
-                )
-            ).all()
+        Args:
+            session: Database session
+            project_ids: Restrict to these projects (all projects if None)
             
-            if len(projects_using_group) < 2:
-                continue  # No violation possible with only one project
-            
-            # Get all videos for each project using this group
-            project_videos = {}  # project_id -> set of video_ids
-            for project_id in projects_using_group:
-                videos = set(session.scalars(
-                    select(ProjectVideo.video_id)
-                    .where(ProjectVideo.project_id == project_id)
-                ).all())
-                project_videos[project_id] = videos
-            
-            # Check for overlapping videos between projects
-            overlapping_videos = set()
-            project_list = list(projects_using_group)
-            
-            for i in range(len(project_list)):
-                for j in range(i + 1, len(project_list)):
-                    project1_id = project_list[i]
-                    project2_id = project_list[j]
-                    
-                    overlap = project_videos[project1_id] & project_videos[project2_id]
-                    if overlap:
-                        overlapping_videos.update(overlap)
-            
-            if overlapping_videos:
-                # Get video UIDs for better error messages
-                video_uids = []
-                for video_id in overlapping_videos:
-                    video = session.get(Video, video_id)
-                    if video:
-                        video_uids.append(video.video_uid)
-                
-                group_violations[group.title] = {
-                    "videos": sorted(video_uids),
-                    "projects": projects_using_group
-                }
+        Returns:
+            pyarrow.Table with one row per answer and question group
+        """
+        pa = ArrowExportService._require_pyarrow()
+        return pa.Table.from_batches(
+            ArrowExportService.iter_answer_batches(session, project_ids), schema=ArrowExportService.answers_schema()
+        ).unify_dictionaries()
+    
+    @staticmethod
+    def get_ground_truth_table(session: Session, project_ids: Optional[List[int]] = None):
+        """Get ground truth as an in-memory Arrow table.
         
-        if group_violations:
-            error_parts = []
-            total_failing_videos = set()
+        Args:
+            session: Database session
+            project_ids: Restrict to these projects (all projects if None)
             
-            for group_name, violation in group_violations.items():
-                total_failing_videos.update(violation['videos'])
-                
-                # Get project names for better error messages
-                project_names = []
-                for project_id in violation['projects']:
-                    project = session.get(Project, project_id)
-                    if project:
-                        project_names.append(f"'{project.name}' (ID: {project_id})")
-                
-                error_parts.append(
-                    f"Non-reusable question group '{group_name}' is used in multiple projects:\n"
-                    f"    Projects: {', '.join(project_names)}\n"
-                    f"    Overlapping videos ({len(violation['videos'])}): {', '.join(violation['videos'][:10])}"
-                    f"{'...' if len(violation['videos']) > 10 else ''}"
-                )
+        Returns:
+            pyarrow.Table with one row per ground truth answer and question group
+        """
+        pa = ArrowExportService._require_pyarrow()
+        return pa.Table.from_batches(
+            ArrowExportService.iter_ground_truth_batches(session, project_ids), schema=ArrowExportService.ground_truth_schema()
+        ).unify_dictionaries()
+    
+    @staticmethod
+    def get_reviews_table(session: Session, project_ids: Optional[List[int]] = None):
+        """Get answer reviews as an in-memory Arrow table.
+        
+        Args:
+            session: Database session
+            project_ids: Restrict to these projects (all projects if None)
             
-            raise ValueError(
-                f"Cannot export due to non-reusable question groups being shared across projects.\n"
-                f"Non-reusable groups should only be used in one project each.\n"
-                f"Total videos affected: {len(total_failing_videos)}\n\n"
-                f"Violations:\n" + "\n\n".join(error_parts)
-            )
-
-def save_export_as_json(export_data: List[Dict[str, Any]], filepath: str) -> None:
-    """Save export data as JSON file with pretty formatting."""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        import json
-        json.dump(export_data, f, indent=2, ensure_ascii=False)
+        Returns:
+            pyarrow.Table with one row per review and question group
+        """
+        pa = ArrowExportService._require_pyarrow()
+        return pa.Table.from_batches(
+            ArrowExportService.iter_review_batches(session, project_ids), schema=ArrowExportService.reviews_schema()
+        ).unify_dictionaries()
 
 
-def save_export_as_excel(export_data: List[Dict[str, Any]], filepath_or_buffer) -> None:
-    """Save export data as Excel file with pretty formatting."""
-    if not export_data:
-        # Create empty Excel file
-        pd.DataFrame({"Message": ["No data to export"]}).to_excel(filepath_or_buffer, index=False)
-        return
+class _ExportTarget:
+    """Open an export destination: a file path, "-" for stdout, or an open text stream."""
+    
+    def __init__(self, target):
+        self.target = target
+        self.stream = None
+        self.owns_stream = False
     
-    # Collect all unique question texts
-    all_questions = set()
-    for video in export_data:
-        all_questions.update(video["answers"].keys())
+    def __enter__(self):
+        if self.target == "-":
+            self.stream = sys.stdout
+        elif hasattr(self.target, "write"):
+            self.stream = self.target
+        else:
+            self.stream = open(self.target, 'w', encoding='utf-8')
+            self.owns_stream = True
+        return self.stream
     
-    all_questions = sorted(list(all_questions))
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.owns_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+        return False
+
+
+def write_ndjson(records: Iterable[Dict[str, Any]], target) -> int:
+    """Stream records as newline-delimited JSON, one record per line.
     
-    # Prepare data for DataFrame
-    rows = []
-    for video in export_data:
-        row = {
-            "Video UID": video["video_uid"],
-            "URL": video["url"]
-        }
+    Args:
+        records: Iterable of JSON-serializable dictionaries (typically a generator)
+        target: File path, "-" for stdout, or an open text stream
         
-        # Add answers for each question
-        for i, question in enumerate(all_questions):
-            display_text = video["question_display_text"].get(question, question)
-            display_value = video["answer_display_values"].get(question, "")
-            
-            row[f"Q{i}: {question}"] = display_text      # Custom display question text
-            row[f"Q{i} Answer"] = display_value          # Custom display answer value
+    Returns:
+        Number of records written
+    """
+    import json
+    count = 0
+    with _ExportTarget(target) as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def write_json_array(records: Iterable[Dict[str, Any]], target, indent: int = 2) -> int:
+    """Stream records as a JSON array without holding the whole array in memory.
+    
+    Output is byte-for-byte identical to json.dump(list(records), f, indent=indent, ensure_ascii=False).
+    
+    Args:
+        records: Iterable of JSON-serializable dictionaries (typically a generator)
+        target: File path, "-" for stdout, or an open text stream
+        indent: Indentation level of the array
         
-        rows.append(row)
+    Returns:
+        Number of records written
+    """
+    import json
+    import textwrap
+    count = 0
+    prefix = " " * indent
+    with _ExportTarget(target) as f:
+        for record in records:
+            f.write("[\n" if count == 0 else ",\n")
+            f.write(textwrap.indent(json.dumps(record, indent=indent, ensure_ascii=False), prefix))
+            count += 1
+        f.write("\n]" if count else "[]")
+    return count
+
+
+def save_export_as_json(export_data: Iterable[Dict[str, Any]], filepath: str) -> None:
+    """Save export data as JSON file with pretty formatting."""
+    write_json_array(export_data, filepath, indent=2)
+
+
+def save_export_as_ndjson(export_data: Iterable[Dict[str, Any]], filepath: str) -> None:
+    """Save export data as newline-delimited JSON, one video per line."""
+    write_ndjson(export_data, filepath)
+
+
+EXCEL_MAX_ROWS = 1048576
+
+
+def write_excel(records: Iterable[Dict[str, Any]], target, questions: List[str],
+                sheet_name: str = "Ground Truth Export", max_rows_per_sheet: int = EXCEL_MAX_ROWS - 1,
+                width_sample_rows: int = 1000) -> int:
+    """Stream exported videos into an Excel workbook in openpyxl write-only mode.
     
-    # Create DataFrame
-    df = pd.DataFrame(rows)
+    Rows are written as they are read from records, so memory does not grow with the
+    export size. When a sheet reaches max_rows_per_sheet data rows, writing continues
+    on "<sheet_name> (2)", "<sheet_name> (3)", ... with the same header. Column widths
+    are sized from the header and the first width_sample_rows rows.
     
-    # Save to Excel with formatting
-    try:
-        with pd.ExcelWriter(filepath_or_buffer, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Ground Truth Export', index=False)
-            
-            # Get the workbook and worksheet
-            workbook = writer.book
-            worksheet = writer.sheets['Ground Truth Export']
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                # Set width with some padding, cap at reasonable size
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            # Style the header row
-            try:
-                from openpyxl.styles import Font, PatternFill, Alignment
-                
-                header_font = Font(bold=True)
-                header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-                center_alignment = Alignment(horizontal="center", vertical="center")
-                
-                for cell in worksheet[1]:  # First row
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = center_alignment
-                    
-                # Freeze the header row
-                worksheet.freeze_panes = "A2"
-                
-            except ImportError:
-                # If openpyxl styling modules aren't available, skip formatting
-                pass
-                
-    except Exception as e:
-        # Fallback to basic Excel export if formatting fails
-        df.to_excel(filepath_or_buffer, index=False)
-        if hasattr(filepath_or_buffer, 'write'):  # It's a buffer, not a file path
-            pass  # Don't print for buffers
-        else:
-            print(f"Warning: Excel formatting failed ({e}), saved with basic formatting")
+    Args:
+        records: Iterable of exported video dictionaries (typically a generator)
+        target: File path or binary stream
+        questions: Question texts in column order (see GroundTruthExportService.get_export_question_texts)
+        sheet_name: Title of the first sheet
+        max_rows_per_sheet: Data rows per sheet before starting a new one
+        width_sample_rows: Number of leading rows used to size columns
+        
+    Returns:
+        Number of videos written
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.utils import get_column_letter
+    
+    header = ["Video UID", "URL"]
+    for i, question in enumerate(questions):
+        header.extend([f"Q{i}: {question}", f"Q{i} Answer"])
+    
+    def to_row(video: Dict[str, Any]) -> List[Any]:
+        row = [video["video_uid"], video["url"]]
+        for question in questions:
+            row.append(video["question_display_text"].get(question, question))  # Custom display question text
+            row.append(video["answer_display_values"].get(question, ""))       # Custom display answer value
+        return row
+    
+    records = iter(records)
+    sample = []
+    for video in records:
+        sample.append(to_row(video))
+        if len(sample) >= width_sample_rows:
+            break
+    
+    # Set width with some padding, cap at reasonable size
+    widths = [len(str(value)) for value in header]
+    for row in sample:
+        for i, value in enumerate(row):
+            if value is not None:
+                widths[i] = max(widths[i], len(str(value)))
+    widths = [min(width + 2, 50) for width in widths]
+    
+    workbook = Workbook(write_only=True)
+    header_font = Font(bold=True)
+    header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+    center_alignment = Alignment(horizontal="center", vertical="center")
+    
+    def new_sheet(index: int):
+        sheet = workbook.create_sheet(sheet_name if index == 1 else f"{sheet_name} ({index})")
+        for i, width in enumerate(widths, start=1):
+            sheet.column_dimensions[get_column_letter(i)].width = width
+        # Freeze the header row
+        sheet.freeze_panes = "A2"
+        cells = []
+        for value in header:
+            cell = WriteOnlyCell(sheet, value=value)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = center_alignment
+            cells.append(cell)
+        sheet.append(cells)
+        return sheet
+    
+    sheet_index = 1
+    sheet = new_sheet(sheet_index)
+    sheet_rows = 0
+    count = 0
+    
+    def all_rows():
+        yield from sample
+        for video in records:
+            yield to_row(video)
+    
+    for row in all_rows():
+        if sheet_rows >= max_rows_per_sheet:
+            sheet_index += 1
+            sheet = new_sheet(sheet_index)
+            sheet_rows = 0
+        sheet.append(row)
+        sheet_rows += 1
+        count += 1
+    
+    workbook.save(target)
+    return count
+
+
+def save_export_as_excel(export_data: Iterable[Dict[str, Any]], filepath_or_buffer, questions: Optional[List[str]] = None) -> int:
+    """Save export data as Excel file with pretty formatting.
+    
+    Pass questions (from GroundTruthExportService.get_export_question_texts) to stream
+    a generator in constant memory; without it, export_data is read once up front to
+    collect the question columns.
+    """
+    if questions is None:
+        # Collect all unique question texts
+        export_data = list(export_data)
+        all_questions = set()
+        for video in export_data:
+            all_questions.update(video["answers"].keys())
+        questions = sorted(all_questions)
+    
+    records = iter(export_data)
+    first = next(records, None)
+    if first is None:
+        # Create empty Excel file
+        from openpyxl import Workbook
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        sheet.append(["Message"])
+        sheet.append(["No data to export"])
+        workbook.save(filepath_or_buffer)
+        return 0
+    
+    return write_excel(itertools.chain([first], records), filepath_or_buffer, questions)
 
 
 # Example usage function
@@ -10095,34 +10558,42 @@ def export_projects_ground_truth(project_ids: List[int], output_path: str, forma
     
     Args:
         project_ids: List of project IDs to export
-        output_path: Path for output file
-        format_type: "json" or "excel"
+        output_path: Path for output file, or "-" to stream JSON/NDJSON to stdout
+        format_type: "json", "ndjson" or "excel"
         session: Database session
     """
     if session is None:
         raise ValueError("Database session is required")
     
     try:
-        # Export the data
-        export_data = GroundTruthExportService.export_ground_truth_data(project_ids, session)
+        if format_type not in ["json", "ndjson", "excel"]:
+            raise ValueError(f"Unsupported format: {format_type}")
         
         # Ensure correct file extension
-        output_path = Path(output_path)
-        if format_type == "json" and not output_path.suffix.lower() == ".json":
-            output_path = output_path.with_suffix(".json")
-        elif format_type == "excel" and not output_path.suffix.lower() in [".xlsx", ".xls"]:
-            output_path = output_path.with_suffix(".xlsx")
-        
-        # Save the data
+        if output_path != "-":
+            output_path = Path(output_path)
+            if format_type == "json" and not output_path.suffix.lower() == ".json":
+                output_path = output_path.with_suffix(".json")
+            elif format_type == "ndjson" and not output_path.suffix.lower() == ".ndjson":
+                output_path = output_path.with_suffix(".ndjson")
+            elif format_type == "excel" and not output_path.suffix.lower() in [".xlsx", ".xls"]:
+                output_path = output_path.with_suffix(".xlsx")
+            output_path = str(output_path)
+        
+        # JSON formats stream videos straight from the database cursor to the output
+        records = GroundTruthExportService.iter_ground_truth_data(project_ids, session)
         if format_type == "json":
-            save_export_as_json(export_data, str(output_path))
-        elif format_type == "excel":
-            save_export_as_excel(export_data, str(output_path))
+            count = write_json_array(records, output_path, indent=2)
+        elif format_type == "ndjson":
+            count = write_ndjson(records, output_path)
         else:
-            raise ValueError(f"Unsupported format: {format_type}")
+            questions = GroundTruthExportService.get_export_question_texts(project_ids, session)
+            count = save_export_as_excel(records, output_path, questions=questions)
         
-        print(f"Successfully exported {len(export_data)} videos to {output_path}")
-        return str(output_path)
+        # Keep stdout clean for downstream consumers when streaming
+        if output_path != "-":
+            print(f"Successfully exported {count} videos to {output_path}")
+        return output_path
         
     except ValueError as e:
         print(f"Export failed: {e}")
@@ -10132,76 +10603,73 @@ def export_projects_ground_truth(project_ids: List[int], output_path: str, forma
         raise
 
 class GoogleSheetsExportService:
-    """Service for generating Google Sheets export data with comprehensive statistics."""
+    """Service for generating Google Sheets export data with comprehensive statistics.
+    
+    Statistics are computed for all users at once with grouped queries, so the
+    number of queries per export does not grow with the number of users or projects.
+    """
     
     @staticmethod
-    def get_master_sheet_annotator_data(session: Session) -> List[Dict[str, Any]]:
-        """Get master sheet data for annotators tab."""
-        annotators = []
-        
-        # Get all users who have annotator role assignments
-        annotator_users = session.scalars(
-            select(User)
+    def _count_if(condition):
+        """SUM(CASE WHEN condition THEN 1 ELSE 0 END); rows where condition is NULL count as 0"""
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+    
+    @staticmethod
+    def _latest(*timestamps):
+        """Latest of the given timestamps, or None if all are missing"""
+        present = [timestamp for timestamp in timestamps if timestamp is not None]
+        return max(present) if present else None
+    
+    @staticmethod
+    def _role_user_counts(role: str, session: Session) -> List[Any]:
+        """Active users with an active role, with their assigned and completed project counts."""
+        return session.execute(
+            select(
+                User.id, User.user_id_str, User.email, User.user_type,
+                func.count().label("assigned_projects"),
+                func.count(ProjectUserRole.completed_at).label("projects_completed")
+            )
             .join(ProjectUserRole, User.id == ProjectUserRole.user_id)
             .join(Project, ProjectUserRole.project_id == Project.id)
             .where(
-                ProjectUserRole.role == "annotator",
+                ProjectUserRole.role == role,
                 ProjectUserRole.is_archived == False,
                 Project.is_archived == False,
                 User.is_archived == False
             )
-            .distinct()
+            .group_by(User.id, User.user_id_str, User.email, User.user_type)
+            .order_by(User.id)
         ).all()
-        
-        for user in annotator_users:
-            # Count assigned projects
-            assigned_projects = session.scalar(
-                select(func.count())
-                .select_from(ProjectUserRole)
-                .join(Project, ProjectUserRole.project_id == Project.id)
-                .where(
-                    ProjectUserRole.user_id == user.id,
-                    ProjectUserRole.role == "annotator",
-                    ProjectUserRole.is_archived == False,
-                    Project.is_archived == False
+    
+    @staticmethod
+    def get_master_sheet_annotator_data(session: Session) -> List[Dict[str, Any]]:
+        """Get master sheet data for annotators tab."""
+        users = GoogleSheetsExportService._role_user_counts("annotator", session)
+        
+        # Projects started (has at least one annotation) and last annotation time
+        activity = {
+            row.user_id: row for row in session.execute(
+                select(
+                    AnnotatorAnswer.user_id,
+                    func.count(func.distinct(AnnotatorAnswer.project_id)).label("projects_started"),
+                    func.max(AnnotatorAnswer.modified_at).label("last_annotation_time")
                 )
+                .group_by(AnnotatorAnswer.user_id)
             )
-            
-            # Count projects started (has at least one annotation)
-            projects_started = session.scalar(
-                select(func.count(func.distinct(AnnotatorAnswer.project_id)))
-                .where(AnnotatorAnswer.user_id == user.id)
-            )
-            
-            # Count projects completed (has completed_at timestamp)
-            projects_completed = session.scalar(
-                select(func.count())
-                .select_from(ProjectUserRole)
-                .join(Project, ProjectUserRole.project_id == Project.id)
-                .where(
-                    ProjectUserRole.user_id == user.id,
-                    ProjectUserRole.role == "annotator",
-                    ProjectUserRole.completed_at.isnot(None),
-                    ProjectUserRole.is_archived == False,
-                    Project.is_archived == False
-                )
-            )
-            
-            # Get last annotation time
-            last_annotation = session.scalar(
-                select(func.max(AnnotatorAnswer.modified_at))
-                .where(AnnotatorAnswer.user_id == user.id)
-            )
-            
+        }
+        
+        annotators = []
+        for user in users:
+            user_activity = activity.get(user.id)
             annotators.append({
                 "user_name": user.user_id_str,
                 "email": user.email or "",
                 "role": user.user_type,
                 "user_id": user.id,
-                "assigned_projects": assigned_projects or 0,
-                "projects_started": projects_started or 0,
-                "projects_completed": projects_completed or 0,
-                "last_annotation_time": last_annotation
+                "assigned_projects": user.assigned_projects,
+                "projects_started": user_activity.projects_started if user_activity else 0,
+                "projects_completed": user.projects_completed,
+                "last_annotation_time": user_activity.last_annotation_time if user_activity else None
             })
         
         return annotators
@@ -10209,78 +10677,46 @@ class GoogleSheetsExportService:
     @staticmethod
     def get_master_sheet_reviewer_data(session: Session) -> List[Dict[str, Any]]:
         """Get master sheet data for reviewers tab."""
-        reviewers = []
-        
-        # Get all users who have reviewer role assignments
-        reviewer_users = session.scalars(
-            select(User)
-            .join(ProjectUserRole, User.id == ProjectUserRole.user_id)
-            .join(Project, ProjectUserRole.project_id == Project.id)
-            .where(
-                ProjectUserRole.role == "reviewer",
-                ProjectUserRole.is_archived == False,
-                Project.is_archived == False,
-                User.is_archived == False
+        users = GoogleSheetsExportService._role_user_counts("reviewer", session)
+        
+        gt_activity = {
+            row.reviewer_id: row for row in session.execute(
+                select(
+                    ReviewerGroundTruth.reviewer_id,
+                    func.count(func.distinct(ReviewerGroundTruth.project_id)).label("projects"),
+                    func.max(ReviewerGroundTruth.created_at).label("last_time")
+                )
+                .group_by(ReviewerGroundTruth.reviewer_id)
             )
-            .distinct()
-        ).all()
+        }
         
-        for user in reviewer_users:
-            # Count assigned projects
-            assigned_projects = session.scalar(
-                select(func.count())
-                .select_from(ProjectUserRole)
-                .join(Project, ProjectUserRole.project_id == Project.id)
-                .where(
-                    ProjectUserRole.user_id == user.id,
-                    ProjectUserRole.role == "reviewer",
-                    ProjectUserRole.is_archived == False,
-                    Project.is_archived == False
+        review_activity = {
+            row.reviewer_id: row for row in session.execute(
+                select(
+                    AnswerReview.reviewer_id,
+                    func.count(func.distinct(AnnotatorAnswer.project_id)).label("projects"),
+                    func.max(AnswerReview.reviewed_at).label("last_time")
                 )
+                .outerjoin(AnnotatorAnswer, AnswerReview.answer_id == AnnotatorAnswer.id)
+                .group_by(AnswerReview.reviewer_id)
             )
-            
-            # Count projects started (has ground truth or answer review)
-            gt_projects = session.scalar(
-                select(func.count(func.distinct(ReviewerGroundTruth.project_id)))
-                .where(ReviewerGroundTruth.reviewer_id == user.id)
-            )
-            
-            review_projects = session.scalar(
-                select(func.count(func.distinct(AnnotatorAnswer.project_id)))
-                .select_from(AnswerReview)
-                .join(AnnotatorAnswer, AnswerReview.answer_id == AnnotatorAnswer.id)
-                .where(AnswerReview.reviewer_id == user.id)
-            )
-            
-            projects_started = max(gt_projects or 0, review_projects or 0)
-            
-            # Get last review time
-            last_gt_time = session.scalar(
-                select(func.max(ReviewerGroundTruth.created_at))
-                .where(ReviewerGroundTruth.reviewer_id == user.id)
-            )
-            
-            last_review_time = session.scalar(
-                select(func.max(AnswerReview.reviewed_at))
-                .where(AnswerReview.reviewer_id == user.id)
-            )
-            
-            last_activity = max(
-                last_gt_time or datetime.min.replace(tzinfo=timezone.utc),
-                last_review_time or datetime.min.replace(tzinfo=timezone.utc)
-            )
-            
-            if last_activity == datetime.min.replace(tzinfo=timezone.utc):
-                last_activity = None
-            
+        }
+        
+        reviewers = []
+        for user in users:
+            gt = gt_activity.get(user.id)
+            review = review_activity.get(user.id)
             reviewers.append({
                 "user_name": user.user_id_str,
                 "email": user.email or "",
                 "role": user.user_type,
                 "user_id": user.id,
-                "assigned_projects": assigned_projects or 0,
-                "projects_started": projects_started,
-                "last_review_time": last_activity
+                "assigned_projects": user.assigned_projects,
+                # Projects started (has ground truth or answer review)
+                "projects_started": max(gt.projects if gt else 0, review.projects if review else 0),
+                "last_review_time": GoogleSheetsExportService._latest(
+                    gt.last_time if gt else None, review.last_time if review else None
+                )
             })
         
         return reviewers
@@ -10288,547 +10724,364 @@ class GoogleSheetsExportService:
     @staticmethod
     def get_master_sheet_meta_reviewer_data(session: Session) -> List[Dict[str, Any]]:
         """Get master sheet data for meta-reviewers tab."""
-        meta_reviewers = []
-        
-        # Get total ground truth records for ratio calculations
-        total_gt_records = session.scalar(
-            select(func.count())
-            .select_from(ReviewerGroundTruth)
-        )
-        
-        # Get total admin-modified records
-        total_admin_modified = session.scalar(
-            select(func.count())
+        # Total and admin-modified ground truth records for ratio calculations
+        total_gt_records, total_admin_modified = session.execute(
+            select(func.count(), func.count(ReviewerGroundTruth.modified_by_admin_id))
             .select_from(ReviewerGroundTruth)
-            .where(ReviewerGroundTruth.modified_by_admin_id.isnot(None))
-        )
+        ).one()
         
-        # Get all users who have admin role assignments
-        meta_reviewer_users = session.scalars(
-            select(User)
-            .join(ProjectUserRole, User.id == ProjectUserRole.user_id)
-            .join(Project, ProjectUserRole.project_id == Project.id)
-            .where(
-                ProjectUserRole.role == "admin",
-                ProjectUserRole.is_archived == False,
-                Project.is_archived == False,
-                User.is_archived == False
-            )
-            .distinct()
-        ).all()
+        users = GoogleSheetsExportService._role_user_counts("admin", session)
         
-        for user in meta_reviewer_users:
-            # Count assigned projects
-            assigned_projects = session.scalar(
-                select(func.count())
-                .select_from(ProjectUserRole)
-                .join(Project, ProjectUserRole.project_id == Project.id)
-                .where(
-                    ProjectUserRole.user_id == user.id,
-                    ProjectUserRole.role == "admin",
-                    ProjectUserRole.is_archived == False,
-                    Project.is_archived == False
+        modifications = {
+            row.modified_by_admin_id: row for row in session.execute(
+                select(
+                    ReviewerGroundTruth.modified_by_admin_id,
+                    func.count(func.distinct(ReviewerGroundTruth.project_id)).label("projects_started"),
+                    func.count().label("modifications"),
+                    func.max(ReviewerGroundTruth.modified_by_admin_at).label("last_modified_time")
                 )
+                .where(ReviewerGroundTruth.modified_by_admin_id.isnot(None))
+                .group_by(ReviewerGroundTruth.modified_by_admin_id)
             )
-            
-            # Count projects started (has modified ground truth)
-            projects_started = session.scalar(
-                select(func.count(func.distinct(ReviewerGroundTruth.project_id)))
-                .where(ReviewerGroundTruth.modified_by_admin_id == user.id)
-            )
-            
-            # Get modification counts and ratios
-            user_modifications = session.scalar(
-                select(func.count())
-                .select_from(ReviewerGroundTruth)
-                .where(ReviewerGroundTruth.modified_by_admin_id == user.id)
-            )
-            
-            ratio_modified_by_user = (user_modifications / total_gt_records * 100) if total_gt_records > 0 else 0
-            ratio_modified_by_all = (total_admin_modified / total_gt_records * 100) if total_gt_records > 0 else 0
-            
-            # Get last modification time
-            last_modified_time = session.scalar(
-                select(func.max(ReviewerGroundTruth.modified_by_admin_at))
-                .where(ReviewerGroundTruth.modified_by_admin_id == user.id)
-            )
-            
+        }
+        
+        ratio_modified_by_all = (total_admin_modified / total_gt_records * 100) if total_gt_records > 0 else 0
+        
+        meta_reviewers = []
+        for user in users:
+            modified = modifications.get(user.id)
+            user_modifications = modified.modifications if modified else 0
             meta_reviewers.append({
                 "user_name": user.user_id_str,
                 "email": user.email or "",
                 "role": user.user_type,
                 "user_id": user.id,
-                "assigned_projects": assigned_projects or 0,
-                "projects_started": projects_started or 0,
-                "ratio_modified_by_user": ratio_modified_by_user,
+                "assigned_projects": user.assigned_projects,
+                "projects_started": modified.projects_started if modified else 0,
+                "ratio_modified_by_user": (user_modifications / total_gt_records * 100) if total_gt_records > 0 else 0,
                 "ratio_modified_by_all": ratio_modified_by_all,
-                "last_modified_time": last_modified_time
+                "last_modified_time": modified.last_modified_time if modified else None
             })
         
         return meta_reviewers
     
     @staticmethod
-    def get_user_project_data_annotator(user_id: int, session: Session) -> List[Dict[str, Any]]:
-        """Get individual annotator sheet data by project."""
-        projects_data = []
-        
-        # Get projects where user has annotator role
-        user_projects = session.scalars(
-            select(Project)
-            .join(ProjectUserRole, Project.id == ProjectUserRole.project_id)
+    def _role_projects(role: str, session: Session, user_ids: Optional[List[int]] = None) -> List[Any]:
+        """Active project assignments of a role with project and schema names, ordered by user and project."""
+        query = (
+            select(
+                ProjectUserRole.user_id, Project.id.label("project_id"), Project.name.label("project_name"),
+                Project.schema_id, Schema.name.label("schema_name")
+            )
+            .join(Project, ProjectUserRole.project_id == Project.id)
+            .outerjoin(Schema, Project.schema_id == Schema.id)
             .where(
-                ProjectUserRole.user_id == user_id,
-                ProjectUserRole.role == "annotator",
+                ProjectUserRole.role == role,
                 ProjectUserRole.is_archived == False,
                 Project.is_archived == False
             )
-        ).all()
-        
-        for project in user_projects:
-            # Get schema
-            schema = session.get(Schema, project.schema_id)
-            
-            # Get total possible answers
-            total_videos = session.scalar(
-                select(func.count())
-                .select_from(ProjectVideo)
-                .where(ProjectVideo.project_id == project.id)
-            )
-            
-            total_questions = session.scalar(
-                select(func.count())
-                .select_from(Question)
-                .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
-                .join(SchemaQuestionGroup, QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id)
-                .where(
-                    SchemaQuestionGroup.schema_id == project.schema_id,
-                    Question.is_archived == False
-                )
-            )
-            
-            total_possible = (total_videos or 0) * (total_questions or 0)
-            
-            # Count user's completed answers
-            user_answers = session.scalar(
-                select(func.count())
-                .where(
-                    AnnotatorAnswer.user_id == user_id,
-                    AnnotatorAnswer.project_id == project.id
-                )
-            )
-            
-            # FIXED: Count reviewed answers properly according to question type
-            # For single choice questions: count where ReviewerGroundTruth exists
-            single_choice_reviewed = session.scalar(
-                select(func.count())
-                .select_from(AnnotatorAnswer)
-                .join(Question, AnnotatorAnswer.question_id == Question.id)
-                .join(ReviewerGroundTruth, and_(
-                    AnnotatorAnswer.video_id == ReviewerGroundTruth.video_id,
-                    AnnotatorAnswer.question_id == ReviewerGroundTruth.question_id,
-                    AnnotatorAnswer.project_id == ReviewerGroundTruth.project_id
-                ))
-                .where(
-                    AnnotatorAnswer.user_id == user_id,
-                    AnnotatorAnswer.project_id == project.id,
-                    Question.type == "single",
-                    Question.is_archived == False
-                )
-            )
-            
-            # For description questions: count where AnswerReview exists and status is not pending
-            description_reviewed = session.scalar(
-                select(func.count())
-                .select_from(AnnotatorAnswer)
-                .join(Question, AnnotatorAnswer.question_id == Question.id)
-                .join(AnswerReview, AnnotatorAnswer.id == AnswerReview.answer_id)
-                .where(
-                    AnnotatorAnswer.user_id == user_id,
-                    AnnotatorAnswer.project_id == project.id,
-                    Question.type == "description",
-                    Question.is_archived == False,
-                    AnswerReview.status.in_(["approved", "rejected"])  # Not pending
-                )
-            )
-            
-            reviewed_answers = (single_choice_reviewed or 0) + (description_reviewed or 0)
-            
-            # Count approved answers for accuracy
-            # Single choice: compare with ground truth
-            single_choice_correct = session.scalar(
-                select(func.count())
-                .select_from(AnnotatorAnswer)
-                .join(Question, AnnotatorAnswer.question_id == Question.id)
-                .join(ReviewerGroundTruth, and_(
-                    AnnotatorAnswer.video_id == ReviewerGroundTruth.video_id,
-                    AnnotatorAnswer.question_id == ReviewerGroundTruth.question_id,
-                    AnnotatorAnswer.project_id == ReviewerGroundTruth.project_id,
-                    AnnotatorAnswer.answer_value == ReviewerGroundTruth.answer_value
-                ))
-                .where(
-                    AnnotatorAnswer.user_id == user_id,
-                    AnnotatorAnswer.project_id == project.id,
-                    Question.type == "single",
-                    Question.is_archived == False
-                )
-            )
-            
-            # Description: approved reviews
-            description_approved = session.scalar(
-                select(func.count())
-                .select_from(AnnotatorAnswer)
-                .join(Question, AnnotatorAnswer.question_id == Question.id)
-                .join(AnswerReview, AnnotatorAnswer.id == AnswerReview.answer_id)
-                .where(
-                    AnnotatorAnswer.user_id == user_id,
-                    AnnotatorAnswer.project_id == project.id,
-                    Question.type == "description",
-                    Question.is_archived == False,
-                    AnswerReview.status == "approved"
-                )
+            .order_by(ProjectUserRole.user_id, Project.id)
+        )
+        if user_ids is not None:
+            query = query.where(ProjectUserRole.user_id.in_(user_ids))
+        return session.execute(query).all()
+    
+    @staticmethod
+    def _project_video_counts(project_ids: List[int], session: Session) -> Dict[int, int]:
+        """Number of videos per project."""
+        return dict(session.execute(
+            select(ProjectVideo.project_id, func.count())
+            .where(ProjectVideo.project_id.in_(project_ids))
+            .group_by(ProjectVideo.project_id)
+        ).all())
+    
+    @staticmethod
+    def _schema_question_counts(schema_ids: List[int], session: Session) -> Dict[int, int]:
+        """Number of non-archived questions per schema."""
+        return dict(session.execute(
+            select(SchemaQuestionGroup.schema_id, func.count())
+            .select_from(Question)
+            .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
+            .join(SchemaQuestionGroup, QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id)
+            .where(
+                SchemaQuestionGroup.schema_id.in_(schema_ids),
+                Question.is_archived == False
             )
-            
-            approved_answers = (single_choice_correct or 0) + (description_approved or 0)
-            
-            # Count wrong answers 
-            # Single choice: incorrect vs ground truth
-            single_choice_wrong = session.scalar(
-                select(func.count())
-                .select_from(AnnotatorAnswer)
-                .join(Question, AnnotatorAnswer.question_id == Question.id)
-                .join(ReviewerGroundTruth, and_(
-                    AnnotatorAnswer.video_id == ReviewerGroundTruth.video_id,
-                    AnnotatorAnswer.question_id == ReviewerGroundTruth.question_id,
-                    AnnotatorAnswer.project_id == ReviewerGroundTruth.project_id,
-                    AnnotatorAnswer.answer_value != ReviewerGroundTruth.answer_value
-                ))
-                .where(
-                    AnnotatorAnswer.user_id == user_id,
-                    AnnotatorAnswer.project_id == project.id,
-                    Question.type == "single",
-                    Question.is_archived == False
+            .group_by(SchemaQuestionGroup.schema_id)
+        ).all())
+    
+    @staticmethod
+    def _ground_truth_totals(project_ids: List[int], session: Session) -> Dict[int, Any]:
+        """Total and admin-modified ground truth rows per project."""
+        return {
+            row.project_id: row for row in session.execute(
+                select(
+                    ReviewerGroundTruth.project_id,
+                    func.count().label("total"),
+                    func.count(ReviewerGroundTruth.modified_by_admin_id).label("admin_modified")
                 )
+                .where(ReviewerGroundTruth.project_id.in_(project_ids))
+                .group_by(ReviewerGroundTruth.project_id)
             )
+        }
+    
+    @staticmethod
+    def get_annotator_project_data_by_user(session: Session, user_ids: Optional[List[int]] = None) -> Dict[int, List[Dict[str, Any]]]:
+        """Get individual annotator sheet data by project for many users at once.
+        
+        Args:
+            session: Database session
+            user_ids: Only these annotators (default: all)
             
-            # Description: rejected reviews
-            description_rejected = session.scalar(
-                select(func.count())
-                .select_from(AnnotatorAnswer)
-                .join(Question, AnnotatorAnswer.question_id == Question.id)
-                .join(AnswerReview, AnnotatorAnswer.id == AnswerReview.answer_id)
-                .where(
-                    AnnotatorAnswer.user_id == user_id,
-                    AnnotatorAnswer.project_id == project.id,
-                    Question.type == "description",
-                    Question.is_archived == False,
-                    AnswerReview.status == "rejected"
-                )
+        Returns:
+            Dictionary mapping user ID to the rows of get_user_project_data_annotator
+        """
+        assignments = GoogleSheetsExportService._role_projects("annotator", session, user_ids)
+        if not assignments:
+            return {}
+        
+        project_ids = sorted({row.project_id for row in assignments})
+        video_counts = GoogleSheetsExportService._project_video_counts(project_ids, session)
+        question_counts = GoogleSheetsExportService._schema_question_counts(
+            sorted({row.schema_id for row in assignments}), session
+        )
+        
+        # Reviewed, correct and wrong answers depend on question type: single choice
+        # answers are judged against ground truth, descriptions by their answer review
+        count_if = GoogleSheetsExportService._count_if
+        single = and_(Question.type == "single", Question.is_archived == False)
+        description = and_(Question.type == "description", Question.is_archived == False)
+        query = (
+            select(
+                AnnotatorAnswer.user_id,
+                AnnotatorAnswer.project_id,
+                func.count().label("completed"),
+                func.max(AnnotatorAnswer.modified_at).label("last_submitted"),
+                count_if(and_(single, ReviewerGroundTruth.video_id.isnot(None))).label("single_reviewed"),
+                count_if(and_(single, AnnotatorAnswer.answer_value == ReviewerGroundTruth.answer_value)).label("single_correct"),
+                count_if(and_(single, AnnotatorAnswer.answer_value != ReviewerGroundTruth.answer_value)).label("single_wrong"),
+                count_if(and_(description, AnswerReview.status.in_(["approved", "rejected"]))).label("description_reviewed"),
+                count_if(and_(description, AnswerReview.status == "approved")).label("description_approved"),
+                count_if(and_(description, AnswerReview.status == "rejected")).label("description_rejected")
             )
+            .select_from(AnnotatorAnswer)
+            .outerjoin(Question, AnnotatorAnswer.question_id == Question.id)
+            .outerjoin(ReviewerGroundTruth, and_(
+                AnnotatorAnswer.video_id == ReviewerGroundTruth.video_id,
+                AnnotatorAnswer.question_id == ReviewerGroundTruth.question_id,
+                AnnotatorAnswer.project_id == ReviewerGroundTruth.project_id
+            ))
+            .outerjoin(AnswerReview, AnnotatorAnswer.id == AnswerReview.answer_id)
+            .where(AnnotatorAnswer.project_id.in_(project_ids))
+            .group_by(AnnotatorAnswer.user_id, AnnotatorAnswer.project_id)
+        )
+        if user_ids is not None:
+            query = query.where(AnnotatorAnswer.user_id.in_(user_ids))
+        stats = {(row.user_id, row.project_id): row for row in session.execute(query)}
+        
+        data_by_user = {}
+        for assignment in assignments:
+            total_videos = video_counts.get(assignment.project_id, 0)
+            total_possible = total_videos * question_counts.get(assignment.schema_id, 0)
+            row = stats.get((assignment.user_id, assignment.project_id))
             
-            wrong_answers = (single_choice_wrong or 0) + (description_rejected or 0)
+            user_answers = row.completed if row else 0
+            reviewed_answers = (row.single_reviewed + row.description_reviewed) if row else 0
+            approved_answers = (row.single_correct + row.description_approved) if row else 0
+            wrong_answers = (row.single_wrong + row.description_rejected) if row else 0
             
-            # Calculate ratios
             completion_ratio = (user_answers / total_possible * 100) if total_possible > 0 else 0
-            reviewed_ratio = (reviewed_answers / user_answers * 100) if user_answers > 0 else 0
-            accuracy = (approved_answers / reviewed_answers * 100) if reviewed_answers > 0 else 0
-            
-            # Get last submission time
-            last_submitted = session.scalar(
-                select(func.max(AnnotatorAnswer.modified_at))
-                .where(
-                    AnnotatorAnswer.user_id == user_id,
-                    AnnotatorAnswer.project_id == project.id
-                )
-            )
-            
-            # Count videos this user has worked on in this project
-            user_video_count = session.scalar(
-                select(func.count(func.distinct(AnnotatorAnswer.video_id)))
-                .where(
-                    AnnotatorAnswer.user_id == user_id,
-                    AnnotatorAnswer.project_id == project.id
-                )
-            )
-            
-            projects_data.append({
-                "project_name": project.name,
-                "schema_name": schema.name if schema else "Unknown",
-                "video_count": total_videos or 0,  # NEW: Video count for this user
+            data_by_user.setdefault(assignment.user_id, []).append({
+                "project_name": assignment.project_name,
+                "schema_name": assignment.schema_name or "Unknown",
+                "video_count": total_videos,
                 "completion_ratio": completion_ratio,
-                "reviewed_ratio": reviewed_ratio,
-                "last_submitted": last_submitted,
-                "accuracy": accuracy,
+                "reviewed_ratio": (reviewed_answers / user_answers * 100) if user_answers > 0 else 0,
+                "last_submitted": row.last_submitted if row else None,
+                "accuracy": (approved_answers / reviewed_answers * 100) if reviewed_answers > 0 else 0,
                 "completion": completion_ratio,  # Same as completion_ratio for overall stats
                 "reviewed": reviewed_answers,
                 "completed": user_answers,
                 "wrong": wrong_answers
             })
         
-        return projects_data
+        return data_by_user
     
     @staticmethod
-    def get_user_project_data_reviewer(user_id: int, session: Session) -> List[Dict[str, Any]]:
-        """Get individual reviewer sheet data by project."""
-        projects_data = []
+    def get_reviewer_project_data_by_user(session: Session, user_ids: Optional[List[int]] = None) -> Dict[int, List[Dict[str, Any]]]:
+        """Get individual reviewer sheet data by project for many users at once.
         
-        # Get projects where user has reviewer role
-        user_projects = session.scalars(
-            select(Project)
-            .join(ProjectUserRole, Project.id == ProjectUserRole.project_id)
-            .where(
-                ProjectUserRole.user_id == user_id,
-                ProjectUserRole.role == "reviewer",
-                ProjectUserRole.is_archived == False,
-                Project.is_archived == False
-            )
-        ).all()
-        
-        for project in user_projects:
-            # Get schema
-            schema = session.get(Schema, project.schema_id)
-            
-            # Get total possible ground truth entries
-            total_videos = session.scalar(
-                select(func.count())
-                .select_from(ProjectVideo)
-                .where(ProjectVideo.project_id == project.id)
-            )
-            
-            total_questions = session.scalar(
-                select(func.count())
-                .select_from(Question)
-                .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
-                .join(SchemaQuestionGroup, QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id)
-                .where(
-                    SchemaQuestionGroup.schema_id == project.schema_id,
-                    Question.is_archived == False
-                )
-            )
-            
-            total_possible_gt = (total_videos or 0) * (total_questions or 0)
-            
-            # Count user's ground truth entries
-            user_gt_count = session.scalar(
-                select(func.count())
-                .where(
-                    ReviewerGroundTruth.reviewer_id == user_id,
-                    ReviewerGroundTruth.project_id == project.id
-                )
-            )
-            
-            # Count all ground truth entries in project
-            all_gt_count = session.scalar(
-                select(func.count())
-                .where(ReviewerGroundTruth.project_id == project.id)
-            )
-            
-            # Count user's answer reviews
-            user_review_count = session.scalar(
-                select(func.count())
-                .select_from(AnswerReview)
-                .join(AnnotatorAnswer, AnswerReview.answer_id == AnnotatorAnswer.id)
-                .where(
-                    AnswerReview.reviewer_id == user_id,
-                    AnnotatorAnswer.project_id == project.id
-                )
-            )
+        Args:
+            session: Database session
+            user_ids: Only these reviewers (default: all)
             
-            # Count all reviews in project for description questions
-            total_description_answers = session.scalar(
-                select(func.count())
-                .select_from(AnnotatorAnswer)
-                .join(Question, AnnotatorAnswer.question_id == Question.id)
-                .where(
-                    AnnotatorAnswer.project_id == project.id,
-                    Question.type == "description",
-                    Question.is_archived == False
-                )
+        Returns:
+            Dictionary mapping user ID to the rows of get_user_project_data_reviewer
+        """
+        assignments = GoogleSheetsExportService._role_projects("reviewer", session, user_ids)
+        if not assignments:
+            return {}
+        
+        project_ids = sorted({row.project_id for row in assignments})
+        video_counts = GoogleSheetsExportService._project_video_counts(project_ids, session)
+        question_counts = GoogleSheetsExportService._schema_question_counts(
+            sorted({row.schema_id for row in assignments}), session
+        )
+        gt_totals = GoogleSheetsExportService._ground_truth_totals(project_ids, session)
+        
+        # Ground truth per reviewer; rows later modified by an admin count as wrong
+        gt_query = (
+            select(
+                ReviewerGroundTruth.reviewer_id,
+                ReviewerGroundTruth.project_id,
+                func.count().label("completed"),
+                func.count(ReviewerGroundTruth.modified_by_admin_id).label("wrong"),
+                func.max(ReviewerGroundTruth.created_at).label("last_time")
             )
-            
-            all_review_count = session.scalar(
-                select(func.count())
-                .select_from(AnswerReview)
-                .join(AnnotatorAnswer, AnswerReview.answer_id == AnnotatorAnswer.id)
-                .where(AnnotatorAnswer.project_id == project.id)
+            .where(ReviewerGroundTruth.project_id.in_(project_ids))
+            .group_by(ReviewerGroundTruth.reviewer_id, ReviewerGroundTruth.project_id)
+        )
+        review_query = (
+            select(
+                AnswerReview.reviewer_id,
+                AnnotatorAnswer.project_id,
+                func.count().label("completed"),
+                func.max(AnswerReview.reviewed_at).label("last_time")
+            )
+            .join(AnnotatorAnswer, AnswerReview.answer_id == AnnotatorAnswer.id)
+            .where(AnnotatorAnswer.project_id.in_(project_ids))
+            .group_by(AnswerReview.reviewer_id, AnnotatorAnswer.project_id)
+        )
+        if user_ids is not None:
+            gt_query = gt_query.where(ReviewerGroundTruth.reviewer_id.in_(user_ids))
+            review_query = review_query.where(AnswerReview.reviewer_id.in_(user_ids))
+        gt_stats = {(row.reviewer_id, row.project_id): row for row in session.execute(gt_query)}
+        review_stats = {(row.reviewer_id, row.project_id): row for row in session.execute(review_query)}
+        
+        all_review_counts = dict(session.execute(
+            select(AnnotatorAnswer.project_id, func.count())
+            .select_from(AnswerReview)
+            .join(AnnotatorAnswer, AnswerReview.answer_id == AnnotatorAnswer.id)
+            .where(AnnotatorAnswer.project_id.in_(project_ids))
+            .group_by(AnnotatorAnswer.project_id)
+        ).all())
+        
+        description_answer_counts = dict(session.execute(
+            select(AnnotatorAnswer.project_id, func.count())
+            .join(Question, AnnotatorAnswer.question_id == Question.id)
+            .where(
+                AnnotatorAnswer.project_id.in_(project_ids),
+                Question.type == "description",
+                Question.is_archived == False
             )
+            .group_by(AnnotatorAnswer.project_id)
+        ).all())
+        
+        data_by_user = {}
+        for assignment in assignments:
+            key = (assignment.user_id, assignment.project_id)
+            total_videos = video_counts.get(assignment.project_id, 0)
+            total_possible_gt = total_videos * question_counts.get(assignment.schema_id, 0)
+            total_description_answers = description_answer_counts.get(assignment.project_id, 0)
+            gt = gt_stats.get(key)
+            review = review_stats.get(key)
+            project_gt = gt_totals.get(assignment.project_id)
+            
+            user_gt_count = gt.completed if gt else 0
+            gt_wrong_count = gt.wrong if gt else 0
+            user_review_count = review.completed if review else 0
+            all_gt_count = project_gt.total if project_gt else 0
+            all_review_count = all_review_counts.get(assignment.project_id, 0)
             
-            # Calculate ratios
             gt_ratio = (user_gt_count / total_possible_gt * 100) if total_possible_gt > 0 else 0
-            all_gt_ratio = (all_gt_count / total_possible_gt * 100) if total_possible_gt > 0 else 0
             review_ratio = (user_review_count / total_description_answers * 100) if total_description_answers > 0 else 0
-            all_review_ratio = (all_review_count / total_description_answers * 100) if total_description_answers > 0 else 0
-            
-            # Count ground truth accuracy (not overridden by admin)
-            gt_accuracy_count = session.scalar(
-                select(func.count())
-                .where(
-                    ReviewerGroundTruth.reviewer_id == user_id,
-                    ReviewerGroundTruth.project_id == project.id,
-                    ReviewerGroundTruth.modified_by_admin_id.is_(None)
-                )
-            )
-            
-            gt_wrong_count = session.scalar(
-                select(func.count())
-                .where(
-                    ReviewerGroundTruth.reviewer_id == user_id,
-                    ReviewerGroundTruth.project_id == project.id,
-                    ReviewerGroundTruth.modified_by_admin_id.isnot(None)
-                )
-            )
-            
-            gt_completion = gt_ratio  # Same as gt_ratio
-            gt_accuracy = (gt_accuracy_count / user_gt_count * 100) if user_gt_count > 0 else 0
-            review_completion = review_ratio  # Same as review_ratio
-            
-            # Get last submission time
-            last_gt_time = session.scalar(
-                select(func.max(ReviewerGroundTruth.created_at))
-                .where(
-                    ReviewerGroundTruth.reviewer_id == user_id,
-                    ReviewerGroundTruth.project_id == project.id
-                )
-            )
-            
-            last_review_time = session.scalar(
-                select(func.max(AnswerReview.reviewed_at))
-                .select_from(AnswerReview)
-                .join(AnnotatorAnswer, AnswerReview.answer_id == AnnotatorAnswer.id)
-                .where(
-                    AnswerReview.reviewer_id == user_id,
-                    AnnotatorAnswer.project_id == project.id
-                )
-            )
-            
-            last_submitted = max(
-                last_gt_time or datetime.min.replace(tzinfo=timezone.utc),
-                last_review_time or datetime.min.replace(tzinfo=timezone.utc)
-            )
-            
-            if last_submitted == datetime.min.replace(tzinfo=timezone.utc):
-                last_submitted = None
-            
-            # Count videos this user has worked on in this project (GT or Reviews)
-            # gt_video_count = session.scalar(
-            #     select(func.count(func.distinct(ReviewerGroundTruth.video_id)))
-            #     .where(
-            #         ReviewerGroundTruth.reviewer_id == user_id,
-            #         ReviewerGroundTruth.project_id == project.id
-            #     )
-            # )
-            
-            # review_video_count = session.scalar(
-            #     select(func.count(func.distinct(AnnotatorAnswer.video_id)))
-            #     .select_from(AnswerReview)
-            #     .join(AnnotatorAnswer, AnswerReview.answer_id == AnnotatorAnswer.id)
-            #     .where(
-            #         AnswerReview.reviewer_id == user_id,
-            #         AnnotatorAnswer.project_id == project.id
-            #     )
-            # )
-            
-            # # Take the maximum of GT and review video counts
-            # user_video_count = max(gt_video_count or 0, review_video_count or 0)
-            
-            projects_data.append({
-                "project_name": project.name,
-                "schema_name": schema.name if schema else "Unknown",
-                "video_count": total_videos or 0,  # Use total project videos like other roles
+            data_by_user.setdefault(assignment.user_id, []).append({
+                "project_name": assignment.project_name,
+                "schema_name": assignment.schema_name or "Unknown",
+                "video_count": total_videos,  # Use total project videos like other roles
                 "gt_ratio": gt_ratio,
-                "all_gt_ratio": all_gt_ratio,
+                "all_gt_ratio": (all_gt_count / total_possible_gt * 100) if total_possible_gt > 0 else 0,
                 "review_ratio": review_ratio,
-                "all_review_ratio": all_review_ratio,
-                "last_submitted": last_submitted,
-                "gt_completion": gt_completion,
-                "gt_accuracy": gt_accuracy,
-                "review_completion": review_completion,
+                "all_review_ratio": (all_review_count / total_description_answers * 100) if total_description_answers > 0 else 0,
+                "last_submitted": GoogleSheetsExportService._latest(
+                    gt.last_time if gt else None, review.last_time if review else None
+                ),
+                "gt_completion": gt_ratio,  # Same as gt_ratio
+                "gt_accuracy": ((user_gt_count - gt_wrong_count) / user_gt_count * 100) if user_gt_count > 0 else 0,
+                "review_completion": review_ratio,  # Same as review_ratio
                 "gt_completed": user_gt_count,
                 "gt_wrong": gt_wrong_count,
                 "review_completed": user_review_count
             })
         
-        return projects_data
+        return data_by_user
     
     @staticmethod
-    def get_user_project_data_meta_reviewer(user_id: int, session: Session) -> List[Dict[str, Any]]:
-        """Get individual meta-reviewer sheet data by project."""
-        projects_data = []
+    def get_meta_reviewer_project_data_by_user(session: Session, user_ids: Optional[List[int]] = None) -> Dict[int, List[Dict[str, Any]]]:
+        """Get individual meta-reviewer sheet data by project for many users at once.
         
-        # Get projects where user has admin role
-        user_projects = session.scalars(
-            select(Project)
-            .join(ProjectUserRole, Project.id == ProjectUserRole.project_id)
-            .where(
-                ProjectUserRole.user_id == user_id,
-                ProjectUserRole.role == "admin",
-                ProjectUserRole.is_archived == False,
-                Project.is_archived == False
-            )
-        ).all()
-        
-        for project in user_projects:
-            # Get schema
-            schema = session.get(Schema, project.schema_id)
-            
-            # Count total ground truth in project
-            total_gt_in_project = session.scalar(
-                select(func.count())
-                .where(ReviewerGroundTruth.project_id == project.id)
-            )
-
-            total_videos = session.scalar(
-                select(func.count())
-                .select_from(ProjectVideo)
-                .where(ProjectVideo.project_id == project.id)
-            )
-            
-            # Count user's modifications in this project
-            user_modifications = session.scalar(
-                select(func.count())
-                .where(
-                    ReviewerGroundTruth.modified_by_admin_id == user_id,
-                    ReviewerGroundTruth.project_id == project.id
-                )
-            )
-            
-            # Count all admin modifications in this project
-            all_admin_modifications = session.scalar(
-                select(func.count())
-                .where(
-                    ReviewerGroundTruth.project_id == project.id,
-                    ReviewerGroundTruth.modified_by_admin_id.isnot(None)
-                )
-            )
-            
-            # Calculate ratios
-            ratio_modified_by_user = (user_modifications / total_gt_in_project * 100) if total_gt_in_project > 0 else 0
-            ratio_modified_by_all = (all_admin_modifications / total_gt_in_project * 100) if total_gt_in_project > 0 else 0
+        Args:
+            session: Database session
+            user_ids: Only these admins (default: all)
             
-            # Get last modification time
-            last_modified = session.scalar(
-                select(func.max(ReviewerGroundTruth.modified_by_admin_at))
-                .where(
-                    ReviewerGroundTruth.modified_by_admin_id == user_id,
-                    ReviewerGroundTruth.project_id == project.id
-                )
+        Returns:
+            Dictionary mapping user ID to the rows of get_user_project_data_meta_reviewer
+        """
+        assignments = GoogleSheetsExportService._role_projects("admin", session, user_ids)
+        if not assignments:
+            return {}
+        
+        project_ids = sorted({row.project_id for row in assignments})
+        video_counts = GoogleSheetsExportService._project_video_counts(project_ids, session)
+        gt_totals = GoogleSheetsExportService._ground_truth_totals(project_ids, session)
+        
+        query = (
+            select(
+                ReviewerGroundTruth.modified_by_admin_id,
+                ReviewerGroundTruth.project_id,
+                func.count().label("modifications"),
+                func.max(ReviewerGroundTruth.modified_by_admin_at).label("last_modified")
             )
-            
-            # Count videos this admin has modified in this project
-            user_video_count = session.scalar(
-                select(func.count(func.distinct(ReviewerGroundTruth.video_id)))
-                .where(
-                    ReviewerGroundTruth.modified_by_admin_id == user_id,
-                    ReviewerGroundTruth.project_id == project.id
-                )
+            .where(
+                ReviewerGroundTruth.project_id.in_(project_ids),
+                ReviewerGroundTruth.modified_by_admin_id.isnot(None)
             )
-            
-            projects_data.append({
-                "project_name": project.name,
-                "schema_name": schema.name if schema else "Unknown",
-                "video_count": total_videos or 0,  # NEW: Video count for this admin
-                "ratio_modified_by_user": ratio_modified_by_user,
-                "ratio_modified_by_all": ratio_modified_by_all,
-                "last_modified": last_modified
+            .group_by(ReviewerGroundTruth.modified_by_admin_id, ReviewerGroundTruth.project_id)
+        )
+        if user_ids is not None:
+            query = query.where(ReviewerGroundTruth.modified_by_admin_id.in_(user_ids))
+        modifications = {(row.modified_by_admin_id, row.project_id): row for row in session.execute(query)}
+        
+        data_by_user = {}
+        for assignment in assignments:
+            project_gt = gt_totals.get(assignment.project_id)
+            total_gt_in_project = project_gt.total if project_gt else 0
+            all_admin_modifications = project_gt.admin_modified if project_gt else 0
+            modified = modifications.get((assignment.user_id, assignment.project_id))
+            user_modifications = modified.modifications if modified else 0
+            
+            data_by_user.setdefault(assignment.user_id, []).append({
+                "project_name": assignment.project_name,
+                "schema_name": assignment.schema_name or "Unknown",
+                "video_count": video_counts.get(assignment.project_id, 0),
+                "ratio_modified_by_user": (user_modifications / total_gt_in_project * 100) if total_gt_in_project > 0 else 0,
+                "ratio_modified_by_all": (all_admin_modifications / total_gt_in_project * 100) if total_gt_in_project > 0 else 0,
+                "last_modified": modified.last_modified if modified else None
             })
         
-        return projects_data
\ No newline at end of file
+        return data_by_user
+    
+    @staticmethod
+    def get_user_project_data_annotator(user_id: int, session: Session) -> List[Dict[str, Any]]:
+        """Get individual annotator sheet data by project."""
+        return GoogleSheetsExportService.get_annotator_project_data_by_user(session, [user_id]).get(user_id, [])
+    
+    @staticmethod
+    def get_user_project_data_reviewer(user_id: int, session: Session) -> List[Dict[str, Any]]:
+        """Get individual reviewer sheet data by project."""
+        return GoogleSheetsExportService.get_reviewer_project_data_by_user(session, [user_id]).get(user_id, [])
+    
+    @staticmethod
+    def get_user_project_data_meta_reviewer(user_id: int, session: Session) -> List[Dict[str, Any]]:
+        """Get individual meta-reviewer sheet data by project."""
+        return GoogleSheetsExportService.get_meta_reviewer_project_data_by_user(session, [user_id]).get(user_id, [])
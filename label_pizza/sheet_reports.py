@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+"""
+Sheet Reports: layout and offline sinks for the Google Sheets export
+
+The Google Sheets export runs in three stages:
+- data: GoogleSheetsExportService computes the statistics
+- layout: this module turns them into the rows of every tab (headers, project
+  rows, preserved manual columns)
+- sink: the tabs are stored somewhere
+
+GoogleSheetExporter (google_sheets_export.py) is the Google Sheets sink; it
+adds diff-only writes, formatting, link chips and permissions on top of the
+layout built here. This module adds sinks that need no Google credentials,
+so the whole pipeline can be regression-tested and benchmarked locally and
+teams without Google access get the same reports as files:
+- InMemorySheetSink keeps every tab in memory
+- CsvSheetSink writes one CSV file per tab
+- XlsxSheetSink writes one workbook per spreadsheet
+
+Manual columns (payment and feedback) typed into the CSV or XLSX files are
+preserved by the next export, just like in Google Sheets.
+
+Usage:
+    python label_pizza/sheet_reports.py --output-dir reports --format xlsx --database-url-name DBURL
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add the parent directory to the path so we can import from label_pizza
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# (tab name, role) of the master sheet tabs
+MASTER_TABS = [("Annotators", "Annotator"), ("Reviewers", "Reviewer"), ("Meta-Reviewers", "Meta-Reviewer")]
+
+# (tab name, include_payment) of every user sheet
+USER_TABS = [("Payment", True), ("Feedback", False)]
+
+MASTER_HEADER_ROWS = 1
+USER_HEADER_ROWS = 2
+
+# Column of the master sheet that links to the user sheets (0-indexed)
+MASTER_LINK_COLUMN = 3
+
+
+# ---------------------------------------------------------------------------
+# Layout
+# ---------------------------------------------------------------------------
+
+def format_timestamp(timestamp) -> str:
+    """Format timestamp for display"""
+    if not timestamp:
+        return ""
+    if isinstance(timestamp, str):
+        return timestamp
+    return timestamp.strftime("%Y-%m-%d %H:%M")
+
+
+def has_activity(user_data: Dict) -> bool:
+    """Check if user has any activity"""
+    return (user_data.get('projects_started', 0) > 0 or
+            user_data.get('assigned_projects', 0) > 0)
+
+
+def user_sheet_name(sheet_prefix: str, user_name: str, role: str) -> str:
+    """Name of a user's individual sheet"""
+    return f"{sheet_prefix}-{user_name} {role}"
+
+
+def master_headers(role: str) -> List[str]:
+    """Header row of a master sheet tab"""
+    # FIXED: Shortened header texts for master sheet
+    if role == "Annotator":
+        return [
+            "User Name", "Email", "Role", "Annotation Sheet", "Last Annotated Time",
+            "Assigned Projects", "Started Projects", "Completed Projects"  # SHORTENED
+        ]
+    elif role == "Reviewer":
+        return [
+            "User Name", "Email", "Role", "Review Sheet", "Last Review Time",
+            "Assigned Projects", "Started Projects"  # SHORTENED
+        ]
+    else:  # Meta-Reviewer
+        return [
+            "User Name", "Email", "Role", "Meta-Review Sheet", "Last Modified Time",
+            "Assigned Projects", "Started Projects"  # FIXED: Added missing Started Projects column
+        ]
+
+
+def master_rows(user_data: List[Dict], role: str) -> List[List]:
+    """Rows of a master sheet tab (header first), one per user with activity"""
+    rows = [master_headers(role)]
+    for user in user_data:
+        if not has_activity(user):
+            continue
+
+        row = [
+            user['user_name'],
+            user['email'],
+            user['role'],
+            f"Link to {user['user_name']} Sheet",  # Placeholder for hyperlink
+            format_timestamp(user.get('last_annotation_time') or user.get('last_review_time') or user.get('last_modified_time')),
+            user.get('assigned_projects', 0),
+            user.get('projects_started', 0)
+        ]
+
+        if role == "Annotator":
+            row.append(user.get('projects_completed', 0))
+
+        rows.append(row)
+    return rows
+
+
+def manual_column_positions(role: str, include_payment: bool) -> List[int]:
+    """Get the column positions for manual data that should be preserved"""
+    if role == "Reviewer":
+        # Columns: Project Name, Schema Name, Video Count, GT%, All GT%, Review%, All Rev%, Last Submitted, [Payment/Feedback], [Overall Stats...]
+        first = 8
+    else:
+        # Annotator: Project Name, Schema Name, Video Count, Last Submitted, [Payment/Feedback], [Overall Stats...]
+        # Meta-Reviewer: Project Name, Schema Name, Video Count, Last Modified, [Payment/Feedback], Modified Ratio By User%, Modified Ratio By All%
+        first = 4
+    if include_payment:
+        return [first, first + 1, first + 2]  # Payment Time, Base Salary, Bonus Salary
+    return [first]  # Feedback
+
+
+def user_sheet_headers(role: str, include_payment: bool) -> Tuple[List[str], List[str]]:
+    """FIXED: Build the properly structured two header rows for user sheets"""
+    if role == "Annotator":
+        row1 = ["Project Name", "Schema Name", "Video Count", "Last Submitted"]
+        if include_payment:
+            row1.extend(["Payment Time", "Base Salary", "Bonus Salary"])
+        else:
+            row1.append("Feedback")
+        # Add Overall Stats spanning headers
+        row1.extend(["Overall Stats", "", "", "", "", ""])
+
+        # Row 2 has sub-headers only for Overall Stats
+        row2 = [""] * (len(row1) - 6)  # Empty for first columns
+        row2.extend(["Accuracy%", "Completion%", "Reviewed%", "Completed", "Reviewed", "Wrong"])
+
+    elif role == "Reviewer":
+        row1 = ["Project Name", "Schema Name", "Video Count", "GT%", "All GT%", "Review%", "All Rev%", "Last Submitted"]
+        if include_payment:
+            row1.extend(["Payment Time", "Base Salary", "Bonus Salary"])
+        else:
+            row1.append("Feedback")
+        # Add Overall Stats spanning headers
+        row1.extend(["Overall Stats", "", "", "", "", ""])
+
+        # Row 2 has sub-headers only for Overall Stats
+        row2 = [""] * (len(row1) - 6)  # Empty for first columns
+        row2.extend(["GT%", "GT Acc%", "Review%", "GT Done", "GT Wrong", "Rev Done"])
+
+    else:  # Meta-Reviewer - Modified Ratio By columns at the end
+        row1 = ["Project Name", "Schema Name", "Video Count", "Last Modified"]
+        if include_payment:
+            row1.extend(["Payment Time", "Base Salary", "Bonus Salary"])
+        else:
+            row1.append("Feedback")
+        # Add Modified Ratio By columns at the end
+        row1.extend(["Modified Ratio By", ""])
+
+        # Row 2 has sub-headers for Modified Ratio By at the end
+        row2 = [""] * (len(row1) - 2)  # Project columns and Payment/Feedback columns
+        row2.extend(["User %", "All %"])  # Modified Ratio By sub-headers
+
+    return row1, row2
+
+
+def project_row(project: Dict, role: str, include_payment: bool) -> List:
+    """Create a project data row with correct column alignment"""
+    # Payment Time, Base Salary, Bonus Salary or the Feedback column
+    manual_placeholders = ['', '', ''] if include_payment else ['']
+
+    if role == "Annotator":
+        row = [
+            project['project_name'],
+            project['schema_name'],
+            project['video_count'],
+            format_timestamp(project['last_submitted'])
+        ]
+        row.extend(manual_placeholders)
+
+        # Add overall statistics
+        row.extend([
+            f"{project['accuracy']:.0f}%",
+            f"{project['completion']:.0f}%",
+            f"{project['reviewed_ratio']:.0f}%",
+            project['completed'],
+            project['reviewed'],
+            project['wrong']
+        ])
+
+    elif role == "Reviewer":
+        row = [
+            project['project_name'],
+            project['schema_name'],
+            project['video_count'],
+            f"{project['gt_ratio']:.0f}%",
+            f"{project['all_gt_ratio']:.0f}%",
+            f"{project['review_ratio']:.0f}%",
+            f"{project['all_review_ratio']:.0f}%",
+            format_timestamp(project['last_submitted'])
+        ]
+        row.extend(manual_placeholders)
+
+        # Add overall statistics
+        row.extend([
+            f"{project['gt_completion']:.0f}%",
+            f"{project['gt_accuracy']:.0f}%",
+            f"{project['review_completion']:.0f}%",
+            project['gt_completed'],
+            project['gt_wrong'],
+            project['review_completed']
+        ])
+
+    else:  # Meta-Reviewer - Modified Ratio By columns at the end
+        row = [
+            project['project_name'],
+            project['schema_name'],
+            project['video_count'],
+            format_timestamp(project['last_modified'])
+        ]
+        row.extend(manual_placeholders)
+
+        # Add Modified Ratio By columns at the end
+        row.extend([
+            f"{project['ratio_modified_by_user']:.0f}%",
+            f"{project['ratio_modified_by_all']:.0f}%"
+        ])
+
+    return row
+
+
+def manual_data_by_project(existing_rows: List[List[str]], role: str, include_payment: bool) -> Dict[str, Dict[int, str]]:
+    """Map each project name in an existing user tab to its manual column values"""
+    manual_col_positions = manual_column_positions(role, include_payment)
+    project_manual_data = {}
+
+    for row in existing_rows[USER_HEADER_ROWS:]:
+        if len(row) > 0 and row[0]:  # Has project name
+            project_name = str(row[0]).strip()
+            if project_name:
+                project_manual_data[project_name] = {
+                    pos: row[pos] for pos in manual_col_positions if pos < len(row)
+                }
+
+    return project_manual_data
+
+
+def sort_project_data(project_data: List[Dict], role: str):
+    """Sort projects by most recent activity, in place"""
+    # Meta-reviewers are sorted by last_modified, annotators and reviewers by last_submitted
+    key = 'last_modified' if role == "Meta-Reviewer" else 'last_submitted'
+    project_data.sort(key=lambda x: x.get(key) or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
+
+
+def user_tab_rows(project_data: List[Dict], role: str, include_payment: bool,
+                  existing_rows: List[List[str]] = None) -> List[List]:
+    """Rows of a user sheet tab: two header rows, then one row per project
+
+    Projects are sorted by most recent activity; manual columns of
+    existing_rows are carried over to the row of the same project.
+    """
+    # Map existing manual data to project names BEFORE sorting
+    existing_manual_data = manual_data_by_project(existing_rows or [], role, include_payment)
+    sort_project_data(project_data, role)
+
+    row1, row2 = user_sheet_headers(role, include_payment)
+    rows = [row1, row2]
+    manual_col_positions = manual_column_positions(role, include_payment)
+
+    for project in project_data:
+        row = project_row(project, role, include_payment)
+
+        # Restore manual data to correct columns for this specific project
+        preserved_data = existing_manual_data.get(project['project_name'], {})
+        for pos in manual_col_positions:
+            value = preserved_data.get(pos)
+            if value is not None and pos < len(row) and str(value).strip():
+                row[pos] = value
+
+        rows.append(row)
+
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Sinks
+# ---------------------------------------------------------------------------
+
+def _cell_text(value) -> str:
+    """Cell value as the text a spreadsheet would display"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _safe_file_name(name: str) -> str:
+    """Spreadsheet or tab name usable as a file name"""
+    return "".join("_" if ch in '<>:"/\\|?*' else ch for ch in name).strip() or "_"
+
+
+class InMemorySheetSink:
+    """Keeps every spreadsheet as {tab name: rows} in memory"""
+
+    def __init__(self):
+        self.spreadsheets: Dict[str, Dict[str, List[List]]] = {}
+        self.write_calls = 0
+
+    def read_tabs(self, spreadsheet_name: str, tab_names: List[str]) -> Dict[str, List[List[str]]]:
+        """Current displayed values of the tabs that exist"""
+        tabs = self.spreadsheets.get(spreadsheet_name, {})
+        return {
+            tab: [[_cell_text(value) for value in row] for row in tabs[tab]]
+            for tab in tab_names if tab in tabs
+        }
+
+    def write_tabs(self, spreadsheet_name: str, tabs: Dict[str, List[List]], header_rows: int = 1):
+        """Replace the given tabs; other tabs of the spreadsheet are kept"""
+        self.write_calls += 1
+        spreadsheet = self.spreadsheets.setdefault(spreadsheet_name, {})
+        for tab, rows in tabs.items():
+            spreadsheet[tab] = [list(row) for row in rows]
+
+
+class CsvSheetSink:
+    """Writes one directory per spreadsheet with one CSV file per tab"""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = Path(output_dir)
+
+    def _tab_path(self, spreadsheet_name: str, tab: str) -> Path:
+        return self.output_dir / _safe_file_name(spreadsheet_name) / f"{_safe_file_name(tab)}.csv"
+
+    def read_tabs(self, spreadsheet_name: str, tab_names: List[str]) -> Dict[str, List[List[str]]]:
+        """Current values of the tabs whose files exist"""
+        tabs = {}
+        for tab in tab_names:
+            path = self._tab_path(spreadsheet_name, tab)
+            if path.exists():
+                with open(path, newline="", encoding="utf-8") as f:
+                    tabs[tab] = [row for row in csv.reader(f)]
+        return tabs
+
+    def write_tabs(self, spreadsheet_name: str, tabs: Dict[str, List[List]], header_rows: int = 1):
+        """Write each tab to its CSV file"""
+        for tab, rows in tabs.items():
+            path = self._tab_path(spreadsheet_name, tab)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerows(rows)
+
+
+class XlsxSheetSink:
+    """Writes one workbook per spreadsheet with one worksheet per tab"""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = Path(output_dir)
+
+    def _workbook_path(self, spreadsheet_name: str) -> Path:
+        return self.output_dir / f"{_safe_file_name(spreadsheet_name)}.xlsx"
+
+    def read_tabs(self, spreadsheet_name: str, tab_names: List[str]) -> Dict[str, List[List[str]]]:
+        """Current displayed values of the tabs that exist"""
+        from openpyxl import load_workbook
+
+        path = self._workbook_path(spreadsheet_name)
+        if not path.exists():
+            return {}
+
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            return {
+                tab: [[_cell_text(value) for value in row] for row in workbook[tab].iter_rows(values_only=True)]
+                for tab in tab_names if tab in workbook.sheetnames
+            }
+        finally:
+            workbook.close()
+
+    def write_tabs(self, spreadsheet_name: str, tabs: Dict[str, List[List]], header_rows: int = 1):
+        """Replace the given worksheets; other worksheets of the workbook are kept"""
+        from openpyxl import Workbook, load_workbook
+        from openpyxl.styles import Alignment, Font, PatternFill
+        from openpyxl.utils import get_column_letter
+
+        path = self._workbook_path(spreadsheet_name)
+        if path.exists():
+            workbook = load_workbook(path)
+        else:
+            workbook = Workbook()
+            workbook.remove(workbook.active)
+
+        header_font = Font(bold=True)
+        header_fill = PatternFill(start_color="D9EBFF", end_color="D9EBFF", fill_type="solid")
+
+        for tab, rows in tabs.items():
+            # Keep the worksheet's position when it is replaced
+            index = None
+            if tab in workbook.sheetnames:
+                index = workbook.sheetnames.index(tab)
+                workbook.remove(workbook[tab])
+            worksheet = workbook.create_sheet(tab, index)
+
+            for row in rows:
+                worksheet.append(list(row))
+
+            for row in worksheet.iter_rows(min_row=1, max_row=min(header_rows, len(rows))):
+                for cell in row:
+                    cell.font = header_font
+                    cell.fill = header_fill
+                    cell.alignment = Alignment(horizontal="center", vertical="center")
+            worksheet.freeze_panes = f"A{header_rows + 1}"
+
+            width = max((len(row) for row in rows), default=0)
+            for col_idx in range(1, width + 1):
+                worksheet.column_dimensions[get_column_letter(col_idx)].width = 18
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        workbook.save(path)
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+def render_reports(sink, master_data: Dict[str, List[Dict]], project_data_by_role: Dict[str, Dict[int, List[Dict]]],
+                   sheet_prefix: str = "Pizza", master_name: str = "Master") -> Dict[str, str]:
+    """Render the master sheet and every user sheet into a sink
+
+    Args:
+        sink: Object with read_tabs(spreadsheet_name, tab_names) and
+            write_tabs(spreadsheet_name, tabs, header_rows)
+        master_data: Master sheet users keyed by role (see GoogleSheetExporter._get_master_data)
+        project_data_by_role: Per-project rows keyed by role and user ID
+            (see GoogleSheetExporter._get_project_data_by_role)
+        sheet_prefix: Prefix of the individual sheet names
+        master_name: Name of the master spreadsheet
+
+    Returns:
+        Dictionary mapping each written user sheet name to its role
+    """
+    user_sheets = {}
+
+    for _, role in MASTER_TABS:
+        for user in master_data[role]:
+            if not has_activity(user):
+                continue
+
+            project_data = list(project_data_by_role[role].get(user['user_id'], []))
+            if not project_data:
+                continue
+
+            sheet_name = user_sheet_name(sheet_prefix, user['user_name'], role)
+            existing_tabs = sink.read_tabs(sheet_name, [tab for tab, _ in USER_TABS])
+            tabs = {
+                tab: user_tab_rows(project_data, role, include_payment, existing_tabs.get(tab))
+                for tab, include_payment in USER_TABS
+            }
+            sink.write_tabs(sheet_name, tabs, header_rows=USER_HEADER_ROWS)
+            user_sheets[sheet_name] = role
+
+    # The master sheet links to the user sheets by name
+    master_tabs = {}
+    for tab, role in MASTER_TABS:
+        rows = master_rows(master_data[role], role)
+        for row in rows[MASTER_HEADER_ROWS:]:
+            sheet_name = user_sheet_name(sheet_prefix, row[0], role)
+            if sheet_name in user_sheets:
+                row[MASTER_LINK_COLUMN] = sheet_name
+        master_tabs[tab] = rows
+    sink.write_tabs(master_name, master_tabs, header_rows=MASTER_HEADER_ROWS)
+
+    return user_sheets
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Export the Google Sheets reports to local XLSX or CSV files")
+    parser.add_argument("--output-dir", type=str, required=True,
+                        help="Directory the report files are written to")
+    parser.add_argument("--format", choices=["xlsx", "csv"], default="xlsx",
+                        help="Report file format (default: xlsx)")
+    parser.add_argument("--database-url-name", type=str, default="DBURL",
+                        help="Environment variable name for database URL")
+    parser.add_argument("--sheet-prefix", type=str, default="Pizza",
+                        help="Prefix for all individual sheet names (default: 'Pizza')")
+    parser.add_argument("--master-name", type=str, default="Master",
+                        help="Name of the master report (default: 'Master')")
+
+    args = parser.parse_args()
+
+    from dotenv import load_dotenv
+    load_dotenv(".env")
+
+    from label_pizza.db import init_database
+    init_database(args.database_url_name)
+
+    import label_pizza.db
+    from label_pizza.services import GoogleSheetsExportService
+
+    started = time.perf_counter()
+    with label_pizza.db.SessionLocal() as session:
+        master_data = {
+            "Annotator": GoogleSheetsExportService.get_master_sheet_annotator_data(session),
+            "Reviewer": GoogleSheetsExportService.get_master_sheet_reviewer_data(session),
+            "Meta-Reviewer": GoogleSheetsExportService.get_master_sheet_meta_reviewer_data(session),
+        }
+        project_data_by_role = {
+            "Annotator": GoogleSheetsExportService.get_annotator_project_data_by_user(session),
+            "Reviewer": GoogleSheetsExportService.get_reviewer_project_data_by_user(session),
+            "Meta-Reviewer": GoogleSheetsExportService.get_meta_reviewer_project_data_by_user(session),
+        }
+    data_seconds = time.perf_counter() - started
+
+    sink = XlsxSheetSink(args.output_dir) if args.format == "xlsx" else CsvSheetSink(args.output_dir)
+    started = time.perf_counter()
+    user_sheets = render_reports(sink, master_data, project_data_by_role, args.sheet_prefix, args.master_name)
+    render_seconds = time.perf_counter() - started
+
+    print(f"✅ Wrote the master report and {len(user_sheets)} user reports to {args.output_dir}")
+    print(f"   Statistics: {data_seconds:.2f}s, layout and files: {render_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Request batching for the Google Sheets export.
+
+Every formatting step of the export (header colors, header merges, column
+widths, alternating row colors, link chips) used to send its own
+spreadsheets.batchUpdate call. SpreadsheetBatch collects the requests of
+all tabs of one spreadsheet while it is exported so they can be sent in a
+single call. The Sheets API applies the requests of a call in order and
+atomically, so e.g. an unmerge followed by new merges needs no pause.
+"""
+
+from typing import Any, Callable, Dict, List
+
+
+class SpreadsheetBatch:
+    """Collects spreadsheets.batchUpdate requests for one spreadsheet"""
+
+    def __init__(self, spreadsheet_id: str):
+        """Create an empty batch.
+
+        Args:
+            spreadsheet_id: ID of the spreadsheet the requests apply to
+        """
+        self.spreadsheet_id = spreadsheet_id
+        self.requests: List[Dict] = []
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    def add(self, *requests: Dict):
+        """Append requests in the order they must be applied"""
+        self.requests.extend(requests)
+
+    def extend(self, requests: List[Dict]):
+        """Append a list of requests in the order they must be applied"""
+        self.requests.extend(requests)
+
+    def flush(self, send: Callable[[Dict], Any]) -> int:
+        """Send all collected requests in one batchUpdate body.
+
+        Args:
+            send: Function called with the {"requests": [...]} body; it performs the API call
+
+        Returns:
+            Number of requests sent (0 if the batch was empty and nothing was sent)
+
+        Raises:
+            Exception: Whatever send raises; the requests are kept so the batch can be retried
+        """
+        if not self.requests:
+            return 0
+        send({"requests": list(self.requests)})
+        count = len(self.requests)
+        self.requests = []
+        return count
@@ -0,0 +1,169 @@
+"""
+Token-bucket rate limiting for the Google Sheets export.
+
+The Sheets API enforces per-minute quotas per user (by default 60 read and
+60 write requests per minute), and the Drive API has a much larger one.
+SheetsRateLimiter keeps one token bucket per quota and is shared by every
+worker thread of an export, so concurrent user-sheet exports together stay
+under the quota instead of each sleeping for a fixed time.
+
+Each bucket holds a small burst and refills at a steady rate chosen so that
+no window of window_seconds ever sees more requests than the quota allows.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Default per-minute, per-user quotas of the Sheets and Drive APIs
+DEFAULT_QUOTAS_PER_MINUTE = {
+    "read": 60,
+    "write": 60,
+    "drive": 12000,
+}
+
+# Fraction of each quota that may be spent in a single burst
+DEFAULT_BURST_FRACTION = 0.1
+
+
+class TokenBucket:
+    """Thread-safe token bucket"""
+
+    def __init__(self, capacity: float, refill_per_second: float,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """Create a full bucket.
+
+        Args:
+            capacity: Maximum number of tokens (the largest burst)
+            refill_per_second: Tokens added per second
+            clock: Monotonic clock returning seconds
+            sleep: Function used to wait for tokens
+
+        Raises:
+            ValueError: If capacity or refill_per_second is not positive
+        """
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("capacity and refill_per_second must be positive")
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """Take tokens if they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            0 if the tokens were taken, otherwise the seconds until they will be available
+        """
+        with self._lock:
+            self._refill()
+            # Tolerate float rounding so a wait of exactly the computed time always succeeds
+            if self._tokens >= tokens - 1e-9:
+                self._tokens = max(0.0, self._tokens - tokens)
+                return 0.0
+            return (tokens - self._tokens) / self.refill_per_second
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Take tokens, waiting until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0:
+                return waited
+            self._sleep(wait)
+            waited += wait
+
+    def drain(self):
+        """Empty the bucket, e.g. after the server reported that the quota was exceeded"""
+        with self._lock:
+            self._refill()
+            self._tokens = 0.0
+
+
+class SheetsRateLimiter:
+    """One token bucket per API quota, shared by all export threads"""
+
+    def __init__(self, quotas: Optional[Dict[str, int]] = None, window_seconds: float = 60.0,
+                 burst_fraction: float = DEFAULT_BURST_FRACTION,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """Create the buckets.
+
+        Args:
+            quotas: Requests allowed per window, keyed by quota name (default: DEFAULT_QUOTAS_PER_MINUTE)
+            window_seconds: Length of the quota window in seconds
+            burst_fraction: Fraction of each quota available as an initial burst
+            clock: Monotonic clock returning seconds
+            sleep: Function used to wait for tokens
+        """
+        quotas = DEFAULT_QUOTAS_PER_MINUTE if quotas is None else quotas
+        self.buckets = {}
+        for name, limit in quotas.items():
+            # burst + refill over one window never exceeds the quota
+            burst = max(1, int(limit * burst_fraction))
+            refill = max(limit - burst, 1) / window_seconds
+            self.buckets[name] = TokenBucket(burst, refill, clock=clock, sleep=sleep)
+
+    def acquire(self, quota: Optional[str]) -> float:
+        """Wait for one request of the given quota.
+
+        Args:
+            quota: Quota name; None or an unknown name is not limited
+
+        Returns:
+            Seconds spent waiting
+        """
+        bucket = self.buckets.get(quota) if quota else None
+        return bucket.acquire() if bucket else 0.0
+
+    def drain(self, quota: Optional[str]):
+        """Empty a quota's bucket so every thread backs off after a rate-limit error"""
+        bucket = self.buckets.get(quota) if quota else None
+        if bucket:
+            bucket.drain()
+
+
+def run_in_workers(items: List[Any], worker: Callable[[Any], Any],
+                   max_workers: int) -> List[Tuple[Any, Any, Optional[Exception]]]:
+    """Run worker over items with a bounded thread pool.
+
+    Args:
+        items: Items to process
+        worker: Function called with each item
+        max_workers: Maximum number of concurrent workers (1 runs serially)
+
+    Returns:
+        (item, result, error) tuples in the order of items; error is None on success
+    """
+    def run(item):
+        try:
+            return item, worker(item), None
+        except Exception as e:
+            return item, None, e
+
+    if max_workers <= 1:
+        return [run(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, items))
@@ -0,0 +1,164 @@
+"""
+Per-video sort and filter metrics for the annotation UI.
+
+The sort tab ranks a project's videos by model confidence, annotator
+consensus, accuracy against ground truth or completion, and the filter tab
+keeps only videos whose ground truth matches given answers. Computing these
+per video and per question issued one query per (video, question, user).
+
+ProjectSortMetrics loads a project's annotator answers (with their question
+type and review status) and its ground truth with two queries, and computes
+every metric for all videos at once with pandas group-bys. Each metric
+returns {video_id: score}; videos without data are left out, so callers read
+scores with .get(video_id, 0).
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from label_pizza.models import AnnotatorAnswer, AnswerReview, Question, ReviewerGroundTruth
+
+
+ANSWER_COLUMNS = ["video_id", "question_id", "user_id", "answer_value",
+                  "confidence_score", "question_type", "review_status"]
+GROUND_TRUTH_COLUMNS = ["video_id", "question_id", "gt_value"]
+
+
+class ProjectSortMetrics:
+    """Answers and ground truth of one project, with vectorized per-video metrics"""
+
+    def __init__(self, answers: pd.DataFrame, ground_truth: pd.DataFrame):
+        """Wrap already loaded data.
+
+        Args:
+            answers: One row per annotator answer with ANSWER_COLUMNS
+            ground_truth: One row per ground truth answer with GROUND_TRUTH_COLUMNS
+        """
+        self.answers = answers if not answers.empty else pd.DataFrame(columns=ANSWER_COLUMNS)
+        self.ground_truth = ground_truth if not ground_truth.empty else pd.DataFrame(columns=GROUND_TRUTH_COLUMNS)
+
+    @classmethod
+    def load(cls, project_id: int, session: Session,
+             question_ids: Optional[List[int]] = None) -> "ProjectSortMetrics":
+        """Load a project's answers and ground truth with one query each.
+
+        Args:
+            project_id: The ID of the project
+            session: Database session
+            question_ids: Only load these questions (default: all questions)
+
+        Returns:
+            ProjectSortMetrics for the project
+        """
+        answer_query = (
+            select(
+                AnnotatorAnswer.video_id, AnnotatorAnswer.question_id, AnnotatorAnswer.user_id,
+                AnnotatorAnswer.answer_value, AnnotatorAnswer.confidence_score,
+                Question.type, AnswerReview.status
+            )
+            .join(Question, Question.id == AnnotatorAnswer.question_id)
+            .outerjoin(AnswerReview, AnswerReview.answer_id == AnnotatorAnswer.id)
+            .where(AnnotatorAnswer.project_id == project_id)
+        )
+        gt_query = (
+            select(ReviewerGroundTruth.video_id, ReviewerGroundTruth.question_id, ReviewerGroundTruth.answer_value)
+            .where(ReviewerGroundTruth.project_id == project_id)
+        )
+        if question_ids is not None:
+            answer_query = answer_query.where(AnnotatorAnswer.question_id.in_(question_ids))
+            gt_query = gt_query.where(ReviewerGroundTruth.question_id.in_(question_ids))
+
+        answers = pd.DataFrame(session.execute(answer_query).all(), columns=ANSWER_COLUMNS)
+        ground_truth = pd.DataFrame(session.execute(gt_query).all(), columns=GROUND_TRUTH_COLUMNS)
+        return cls(answers, ground_truth)
+
+    def _answers_for(self, question_ids: Iterable[int], user_ids: Optional[Iterable[int]] = None) -> pd.DataFrame:
+        answers = self.answers[self.answers["question_id"].isin(list(question_ids))]
+        if user_ids is not None:
+            answers = answers[answers["user_id"].isin(list(user_ids))]
+        return answers
+
+    def _answers_with_ground_truth(self, answers: pd.DataFrame) -> pd.DataFrame:
+        return answers.merge(self.ground_truth, on=["video_id", "question_id"], how="inner")
+
+    @staticmethod
+    def _to_dict(series: pd.Series) -> Dict[int, float]:
+        return {int(video_id): float(value) for video_id, value in series.items()}
+
+    def model_confidence(self, model_user_ids: List[int], question_ids: List[int]) -> Dict[int, float]:
+        """Mean confidence score of the model users' answers on the questions, per video"""
+        answers = self._answers_for(question_ids, model_user_ids)
+        scores = pd.to_numeric(answers["confidence_score"], errors="coerce")
+        return self._to_dict(scores.groupby(answers["video_id"]).mean().dropna())
+
+    def consensus_rates(self, annotator_user_ids: List[int], question_ids: List[int]) -> Dict[int, float]:
+        """Share of questions, among those answered by 2+ annotators, where a majority agrees, per video"""
+        answers = self._answers_for(question_ids, annotator_user_ids)
+        if answers.empty:
+            return {}
+
+        per_value = answers.groupby(["video_id", "question_id", "answer_value"]).size()
+        per_question = per_value.groupby(level=["video_id", "question_id"]).agg(["max", "sum"])
+        per_question = per_question[per_question["sum"] >= 2]
+        agreed = (per_question["max"] / per_question["sum"]) >= 0.5
+        return self._to_dict(agreed.groupby(level="video_id").mean())
+
+    def accuracy_rates(self, annotator_user_ids: List[int], question_ids: List[int]) -> Dict[int, float]:
+        """Share of the annotators' answers that match the ground truth, per video"""
+        compared = self._answers_with_ground_truth(self._answers_for(question_ids, annotator_user_ids))
+        correct = compared["answer_value"] == compared["gt_value"]
+        return self._to_dict(correct.groupby(compared["video_id"]).mean())
+
+    def completion_rates(self, question_ids: List[int]) -> Dict[int, float]:
+        """Percentage of the questions that have ground truth, per video"""
+        if not question_ids:
+            return {}
+        gt = self.ground_truth[self.ground_truth["question_id"].isin(question_ids)]
+        counts = gt.groupby("video_id")["question_id"].nunique()
+        return self._to_dict(counts / len(question_ids) * 100)
+
+    def user_completion_rates(self, user_id: int, question_ids: List[int]) -> Dict[int, float]:
+        """Percentage of the questions a user answered, per video"""
+        if not question_ids:
+            return {}
+        answers = self._answers_for(question_ids, [user_id])
+        counts = answers.groupby("video_id")["question_id"].nunique()
+        return self._to_dict(counts / len(question_ids) * 100)
+
+    def user_accuracy_rates(self, user_id: int, question_ids: List[int]) -> Dict[int, float]:
+        """Percentage of a user's judged answers that are correct, per video
+
+        Single-choice answers are judged against the ground truth; description
+        answers count once they are approved or rejected by a reviewer.
+        """
+        answers = self._answers_for(question_ids, [user_id])
+
+        single = self._answers_with_ground_truth(answers[answers["question_type"] == "single"])
+        single = pd.DataFrame({
+            "video_id": single["video_id"],
+            "correct": single["answer_value"] == single["gt_value"],
+        })
+
+        description = answers[
+            (answers["question_type"] == "description") &
+            answers["review_status"].isin(["approved", "rejected"])
+        ]
+        description = pd.DataFrame({
+            "video_id": description["video_id"],
+            "correct": description["review_status"] == "approved",
+        })
+
+        judged = pd.concat([single, description], ignore_index=True)
+        if judged.empty:
+            return {}
+        return self._to_dict(judged["correct"].astype(float).groupby(judged["video_id"]).mean() * 100)
+
+    def videos_matching_ground_truth(self, filter_by_gt: Dict[int, str]) -> set:
+        """IDs of the videos whose ground truth has the required answer for every filtered question"""
+        required = pd.DataFrame(list(filter_by_gt.items()), columns=["question_id", "gt_value"])
+        matches = self.ground_truth.merge(required, on=["question_id", "gt_value"], how="inner")
+        counts = matches.groupby("video_id")["question_id"].nunique()
+        return {int(video_id) for video_id in counts[counts == len(filter_by_gt)].index}
@@ -9,10 +9,11 @@ Covers cascade deletion logic, backup scenarios, admin reversion, and error hand
 
 import sys
 import os
+import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock, call
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import text, create_engine
 
 # Add the current directory to Python path so we can import override_utils
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,7 +22,7 @@ if current_dir not in sys.path:
 
 try:
     import override_utils
-    from override_utils import DeleteOperation
+    from override_utils import DeleteOperation, DeletePlan
 except ImportError as e:
     print(f"Error importing override_utils: {e}")
     print(f"Current directory: {current_dir}")
@@ -64,8 +65,10 @@ def mock_db():
 
 @pytest.fixture
 def mock_backup():
-    """Mock backup creation function"""
-    with patch('override_utils.create_backup_if_requested') as mock_backup:
+    """Mock full database backup creation function"""
+    with patch('override_utils.create_backup_if_requested') as mock_backup, \
+         patch('override_utils.get_db_url_for_backup', return_value="postgresql://test"), \
+         patch('override_utils.BACKUP_SCOPE', "database"):
         mock_backup.return_value = "/backups/test_backup.sql.gz"
         yield mock_backup
 
@@ -81,6 +84,61 @@ def sample_backup_params():
     }
 
 
+@pytest.fixture
+def plan_session():
+    """In-memory SQLite database with one project for delete plan tests.
+    
+    alice is annotator and reviewer, bob is reviewer and admin, carol is annotator.
+    """
+    from label_pizza.db import Base
+    
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    for i, name in enumerate(["alice", "bob", "carol"], 1):
+        session.execute(text("INSERT INTO users (id, user_id_str, password_hash) VALUES (:id, :name, 'x')"), {"id": i, "name": name})
+    session.execute(text("INSERT INTO schemas (id, name) VALUES (1, 'schema')"))
+    session.execute(text("INSERT INTO question_groups (id, title, display_title) VALUES (1, 'group', 'Group')"))
+    session.execute(text("INSERT INTO questions (id, text, display_text, type) VALUES (1, 'q1', 'Q1', 'single'), (2, 'q2', 'Q2', 'single')"))
+    session.execute(text("INSERT INTO question_group_questions VALUES (1, 1, 0), (1, 2, 1)"))
+    session.execute(text("INSERT INTO schema_question_groups VALUES (1, 1, 0)"))
+    session.execute(text("INSERT INTO projects (id, name, schema_id) VALUES (1, 'project', 1)"))
+    session.execute(text("INSERT INTO videos (id, video_uid, url) VALUES (1, 'v1.mp4', 'u1'), (2, 'v2.mp4', 'u2')"))
+    session.execute(text("INSERT INTO project_videos (project_id, video_id) VALUES (1, 1), (1, 2)"))
+    session.execute(text("""
+        INSERT INTO project_user_roles (project_id, user_id, role, user_weight) VALUES
+        (1, 1, 'annotator', 1.0), (1, 1, 'reviewer', 1.0), (1, 2, 'reviewer', 1.0), (1, 2, 'admin', 1.0), (1, 3, 'annotator', 1.0)
+    """))
+    answer_id = 0
+    for user_id in (1, 3):
+        for video_id in (1, 2):
+            for question_id in (1, 2):
+                answer_id += 1
+                session.execute(text("""
+                    INSERT INTO annotator_answers (id, video_id, question_id, user_id, project_id, answer_type, answer_value)
+                    VALUES (:id, :v, :q, :u, 1, 'single', 'a')
+                """), {"id": answer_id, "v": video_id, "q": question_id, "u": user_id})
+                session.execute(text("INSERT INTO answer_reviews (answer_id, reviewer_id, status) VALUES (:a, :r, 'approved')"),
+                                {"a": answer_id, "r": 2 if user_id == 1 else 1})
+    session.execute(text("""
+        INSERT INTO reviewer_ground_truth
+        (video_id, question_id, project_id, reviewer_id, answer_type, answer_value, original_answer_value, modified_by_admin_id, created_at)
+        VALUES (1, 1, 1, 1, 'single', 'b', 'a', 2, CURRENT_TIMESTAMP), (2, 1, 1, 2, 'single', 'a', 'a', NULL, CURRENT_TIMESTAMP)
+    """))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def snapshot_db(plan_session):
+    """Point SessionLocal at the planner test database"""
+    from sqlalchemy.orm import sessionmaker
+    with patch('override_utils.label_pizza.db.SessionLocal', sessionmaker(bind=plan_session.get_bind())):
+        yield plan_session
+
+
 @pytest.fixture
 def hashable_backup_params():
     """Hashable backup parameters for set operations"""
@@ -131,31 +189,34 @@ class TestHelperFunctions:
         # Should have all unique operations
         assert len(result) == 3
     
+    @patch('override_utils._get_readable_operation_name', return_value="Delete user 'alice'")
     @patch('builtins.input', return_value='DELETE')
-    def test_confirm_cascade_deletion_accept(self, mock_input):
-        """Test user confirmation - accept deletion"""
+    def test_confirm_delete_plan_accept(self, mock_input, mock_name, capsys):
+        """Test user confirmation - accept deletion, counts shown per table"""
         backup_params = {"backup_first": True}
-        operations = [
-            DeleteOperation('User', 'using_id', (1,), backup_params),
-            DeleteOperation('AnswerReview', 'using_id', (1,), backup_params)
-        ]
+        plan = DeletePlan([DeleteOperation('User', 'using_id', (1,), backup_params)],
+                          {'AnswerReview': 1200, 'User': 1})
         
-        result = override_utils._confirm_cascade_deletion(operations)
+        result = override_utils._confirm_delete_plan(plan)
         assert result is True
         mock_input.assert_called_once()
+        output = capsys.readouterr().out
+        assert "answer_reviews" in output and "1,200" in output
+        assert "Total rows: 1,201" in output
     
+    @patch('override_utils._get_readable_operation_name', return_value="Delete user 'alice'")
     @patch('builtins.input', return_value='CANCEL')
-    def test_confirm_cascade_deletion_reject(self, mock_input):
+    def test_confirm_delete_plan_reject(self, mock_input, mock_name):
         """Test user confirmation - reject deletion"""
         backup_params = {"backup_first": True}
-        operations = [DeleteOperation('User', 'using_id', (1,), backup_params)]
+        plan = DeletePlan([DeleteOperation('User', 'using_id', (1,), backup_params)], {'User': 1})
         
-        result = override_utils._confirm_cascade_deletion(operations)
+        result = override_utils._confirm_delete_plan(plan)
         assert result is False
     
-    def test_confirm_cascade_deletion_empty(self):
-        """Test confirmation with empty operations"""
-        result = override_utils._confirm_cascade_deletion([])
+    def test_confirm_delete_plan_empty(self):
+        """Test confirmation with empty plan"""
+        result = override_utils._confirm_delete_plan(DeletePlan([], {}))
         assert result is True
 
 
@@ -199,72 +260,269 @@ class TestDatabaseLookups:
 
 
 # ============================================================================
-# DEPENDENCY COLLECTION TESTS
+# DELETE PLAN TESTS
 # ============================================================================
 
-class TestDependencyCollection:
-    """Test dependency collection functions"""
+def _plan(session, table, identifier):
+    """Build a delete plan for a single root operation"""
+    operations = [DeleteOperation(table, 'using_id', identifier, {"backup_first": False})]
+    return override_utils._build_delete_plan(session, operations)
+
+
+class TestDeletePlan:
+    """Test set-based cascade planning and execution on SQLite"""
     
-    def test_collect_answer_review_dependencies(self, mock_session):
-        """Test answer review dependency collection"""
-        mock_session.execute.return_value.fetchall.return_value = [(1,), (2,)]
-        backup_params = {"backup_first": True}
-        
-        result = override_utils._collect_answer_review_dependencies(mock_session, 123, backup_params)
+    def test_plan_answer_cascades_to_review(self, plan_session):
+        """Test annotator answer deletion plan includes its review"""
+        plan = _plan(plan_session, 'AnnotatorAnswer', (1,))
         
-        assert len(result) == 2
-        operations_list = list(result)
-        assert all(op.table == 'AnswerReview' for op in operations_list)
-        identifiers = [op.identifier for op in operations_list]
-        assert (1,) in identifiers
-        assert (2,) in identifiers
+        assert plan.counts['AnnotatorAnswer'] == 1
+        assert plan.counts['AnswerReview'] == 1
+        assert plan.total_rows == 2
     
-    def test_collect_project_group_dependencies(self, mock_session):
-        """Test project group dependency collection"""
-        mock_session.execute.return_value.fetchall.return_value = [(10,), (20,)]
-        backup_params = {"backup_first": True}
+    def test_plan_missing_root_is_empty(self, plan_session):
+        """Test roots that do not exist are not staged"""
+        plan = _plan(plan_session, 'User', (999,))
         
-        result = override_utils._collect_project_group_dependencies(mock_session, 5, backup_params)
+        assert plan.total_rows == 0
+    
+    def test_plan_annotator_role_escalates(self, plan_session):
+        """Test annotator role removal also removes the reviewer role and its work"""
+        plan = _plan(plan_session, 'ProjectUserRole', (1, 1, 'annotator'))
         
-        assert len(result) == 2
-        operations_list = list(result)
-        assert all(op.table == 'ProjectGroupProject' for op in operations_list)
-        identifiers = [op.identifier for op in operations_list]
-        assert (5, 10) in identifiers
-        assert (5, 20) in identifiers
+        assert plan.counts['ProjectUserRole'] == 2  # annotator + reviewer
+        assert plan.counts['AnnotatorAnswer'] == 4  # alice's answers
+        assert plan.counts['ReviewerGroundTruth'] == 1  # ground truth alice created
+        # Reviews of alice's answers plus alice's reviews of carol's answers
+        assert plan.counts['AnswerReview'] == 8
+        assert plan.admin_reverts == 0
     
-    def test_collect_project_user_role_dependencies_admin(self, mock_session):
-        """Test admin role deletion - should trigger ground truth reversion"""
-        backup_params = {"backup_first": True}
+    def test_plan_reviewer_role_escalates_to_admin(self, plan_session):
+        """Test reviewer role removal also removes the admin role and reverts its edits"""
+        plan = _plan(plan_session, 'ProjectUserRole', (1, 2, 'reviewer'))
         
-        result = override_utils._collect_project_user_role_dependencies(
-            mock_session, 1, 2, "admin", backup_params
-        )
+        assert plan.counts['ProjectUserRole'] == 2  # reviewer + admin
+        assert plan.counts['AnnotatorAnswer'] == 0
+        assert plan.counts['ReviewerGroundTruth'] == 1
+        assert plan.admin_reverts == 1
+    
+    def test_plan_project_covers_everything(self, plan_session):
+        """Test project deletion plan covers all project rows"""
+        plan = _plan(plan_session, 'Project', (1,))
         
-        # Admin role deletion should not add additional operations
-        # (reversion is handled in _execute_delete_operations)
-        assert len(result) == 0
+        assert plan.counts['Project'] == 1
+        assert plan.counts['ProjectVideo'] == 2
+        assert plan.counts['ProjectUserRole'] == 5
+        assert plan.counts['AnnotatorAnswer'] == 8
+        assert plan.counts['AnswerReview'] == 8
+        assert plan.counts['ReviewerGroundTruth'] == 2
+        assert plan.counts['Video'] == 0
     
-    def test_collect_project_user_role_dependencies_reviewer_simple(self, mock_session):
-        """Test reviewer role deletion without admin role"""
-        backup_params = {"backup_first": True}
+    def test_plan_question_group_question(self, plan_session):
+        """Test removing a question from a group removes its answers in projects using the group"""
+        plan = _plan(plan_session, 'QuestionGroupQuestion', (1, 1))
         
-        # Mock no admin role + some ground truths and reviews
-        mock_session.execute.return_value.fetchone.return_value = None  # No admin role
-        mock_session.execute.return_value.fetchall.side_effect = [
-            [(10, 1), (20, 1)],  # Reviewer ground truths
-            [(100,), (200,)]     # Answer reviews
+        assert plan.counts['QuestionGroupQuestion'] == 1
+        assert plan.counts['AnnotatorAnswer'] == 4
+        assert plan.counts['ReviewerGroundTruth'] == 2
+        assert plan.counts['Question'] == 0
+    
+    def test_plan_deduplicates_overlapping_roots(self, plan_session):
+        """Test overlapping roots stage each row once"""
+        backup_params = {"backup_first": False}
+        operations = [
+            DeleteOperation('User', 'using_id', (3,), backup_params),
+            DeleteOperation('ProjectUserRole', 'using_id', (1, 3, 'annotator'), backup_params),
+            DeleteOperation('AnnotatorAnswer', 'using_id', (5,), backup_params),
         ]
         
-        result = override_utils._collect_project_user_role_dependencies(
-            mock_session, 1, 2, "reviewer", backup_params
-        )
+        plan = override_utils._build_delete_plan(plan_session, operations)
+        
+        assert plan.counts['ProjectUserRole'] == 1
+        assert plan.counts['AnnotatorAnswer'] == 4
+        assert plan.counts['AnswerReview'] == 4
+    
+    def test_execute_plan_deletes_and_reverts(self, plan_session):
+        """Test plan execution deletes staged rows and reverts admin edits"""
+        plan = _plan(plan_session, 'User', (2,))
+        
+        assert override_utils._execute_delete_plan(plan_session, plan) is True
+        
+        assert plan_session.execute(text("SELECT COUNT(*) FROM users WHERE id = 2")).scalar() == 0
+        assert plan_session.execute(text("SELECT COUNT(*) FROM project_user_roles WHERE user_id = 2")).scalar() == 0
+        assert plan_session.execute(text("SELECT COUNT(*) FROM answer_reviews WHERE reviewer_id = 2")).scalar() == 0
+        # Ground truth bob created is gone, the one he modified as admin is reverted
+        row = plan_session.execute(text("SELECT answer_value, modified_by_admin_id FROM reviewer_ground_truth")).fetchall()
+        assert row == [('a', None)]
+        # Other users' work is untouched
+        assert plan_session.execute(text("SELECT COUNT(*) FROM annotator_answers")).scalar() == 8
+    
+    def test_run_plan_cancelled_leaves_data(self, plan_session):
+        """Test cancelled deletion changes nothing and cleans up staging tables"""
+        backup_params = {"backup_first": False}
+        operations = [DeleteOperation('Project', 'using_id', (1,), backup_params)]
         
-        operations_list = list(result)
-        tables = [op.table for op in operations_list]
-        assert 'ReviewerGroundTruth' in tables
-        assert 'AnswerReview' in tables
+        with patch('override_utils._confirm_delete_plan', return_value=False):
+            assert override_utils._run_delete_plan(plan_session, operations) is False
+        
+        assert plan_session.execute(text("SELECT COUNT(*) FROM annotator_answers")).scalar() == 8
+        # Planning again on the same connection works
+        assert _plan(plan_session, 'Project', (1,)).counts['Project'] == 1
+
+
+# ============================================================================
+# SNAPSHOT AND UNDO TESTS
+# ============================================================================
+
+def _table_rows(session):
+    """All rows of every data table, for before/after comparisons"""
+    from label_pizza.models import Base
+    # Every write bumps project_data_versions, so it never returns to its old rows
+    return {name: sorted(map(tuple, session.execute(table.select()).fetchall()), key=repr)
+            for name, table in Base.metadata.tables.items() if name != "project_data_versions"}
+
+
+class TestSnapshotAndUndo:
+    """Test scoped pre-change snapshots and undo_snapshot on SQLite"""
+    
+    def test_delete_snapshot_and_undo(self, snapshot_db, tmp_path):
+        """Test a cascade delete is fully put back by undo, including admin reverts"""
+        before = _table_rows(snapshot_db)
+        
+        with patch('builtins.input', return_value='DELETE'):
+            assert override_utils.delete_user_using_id(2, backup_dir=str(tmp_path)) is True
+        snapshot_db.expire_all()
+        assert _table_rows(snapshot_db) != before
+        
+        snapshots = list(tmp_path.glob("snapshot_*.json.gz"))
+        assert len(snapshots) == 1
+        assert override_utils.undo_snapshot(str(snapshots[0]), confirm=False) is True
+        
+        snapshot_db.expire_all()
+        assert _table_rows(snapshot_db) == before
+    
+    def test_rename_snapshot_and_undo(self, snapshot_db, tmp_path):
+        """Test a rename snapshot holds the single row and undo restores the name"""
+        assert override_utils.set_user_name_using_id(1, "alicia", backup_dir=str(tmp_path), compress=False) is True
+        
+        snapshot_file = next(tmp_path.glob("snapshot_*.json"))
+        snapshot = json.loads(snapshot_file.read_text())
+        assert [(entry["table"], entry["mode"], len(entry["rows"])) for entry in snapshot["tables"]] == [("users", "replace", 1)]
+        
+        assert override_utils.undo_snapshot(str(snapshot_file), confirm=False) is True
+        assert snapshot_db.execute(text("SELECT user_id_str FROM users WHERE id = 1")).scalar() == "alice"
+    
+    def test_undo_conflict_changes_nothing(self, snapshot_db, tmp_path):
+        """Test undo fails without changes when a deleted key is in use again"""
+        with patch('builtins.input', return_value='DELETE'):
+            assert override_utils.delete_video_using_id(2, backup_dir=str(tmp_path)) is True
+        snapshot_db.execute(text("INSERT INTO videos (id, video_uid, url) VALUES (2, 'other.mp4', 'u')"))
+        snapshot_db.commit()
+        
+        assert override_utils.undo_snapshot(str(next(tmp_path.glob("snapshot_*"))), confirm=False) is False
+        assert snapshot_db.execute(text("SELECT COUNT(*) FROM project_videos WHERE video_id = 2")).scalar() == 0
+    
+    @patch('builtins.input', return_value='NO')
+    def test_undo_cancelled(self, mock_input, snapshot_db, tmp_path):
+        """Test undo asks for confirmation"""
+        assert override_utils.set_user_name_using_id(1, "alicia", backup_dir=str(tmp_path)) is True
+        
+        assert override_utils.undo_snapshot(str(next(tmp_path.glob("snapshot_*")))) is False
+        assert snapshot_db.execute(text("SELECT user_id_str FROM users WHERE id = 1")).scalar() == "alicia"
+    
+    def test_undo_rejects_other_files(self, tmp_path):
+        """Test undo refuses files that are not snapshots"""
+        other = tmp_path / "backup.json"
+        other.write_text("[]")
+        
+        assert override_utils.undo_snapshot(str(other), confirm=False) is False
+
+
 
+class TestBatchOperations:
+    """Test batch_rename and batch_delete from CSV and JSON manifests on SQLite"""
+    
+    def test_batch_rename_csv_with_swap(self, snapshot_db, tmp_path):
+        """Test a CSV rename manifest may swap names within the batch and is snapshotted once"""
+        manifest = tmp_path / "renames.csv"
+        manifest.write_text("old_name,new_name\nv1.mp4,v2.mp4\nv2.mp4,v1.mp4\n")
+        
+        assert override_utils.batch_rename("video", str(manifest), backup_dir=str(tmp_path), confirm=False) is True
+        assert snapshot_db.execute(text("SELECT video_uid FROM videos ORDER BY id")).scalars().all() == ["v2.mp4", "v1.mp4"]
+        
+        snapshots = list(tmp_path.glob("snapshot_*"))
+        assert len(snapshots) == 1
+        assert override_utils.undo_snapshot(str(snapshots[0]), confirm=False) is True
+        assert snapshot_db.execute(text("SELECT video_uid FROM videos ORDER BY id")).scalars().all() == ["v1.mp4", "v2.mp4"]
+    
+    def test_batch_rename_json_mapping(self, snapshot_db, tmp_path):
+        """Test a JSON {old: new} manifest renames every entry"""
+        manifest = tmp_path / "renames.json"
+        manifest.write_text(json.dumps({"alice": "alicia", "carol": "caroline"}))
+        
+        assert override_utils.batch_rename("user", str(manifest), backup_first=False, confirm=False) is True
+        assert snapshot_db.execute(text("SELECT user_id_str FROM users ORDER BY id")).scalars().all() == ["alicia", "bob", "caroline"]
+    
+    def test_batch_rename_validation_changes_nothing(self, snapshot_db, tmp_path):
+        """Test unknown names, duplicates and taken names reject the whole batch"""
+        manifest = tmp_path / "renames.json"
+        manifest.write_text(json.dumps([
+            {"old_name": "alice", "new_name": "bob"},
+            {"old_name": "carol", "new_name": "new"},
+            {"old_name": "carol", "new_name": "other"},
+            {"old_name": "nobody", "new_name": "someone"},
+        ]))
+        
+        assert override_utils.batch_rename("user", str(manifest), backup_dir=str(tmp_path), confirm=False) is False
+        assert snapshot_db.execute(text("SELECT user_id_str FROM users ORDER BY id")).scalars().all() == ["alice", "bob", "carol"]
+        assert list(tmp_path.glob("snapshot_*")) == []
+    
+    @patch('builtins.input', return_value='NO')
+    def test_batch_rename_cancelled(self, mock_input, snapshot_db, tmp_path):
+        """Test batch rename asks for a single confirmation"""
+        manifest = tmp_path / "renames.csv"
+        manifest.write_text("old_name,new_name\nq1,first\nq2,second\n")
+        
+        assert override_utils.batch_rename("question", str(manifest), backup_dir=str(tmp_path)) is False
+        mock_input.assert_called_once()
+        assert snapshot_db.execute(text("SELECT text FROM questions ORDER BY id")).scalars().all() == ["q1", "q2"]
+    
+    def test_batch_delete_single_plan(self, snapshot_db, tmp_path):
+        """Test a delete manifest is planned, confirmed and snapshotted once"""
+        manifest = tmp_path / "users.json"
+        manifest.write_text(json.dumps(["alice", "carol", "alice"]))
+        
+        with patch('builtins.input', return_value='DELETE') as mock_input:
+            assert override_utils.batch_delete("user", str(manifest), backup_dir=str(tmp_path)) is True
+        mock_input.assert_called_once()
+        
+        assert snapshot_db.execute(text("SELECT user_id_str FROM users")).scalars().all() == ["bob"]
+        assert snapshot_db.execute(text("SELECT COUNT(*) FROM annotator_answers")).scalar() == 0
+        assert len(list(tmp_path.glob("snapshot_*"))) == 1
+    
+    def test_batch_delete_unknown_name(self, snapshot_db, tmp_path):
+        """Test a manifest with an unknown name deletes nothing"""
+        manifest = tmp_path / "videos.csv"
+        manifest.write_text("name\nv1.mp4\nmissing.mp4\n")
+        
+        assert override_utils.batch_delete("video", str(manifest), backup_dir=str(tmp_path)) is False
+        assert snapshot_db.execute(text("SELECT COUNT(*) FROM videos")).scalar() == 2
+    
+    def test_read_manifest_errors(self, tmp_path):
+        """Test manifests with missing columns, empty values or other file types are rejected"""
+        missing_column = tmp_path / "a.csv"
+        missing_column.write_text("old_name\nx\n")
+        empty_value = tmp_path / "b.json"
+        empty_value.write_text(json.dumps([{"old_name": "x", "new_name": ""}]))
+        
+        for manifest in (missing_column, empty_value, tmp_path / "c.txt"):
+            with pytest.raises(ValueError):
+                override_utils._read_manifest(str(manifest), ("old_name", "new_name"))
+    
+    def test_unknown_entity(self, tmp_path):
+        """Test batch functions reject unsupported entity types"""
+        assert override_utils.batch_rename("answer", str(tmp_path / "x.csv")) is False
+        assert override_utils.batch_delete("answer", str(tmp_path / "x.csv")) is False
 
 # ============================================================================
 # DELETE USING ID FUNCTION TESTS
@@ -278,15 +536,15 @@ class TestDeleteUsingIdFunctions:
         mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
         mock_session.execute.return_value.fetchone.return_value = ("test_user",)
         
-        with patch('override_utils._collect_user_dependencies', return_value=set()) as mock_collect_deps, \
-             patch('override_utils._collect_delete_operations', return_value=[]) as mock_collect_ops, \
-             patch('override_utils._confirm_cascade_deletion', return_value=True) as mock_confirm, \
-             patch('override_utils._execute_delete_operations', return_value=True) as mock_execute:
+        with patch('override_utils._build_delete_plan', return_value=DeletePlan([], {})) as mock_plan, \
+             patch('override_utils._confirm_delete_plan', return_value=True) as mock_confirm, \
+             patch('override_utils._execute_delete_plan', return_value=True) as mock_execute:
             
             result = override_utils.delete_user_using_id(1)
             
             assert result is True
-            mock_collect_deps.assert_called_once()
+            operations = mock_plan.call_args[0][1]
+            assert [(op.table, op.identifier) for op in operations] == [('User', (1,))]
             mock_confirm.assert_called_once()
             mock_execute.assert_called_once()
     
@@ -304,10 +562,9 @@ class TestDeleteUsingIdFunctions:
         mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
         mock_session.execute.return_value.fetchone.return_value = ("test_user",)
         
-        with patch('override_utils._collect_user_dependencies', return_value=set()), \
-             patch('override_utils._collect_delete_operations', return_value=[]), \
-             patch('override_utils._confirm_cascade_deletion', return_value=False) as mock_confirm, \
-             patch('override_utils._execute_delete_operations') as mock_execute:
+        with patch('override_utils._build_delete_plan', return_value=DeletePlan([], {})), \
+             patch('override_utils._confirm_delete_plan', return_value=False) as mock_confirm, \
+             patch('override_utils._execute_delete_plan') as mock_execute:
             
             result = override_utils.delete_user_using_id(1)
             
@@ -319,8 +576,9 @@ class TestDeleteUsingIdFunctions:
         mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
         mock_session.execute.return_value.fetchone.return_value = (1,)  # Tag exists
         
-        with patch('override_utils._confirm_cascade_deletion', return_value=True), \
-             patch('override_utils._execute_delete_operations', return_value=True):
+        with patch('override_utils._build_delete_plan', return_value=DeletePlan([], {})), \
+             patch('override_utils._confirm_delete_plan', return_value=True), \
+             patch('override_utils._execute_delete_plan', return_value=True):
             
             result = override_utils.delete_video_tag_using_id(1, "NSFW")
             
@@ -383,91 +641,62 @@ class TestDeleteUsingNameFunctions:
 class TestExecuteOperations:
     """Test operation execution and backup handling"""
     
-    def test_execute_delete_operations_empty(self):
-        """Test execution with empty operations list"""
-        result = override_utils._execute_delete_operations([])
+    def test_execute_delete_plan_empty(self, mock_session):
+        """Test execution with empty plan"""
+        result = override_utils._execute_delete_plan(mock_session, DeletePlan([], {}))
         assert result is True
+        mock_session.execute.assert_not_called()
     
     @patch('builtins.input', return_value='CONTINUE')
-    def test_execute_delete_operations_backup_failure(self, mock_input, mock_db, mock_backup):
-        """Test operation execution when backup fails"""
+    def test_execute_delete_plan_backup_failure(self, mock_input, mock_session, mock_backup):
+        """Test plan execution when backup fails"""
         mock_backup.side_effect = Exception("Backup failed")
         backup_params = {"backup_first": True, "backup_dir": "./backups", "backup_file": None, "compress": True}
-        operations = [DeleteOperation('User', 'using_id', (1,), backup_params)]
+        plan = DeletePlan([DeleteOperation('User', 'using_id', (1,), backup_params)], {'User': 1})
         
-        with patch('override_utils._execute_single_delete_operation') as mock_single:
-            result = override_utils._execute_delete_operations(operations)
-            
-            assert result is True  # Should continue after user confirmation
-            mock_input.assert_called_once()
-            mock_single.assert_called_once()
+        result = override_utils._execute_delete_plan(mock_session, plan)
+        
+        assert result is True  # Should continue after user confirmation
+        mock_input.assert_called_once()
+        mock_session.commit.assert_called_once()
     
     @patch('builtins.input', return_value='ABORT')
-    def test_execute_delete_operations_backup_failure_abort(self, mock_input, mock_db, mock_backup):
-        """Test operation execution when backup fails and user aborts"""
+    def test_execute_delete_plan_backup_failure_abort(self, mock_input, mock_session, mock_backup):
+        """Test plan execution when backup fails and user aborts"""
         mock_backup.side_effect = Exception("Backup failed")
         backup_params = {"backup_first": True, "backup_dir": "./backups", "backup_file": None, "compress": True}
-        operations = [DeleteOperation('User', 'using_id', (1,), backup_params)]
+        plan = DeletePlan([DeleteOperation('User', 'using_id', (1,), backup_params)], {'User': 1})
         
-        result = override_utils._execute_delete_operations(operations)
+        result = override_utils._execute_delete_plan(mock_session, plan)
         
         assert result is False
         mock_input.assert_called_once()
+        mock_session.commit.assert_not_called()
     
-    def test_execute_delete_operations_admin_reversion(self, mock_db):
-        """Test admin ground truth reversion during operation execution"""
-        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
-        mock_session.execute.return_value.rowcount = 3
-        
+    def test_execute_delete_plan_table_statements(self, mock_session):
+        """Test one DELETE per non-empty table, children before parents"""
         backup_params = {"backup_first": False}
-        operations = [
-            DeleteOperation('ProjectUserRole', 'using_id', (1, 2, 'admin'), backup_params),
-            DeleteOperation('User', 'using_id', (2,), backup_params)
-        ]
+        plan = DeletePlan([DeleteOperation('User', 'using_id', (1,), backup_params)],
+                          {'User': 1, 'ProjectUserRole': 2, 'AnswerReview': 3, 'Video': 0})
         
-        with patch('override_utils._execute_single_delete_operation') as mock_single:
-            result = override_utils._execute_delete_operations(operations)
-            
-            assert result is True
-            # Should execute reversion SQL and single operations
-            assert mock_session.execute.call_count >= 1
-            mock_single.assert_called()
-    
-    def test_execute_single_delete_operation_user(self, mock_session):
-        """Test single operation execution for user table"""
-        backup_params = {"backup_first": False}
-        operation = DeleteOperation('User', 'using_id', (123,), backup_params)
-        
-        override_utils._execute_single_delete_operation(mock_session, operation)
+        result = override_utils._execute_delete_plan(mock_session, plan)
         
-        # Verify SQL execution
-        mock_session.execute.assert_called()
-        call_args = mock_session.execute.call_args
-        sql_str = str(call_args[0][0])
-        assert "DELETE FROM users WHERE id = :id" in sql_str
-        assert call_args[1] == {"id": 123}
-    
-    def test_execute_single_delete_operation_video_tag(self, mock_session):
-        """Test single operation execution for video tag"""
-        backup_params = {"backup_first": False}
-        operation = DeleteOperation('VideoTag', 'using_id', (1, 'NSFW'), backup_params)
-        
-        override_utils._execute_single_delete_operation(mock_session, operation)
-        
-        # Verify SQL execution
-        mock_session.execute.assert_called()
-        call_args = mock_session.execute.call_args
-        sql_str = str(call_args[0][0])
-        assert "DELETE FROM video_tags" in sql_str
-        assert call_args[1] == {"video_id": 1, "tag": "NSFW"}
+        assert result is True
+        deletes = [str(c[0][0]) for c in mock_session.execute.call_args_list if str(c[0][0]).startswith("DELETE")]
+        assert deletes == [
+            "DELETE FROM answer_reviews WHERE (id) IN (SELECT id FROM _del_answer_reviews)",
+            "DELETE FROM project_user_roles WHERE (project_id, user_id, role) IN (SELECT project_id, user_id, role FROM _del_project_user_roles)",
+            "DELETE FROM users WHERE (id) IN (SELECT id FROM _del_users)",
+        ]
+        mock_session.commit.assert_called_once()
     
-    def test_execute_single_delete_operation_unknown_table(self, mock_session):
-        """Test single operation execution with unknown table"""
+    def test_build_delete_plan_unknown_table(self, mock_session):
+        """Test planning with unknown table"""
         backup_params = {"backup_first": False}
         operation = DeleteOperation('UnknownTable', 'using_id', (1,), backup_params)
         
         with pytest.raises(ValueError, match="Unknown table for using_id deletion"):
-            override_utils._execute_single_delete_operation(mock_session, operation)
+            override_utils._build_delete_plan(mock_session, [operation])
 
 
 # ============================================================================
@@ -521,11 +750,14 @@ class TestNameManagementFunctions:
     def test_set_user_name_using_id_backup_failure_abort(self, mock_input, mock_db, mock_backup):
         """Test setting user name when backup fails and user aborts"""
         mock_backup.side_effect = Exception("Backup failed")
+        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+        mock_session.execute.return_value.fetchone.side_effect = [("old_name",), None]
         
         result = override_utils.set_user_name_using_id(1, "new_name")
         
         assert result is False
         mock_input.assert_called_once()
+        mock_session.commit.assert_not_called()
     
     def test_set_user_name_using_id_user_not_found(self, mock_db):
         """Test setting user name - user not found"""
@@ -569,7 +801,7 @@ class TestIntegrationAndEdgeCases:
         result = override_utils._collect_delete_operations(set())
         assert result == []
         
-        result = override_utils._execute_delete_operations([])
+        result = override_utils._execute_delete_plan(Mock(spec=Session), DeletePlan([], {}))
         assert result is True
     
     def test_database_error_handling(self, mock_db):
@@ -604,55 +836,36 @@ class TestIntegrationAndEdgeCases:
 class TestSpecificScenarios:
     """Test specific business logic scenarios"""
     
-    def test_admin_role_deletion_reversion_logic(self, mock_db):
-        """Test admin role deletion triggers ground truth reversion"""
-        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+    def test_admin_role_deletion_reversion_logic(self, mock_session):
+        """Test admin role deletion triggers ground truth reversion before deletes"""
         mock_session.execute.return_value.rowcount = 5  # 5 ground truths reverted
         
         backup_params = {"backup_first": False}
-        operations = [
-            DeleteOperation('ProjectUserRole', 'using_id', (1, 2, 'admin'), backup_params)
-        ]
+        plan = DeletePlan([DeleteOperation('ProjectUserRole', 'using_id', (1, 2, 'admin'), backup_params)],
+                          {'ProjectUserRole': 1}, admin_reverts=5)
         
-        with patch('override_utils._execute_single_delete_operation') as mock_single:
-            result = override_utils._execute_delete_operations(operations)
-            
-            assert result is True
-            # Should execute reversion SQL
-            assert mock_session.execute.call_count >= 1
-            
-            # Check that the reversion SQL was called
-            reversion_call = mock_session.execute.call_args_list[0]
-            sql_text = str(reversion_call[0][0])
-            assert "UPDATE reviewer_ground_truth" in sql_text
-            assert "SET answer_value = original_answer_value" in sql_text
+        result = override_utils._execute_delete_plan(mock_session, plan)
+        
+        assert result is True
+        # Check that the reversion SQL was called first
+        reversion_call = mock_session.execute.call_args_list[0]
+        sql_text = str(reversion_call[0][0])
+        assert "UPDATE reviewer_ground_truth" in sql_text
+        assert "SET answer_value = original_answer_value" in sql_text
     
-    def test_reviewer_role_without_admin(self, mock_db):
+    def test_reviewer_role_without_admin(self, plan_session):
         """Test reviewer role deletion when user doesn't have admin role"""
-        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
-        
-        # Mock that user does NOT have admin role
-        mock_session.execute.return_value.fetchone.return_value = None
-        mock_session.execute.return_value.fetchall.side_effect = [
-            [(10, 1), (20, 1)],  # Reviewer ground truths
-            [(100,), (200,)]     # Answer reviews
-        ]
-        
-        backup_params = {"backup_first": False}
-        result = override_utils._collect_project_user_role_dependencies(
-            mock_session, 1, 2, "reviewer", backup_params
-        )
-        
-        operations_list = list(result)
-        tables = [op.table for op in operations_list]
+        # alice is reviewer and annotator, not admin
+        plan = _plan(plan_session, 'ProjectUserRole', (1, 1, 'reviewer'))
         
-        # Should NOT include admin role deletion
-        assert 'ProjectUserRole' not in tables or \
-               not any(op.identifier[2] == 'admin' for op in operations_list if op.table == 'ProjectUserRole')
+        # Should NOT include admin role deletion or alice's annotations
+        assert plan.counts['ProjectUserRole'] == 1
+        assert plan.counts['AnnotatorAnswer'] == 0
+        assert plan.admin_reverts == 0
         
         # Should include reviewer-specific deletions
-        assert 'ReviewerGroundTruth' in tables
-        assert 'AnswerReview' in tables
+        assert plan.counts['ReviewerGroundTruth'] == 1
+        assert plan.counts['AnswerReview'] == 4
 
 
 # ============================================================================
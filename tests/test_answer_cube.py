@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+from label_pizza.answer_cube import MISSING, ProjectAnswerCube
+from label_pizza.models import AnnotatorAnswer, Question, ReviewerGroundTruth
+from label_pizza.sort_metrics import ProjectSortMetrics
+
+
+ANSWERS = [
+    # (video, question, user, value, confidence)
+    (10, 1, 1, "yes", 0.9), (10, 1, 2, "yes", None), (10, 1, 3, "no", 0.5),
+    (10, 2, 1, "no", 0.7), (10, 2, 2, "yes", 0.25),
+    (20, 1, 1, "no", 0.25), (20, 2, 2, "no", None),
+]
+GROUND_TRUTH = [(10, 1, "yes"), (10, 2, "no"), (20, 1, "yes"), (30, 2, "yes")]
+
+
+@pytest.fixture
+def cube_session(session):
+    session.add_all([
+        Question(id=1, text="q1", display_text="Q1", type="single", options=["yes", "no"]),
+        Question(id=2, text="q2", display_text="Q2", type="single", options=["yes", "no"]),
+    ])
+    for answer_id, (video_id, question_id, user_id, value, confidence) in enumerate(ANSWERS, 1):
+        session.add(AnnotatorAnswer(
+            id=answer_id, video_id=video_id, question_id=question_id, user_id=user_id, project_id=1,
+            answer_value=value, confidence_score=confidence,
+        ))
+    session.add(AnnotatorAnswer(id=99, video_id=10, question_id=1, user_id=1, project_id=2, answer_value="no"))
+    for video_id, question_id, value in GROUND_TRUTH:
+        session.add(ReviewerGroundTruth(
+            video_id=video_id, question_id=question_id, project_id=1, reviewer_id=9,
+            answer_value=value, original_answer_value=value,
+        ))
+    session.flush()
+    return session
+
+
+def test_build_encodes_one_project(cube_session):
+    cube = ProjectAnswerCube.build(project_id=1, session=cube_session)
+
+    assert cube.video_ids == [10, 20, 30]
+    assert cube.question_ids == [1, 2]
+    assert cube.user_ids == [1, 2, 3]
+    assert cube.answers.shape == (3, 2, 3) and cube.answers.dtype == np.int16
+    assert cube.ground_truth.shape == (3, 2)
+
+    v, q, u = cube.video_index[10], cube.question_index[1], cube.user_index[3]
+    assert cube.decode(1, cube.answers[v, q, u]) == "no"
+    assert cube.confidence[v, q, u] == pytest.approx(0.5)
+    assert np.isnan(cube.confidence[v, q, cube.user_index[2]])
+    assert cube.answers[cube.video_index[30], q, u] == MISSING
+    assert cube.decode(2, cube.ground_truth[cube.video_index[30], cube.question_index[2]]) == "yes"
+
+
+def test_metrics_match_sort_metrics(cube_session):
+    cube = ProjectAnswerCube.build(project_id=1, session=cube_session)
+    frames = ProjectSortMetrics.load(project_id=1, session=cube_session)
+
+    for user_ids in ([1, 2], [1, 2, 3], [3]):
+        for question_ids in ([1], [1, 2], [2, 5]):
+            assert cube.model_confidence(user_ids, question_ids) == pytest.approx(
+                frames.model_confidence(user_ids, question_ids))
+            assert cube.consensus_rates(user_ids, question_ids) == frames.consensus_rates(user_ids, question_ids)
+            assert cube.accuracy_rates(user_ids, question_ids) == frames.accuracy_rates(user_ids, question_ids)
+            assert cube.completion_rates(question_ids) == frames.completion_rates(question_ids)
+            assert cube.user_completion_rates(user_ids[0], question_ids) == frames.user_completion_rates(
+                user_ids[0], question_ids)
+
+    for filter_by_gt in ({1: "yes"}, {1: "yes", 2: "no"}, {2: "maybe"}, {7: "yes"}):
+        assert cube.videos_matching_ground_truth(filter_by_gt) == frames.videos_matching_ground_truth(filter_by_gt)
+
+
+def test_incremental_updates():
+    cube = ProjectAnswerCube.from_rows(ANSWERS, GROUND_TRUTH)
+
+    # New video, new user and a value the question has not seen yet
+    cube.set_answers(video_id=40, user_id=4, answers={1: "maybe", 2: "no"}, confidences={1: 0.5})
+    assert cube.answer_votes(40, 1) == {"maybe": 1}
+    assert cube.user_completion_rates(4, [1, 2]) == {40: 100.0}
+    assert cube.model_confidence([4], [1, 2]) == {40: 0.5}
+
+    cube.set_answer(video_id=10, question_id=1, user_id=3, value="yes")
+    assert cube.answer_votes(10, 1) == {"yes": 3}
+    assert cube.answer_votes(10, 1, user_ids=[1, 4]) == {"yes": 1}
+
+    cube.set_ground_truths(video_id=40, answers={1: "maybe"})
+    assert cube.videos_matching_ground_truth({1: "maybe"}) == {40}
+    cube.remove_ground_truth(video_id=40, question_id=1)
+    assert cube.videos_matching_ground_truth({1: "maybe"}) == set()
+
+    cube.remove_answer(video_id=40, question_id=1, user_id=4)
+    assert cube.answer_votes(40, 1) == {}
+
+    rebuilt = ProjectAnswerCube.from_rows(
+        [row for row in ANSWERS if row[:3] != (10, 1, 3)] + [(10, 1, 3, "yes", None), (40, 2, 4, "no", None)],
+        GROUND_TRUTH,
+    )
+    for user_ids, question_ids in (([1, 2, 3, 4], [1, 2]), ([4], [2])):
+        assert cube.consensus_rates(user_ids, question_ids) == rebuilt.consensus_rates(user_ids, question_ids)
+        assert cube.accuracy_rates(user_ids, question_ids) == rebuilt.accuracy_rates(user_ids, question_ids)
+
+
+def test_codes_widen_past_int16():
+    # Codes 0 to 32767 still fit
+    limit = np.iinfo(np.int16).max + 1
+    cube = ProjectAnswerCube.from_rows([(1, 1, user_id, f"text {user_id}", None) for user_id in range(limit)], [])
+    assert cube.answers.dtype == np.int16
+
+    cube.set_answer(video_id=1, question_id=1, user_id=-1, value="one more")
+    assert cube.answers.dtype == np.int32
+    assert cube.decode(1, cube.answers[0, 0, cube.user_index[-1]]) == "one more"
+
+
+def test_save_and_memory_map(tmp_path):
+    cube = ProjectAnswerCube.from_rows(ANSWERS, GROUND_TRUTH, project_id=1)
+    cube.save(tmp_path / "cube")
+
+    loaded = ProjectAnswerCube.load(tmp_path / "cube")
+    assert isinstance(loaded.answers, np.memmap)
+    assert loaded.project_id == 1
+    assert loaded.video_ids == cube.video_ids and loaded.values == cube.values
+    np.testing.assert_array_equal(loaded.answers, cube.answers)
+    np.testing.assert_array_equal(loaded.confidence, cube.confidence)
+    assert loaded.accuracy_rates([1, 2, 3], [1, 2]) == cube.accuracy_rates([1, 2, 3], [1, 2])
+
+    writable = ProjectAnswerCube.load(tmp_path / "cube", mmap_mode="r+")
+    writable.set_answer(video_id=20, question_id=1, user_id=2, value="yes")
+    writable.answers.flush()
+    assert ProjectAnswerCube.load(tmp_path / "cube").answer_votes(20, 1) == {"no": 1, "yes": 1}
+
+
+def test_empty_cube():
+    cube = ProjectAnswerCube.empty(project_id=1)
+
+    assert cube.nbytes == 0
+    assert cube.model_confidence([1], [1]) == {}
+    assert cube.consensus_rates([1, 2], [1]) == {}
+    assert cube.completion_rates([1]) == {}
+    assert cube.videos_matching_ground_truth({1: "yes"}) == set()
+    cube.set_ground_truth(video_id=1, question_id=1, value="yes")
+    assert cube.completion_rates([1]) == {1: 100.0}
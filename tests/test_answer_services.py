@@ -1,9 +1,9 @@
 import pytest
-from label_pizza.services import AnnotatorService, GroundTruthService, ProjectService, AuthService, QuestionService, QuestionGroupService
+from label_pizza.services import AnnotatorService, GroundTruthService, ProjectService, AuthService, QuestionService, QuestionGroupService, SchemaService, VideoService, ArrowExportService, GoogleSheetsExportService
 import pandas as pd
 from datetime import datetime, timezone
-from sqlalchemy import select
-from label_pizza.models import Question, QuestionGroupQuestion, SchemaQuestionGroup, Project, AnnotatorAnswer, AnswerReview
+from sqlalchemy import and_, func, select
+from label_pizza.models import Question, QuestionGroupQuestion, SchemaQuestionGroup, Project, AnnotatorAnswer, AnswerReview, ReviewerGroundTruth
 
 def test_annotator_service_submit_answer_to_question_group(session, test_user, test_project, test_video, test_question_group):
     """Test submitting answers to a question group."""
@@ -751,4 +751,336 @@ def test_ground_truth_service_submit_answer_review_single_choice(session, test_u
 def test_ground_truth_service_get_answer_review_nonexistent(session):
     """Test getting review for non-existent answer."""
     review_result = GroundTruthService.get_answer_review(999, session)
-    assert review_result is None
\ No newline at end of file
+    assert review_result is None
+
+
+def test_annotator_service_get_user_answers_for_question_group(session, test_user, test_project, test_video, test_question_group):
+    """Test reading a user's answers for a question group."""
+    AnnotatorService.submit_answer_to_question_group(
+        video_id=test_video.id,
+        project_id=test_project.id,
+        user_id=test_user.id,
+        question_group_id=test_question_group.id,
+        answers={"test question": "option2"},
+        session=session
+    )
+    
+    result = AnnotatorService.get_user_answers_for_question_group(
+        test_video.id, test_project.id, test_user.id, test_question_group.id, session
+    )
+    assert result == {"test question": "option2"}
+    assert AnnotatorService.check_user_has_submitted_answers(
+        test_video.id, test_project.id, test_user.id, test_question_group.id, session
+    )
+    assert not AnnotatorService.check_user_has_submitted_answers(
+        test_video.id, test_project.id, test_user.id, test_question_group.id + 1, session
+    )
+
+def test_ground_truth_service_batch_get_complete_video_data_for_display(session, test_user, test_project, test_video):
+    """Test that the page-level display fetch gives every video the payload of its single-video fetch."""
+    group = SchemaService.get_schema_question_groups_list(test_project.schema_id, session)[0]
+    QuestionService.add_question(text="display description", qtype="description", options=None, default=None, session=session)
+    description_question = QuestionService.get_question_by_text("display description", session)
+    description_group = QuestionGroupService.create_group(
+        title="Display Description Group",
+        display_title="Display Description Group",
+        description="Group for description questions",
+        is_reusable=True,
+        question_ids=[description_question["id"]],
+        verification_function=None,
+        session=session
+    )
+    schema = SchemaService.create_schema("display_schema", [group["ID"], description_group.id], session=session)
+    VideoService.add_video(video_uid="second.mp4", url="http://example.com/second.mp4", session=session)
+    second_video = VideoService.get_video_by_uid("second.mp4", session)
+    ProjectService.create_project(
+        name="display_project",
+        description="test description",
+        schema_id=schema.id,
+        video_ids=[test_video.id, second_video.id],
+        session=session
+    )
+    project = ProjectService.get_project_by_name("display_project", session)
+    AuthService.create_user(user_id="display_annotator", email="display@example.com", password_hash="x", user_type="human", session=session)
+    annotator = AuthService.get_user_by_id("display_annotator", session)
+    ProjectService.add_user_to_project(project.id, annotator.id, "annotator", session)
+    question = QuestionService.get_question_by_text("test question for schema", session)
+    
+    # The first video has ground truth, both answers and a review; the second only a single-choice answer
+    for video, answer in [(test_video, "option1"), (second_video, "option2")]:
+        AnnotatorService.submit_answer_to_question_group(
+            video_id=video.id,
+            project_id=project.id,
+            user_id=annotator.id,
+            question_group_id=group["ID"],
+            answers={"test question for schema": answer},
+            session=session
+        )
+    AnnotatorService.submit_answer_to_question_group(
+        video_id=test_video.id,
+        project_id=project.id,
+        user_id=annotator.id,
+        question_group_id=description_group.id,
+        answers={"display description": "a description"},
+        session=session
+    )
+    description_answer = session.scalar(select(AnnotatorAnswer).where(AnnotatorAnswer.answer_value == "a description"))
+    GroundTruthService.submit_answer_review(
+        answer_id=description_answer.id, reviewer_id=test_user.id, status="approved", session=session
+    )
+    GroundTruthService.submit_ground_truth_to_question_group(
+        video_id=test_video.id,
+        project_id=project.id,
+        reviewer_id=test_user.id,
+        question_group_id=group["ID"],
+        answers={"test question for schema": "option2"},
+        session=session
+    )
+    
+    video_ids = [test_video.id, second_video.id]
+    pages = {}
+    for role, user_id in [("annotator", annotator.id), ("reviewer", test_user.id), ("meta_reviewer", test_user.id)]:
+        page = GroundTruthService.batch_get_complete_video_data_for_display(
+            video_ids=video_ids, project_id=project.id, user_id=user_id, role=role, session=session
+        )
+        assert list(page) == video_ids
+        for video_id in video_ids:
+            single = GroundTruthService.get_complete_video_data_for_display(
+                video_id=video_id, project_id=project.id, user_id=user_id, role=role, session=session
+            )
+            assert single and page[video_id] == single
+        pages[role] = page
+    
+    first, second = pages["reviewer"][test_video.id], pages["reviewer"][second_video.id]
+    assert first["gt_data"] == {question["id"]: "option2"}
+    assert first["gt_status_by_question"][question["id"]] == "🏆 GT by: test_user"
+    assert first["admin_modifications"][question["id"]]["is_modified"] is False
+    assert first["completion_status_by_group"] == {group["ID"]: True, description_group.id: False}
+    reviews = first["answer_reviews_by_group"][description_group.id]["display description"]
+    assert [review["status"] for review in reviews.values()] == ["approved"]
+    assert second["gt_data"] == {} and second["answer_reviews_by_group"] == {}
+    assert second["completion_status_by_group"] == {group["ID"]: False, description_group.id: False}
+    
+    annotated = pages["annotator"]
+    assert annotated[test_video.id]["annotator_data"]["answer_dict"] == {
+        "test question for schema": "option1", "display description": "a description"
+    }
+    assert annotated[second_video.id]["annotator_data"]["answer_dict"] == {"test question for schema": "option2"}
+    answers = annotated[test_video.id]["annotator_data"]["answers_by_question"]
+    assert answers[description_question["id"]] is description_answer
+    gt_records = GroundTruthService.get_all_ground_truth_data_for_video(test_video.id, project.id, session)["gt_records"]
+    assert isinstance(gt_records[question["id"]], ReviewerGroundTruth)
+    assert (gt_records[question["id"]].reviewer_id, gt_records[question["id"]].answer_value) == (test_user.id, "option2")
+    assert annotated[second_video.id]["completion_status_by_group"] == {group["ID"]: True, description_group.id: False}
+    assert not annotated[test_video.id]["is_training_mode"]
+
+
+def test_arrow_export_service_get_ground_truth_table(session, test_user, test_project, test_video):
+    """Test the columnar ground truth table carries its partition columns and dictionary-encoded text."""
+    pa = pytest.importorskip("pyarrow")
+    group = SchemaService.get_schema_question_groups_list(test_project.schema_id, session)[0]
+    VideoService.add_video(video_uid="arrow.mp4", url="http://example.com/arrow.mp4", session=session)
+    second_video = VideoService.get_video_by_uid("arrow.mp4", session)
+    ProjectService.create_project(
+        name="arrow_project",
+        description="test description",
+        schema_id=test_project.schema_id,
+        video_ids=[test_video.id, second_video.id],
+        session=session
+    )
+    second_project = ProjectService.get_project_by_name("arrow_project", session)
+    for project, video, answer in [
+        (test_project, test_video, "option2"), (second_project, test_video, "option1"), (second_project, second_video, "option1")
+    ]:
+        GroundTruthService.submit_ground_truth_to_question_group(
+            video_id=video.id,
+            project_id=project.id,
+            reviewer_id=test_user.id,
+            question_group_id=group["ID"],
+            answers={"test question for schema": answer},
+            session=session
+        )
+    GroundTruthService.override_ground_truth_to_question_group(
+        video_id=second_video.id,
+        project_id=second_project.id,
+        question_group_id=group["ID"],
+        admin_id=test_user.id,
+        answers={"test question for schema": "option2"},
+        session=session
+    )
+    
+    table = ArrowExportService.get_ground_truth_table(session)
+    
+    assert table.schema == ArrowExportService.ground_truth_schema()
+    for name in ["project_name", "question_group_title", "video_uid", "question_text", "reviewer_name",
+                 "answer_type", "answer_value", "original_answer_value", "modified_by_admin_name"]:
+        assert pa.types.is_dictionary(table.schema.field(name).type)
+        assert table.column(name).num_chunks == 1
+    
+    def utc(value):
+        return value.replace(tzinfo=timezone.utc) if value is not None and value.tzinfo is None else value
+    
+    rows = table.to_pylist()
+    assert [(row["project_name"], row["video_uid"]) for row in rows] == [
+        ("arrow_project", "test.mp4"), ("arrow_project", "arrow.mp4"), ("test_project", "test.mp4")
+    ]
+    for row in rows:
+        expected = GroundTruthService.get_ground_truth(row["video_id"], row["project_id"], session)
+        assert len(expected) == 1
+        expected = expected.iloc[0].to_dict()
+        assert row["question_group_title"] == group["Title"]
+        assert row["question_text"] == "test question for schema"
+        assert row["reviewer_name"] == test_user.user_id_str
+        assert (row["question_id"], row["reviewer_id"]) == (expected["Question ID"], expected["Reviewer ID"])
+        assert (row["answer_value"], row["original_answer_value"]) == (expected["Answer Value"], expected["Original Value"])
+        assert row["modified_by_admin_name"] == (test_user.user_id_str if expected["Modified By Admin"] == test_user.id else None)
+        for column, expected_column in [("created_at", "Created At"), ("modified_at", "Modified At"), ("modified_by_admin_at", "Modified By Admin At")]:
+            value = expected[expected_column]
+            assert row[column] == (None if pd.isna(value) else utc(value.to_pydatetime()))
+    assert rows[1]["original_answer_value"] == "option1" and rows[1]["answer_value"] == "option2"
+    
+    project_table = ArrowExportService.get_ground_truth_table(session, project_ids=[test_project.id])
+    assert project_table.to_pylist() == rows[2:]
+    assert ArrowExportService.get_answers_table(session, project_ids=[test_project.id]).num_rows == 0
+
+
+def _per_project_counts(session, user_id, project_id):
+    """The per-project COUNT queries the sheet statistics were computed with before grouping."""
+    def count(query):
+        return session.scalar(query) or 0
+    
+    answers = select(func.count()).select_from(AnnotatorAnswer).join(Question, AnnotatorAnswer.question_id == Question.id).where(
+        AnnotatorAnswer.user_id == user_id, AnnotatorAnswer.project_id == project_id, Question.is_archived == False
+    )
+    single = answers.where(Question.type == "single").join(ReviewerGroundTruth, and_(
+        AnnotatorAnswer.video_id == ReviewerGroundTruth.video_id,
+        AnnotatorAnswer.question_id == ReviewerGroundTruth.question_id,
+        AnnotatorAnswer.project_id == ReviewerGroundTruth.project_id
+    ))
+    description = answers.where(Question.type == "description").join(AnswerReview, AnnotatorAnswer.id == AnswerReview.answer_id)
+    ground_truth = select(func.count()).select_from(ReviewerGroundTruth).where(ReviewerGroundTruth.project_id == project_id)
+    
+    return {
+        "completed": count(select(func.count()).select_from(AnnotatorAnswer).where(
+            AnnotatorAnswer.user_id == user_id, AnnotatorAnswer.project_id == project_id
+        )),
+        "reviewed": count(single) + count(description.where(AnswerReview.status.in_(["approved", "rejected"]))),
+        "wrong": count(single.where(AnnotatorAnswer.answer_value != ReviewerGroundTruth.answer_value))
+                 + count(description.where(AnswerReview.status == "rejected")),
+        "gt_completed": count(ground_truth.where(ReviewerGroundTruth.reviewer_id == user_id)),
+        "gt_wrong": count(ground_truth.where(
+            ReviewerGroundTruth.reviewer_id == user_id, ReviewerGroundTruth.modified_by_admin_id.isnot(None)
+        )),
+        "review_completed": count(select(func.count()).select_from(AnswerReview).join(
+            AnnotatorAnswer, AnswerReview.answer_id == AnnotatorAnswer.id
+        ).where(AnswerReview.reviewer_id == user_id, AnnotatorAnswer.project_id == project_id)),
+        "gt_total": count(ground_truth),
+        "modified_by_user": count(ground_truth.where(ReviewerGroundTruth.modified_by_admin_id == user_id)),
+        "modified_by_all": count(ground_truth.where(ReviewerGroundTruth.modified_by_admin_id.isnot(None)))
+    }
+
+def test_google_sheets_export_service_project_data_by_user(session, test_user, test_project, test_video):
+    """Test the grouped per-user sheet statistics against the per-project counts."""
+    group = SchemaService.get_schema_question_groups_list(test_project.schema_id, session)[0]
+    users = {}
+    for user_id, role in [("sheet_annotator", "annotator"), ("sheet_annotator2", "annotator"), ("sheet_reviewer", "reviewer")]:
+        AuthService.create_user(user_id=user_id, email=f"{user_id}@example.com", password_hash="x", user_type="human", session=session)
+        users[user_id] = AuthService.get_user_by_id(user_id, session)
+        ProjectService.add_user_to_project(test_project.id, users[user_id].id, role, session)
+    annotator, annotator2, reviewer = users["sheet_annotator"], users["sheet_annotator2"], users["sheet_reviewer"]
+    
+    QuestionService.add_question(text="sheet description", qtype="description", options=None, default=None, session=session)
+    description_group = QuestionGroupService.create_group(
+        title="Sheet Description Group",
+        display_title="Sheet Description Group",
+        description="Group for description questions",
+        is_reusable=True,
+        question_ids=[QuestionService.get_question_by_text("sheet description", session)["id"]],
+        verification_function=None,
+        session=session
+    )
+    
+    for user, answer in [(annotator, "option1"), (annotator2, "option2")]:
+        AnnotatorService.submit_answer_to_question_group(
+            video_id=test_video.id,
+            project_id=test_project.id,
+            user_id=user.id,
+            question_group_id=group["ID"],
+            answers={"test question for schema": answer},
+            session=session
+        )
+    AnnotatorService.submit_answer_to_question_group(
+        video_id=test_video.id,
+        project_id=test_project.id,
+        user_id=annotator.id,
+        question_group_id=description_group.id,
+        answers={"sheet description": "a description"},
+        session=session
+    )
+    description_answer = session.scalar(select(AnnotatorAnswer).where(
+        AnnotatorAnswer.user_id == annotator.id, AnnotatorAnswer.answer_value == "a description"
+    ))
+    GroundTruthService.submit_answer_review(
+        answer_id=description_answer.id, reviewer_id=reviewer.id, status="rejected", comment="Too short", session=session
+    )
+    GroundTruthService.submit_ground_truth_to_question_group(
+        video_id=test_video.id,
+        project_id=test_project.id,
+        reviewer_id=reviewer.id,
+        question_group_id=group["ID"],
+        answers={"test question for schema": "option1"},
+        session=session
+    )
+    GroundTruthService.override_ground_truth_to_question_group(
+        video_id=test_video.id,
+        project_id=test_project.id,
+        question_group_id=group["ID"],
+        admin_id=test_user.id,
+        answers={"test question for schema": "option2"},
+        session=session
+    )
+    
+    annotator_data = GoogleSheetsExportService.get_annotator_project_data_by_user(session)
+    reviewer_data = GoogleSheetsExportService.get_reviewer_project_data_by_user(session)
+    meta_reviewer_data = GoogleSheetsExportService.get_meta_reviewer_project_data_by_user(session)
+    # Reviewers and admins are annotators of the project too, so every user gets annotator rows
+    assert set(annotator_data) == {test_user.id, annotator.id, annotator2.id, reviewer.id}
+    assert set(reviewer_data) == {test_user.id, reviewer.id}
+    assert set(meta_reviewer_data) == {test_user.id}
+    
+    for user_id, rows in annotator_data.items():
+        counts = _per_project_counts(session, user_id, test_project.id)
+        assert [row["project_name"] for row in rows] == [test_project.name]
+        row = rows[0]
+        assert (row["completed"], row["reviewed"], row["wrong"]) == (counts["completed"], counts["reviewed"], counts["wrong"])
+        assert row["reviewed_ratio"] == (counts["reviewed"] / counts["completed"] * 100 if counts["completed"] else 0)
+        assert GoogleSheetsExportService.get_user_project_data_annotator(user_id, session) == rows
+    # The rejected description and the overridden ground truth both count against the first annotator
+    assert (annotator_data[annotator.id][0]["completed"], annotator_data[annotator.id][0]["wrong"]) == (2, 2)
+    assert (annotator_data[annotator2.id][0]["wrong"], annotator_data[annotator2.id][0]["accuracy"]) == (0, 100)
+    
+    for user_id, rows in reviewer_data.items():
+        counts = _per_project_counts(session, user_id, test_project.id)
+        row = rows[0]
+        assert (row["gt_completed"], row["gt_wrong"], row["review_completed"]) == (
+            counts["gt_completed"], counts["gt_wrong"], counts["review_completed"]
+        )
+        assert GoogleSheetsExportService.get_user_project_data_reviewer(user_id, session) == rows
+    reviewer_row = reviewer_data[reviewer.id][0]
+    assert (reviewer_row["gt_completed"], reviewer_row["gt_wrong"], reviewer_row["review_completed"]) == (1, 1, 1)
+    assert (reviewer_row["gt_ratio"], reviewer_row["gt_accuracy"], reviewer_row["review_ratio"]) == (100, 0, 100)
+    assert reviewer_data[test_user.id][0]["gt_completed"] == 0
+    assert GoogleSheetsExportService.get_user_project_data_reviewer(annotator.id, session) == []
+    
+    counts = _per_project_counts(session, test_user.id, test_project.id)
+    meta_row = meta_reviewer_data[test_user.id][0]
+    assert meta_row["ratio_modified_by_user"] == counts["modified_by_user"] / counts["gt_total"] * 100 == 100
+    assert meta_row["ratio_modified_by_all"] == counts["modified_by_all"] / counts["gt_total"] * 100
+    assert meta_row["last_modified"] is not None
+    assert GoogleSheetsExportService.get_user_project_data_meta_reviewer(test_user.id, session) == meta_reviewer_data[test_user.id]
+    assert GoogleSheetsExportService.get_user_project_data_meta_reviewer(reviewer.id, session) == []
+    
+    master = GoogleSheetsExportService.get_master_sheet_annotator_data(session)
+    started = {user["user_id"]: (user["assigned_projects"], user["projects_started"]) for user in master}
+    assert started[annotator.id] == (1, 1)
+    assert started[reviewer.id] == (1, 0)
@@ -0,0 +1,307 @@
+import gzip
+import hashlib
+import json
+import os
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("psycopg2")
+zstd = pytest.importorskip("zstandard")
+
+from label_pizza import backup_restore
+from label_pizza.backup_restore import (
+    COPY_ARCHIVE_FORMAT, COPY_MANIFEST, DIFF_ARCHIVE_FORMAT, DatabaseBackupRestore, _ChunkedZstdWriter,
+    _CopyArchiveReader, find_latest_chain_backup, verify_backup
+)
+
+
+ROWS = b"".join(f"{i}\tvideo_{i}.mp4\tanswer {i % 7}\n".encode() for i in range(3000))
+
+
+def _write_zstd(path, data, chunk_size=4096, executor=None, pieces=1000):
+    """Write data through a _ChunkedZstdWriter in uneven pieces and return its chunk index"""
+    with _ChunkedZstdWriter(path, chunk_size=chunk_size, executor=executor) as f:
+        for start in range(0, len(data), pieces):
+            f.write(data[start:start + pieces])
+    return f.chunks
+
+
+def _zstd_archive(tmp_path, as_tar):
+    """A zstd COPY archive with one data member and one fingerprint member, as a directory or a tar"""
+    directory = tmp_path / ("archive.tar.partial" if as_tar else "archive")
+    (directory / "data").mkdir(parents=True)
+    (directory / "fingerprints").mkdir()
+    chunks = _write_zstd(str(directory / "data" / "videos.copy.zst"), ROWS)
+    fingerprint_chunks = _write_zstd(str(directory / "fingerprints" / "videos.tsv.zst"), ROWS[:5000])
+    manifest = {
+        "format": COPY_ARCHIVE_FORMAT, "backup_id": "base", "created_at": "2024-01-01T00:00:00",
+        "copy_format": "csv", "compressed": True, "compression": "zstd", "fingerprints": True,
+        "tables": [{
+            "table": "videos", "columns": ["id", "video_uid", "answer"], "key_columns": ["id"],
+            "file": "data/videos.copy.zst", "fingerprints": "fingerprints/videos.tsv.zst", "rows": 3000,
+            "chunks": chunks, "fingerprint_chunks": fingerprint_chunks
+        }]
+    }
+    (directory / COPY_MANIFEST).write_text(json.dumps(manifest))
+    if not as_tar:
+        return str(directory), chunks
+    path = str(tmp_path / "archive.tar")
+    DatabaseBackupRestore._pack_archive(str(directory), path)
+    return path, chunks
+
+
+@pytest.mark.parametrize("workers", [None, 3])
+def test_chunked_zstd_writer_frames_and_index(tmp_path, workers):
+    path = str(tmp_path / "videos.copy.zst")
+    if workers is None:
+        chunks = _write_zstd(path, ROWS)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunks = _write_zstd(path, ROWS, executor=executor)
+
+    content = (tmp_path / "videos.copy.zst").read_bytes()
+    assert len(chunks) == -(-len(ROWS) // 4096) > 1
+    assert [raw_size for _, _, raw_size, _ in chunks] == [4096] * (len(chunks) - 1) + [len(ROWS) % 4096]
+
+    # Frames are contiguous, in order, and each one decompresses on its own
+    offset = 0
+    for index, (frame_offset, size, raw_size, digest) in enumerate(chunks):
+        assert frame_offset == offset
+        frame = content[offset:offset + size]
+        assert hashlib.sha256(frame).hexdigest() == digest
+        assert zstd.ZstdDecompressor().decompress(frame) == ROWS[index * 4096:index * 4096 + raw_size]
+        offset += size
+    assert offset == len(content)
+
+
+@pytest.mark.parametrize("as_tar", [False, True])
+def test_chunked_zstd_member_reads_back_across_frames(tmp_path, as_tar):
+    path, chunks = _zstd_archive(tmp_path, as_tar)
+    assert len(chunks) > 1
+
+    with _CopyArchiveReader(path) as archive:
+        assert archive.manifest()["tables"][0]["chunks"] == chunks
+        with archive.open("data/videos.copy.zst", "zstd") as f:
+            assert f.read() == ROWS
+        with archive.open("fingerprints/videos.tsv.zst", "zstd") as f:
+            assert f.read() == ROWS[:5000]
+
+
+@pytest.mark.parametrize("as_tar", [False, True])
+def test_verify_backup_detects_a_flipped_byte(tmp_path, capsys, as_tar):
+    path, chunks = _zstd_archive(tmp_path, as_tar)
+    with _CopyArchiveReader(path) as archive:
+        member = archive.manifest()["tables"][0]
+    assert verify_backup(path, jobs=2)
+    assert f"2 members, {len(member['chunks']) + len(member['fingerprint_chunks'])} checksummed chunks" in capsys.readouterr().out
+
+    # Flip one byte in the middle of the second frame of the data member
+    if as_tar:
+        with tarfile.open(path) as tar:
+            member_offset = tar.getmember("data/videos.copy.zst").offset_data
+        target = path
+    else:
+        member_offset = 0
+        target = os.path.join(path, "data", "videos.copy.zst")
+    position = member_offset + chunks[1][0] + chunks[1][1] // 2
+    with open(target, "r+b") as f:
+        f.seek(position)
+        byte = f.read(1)
+        f.seek(position)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+    assert not verify_backup(path, jobs=2)
+    assert "data/videos.copy.zst: chunk 1 checksum mismatch" in capsys.readouterr().out
+
+
+def test_verify_backup_reports_missing_member(tmp_path, capsys):
+    path, _ = _zstd_archive(tmp_path, as_tar=False)
+    os.remove(os.path.join(path, "fingerprints", "videos.tsv.zst"))
+
+    assert not verify_backup(path)
+    assert "fingerprints/videos.tsv.zst: missing" in capsys.readouterr().out
+
+
+class FakeCursor:
+    """Records every statement, and the data of every COPY, instead of talking to Postgres"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.calls.append(("execute", " ".join(sql.split())))
+
+    def copy_expert(self, sql, f):
+        self.calls.append(("copy", sql, f.read()))
+
+
+class FakeConnection:
+    def __init__(self):
+        self.cursors = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        self.cursors.append(FakeCursor())
+        return self.cursors[-1]
+
+    def close(self):
+        pass
+
+
+def _write_archive(path, manifest, members=None):
+    """Write a COPY or differential archive as a directory, or as a tar when path ends in .tar"""
+    as_tar = str(path).endswith(".tar")
+    directory = Path(str(path) + ".partial") if as_tar else Path(path)
+    directory.mkdir()
+    for name, data in (members or {}).items():
+        (directory / name).parent.mkdir(parents=True, exist_ok=True)
+        (directory / name).write_bytes(data)
+    (directory / COPY_MANIFEST).write_text(json.dumps(manifest))
+    if as_tar:
+        DatabaseBackupRestore._pack_archive(str(directory), str(path))
+    return str(path)
+
+
+def _base_manifest(backup_id, created_at, fingerprints=True):
+    return {"format": COPY_ARCHIVE_FORMAT, "backup_id": backup_id, "created_at": created_at,
+            "copy_format": "binary", "compressed": False, "fingerprints": fingerprints, "tables": []}
+
+
+def _diff_manifest(backup_id, parent, parent_id, chain_length, created_at, tables=(), compressed=False):
+    return {"format": DIFF_ARCHIVE_FORMAT, "backup_id": backup_id, "parent": parent, "parent_id": parent_id,
+            "base_id": "base", "chain_length": chain_length, "created_at": created_at,
+            "copy_format": "binary", "compressed": compressed, "tables": list(tables)}
+
+
+@pytest.fixture
+def chain_dir(tmp_path):
+    """base.tar <- diff1 (directory) <- diff2.tar"""
+    _write_archive(tmp_path / "base.tar", _base_manifest("base", "2024-01-01T00:00:00"))
+    _write_archive(tmp_path / "diff1", _diff_manifest("d1", "base.tar", "base", 1, "2024-01-02T00:00:00"))
+    _write_archive(tmp_path / "diff2.tar", _diff_manifest("d2", "diff1", "d1", 2, "2024-01-03T00:00:00"))
+    return tmp_path
+
+
+def test_archive_chain_follows_parents_to_the_base(chain_dir):
+    backup = DatabaseBackupRestore("postgresql://localhost/label_pizza")
+
+    chain = backup._archive_chain(str(chain_dir / "diff2.tar"))
+    assert [path for path, _ in chain] == [str(chain_dir / name) for name in ["base.tar", "diff1", "diff2.tar"]]
+    assert [manifest["backup_id"] for _, manifest in chain] == ["base", "d1", "d2"]
+
+    assert [path for path, _ in backup._archive_chain(str(chain_dir / "base.tar"))] == [str(chain_dir / "base.tar")]
+
+
+def test_archive_chain_rejects_broken_chains(chain_dir):
+    backup = DatabaseBackupRestore("postgresql://localhost/label_pizza")
+    _write_archive(chain_dir / "orphan", _diff_manifest("d3", "gone.tar", "gone", 1, "2024-01-04T00:00:00"))
+    _write_archive(chain_dir / "stranger", _diff_manifest("d4", "diff1", "someone-else", 2, "2024-01-04T00:00:00"))
+    (chain_dir / "plain.sql").write_text("SELECT 1;")
+    _write_archive(chain_dir / "on_sql", _diff_manifest("d5", "plain.sql", "sql", 1, "2024-01-04T00:00:00"))
+
+    with pytest.raises(ValueError, match="Parent backup not found"):
+        backup._archive_chain(str(chain_dir / "orphan"))
+    with pytest.raises(ValueError, match="is not the parent recorded in"):
+        backup._archive_chain(str(chain_dir / "stranger"))
+    with pytest.raises(ValueError, match="Not a COPY or differential backup"):
+        backup._archive_chain(str(chain_dir / "on_sql"))
+
+
+def test_find_latest_chain_backup(chain_dir, tmp_path):
+    assert find_latest_chain_backup(str(chain_dir)) == (str(chain_dir / "diff2.tar"), 2)
+
+    # Newer backups without row fingerprints cannot start a diff; other files are ignored
+    _write_archive(chain_dir / "schema_only.tar", _base_manifest("schema", "2024-02-01T00:00:00", fingerprints=False))
+    (chain_dir / "schema_only.tar.meta.json").write_text("{}")
+    (chain_dir / "backup.sql").write_text("SELECT 1;")
+    assert find_latest_chain_backup(str(chain_dir)) == (str(chain_dir / "diff2.tar"), 2)
+
+    _write_archive(chain_dir / "fresh.tar", _base_manifest("fresh", "2024-02-02T00:00:00"))
+    assert find_latest_chain_backup(str(chain_dir)) == (str(chain_dir / "fresh.tar"), 0)
+
+    (tmp_path / "empty").mkdir()
+    assert find_latest_chain_backup(str(tmp_path / "empty")) is None
+    assert find_latest_chain_backup(str(tmp_path / "missing")) is None
+
+
+@pytest.fixture
+def diff_archive(tmp_path):
+    """A gzip diff with one changed and one deleted answer, and two deleted tags"""
+    answers = {"table": "answers", "columns": ["id", "answer_value"], "key_columns": ["id"],
+               "file": "data/answers.copy.gz", "changes": "changes/answers.tsv.gz", "rows": 1, "deleted": 1}
+    tags = {"table": "tags", "columns": ["video_id", "tag"], "key_columns": ["video_id", "tag"],
+            "file": "data/tags.copy.gz", "changes": "changes/tags.tsv.gz", "rows": 0, "deleted": 2}
+    sequences = 'SELECT setval(\'"answers_id_seq"\', 5, true);\nSELECT setval(\'"tags_id_seq"\', 3, true);\n'
+    # Archives written before zstd support have no "compression" key and are gzip
+    return _write_archive(tmp_path / "diff.tar", _diff_manifest("d1", "base.tar", "base", 1, "2024-01-02T00:00:00",
+                                                                 tables=[answers, tags], compressed=True), {
+        "changes/answers.tsv.gz": gzip.compress(b"[1]\tabc\n[2]\t\\N\n"),
+        "data/answers.copy.gz": gzip.compress(b"answer rows"),
+        "changes/tags.tsv.gz": gzip.compress(b'[1, "night"]\t\\N\n[2, "day"]\t\\N\n'),
+        "data/tags.copy.gz": gzip.compress(b""),
+        "sequences.sql": sequences.encode()
+    })
+
+
+def test_apply_diff_archive_deletes_before_copying(diff_archive):
+    cursor = FakeCursor()
+    DatabaseBackupRestore("postgresql://localhost/label_pizza")._apply_diff_archive(cursor, diff_archive)
+
+    assert cursor.calls == [
+        ("execute", "CREATE TEMP TABLE IF NOT EXISTS _changes (k text, fp text) ON COMMIT DROP;"),
+        ("execute", "TRUNCATE _changes;"),
+        ("copy", "COPY _changes (k, fp) FROM STDIN", b"[1]\tabc\n[2]\t\\N\n"),
+        ("execute", 'DELETE FROM public."answers" t USING _changes c WHERE c.k = json_build_array(t."id")::text;'),
+        ("copy", 'COPY public."answers" ("id", "answer_value") FROM STDIN WITH (FORMAT binary)', b"answer rows"),
+        ("execute", "TRUNCATE _changes;"),
+        ("copy", "COPY _changes (k, fp) FROM STDIN", b'[1, "night"]\t\\N\n[2, "day"]\t\\N\n'),
+        ("execute", 'DELETE FROM public."tags" t USING _changes c WHERE c.k = json_build_array(t."video_id", t."tag")::text;'),
+        ("execute", 'SELECT setval(\'"answers_id_seq"\', 5, true)'),
+        ("execute", 'SELECT setval(\'"tags_id_seq"\', 3, true)'),
+    ]
+
+
+def test_apply_diff_archive_single_table(diff_archive):
+    cursor = FakeCursor()
+    DatabaseBackupRestore("postgresql://localhost/label_pizza")._apply_diff_archive(cursor, diff_archive, tables=["tags"])
+
+    statements = [call[1] for call in cursor.calls]
+    assert not any('"answers"' in statement or "answers_id_seq" in statement for statement in statements)
+    assert statements[-2].startswith('DELETE FROM public."tags"')
+    assert statements[-1] == 'SELECT setval(\'"tags_id_seq"\', 3, true)'
+
+
+def test_apply_diff_archive_rejects_a_base_archive(chain_dir):
+    with pytest.raises(ValueError, match="Not a differential backup"):
+        DatabaseBackupRestore("postgresql://localhost/label_pizza")._apply_diff_archive(FakeCursor(), str(chain_dir / "base.tar"))
+
+
+def test_restore_backup_replays_the_chain_in_order(chain_dir, monkeypatch):
+    backup = DatabaseBackupRestore("postgresql://localhost/label_pizza")
+    applied = []
+    monkeypatch.setattr(backup_restore.psycopg2, "connect", lambda url: FakeConnection())
+    monkeypatch.setattr(backup, "_restore_copy_archive", lambda cursor, path, verbose, tables: applied.append(("base", path)))
+    monkeypatch.setattr(backup, "_apply_diff_archive", lambda cursor, path, verbose, tables: applied.append(("diff", path)))
+
+    assert backup.restore_backup(str(chain_dir / "diff2.tar"), force=True)
+    assert applied == [("base", str(chain_dir / "base.tar")), ("diff", str(chain_dir / "diff1")), ("diff", str(chain_dir / "diff2.tar"))]
+
+    # A broken chain fails before anything is restored
+    os.remove(chain_dir / "base.tar")
+    applied.clear()
+    assert not backup.restore_backup(str(chain_dir / "diff2.tar"), force=True)
+    assert applied == []
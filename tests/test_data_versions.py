@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import create_engine, select, text, update
+from sqlalchemy.orm import Session
+
+from label_pizza import data_versions
+from label_pizza.data_versions import bump_project_versions, get_project_version
+from label_pizza.models import (
+    AnnotatorAnswer, AnswerReview, Base, Project, ProjectDataVersion, ProjectUserRole, ProjectVideo, Question,
+    QuestionGroup, QuestionGroupQuestion, Schema, SchemaQuestionGroup, User, VideoTag
+)
+from label_pizza.services import ProjectService
+
+
+def _versions(session):
+    return dict(session.execute(select(ProjectDataVersion.project_id, ProjectDataVersion.version)).all())
+
+
+def _bumped(session, before):
+    after = _versions(session)
+    return {project_id for project_id in after if after[project_id] != before.get(project_id, 0)}
+
+
+@pytest.fixture
+def versioned_session(session):
+    """Projects 1 and 2 on schemas 1 and 2, question 1 in schema 1, video 1 and user 1 in project 1"""
+    session.add_all([
+        User(id=1, user_id_str="alice", email="alice@example.com", password_hash="x"),
+        User(id=2, user_id_str="bob", email="bob@example.com", password_hash="x"),
+        Schema(id=1, name="s1"), Schema(id=2, name="s2"),
+        QuestionGroup(id=1, title="g1", display_title="G1"),
+        Question(id=1, text="q1", display_text="Q1", type="single", options=["yes", "no"]),
+        QuestionGroupQuestion(question_group_id=1, question_id=1, display_order=0),
+        SchemaQuestionGroup(schema_id=1, question_group_id=1, display_order=0),
+        Project(id=1, name="p1", schema_id=1), Project(id=2, name="p2", schema_id=2),
+        ProjectVideo(project_id=1, video_id=1),
+        ProjectUserRole(project_id=1, user_id=1, role="annotator"),
+        AnnotatorAnswer(id=1, video_id=1, question_id=1, user_id=1, project_id=1, answer_value="yes"),
+    ])
+    session.commit()
+    data_versions.forget_recent_versions()
+    return session
+
+
+def test_answer_submit_bumps_its_project_once(versioned_session):
+    before = _versions(versioned_session)
+
+    versioned_session.add(AnnotatorAnswer(id=2, video_id=1, question_id=1, user_id=2, project_id=1, answer_value="no"))
+    versioned_session.flush()
+    versioned_session.get(AnnotatorAnswer, 1).answer_value = "no"
+    versioned_session.commit()
+
+    assert _versions(versioned_session)[1] == before[1] + 1
+    assert _bumped(versioned_session, before) == {1}
+
+
+@pytest.mark.parametrize("change, projects", [
+    (lambda s: s.add(AnswerReview(answer_id=1, reviewer_id=2, status="approved")), {1}),
+    (lambda s: setattr(s.get(Question, 1), "display_text", "Question 1"), {1}),
+    (lambda s: s.add(SchemaQuestionGroup(schema_id=2, question_group_id=1, display_order=0)), {2}),
+    (lambda s: s.add(VideoTag(video_id=1, tag="night")), {1}),
+    (lambda s: setattr(s.get(User, 1), "user_id_str", "alice2"), {1}),
+    (lambda s: s.delete(s.get(ProjectVideo, (1, 1))), {1}),
+])
+def test_related_writes_bump_dependent_projects(versioned_session, change, projects):
+    before = _versions(versioned_session)
+
+    change(versioned_session)
+    versioned_session.commit()
+
+    assert _bumped(versioned_session, before) == projects
+
+
+def test_statements_bump_scoped_or_all_projects(versioned_session):
+    before = _versions(versioned_session)
+    ProjectService.add_user_to_project(project_id=2, user_id=2, role="annotator", session=versioned_session)
+    versioned_session.commit()
+    assert _bumped(versioned_session, before) == {2}
+
+    before = _versions(versioned_session)
+    versioned_session.execute(update(ProjectUserRole).where(ProjectUserRole.user_id == 1).values(is_archived=True))
+    versioned_session.commit()
+    assert _bumped(versioned_session, before) == {1, 2}
+
+    before = _versions(versioned_session)
+    versioned_session.execute(text("UPDATE users SET user_id_str = 'carol' WHERE id = 2"))
+    versioned_session.commit()
+    assert _bumped(versioned_session, before) == {1, 2}
+
+
+def test_rollback_and_reads_do_not_bump():
+    # Its own database, since rolling back the shared test session ends the test's outer transaction
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Project(id=1, name="p1", schema_id=1), Project(id=2, name="p2", schema_id=2)])
+        session.commit()
+        before = _versions(session)
+
+        session.execute(select(AnnotatorAnswer)).all()
+        session.commit()
+        session.add(AnnotatorAnswer(id=2, video_id=1, question_id=1, user_id=2, project_id=1, answer_value="no"))
+        session.execute(text("DELETE FROM video_tags"))
+        session.rollback()
+        session.commit()
+
+        assert _versions(session) == before == {1: 1, 2: 1}
+
+
+def test_recent_versions_are_forgotten_on_commit(versioned_session):
+    version = get_project_version(versioned_session, 1)
+    assert get_project_version(versioned_session, 3) == 0
+
+    # Bumped behind the memo's back: the remembered version is reused
+    bump_project_versions(versioned_session, [1])
+    assert get_project_version(versioned_session, 1, max_age=60) == version
+    assert get_project_version(versioned_session, 1, max_age=0) == version + 1
+
+    versioned_session.get(AnnotatorAnswer, 1).answer_value = "no"
+    versioned_session.commit()
+    assert get_project_version(versioned_session, 1, max_age=60) == version + 2
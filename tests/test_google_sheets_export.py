@@ -0,0 +1,172 @@
+import re
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from label_pizza.sheet_reports import master_rows, user_tab_rows
+from label_pizza.sheets_rate_limiter import SheetsRateLimiter
+
+
+class FakeRequest:
+    def __init__(self, result):
+        self.result = result
+
+    def execute(self):
+        return self.result
+
+
+class FakeSheetsService:
+    """In-memory stand-in for the Sheets API: cell values are kept per tab, formatting requests are recorded"""
+
+    def __init__(self):
+        self.tabs = {}
+        self.value_writes = []
+        self.format_requests = []
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def read(self, tab_name):
+        """A tab's values as the API returns them: text cells, without trailing blanks"""
+        return _as_text(self.tabs.get(tab_name, []))
+
+    def batchGet(self, spreadsheetId, ranges, **kwargs):
+        return FakeRequest({"valueRanges": [{"values": self.read(self._tab_name(name))} for name in ranges]})
+
+    def batchUpdate(self, spreadsheetId, body, **kwargs):
+        # values().batchUpdate sends "data", spreadsheets().batchUpdate sends "requests"
+        if "data" in body:
+            self.value_writes.append(body["data"])
+            for value_range in body["data"]:
+                self._write(value_range["range"], value_range["values"])
+        else:
+            self.format_requests.append(body["requests"])
+        return FakeRequest({})
+
+    @staticmethod
+    def _tab_name(range_name):
+        return range_name.split("!")[0].strip("'").replace("''", "'")
+
+    def _write(self, range_name, values):
+        column_letters, row_number = re.match(r"([A-Z]+)(\d+)", range_name.split("!")[1]).groups()
+        column = 0
+        for letter in column_letters:
+            column = column * 26 + ord(letter) - ord("A") + 1
+        rows = self.tabs.setdefault(self._tab_name(range_name), [])
+
+        for row_offset, row_values in enumerate(values):
+            row_idx = int(row_number) - 1 + row_offset
+            while len(rows) <= row_idx:
+                rows.append([])
+            row = rows[row_idx]
+            while len(row) < column - 1 + len(row_values):
+                row.append("")
+            # The API reports displayed values, which are always text
+            row[column - 1:column - 1 + len(row_values)] = ["" if value is None else str(value) for value in row_values]
+
+
+class FakeSpreadsheet:
+    def __init__(self, tab_names):
+        self.id = "spreadsheet"
+        self.worksheets = {name: FakeWorksheet(name, sheet_id, self) for sheet_id, name in enumerate(tab_names)}
+
+    def worksheet(self, name):
+        return self.worksheets[name]
+
+
+class FakeWorksheet:
+    def __init__(self, title, sheet_id, spreadsheet):
+        self.title = title
+        self._properties = {"sheetId": sheet_id}
+        self.spreadsheet = spreadsheet
+
+
+def _annotator(user_id, name):
+    return {"user_id": user_id, "user_name": name, "email": f"{name}@example.com", "role": "human",
+            "last_annotation_time": datetime(2024, 1, 3, 8, 0), "assigned_projects": 2,
+            "projects_started": 2, "projects_completed": 1}
+
+
+def _annotator_project(name, day):
+    return {
+        "project_name": name, "schema_name": "Schema", "video_count": 1500,
+        "last_submitted": datetime(2024, 1, day, 12, 30, tzinfo=timezone.utc),
+        "accuracy": 90.0, "completion": 50.0, "reviewed_ratio": 25.0,
+        "completed": 5, "reviewed": 2, "wrong": 1,
+    }
+
+
+def _as_text(rows):
+    """Rows as the API reads them back: text cells, without trailing blanks or empty rows at the end"""
+    text_rows = [["" if value is None else str(value) for value in row] for row in rows]
+    for row in text_rows:
+        while row and row[-1] == "":
+            row.pop()
+    while text_rows and not text_rows[-1]:
+        text_rows.pop()
+    return text_rows
+
+
+@pytest.fixture
+def exporter():
+    pytest.importorskip("gspread")
+    pytest.importorskip("googleapiclient")
+    pytest.importorskip("google_auth_oauthlib")
+    from label_pizza.google_sheets_export import GoogleSheetExporter
+
+    exporter = GoogleSheetExporter.__new__(GoogleSheetExporter)
+    exporter.rate_limiter = SheetsRateLimiter(quotas={})
+    exporter._thread_local = threading.local()
+    exporter._thread_local.sheets_service = FakeSheetsService()
+    exporter.export_failures = []
+    return exporter
+
+
+def test_export_master_tab_first_run_and_new_user(exporter):
+    service = exporter.sheets_service
+    sheet = FakeSpreadsheet(["Annotators"])
+    users = [_annotator(1, "alice")]
+
+    # First export: the tab is empty, so every row is written and the tab is formatted
+    exporter._export_master_tab(sheet, "Annotators", users, "Annotator")
+    assert service.read("Annotators") == _as_text(master_rows(users, "Annotator"))
+    assert len(service.format_requests) == 1
+
+    # Same data again: nothing to write and no formatting
+    exporter._export_master_tab(sheet, "Annotators", users, "Annotator")
+    assert len(service.value_writes) == 1 and len(service.format_requests) == 1
+
+    # A new user changes the shape, so the tab is formatted again
+    users.append(_annotator(2, "bob"))
+    exporter._export_master_tab(sheet, "Annotators", users, "Annotator")
+    assert service.read("Annotators") == _as_text(master_rows(users, "Annotator"))
+    assert [row[0] for row in service.read("Annotators")[1:]] == ["alice", "bob"]
+    assert len(service.format_requests) == 2
+
+
+def test_export_user_tab_first_run_and_new_project(exporter):
+    service = exporter.sheets_service
+    worksheet = FakeSpreadsheet(["Payment"]).worksheet("Payment")
+    projects = [_annotator_project("Older", 1)]
+
+    exporter._export_user_tab(worksheet, projects, "Annotator", include_payment=True)
+    assert service.read("Payment") == _as_text(user_tab_rows(projects, "Annotator", include_payment=True))
+    assert len(service.format_requests) == 1
+
+    # Fill in a payment column, then add a project: the manual cell follows its project
+    service.tabs["Payment"][2][4] = "2024-03"
+    projects.append(_annotator_project("Newer", 2))
+    exporter._export_user_tab(worksheet, projects, "Annotator", include_payment=True)
+
+    rows = service.read("Payment")
+    assert [(row[0], row[4]) for row in rows[2:]] == [("Newer", ""), ("Older", "2024-03")]
+    assert len(service.format_requests) == 2
+
+    # Unchanged data writes nothing and keeps the formatting
+    writes = len(service.value_writes)
+    exporter._export_user_tab(worksheet, projects, "Annotator", include_payment=True)
+    assert len(service.value_writes) == writes and len(service.format_requests) == 2
@@ -0,0 +1,91 @@
+import io
+import json
+
+import pytest
+
+from label_pizza.services import (
+    GroundTruthExportService, GroundTruthService, ProjectService, SchemaService, VideoService,
+    write_json_array, write_ndjson
+)
+
+
+@pytest.fixture
+def exported_projects(session, test_user, test_project, test_video):
+    """test_project with test.mp4, and a second project on the same schema with test.mp4 and second.mp4"""
+    VideoService.add_video(video_uid="second.mp4", url="http://example.com/second.mp4", session=session)
+    second_video = VideoService.get_video_by_uid("second.mp4", session)
+    ProjectService.create_project(
+        name="second_project",
+        description="test description",
+        schema_id=test_project.schema_id,
+        video_ids=[test_video.id, second_video.id],
+        session=session
+    )
+    second_project = ProjectService.get_project_by_name("second_project", session)
+    group = SchemaService.get_schema_question_groups_list(test_project.schema_id, session)[0]
+
+    # The group is reusable, so test.mp4 must have the same answer in both projects
+    for project, video, answer in [
+        (test_project, test_video, "option1"), (second_project, test_video, "option1"), (second_project, second_video, "option2")
+    ]:
+        GroundTruthService.submit_ground_truth_to_question_group(
+            video_id=video.id,
+            project_id=project.id,
+            reviewer_id=test_user.id,
+            question_group_id=group["ID"],
+            answers={"test question for schema": answer},
+            session=session
+        )
+    return [test_project.id, second_project.id]
+
+
+def _video(video_uid, answer):
+    return {
+        "video_uid": video_uid,
+        "url": f"http://example.com/{video_uid}",
+        "answers": {"test question for schema": answer},
+        "question_display_text": {"test question for schema": "Test Question for Schema"},
+        "answer_display_values": {"test question for schema": "Option 1" if answer == "option1" else "Option 2"}
+    }
+
+
+def test_iter_ground_truth_data_matches_export(session, exported_projects):
+    expected = [_video("test.mp4", "option1"), _video("second.mp4", "option2")]
+
+    assert GroundTruthExportService.export_ground_truth_data(exported_projects, session) == expected
+    assert list(GroundTruthExportService.iter_ground_truth_data(exported_projects, session, batch_size=1)) == expected
+    assert GroundTruthExportService.export_ground_truth_data(exported_projects[::-1], session) == expected
+    assert GroundTruthExportService.export_ground_truth_data(exported_projects[:1], session) == expected[:1]
+
+
+def test_export_ground_truth_data_empty_project_list(session, exported_projects):
+    assert GroundTruthExportService.export_ground_truth_data([], session) == []
+    assert list(GroundTruthExportService.iter_ground_truth_data([], session)) == []
+
+    stream = io.StringIO()
+    assert write_ndjson(GroundTruthExportService.iter_ground_truth_data([], session), stream) == 0
+    assert stream.getvalue() == ""
+
+    stream = io.StringIO()
+    assert write_json_array(GroundTruthExportService.iter_ground_truth_data([], session), stream) == 0
+    assert json.loads(stream.getvalue()) == []
+
+
+def test_export_ground_truth_data_missing_project_raises(session, exported_projects):
+    with pytest.raises(ValueError, match="Project with ID 999 not found"):
+        GroundTruthExportService.iter_ground_truth_data(exported_projects + [999], session)
+
+
+def test_write_ndjson_and_json_array_files(session, exported_projects, tmp_path):
+    expected = GroundTruthExportService.export_ground_truth_data(exported_projects, session)
+
+    ndjson_path = tmp_path / "ground_truth.ndjson"
+    assert write_ndjson(GroundTruthExportService.iter_ground_truth_data(exported_projects, session), str(ndjson_path)) == 2
+    lines = ndjson_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == expected
+
+    json_path = tmp_path / "ground_truth.json"
+    assert write_json_array(GroundTruthExportService.iter_ground_truth_data(exported_projects, session), str(json_path)) == 2
+    text = json_path.read_text(encoding="utf-8")
+    assert json.loads(text) == expected
+    assert text == json.dumps(expected, indent=2, ensure_ascii=False)
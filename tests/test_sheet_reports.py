@@ -0,0 +1,142 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from label_pizza.sheet_reports import (
+    CsvSheetSink,
+    InMemorySheetSink,
+    XlsxSheetSink,
+    manual_column_positions,
+    master_rows,
+    render_reports,
+    user_tab_rows,
+)
+
+
+def _annotator_project(name, day, accuracy=90.0):
+    return {
+        "project_name": name, "schema_name": "Schema", "video_count": 10,
+        "last_submitted": datetime(2024, 1, day, 12, 30, tzinfo=timezone.utc),
+        "accuracy": accuracy, "completion": 50.0, "reviewed_ratio": 25.0,
+        "completed": 5, "reviewed": 2, "wrong": 1,
+    }
+
+
+def _reviewer_project(name, day):
+    return {
+        "project_name": name, "schema_name": "Schema", "video_count": 4,
+        "gt_ratio": 50.0, "all_gt_ratio": 75.0, "review_ratio": 25.0, "all_review_ratio": 100.0,
+        "last_submitted": datetime(2024, 2, day, tzinfo=timezone.utc),
+        "gt_completion": 50.0, "gt_accuracy": 80.0, "review_completion": 25.0,
+        "gt_completed": 2, "gt_wrong": 0, "review_completed": 1,
+    }
+
+
+def _report_data():
+    master_data = {
+        "Annotator": [
+            {"user_id": 1, "user_name": "alice", "email": "alice@example.com", "role": "human",
+             "last_annotation_time": datetime(2024, 1, 3, 8, 0), "assigned_projects": 2,
+             "projects_started": 2, "projects_completed": 1},
+            {"user_id": 2, "user_name": "idle", "email": "idle@example.com", "role": "human",
+             "assigned_projects": 0, "projects_started": 0, "projects_completed": 0},
+        ],
+        "Reviewer": [
+            {"user_id": 3, "user_name": "bob", "email": "bob@example.com", "role": "human",
+             "last_review_time": None, "assigned_projects": 1, "projects_started": 0},
+        ],
+        "Meta-Reviewer": [],
+    }
+    project_data_by_role = {
+        "Annotator": {1: [_annotator_project("Older", 1), _annotator_project("Newer", 2)]},
+        "Reviewer": {3: [_reviewer_project("Review Project", 5)]},
+        "Meta-Reviewer": {},
+    }
+    return master_data, project_data_by_role
+
+
+def test_master_rows_skip_inactive_users():
+    master_data, _ = _report_data()
+    rows = master_rows(master_data["Annotator"], "Annotator")
+
+    assert rows[0][3] == "Annotation Sheet"
+    assert rows[1:] == [["alice", "alice@example.com", "human", "Link to alice Sheet",
+                         "2024-01-03 08:00", 2, 2, 1]]
+
+
+def test_user_tab_rows_sort_and_preserve_manual_columns():
+    existing = user_tab_rows([_annotator_project("Older", 1)], "Annotator", include_payment=True)
+    existing = [[str(value) for value in row] for row in existing]
+    existing[2][4:7] = ["2024-03", "100", "20"]
+
+    rows = user_tab_rows([_annotator_project("Older", 1), _annotator_project("Newer", 2)],
+                         "Annotator", include_payment=True, existing_rows=existing)
+
+    assert rows[0][:5] == ["Project Name", "Schema Name", "Video Count", "Last Submitted", "Payment Time"]
+    assert [row[0] for row in rows[2:]] == ["Newer", "Older"]
+    assert rows[2][4:7] == ["", "", ""]
+    assert rows[3][4:7] == ["2024-03", "100", "20"]
+    assert manual_column_positions("Reviewer", False) == [8]
+
+
+def test_render_reports_in_memory():
+    master_data, project_data_by_role = _report_data()
+    sink = InMemorySheetSink()
+
+    user_sheets = render_reports(sink, master_data, project_data_by_role, sheet_prefix="Test")
+
+    assert user_sheets == {"Test-alice Annotator": "Annotator", "Test-bob Reviewer": "Reviewer"}
+    assert set(sink.spreadsheets) == {"Master", "Test-alice Annotator", "Test-bob Reviewer"}
+    assert sink.write_calls == 3
+
+    master = sink.spreadsheets["Master"]
+    assert [row[3] for row in master["Annotators"][1:]] == ["Test-alice Annotator"]
+    assert [row[3] for row in master["Reviewers"][1:]] == ["Test-bob Reviewer"]
+    assert master["Meta-Reviewers"] == [master_rows([], "Meta-Reviewer")[0]]
+
+    alice = sink.spreadsheets["Test-alice Annotator"]
+    assert set(alice) == {"Payment", "Feedback"}
+    assert alice["Payment"][2][:4] == ["Newer", "Schema", 10, "2024-01-02 12:30"]
+    assert alice["Feedback"][2][4:] == ["", "90%", "50%", "25%", 5, 2, 1]
+
+
+def test_render_reports_keeps_manual_columns_across_runs():
+    master_data, project_data_by_role = _report_data()
+    sink = InMemorySheetSink()
+    render_reports(sink, master_data, project_data_by_role)
+
+    feedback = sink.spreadsheets["Pizza-alice Annotator"]["Feedback"]
+    feedback[3][4] = "Great work"  # "Older" is the second project row
+
+    project_data_by_role["Annotator"][1].append(_annotator_project("Newest", 9))
+    render_reports(sink, master_data, project_data_by_role)
+
+    feedback = sink.spreadsheets["Pizza-alice Annotator"]["Feedback"]
+    assert [(row[0], row[4]) for row in feedback[2:]] == [("Newest", ""), ("Newer", ""), ("Older", "Great work")]
+
+
+@pytest.mark.parametrize("sink_class", [CsvSheetSink, XlsxSheetSink])
+def test_file_sinks_round_trip_manual_columns(tmp_path, sink_class):
+    pytest.importorskip("openpyxl")
+    master_data, project_data_by_role = _report_data()
+    sink = sink_class(tmp_path)
+    render_reports(sink, master_data, project_data_by_role)
+
+    payment = sink.read_tabs("Pizza-bob Reviewer", ["Payment", "Missing"])
+    assert list(payment) == ["Payment"]
+    rows = payment["Payment"]
+    assert rows[0][8] == "Payment Time"
+    assert rows[2][:4] == ["Review Project", "Schema", "4", "50%"]
+
+    # Fill in the payment columns as a user would, then export again
+    rows[2][8:11] = ["2024-03", "50", "5"]
+    sink.write_tabs("Pizza-bob Reviewer", {"Payment": rows}, header_rows=2)
+    render_reports(sink, master_data, project_data_by_role)
+
+    tabs = sink.read_tabs("Pizza-bob Reviewer", ["Payment", "Feedback"])
+    assert tabs["Payment"][2][8:11] == ["2024-03", "50", "5"]
+    assert tabs["Feedback"][2][8] == ""
+
+    master = sink.read_tabs("Master", ["Annotators", "Reviewers", "Meta-Reviewers"])
+    assert master["Annotators"][1][3] == "Pizza-alice Annotator"
+    assert master["Annotators"][1][5:] == ["2", "2", "1"]
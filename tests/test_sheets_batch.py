@@ -0,0 +1,35 @@
+import pytest
+
+from label_pizza.sheets_batch import SpreadsheetBatch
+
+
+def test_spreadsheet_batch_flushes_all_requests_in_one_call():
+    batch = SpreadsheetBatch("sheet-1")
+    batch.add({"unmergeCells": {"range": {"sheetId": 1}}})
+    batch.extend([{"mergeCells": {"range": {"sheetId": 1}}}, {"repeatCell": {"range": {"sheetId": 2}}}])
+    assert len(batch) == 3
+
+    sent = []
+    assert batch.flush(sent.append) == 3
+    assert len(sent) == 1
+    # Requests keep the order they were added in
+    assert [next(iter(request)) for request in sent[0]["requests"]] == ["unmergeCells", "mergeCells", "repeatCell"]
+    assert len(batch) == 0
+
+
+def test_spreadsheet_batch_skips_empty_flush():
+    sent = []
+    assert SpreadsheetBatch("sheet-1").flush(sent.append) == 0
+    assert sent == []
+
+
+def test_spreadsheet_batch_keeps_requests_when_send_fails():
+    batch = SpreadsheetBatch("sheet-1")
+    batch.add({"repeatCell": {}})
+
+    def failing_send(body):
+        raise RuntimeError("APIError: [500]")
+
+    with pytest.raises(RuntimeError):
+        batch.flush(failing_send)
+    assert len(batch) == 1
@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import deque
+
+import pytest
+
+from label_pizza.sheets_rate_limiter import SheetsRateLimiter, TokenBucket, run_in_workers
+
+
+class FakeClock:
+    """Clock that only advances when something sleeps"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeSheetsClient:
+    """Local stand-in for the Sheets API that rejects calls over a sliding-window quota"""
+
+    def __init__(self, quota, window_seconds, clock, slack=0):
+        self.quota = quota
+        self.window_seconds = window_seconds
+        self.clock = clock
+        self.slack = slack
+        self.calls = deque()
+        self.total_calls = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def values_update(self):
+        with self._lock:
+            now = self.clock()
+            while self.calls and self.calls[0] <= now - self.window_seconds:
+                self.calls.popleft()
+            self.calls.append(now)
+            self.total_calls += 1
+            self.peak = max(self.peak, len(self.calls))
+            if len(self.calls) > self.quota + self.slack:
+                raise Exception("APIError: [429]: Quota exceeded for quota metric 'Write requests'")
+        return {"updatedCells": 1}
+
+
+def test_token_bucket_burst_then_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=3, refill_per_second=2, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+    assert bucket.try_acquire() == pytest.approx(0.5)
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(0.5)
+
+    bucket.drain()
+    assert bucket.try_acquire() == pytest.approx(0.5)
+
+
+def test_token_bucket_rejects_non_positive_rates():
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=0, refill_per_second=1)
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=1, refill_per_second=0)
+
+
+def test_rate_limiter_stays_under_quota_at_near_full_rate():
+    clock = FakeClock()
+    limiter = SheetsRateLimiter(quotas={"write": 60}, clock=clock, sleep=clock.sleep)
+    client = FakeSheetsClient(quota=60, window_seconds=60, clock=clock)
+
+    for _ in range(600):
+        limiter.acquire("write")
+        client.values_update()
+
+    assert client.peak <= 60
+    # Steady state runs at 90% of the quota (10% is kept as burst)
+    assert 600 / clock.now * 60 >= 0.85 * 60
+
+
+def test_rate_limiter_ignores_unlimited_quotas():
+    clock = FakeClock()
+    limiter = SheetsRateLimiter(quotas={"read": 1}, clock=clock, sleep=clock.sleep)
+
+    for _ in range(10):
+        assert limiter.acquire(None) == 0
+        assert limiter.acquire("unknown") == 0
+    assert clock.now == 0
+
+
+def test_concurrent_workers_share_the_quota():
+    limiter = SheetsRateLimiter(quotas={"write": 20}, window_seconds=0.2)
+    max_workers = 8
+    # Calls are recorded slightly after their token is taken, so allow one in-flight call per worker
+    client = FakeSheetsClient(quota=20, window_seconds=0.2, clock=time.monotonic, slack=max_workers)
+
+    def export_user_sheet(user_index):
+        for _ in range(10):
+            limiter.acquire("write")
+            client.values_update()
+        return f"sheet-{user_index}"
+
+    results = run_in_workers(list(range(12)), export_user_sheet, max_workers=max_workers)
+
+    assert [error for _, _, error in results] == [None] * 12
+    assert [result for _, result, _ in results] == [f"sheet-{i}" for i in range(12)]
+    assert client.total_calls == 120
+
+
+def test_run_in_workers_collects_errors_in_order():
+    def worker(item):
+        if item == 2:
+            raise ValueError("bad item")
+        return item * 10
+
+    for max_workers in (1, 3):
+        results = run_in_workers([1, 2, 3], worker, max_workers=max_workers)
+        assert [item for item, _, _ in results] == [1, 2, 3]
+        assert [result for _, result, _ in results] == [10, None, 30]
+        assert isinstance(results[1][2], ValueError)
+
+
+def test_exporter_retry_drains_shared_bucket(monkeypatch):
+    pytest.importorskip("gspread")
+    pytest.importorskip("googleapiclient")
+    pytest.importorskip("google_auth_oauthlib")
+    import label_pizza.google_sheets_export as google_sheets_export
+
+    clock = FakeClock()
+    exporter = google_sheets_export.GoogleSheetExporter.__new__(google_sheets_export.GoogleSheetExporter)
+    exporter.rate_limiter = SheetsRateLimiter(quotas={"write": 60}, clock=clock, sleep=clock.sleep)
+    monkeypatch.setattr(google_sheets_export.time, "sleep", lambda seconds: None)
+
+    attempts = []
+
+    def flaky_update():
+        attempts.append(clock())
+        if len(attempts) == 1:
+            raise Exception("APIError: [429]: Quota exceeded")
+        return "ok"
+
+    assert exporter._api_call_with_retry(flaky_update, operation_name="test update") == "ok"
+    assert len(attempts) == 2
+    # The retry had to wait for the drained bucket to refill
+    assert attempts[1] > attempts[0]
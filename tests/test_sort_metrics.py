@@ -0,0 +1,84 @@
+import pytest
+
+from label_pizza.models import AnnotatorAnswer, AnswerReview, Question, ReviewerGroundTruth
+from label_pizza.sort_metrics import ProjectSortMetrics
+
+
+@pytest.fixture
+def metrics_session(session):
+    """Project 1 with videos 1-3, single-choice questions 1-2, description question 3 and users 1-3"""
+    session.add_all([
+        Question(id=1, text="q1", display_text="Q1", type="single", options=["yes", "no"]),
+        Question(id=2, text="q2", display_text="Q2", type="single", options=["yes", "no"]),
+        Question(id=3, text="q3", display_text="Q3", type="description"),
+    ])
+    answers = [
+        # (video, question, user, value, confidence)
+        (1, 1, 1, "yes", 0.9), (1, 1, 2, "yes", None), (1, 1, 3, "no", 0.5),
+        (1, 2, 1, "no", 0.7), (1, 2, 2, "yes", 0.3),
+        (2, 1, 1, "no", 0.2), (2, 2, 2, "no", None),
+        (3, 3, 1, "looks fine", None),
+        (2, 3, 1, "blurry", None),
+    ]
+    for answer_id, (video_id, question_id, user_id, value, confidence) in enumerate(answers, 1):
+        session.add(AnnotatorAnswer(
+            id=answer_id, video_id=video_id, question_id=question_id, user_id=user_id, project_id=1,
+            answer_value=value, confidence_score=confidence,
+        ))
+    # Another project's answer must be ignored
+    session.add(AnnotatorAnswer(id=99, video_id=1, question_id=1, user_id=1, project_id=2, answer_value="no"))
+    session.add_all([
+        AnswerReview(answer_id=8, reviewer_id=9, status="approved"),
+        AnswerReview(answer_id=9, reviewer_id=9, status="pending"),
+    ])
+    for video_id, question_id, value in [(1, 1, "yes"), (1, 2, "no"), (2, 1, "yes")]:
+        session.add(ReviewerGroundTruth(
+            video_id=video_id, question_id=question_id, project_id=1, reviewer_id=9,
+            answer_value=value, original_answer_value=value,
+        ))
+    session.flush()
+    return session
+
+
+def test_project_level_metrics(metrics_session):
+    metrics = ProjectSortMetrics.load(project_id=1, session=metrics_session)
+
+    # Answers without a confidence score are ignored
+    assert metrics.model_confidence([1, 2], [1, 2]) == pytest.approx({1: (0.9 + 0.7 + 0.3) / 3, 2: 0.2})
+    # Video 1: q1 has a 2/3 majority, q2 is split 1/1 which still counts as agreement
+    assert metrics.consensus_rates([1, 2, 3], [1, 2]) == {1: 1.0}
+    # Video 1: 3 of 5 answers match the ground truth; video 2: the only compared answer is wrong
+    assert metrics.accuracy_rates([1, 2, 3], [1, 2]) == pytest.approx({1: 0.6, 2: 0.0})
+    assert metrics.completion_rates([1, 2]) == {1: 100.0, 2: 50.0}
+
+
+def test_user_metrics(metrics_session):
+    metrics = ProjectSortMetrics.load(project_id=1, session=metrics_session)
+
+    assert metrics.user_completion_rates(1, [1, 2, 3]) == pytest.approx({1: 200 / 3, 2: 200 / 3, 3: 100 / 3})
+    # Video 1: q1 right, q2 right; video 2: q1 wrong and the pending description review is not judged;
+    # video 3: the approved description answer counts as correct
+    assert metrics.user_accuracy_rates(1, [1, 2, 3]) == {1: 100.0, 2: 0.0, 3: 100.0}
+    assert metrics.user_accuracy_rates(3, [2]) == {}
+
+
+def test_ground_truth_filter_and_question_subset(metrics_session):
+    metrics = ProjectSortMetrics.load(project_id=1, session=metrics_session)
+    assert metrics.videos_matching_ground_truth({1: "yes"}) == {1, 2}
+    assert metrics.videos_matching_ground_truth({1: "yes", 2: "no"}) == {1}
+    assert metrics.videos_matching_ground_truth({1: "no"}) == set()
+
+    subset = ProjectSortMetrics.load(project_id=1, session=metrics_session, question_ids=[2])
+    assert set(subset.answers["question_id"]) == {2}
+    assert subset.completion_rates([2]) == {1: 100.0}
+
+
+def test_empty_project(session):
+    metrics = ProjectSortMetrics.load(project_id=1, session=session)
+
+    assert metrics.model_confidence([1], [1]) == {}
+    assert metrics.consensus_rates([1, 2], [1]) == {}
+    assert metrics.accuracy_rates([1], [1]) == {}
+    assert metrics.completion_rates([1]) == {}
+    assert metrics.user_accuracy_rates(1, [1]) == {}
+    assert metrics.videos_matching_ground_truth({1: "yes"}) == set()